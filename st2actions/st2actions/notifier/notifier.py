@@ -31,6 +31,7 @@ from st2common.persistence.action import Action
 from st2common.persistence.liveaction import LiveAction
 from st2common.models.system.common import ResourceReference
 from st2common.persistence.execution import ActionExecution
+from st2common.services import executions as execution_service
 from st2common.services import policies as policy_service
 from st2common.services import trace as trace_service
 from st2common.services import workflows as workflow_service
@@ -63,6 +64,7 @@ NOTIFY_TRIGGER_TYPE = INTERNAL_TRIGGER_TYPES["action"][1]
 
 class Notifier(consumers.MessageHandler):
     message_type = ActionExecutionDB
+    service_name = "notifier"
 
     def __init__(self, connection, queues, trigger_dispatcher=None):
         super(Notifier, self).__init__(connection, queues)
@@ -96,6 +98,9 @@ class Notifier(consumers.MessageHandler):
                     policy_service.apply_post_run_policies(liveaction_db)
 
             if liveaction_db.notify:
+                # Notification messages can reference execution result and parameters
+                execution_db = execution_service.get_full_execution(execution_db)
+
                 with CounterWithTimer(key="notifier.notify_trigger.post"):
                     self._post_notify_triggers(
                         liveaction_db=liveaction_db, execution_db=execution_db
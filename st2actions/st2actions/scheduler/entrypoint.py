@@ -42,6 +42,7 @@ class SchedulerEntrypoint(consumers.MessageHandler):
     """
 
     message_type = LiveActionDB
+    service_name = "scheduler"
 
     def process(self, request):
         """
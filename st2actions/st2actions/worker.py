@@ -28,6 +28,7 @@ from st2common.exceptions.db import StackStormDBObjectNotFoundError
 from st2common.models.db.liveaction import LiveActionDB
 from st2common.persistence.execution import ActionExecution
 from st2common.services import coordination
+from st2common.services.config_cache import PackConfigCacheWatcher
 from st2common.services import executions
 from st2common.services import workflows as wf_svc
 from st2common.transport.consumers import MessageHandler
@@ -61,11 +62,13 @@ ACTIONRUNNER_DISPATCHABLE_STATES = [
 
 class ActionExecutionDispatcher(MessageHandler):
     message_type = LiveActionDB
+    service_name = "actionrunner"
 
     def __init__(self, connection, queues):
         super(ActionExecutionDispatcher, self).__init__(connection, queues)
         self.container = RunnerContainer()
         self._running_liveactions = set()
+        self._config_cache_watcher = None
 
     def get_queue_consumer(self, connection, queues):
         # We want to use a special ActionsQueueConsumer which uses 2 dispatcher pools
@@ -137,9 +140,20 @@ class ActionExecutionDispatcher(MessageHandler):
 
         return dispatchers[liveaction.status](liveaction)
 
+    def start(self, wait=False):
+        if cfg.CONF.packs.config_cache_enabled:
+            self._config_cache_watcher = PackConfigCacheWatcher()
+            self._config_cache_watcher.start()
+
+        super(ActionExecutionDispatcher, self).start(wait=wait)
+
     def shutdown(self):
         super(ActionExecutionDispatcher, self).shutdown()
 
+        if self._config_cache_watcher:
+            self._config_cache_watcher.stop()
+            self._config_cache_watcher = None
+
         if cfg.CONF.actionrunner.graceful_shutdown:
 
             coordinator = coordination.get_coordinator()
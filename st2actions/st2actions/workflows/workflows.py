@@ -30,6 +30,7 @@ from st2common.persistence import liveaction as lv_db_access
 from st2common.persistence import workflow as wf_db_access
 from st2common.persistence import execution as ex_db_access
 from st2common.services import action as ac_svc
+from st2common.services import executions as ex_svc
 from st2common.services import policies as pc_svc
 from st2common.services import workflows as wf_svc
 from st2common.transport import consumers
@@ -52,6 +53,8 @@ WORKFLOW_ENGINE_START_STOP_SEQ = "workflow_engine_start_stop_seq"
 
 
 class WorkflowExecutionHandler(consumers.VariableMessageHandler):
+    service_name = "workflow_engine"
+
     def __init__(self, connection, queues):
         super(WorkflowExecutionHandler, self).__init__(connection, queues)
         self._active_messages = 0
@@ -254,7 +257,8 @@ class WorkflowExecutionHandler(consumers.VariableMessageHandler):
         lv_ac_db = lv_db_access.LiveAction.get_by_id(ac_ex_db.liveaction["id"])
         pc_svc.apply_post_run_policies(lv_ac_db)
 
-        # Process completion of the action execution.
+        # Process completion of the action execution. Completion handling needs the result.
+        ac_ex_db = ex_svc.get_full_execution(ac_ex_db)
         wf_svc.handle_action_execution_completion(ac_ex_db)
 
 
@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
+
 from oslo_config import cfg
 
 from st2api import config as st2api_config
@@ -27,7 +29,10 @@ from st2common.middleware.instrumentation import ResponseInstrumentationMiddlewa
 from st2common.router import Router
 from st2common.constants.system import VERSION_STRING
 from st2common.service_setup import setup as common_setup
+from st2common.services import actionalias_matcher
+from st2common.services import trigger_dispatcher
 from st2common.util import spec_loader
+from st2api.controllers.resource import enable_list_response_cache
 from st2api.validation import validate_auth_cookie_is_correctly_configured
 from st2api.validation import validate_rbac_is_correctly_configured
 
@@ -66,10 +71,19 @@ def setup_app(config=None):
             config_args=config.get("config_args", None),
         )
 
+        # NOTE: gunicorn workers don't go through st2api.cmd.api teardown
+        atexit.register(teardown_app)
+
     # Additional pre-run time checks
     validate_auth_cookie_is_correctly_configured()
     validate_rbac_is_correctly_configured()
 
+    if cfg.CONF.api.list_response_cache_enabled:
+        enable_list_response_cache(size=cfg.CONF.api.list_response_cache_size)
+
+    if cfg.CONF.api.alias_matcher_cache_enabled:
+        actionalias_matcher.start_watcher()
+
     router = Router(
         debug=cfg.CONF.api.debug, auth=cfg.CONF.auth.enable, is_gunicorn=is_gunicorn
     )
@@ -95,3 +109,13 @@ def setup_app(config=None):
     app = RequestInstrumentationMiddleware(app, router, service_name="api")
 
     return app
+
+
+def teardown_app():
+    """
+    Stop background threads which have been started by setup_app or while handling requests.
+    """
+    actionalias_matcher.stop_watcher()
+
+    # Publish webhook triggers which are still buffered when asynchronous dispatch is enabled
+    trigger_dispatcher.shutdown_batching_trigger_dispatchers()
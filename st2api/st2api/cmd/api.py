@@ -90,6 +90,7 @@ def _run_server():
 
 
 def _teardown():
+    app.teardown_app()
     common_teardown()
 
 
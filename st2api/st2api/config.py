@@ -90,6 +90,13 @@ def _register_app_opts(ignore_errors=False):
             help="Maximum limit (page size) argument which can be "
             "specified by the user in a query string.",
         ),
+        cfg.BoolOpt(
+            "alias_matcher_cache_enabled",
+            default=False,
+            help="True to keep precompiled format strings of all the enabled action aliases in "
+            "memory and use them when matching commands. Matcher is rebuilt when action aliases "
+            "are created, updated or deleted.",
+        ),
     ]
 
     common_config.do_register_opts(
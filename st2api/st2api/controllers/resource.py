@@ -17,11 +17,16 @@
 
 import abc
 import copy
+import functools
+import hashlib
 
 from oslo_config import cfg
 from mongoengine import ValidationError, LookUpError
+from mongoengine.queryset.queryset import QuerySet
+from mongoengine.queryset.visitor import Q
 import six
 from six.moves import http_client
+from webob.etag import ETagMatcher
 
 from st2common import log as logging
 from st2common.models.system.common import ResourceReference
@@ -30,13 +35,36 @@ from st2common.exceptions.rbac import ResourceAccessDeniedPermissionIsolationErr
 from st2common.rbac.backends import get_rbac_backend
 from st2common.exceptions.rbac import AccessDeniedError
 from st2common.util import schema as util_schema
+from st2common.util.cache import ExpiringLRUCache
+from st2common.util import pagination as pagination_utils
 from st2common.router import abort
 from st2common.router import Response
+from st2common.router import StreamingJSONListResponse
 
 LOG = logging.getLogger(__name__)
 
 RESERVED_QUERY_PARAMS = {"id": "id", "name": "name", "sort": "order_by"}
 
+# In-process cache of serialized list responses (see enable_list_response_cache)
+LIST_RESPONSE_CACHE = None
+
+
+def enable_list_response_cache(size):
+    """
+    Enable in-process cache of serialized list responses for the queries without filters.
+
+    Only list responses of the controllers with revision tracking are cached (see
+    ResourceController.revision_access). A cached response is only used as long as the
+    revisions of the corresponding collections don't change.
+    """
+    global LIST_RESPONSE_CACHE
+    LIST_RESPONSE_CACHE = ExpiringLRUCache(size=size)
+
+
+def disable_list_response_cache():
+    global LIST_RESPONSE_CACHE
+    LIST_RESPONSE_CACHE = None
+
 
 def split_id_value(value):
     if not value or isinstance(value, (list, tuple)):
@@ -100,6 +128,24 @@ class ResourceController(object):
 
     query_options = {"sort": []}
 
+    # Name of the (indexed) database field which is used for cursor (keyset) pagination. Items
+    # are ordered by this field and by id which acts as a tie breaker.
+    cursor_field = "id"
+
+    # A list of persistence classes with revision tracking (see Access.track_revisions) which
+    # determine the content of list responses. When specified, list responses include an "ETag"
+    # header and conditional requests with "If-None-Match" header are supported.
+    revision_access = []
+
+    # True to serialize list responses item by item and stream them to the client instead of
+    # building the whole response in memory. Only enable it for controllers which return the
+    # "_get_all" response as is.
+    stream_list_responses = False
+
+    # Number of database objects which are retrieved and converted at once when streaming list
+    # responses
+    stream_batch_size = 100
+
     # A list of optional transformation functions for user provided filter values
     filter_transform_functions = {}
 
@@ -140,10 +186,25 @@ class ResourceController(object):
         from_model_kwargs=None,
         raw_filters=None,
         requester_user=None,
+        cursor=None,
+        include_count=True,
+        if_none_match=None,
     ):
         """
         :param exclude_fields: A list of object fields to exclude.
         :type exclude_fields: ``list``
+
+        :param if_none_match: Value of the "If-None-Match" request header.
+        :type if_none_match: ``str``
+
+        :param cursor: Cursor returned in the "X-Next-Cursor" header of the previous page or "*"
+                       for the first page. When provided, keyset pagination on the
+                       "cursor_field" is used instead of offset based pagination.
+        :type cursor: ``str``
+
+        :param include_count: True to include total number of matching items in the
+                              "X-Total-Count" response header.
+        :type include_count: ``bool``
         """
         raw_filters = copy.deepcopy(raw_filters) or {}
 
@@ -191,9 +252,85 @@ class ResourceController(object):
         if offset >= 2**31:
             raise ValueError('Offset "%s" specified is more than 32-bit int' % (offset))
 
+        if cursor:
+            if offset:
+                raise ValueError(
+                    "offset and cursor arguments are mutually exclusive. "
+                    "You need to provide either one or another, but not both."
+                )
+
+            cursor_direction = self._get_cursor_direction(
+                sort_values=raw_filters["sort"], is_user_sort=bool(db_sort_values)
+            )
+            raw_filters["sort"] = [
+                cursor_direction + self.cursor_field,
+                cursor_direction + "id",
+            ]
+
+            if include_fields and self.cursor_field not in include_fields:
+                include_fields.append(self.cursor_field)
+
+            if self.cursor_field in exclude_fields:
+                exclude_fields.remove(self.cursor_field)
+
         limit = validate_limit_query_param(limit=limit, requester_user=requester_user)
         eop = offset + int(limit) if limit else None
 
+        etag = None
+        cache_key = None
+
+        if self.revision_access:
+            request_key = repr(
+                (
+                    self.__class__.__name__,
+                    sorted(raw_filters.items()),
+                    sorted(exclude_fields),
+                    sorted(include_fields),
+                    advanced_filters,
+                    offset,
+                    limit,
+                    cursor,
+                    include_count,
+                    sorted((from_model_kwargs or {}).items()),
+                    self._get_list_request_user_key(requester_user=requester_user),
+                )
+            )
+
+            # NOTE: Revisions are retrieved before the query is performed so any change which
+            # happens during the query results in a different ETag for the next request
+            etag = self._get_list_etag(request_key=request_key)
+
+            # NOTE: If-None-Match uses weak comparison (RFC 7232) so ETags which have been
+            # weakened by a proxy (e.g. when compressing the response) still match
+            if_none_match = ETagMatcher.parse(if_none_match, strong=False)
+
+            if etag in if_none_match:
+                resp = Response(status=http_client.NOT_MODIFIED)
+                resp.headers["ETag"] = '"%s"' % (etag)
+                return resp
+
+            is_filtered = any(
+                value for key, value in six.iteritems(raw_filters) if key != "sort"
+            )
+            is_cacheable = not (
+                is_filtered
+                or exclude_fields
+                or include_fields
+                or advanced_filters
+                or cursor
+            )
+
+            if LIST_RESPONSE_CACHE is not None and is_cacheable:
+                cache_key = request_key
+                cached_response = LIST_RESPONSE_CACHE.get(cache_key)
+
+                if cached_response and cached_response[0] == etag:
+                    _, body, headers = cached_response
+                    resp = Response(body=body, content_type="application/json")
+                    resp.headers.update(headers)
+                    resp.headers["ETag"] = '"%s"' % (etag)
+                    return resp
+
         filters = {}
         for k, v in six.iteritems(self.supported_filters):
             filter_value = raw_filters.get(k, None)
@@ -234,30 +371,196 @@ class ResourceController(object):
         instances = self.access.query(
             exclude_fields=exclude_fields, only_fields=include_fields, **filters
         )
-        if limit == 1:
+        count_instances = instances
+        next_cursor = None
+
+        if cursor:
+            # Use a range query on the cursor field index instead of skipping over all the items
+            # on the previous pages
+            if cursor != pagination_utils.FIRST_PAGE_CURSOR:
+                instances = self.access.query(
+                    self._get_cursor_filter(cursor=cursor, direction=cursor_direction),
+                    exclude_fields=exclude_fields,
+                    only_fields=include_fields,
+                    **filters,
+                )
+
+            if limit:
+                instances = list(instances.limit(limit))
+
+                # There might be more items if the page is full
+                if len(instances) == limit:
+                    next_cursor = self._get_cursor(instance=instances[-1])
+            else:
+                instances = list(instances)
+
+            offset, eop = 0, None
+        elif limit == 1:
             # Perform the filtering on the DB side
             instances = instances.limit(limit)
 
         from_model_kwargs = from_model_kwargs or {}
         from_model_kwargs.update(self.from_model_kwargs)
 
-        result = self.resources_model_filter(
-            model=self.model,
-            instances=instances,
-            offset=offset,
-            eop=eop,
-            requester_user=requester_user,
-            **from_model_kwargs,
-        )
+        if self.stream_list_responses:
+            result = self._iter_resources_model_filter(
+                model=self.model,
+                instances=instances,
+                offset=offset,
+                eop=eop,
+                requester_user=requester_user,
+                **from_model_kwargs,
+            )
+            resp = StreamingJSONListResponse(items=result)
+        else:
+            result = self.resources_model_filter(
+                model=self.model,
+                instances=instances,
+                offset=offset,
+                eop=eop,
+                requester_user=requester_user,
+                **from_model_kwargs,
+            )
+            resp = Response(json=result)
 
-        resp = Response(json=result)
-        resp.headers["X-Total-Count"] = str(instances.count())
+        if include_count:
+            resp.headers["X-Total-Count"] = str(count_instances.count())
 
         if limit:
             resp.headers["X-Limit"] = str(limit)
 
+        if next_cursor:
+            resp.headers[pagination_utils.NEXT_CURSOR_HEADER] = next_cursor
+
+        if cache_key:
+            LIST_RESPONSE_CACHE.set(cache_key, (etag, resp.body, dict(resp.headers)))
+
+        if etag:
+            resp.headers["ETag"] = '"%s"' % (etag)
+
         return resp
 
+    def _get_list_etag(self, request_key):
+        """
+        Return ETag for the list response which is based on the current revisions of the
+        collections in "revision_access" and the provided request parameters.
+
+        :rtype: ``str``
+        """
+        revisions = [access.get_revision() for access in self.revision_access]
+        value = "%s|%s" % (",".join(revisions), request_key)
+        return hashlib.sha1(value.encode("utf-8")).hexdigest()
+
+    def _get_list_request_user_key(self, requester_user):
+        """
+        Return value which identifies the requester in the list response ETag and cache key or
+        None if list responses don't depend on the requester.
+        """
+        return None
+
+    def _get_cursor_direction(self, sort_values, is_user_sort=False):
+        """
+        Return sort direction ("+" or "-") which is used for cursor pagination.
+
+        Cursor pagination is only supported when sorting by the "cursor_field". If the default
+        sort order of the resource is not by that field, ascending order is used.
+        """
+        if sort_values and sort_values[0].lstrip("+-") == self.cursor_field:
+            return "-" if sort_values[0].startswith("-") else "+"
+
+        if is_user_sort:
+            raise ValueError(
+                'Cursor pagination is only supported when sorting by "%s"'
+                % (self.cursor_field)
+            )
+
+        return "+"
+
+    def _get_cursor_field(self):
+        field_path = self.cursor_field.split(".")
+        return self.access.impl.model._lookup_field(field_path)[-1]
+
+    def _get_cursor(self, instance):
+        """
+        Return cursor which points to the page which follows the provided instance.
+
+        :rtype: ``str``
+        """
+        value = functools.reduce(getattr, self.cursor_field.split("."), instance)
+
+        if value is None:
+            return None
+
+        value = self._get_cursor_field().to_mongo(value)
+
+        if self.cursor_field == "id":
+            value = str(value)
+
+        return pagination_utils.encode_cursor(value=value, id=instance.id)
+
+    def _get_cursor_filter(self, cursor, direction):
+        """
+        Return query which matches all the items which follow the item the provided cursor
+        points to.
+        """
+        value, id = pagination_utils.decode_cursor(cursor=cursor)
+        operator = "lt" if direction == "-" else "gt"
+
+        if self.cursor_field == "id":
+            return Q(**{"id__%s" % (operator): id})
+
+        field_name = "__".join(self.cursor_field.split("."))
+        value = self._get_cursor_field().to_python(value)
+
+        return Q(**{"%s__%s" % (field_name, operator): value}) | Q(
+            **{field_name: value, "id__%s" % (operator): id}
+        )
+
+    def _iter_resources_model_filter(
+        self,
+        model,
+        instances,
+        requester_user=None,
+        offset=0,
+        eop=None,
+        **from_model_kwargs,
+    ):
+        """
+        Generator version of "resources_model_filter" which retrieves and converts DB objects in
+        batches so only a single batch is held in memory at a time.
+        """
+        instances = instances[offset:eop]
+
+        if isinstance(instances, QuerySet):
+            instances = instances.no_cache().batch_size(self.stream_batch_size)
+
+        batch = []
+        for instance in instances:
+            batch.append(instance)
+
+            if len(batch) < self.stream_batch_size:
+                continue
+
+            for item in self.resources_model_filter(
+                model=model,
+                instances=batch,
+                requester_user=requester_user,
+                eop=None,
+                **from_model_kwargs,
+            ):
+                yield item
+
+            batch = []
+
+        for item in self.resources_model_filter(
+            model=model,
+            instances=batch,
+            requester_user=requester_user,
+            eop=None,
+            **from_model_kwargs,
+        ):
+            yield item
+
     def resources_model_filter(
         self,
         model,
@@ -596,6 +899,15 @@ class BaseResourceIsolationControllerMixin(object):
 
         return result
 
+    def _get_list_request_user_key(self, requester_user):
+        if not (cfg.CONF.rbac.enable and cfg.CONF.rbac.permission_isolation):
+            return super(
+                BaseResourceIsolationControllerMixin, self
+            )._get_list_request_user_key(requester_user=requester_user)
+
+        # List responses only contain resources which are visible to the requester
+        return ("user", getattr(requester_user, "name", None))
+
     def resource_model_filter(
         self, model, instance, requester_user=None, **from_model_kwargs
     ):
@@ -704,6 +1016,7 @@ class ContentPackResourceController(ResourceController):
         from_model_kwargs=None,
         raw_filters=None,
         requester_user=None,
+        if_none_match=None,
     ):
         resp = super(ContentPackResourceController, self)._get_all(
             exclude_fields=exclude_fields,
@@ -715,6 +1028,7 @@ class ContentPackResourceController(ResourceController):
             from_model_kwargs=from_model_kwargs,
             raw_filters=raw_filters,
             requester_user=requester_user,
+            if_none_match=if_none_match,
         )
 
         return resp
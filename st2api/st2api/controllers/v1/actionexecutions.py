@@ -38,6 +38,7 @@ from st2common.constants import action as action_constants
 from st2common.exceptions import actionrunner as runner_exc
 from st2common.exceptions import apivalidation as validation_exc
 from st2common.exceptions import param as param_exc
+from st2common.exceptions import rbac as rbac_exc
 from st2common.exceptions import trace as trace_exc
 from st2common.models.api.action import LiveActionAPI
 from st2common.models.api.action import LiveActionCreateAPI
@@ -54,13 +55,16 @@ from st2common.services import action as action_service
 from st2common.services import executions as execution_service
 from st2common.services import trace as trace_service
 from st2common.util import isotime
+from st2common.util import json_path as json_path_utils
+from st2common.util import mongoescape
 from st2common.util import action_db as action_utils
 from st2common.util import param as param_utils
+from st2common.util import schema as util_schema
 from st2common.util.jsonify import try_loads
 from st2common.rbac.types import PermissionType
 from st2common.rbac.backends import get_rbac_backend
 
-__all__ = ["ActionExecutionsController"]
+__all__ = ["ActionExecutionsController", "ActionExecutionsBulkController"]
 
 LOG = logging.getLogger(__name__)
 
@@ -182,23 +186,13 @@ class ActionExecutionsControllerMixin(BaseRestControllerMixin):
 
         # Retrieve other st2 context from request header.
         if context_string:
-            context = try_loads(context_string)
-            if not isinstance(context, dict):
-                raise ValueError(
-                    "Unable to convert st2-context from the headers into JSON"
-                    f" (was {type(context)})."
-                )
+            context = self._get_context_from_string(context_string=context_string)
             liveaction.context.update(context)
 
         # Include RBAC context (if RBAC is available and enabled)
-        if cfg.CONF.rbac.enable:
-            user_db = UserDB(name=user)
-            rbac_service = get_rbac_backend().get_service_class()
-            role_dbs = rbac_service.get_roles_for_user(
-                user_db=user_db, include_remote=True
-            )
-            roles = [role_db.name for role_db in role_dbs]
-            liveaction.context["rbac"] = {"user": user, "roles": roles}
+        rbac_context = self._get_rbac_context(user=user)
+        if rbac_context:
+            liveaction.context["rbac"] = rbac_context
 
         # Schedule the action execution.
         liveaction_db = LiveActionAPI.to_model(liveaction)
@@ -252,6 +246,31 @@ class ActionExecutionsControllerMixin(BaseRestControllerMixin):
 
         return Response(json=execution_api, status=http_client.CREATED)
 
+    def _get_context_from_string(self, context_string):
+        context = try_loads(context_string)
+        if not isinstance(context, dict):
+            raise ValueError(
+                "Unable to convert st2-context from the headers into JSON"
+                f" (was {type(context)})."
+            )
+
+        return context
+
+    def _get_rbac_context(self, user):
+        """
+        Return RBAC execution context for the provided user or None if RBAC is not enabled.
+
+        :rtype: ``dict``
+        """
+        if not cfg.CONF.rbac.enable:
+            return None
+
+        user_db = UserDB(name=user)
+        rbac_service = get_rbac_backend().get_service_class()
+        role_dbs = rbac_service.get_roles_for_user(user_db=user_db, include_remote=True)
+        roles = [role_db.name for role_db in role_dbs]
+        return {"user": user, "roles": roles}
+
     def _get_result_object(self, id):
         """
         Retrieve result object for the provided action execution.
@@ -387,7 +406,13 @@ class ActionExecutionAttributeController(BaseActionExecutionNestedController):
 
 class ActionExecutionRawResultController(BaseActionExecutionNestedController):
     def get(
-        self, id, requester_user, download=False, compress=False, pretty_format=False
+        self,
+        id,
+        requester_user,
+        download=False,
+        compress=False,
+        pretty_format=False,
+        path=None,
     ):
         """
         Retrieve raw action execution result object as a JSON string or optionally force result
@@ -403,10 +428,13 @@ class ActionExecutionRawResultController(BaseActionExecutionNestedController):
         :param pretty_format: True to pretty format returned JSON data - this adds quite some
                               overhead compared to the default behavior where we don't pretty
                               format the result.
+        :param path: JSON pointer (e.g. /stdout) or JSONPath expression (e.g. result.items[0].id)
+                     relative to the result object. When specified, only the selected part of
+                     the result is returned.
 
         Handles requests:
 
-            GET /executions/<id>/result[?download=1][&compress=1]
+            GET /executions/<id>/result[?download=1][&compress=1][&path=<path>]
 
         TODO: Maybe we should also support pre-signed URLs for sharing externally with other
         people?
@@ -427,7 +455,11 @@ class ActionExecutionRawResultController(BaseActionExecutionNestedController):
         except IndexError:
             raise NotFoundException("Execution with id %s not found" % (id))
 
-        if isinstance(result["result"], dict):
+        if path:
+            response_body = self._get_result_path_value(
+                id=id, result=result["result"], path=path, pretty_format=pretty_format
+            )
+        elif isinstance(result["result"], dict):
             # For backward compatibility we also support old non JSON field storage format
             if pretty_format:
                 response_body = orjson.dumps(
@@ -468,6 +500,31 @@ class ActionExecutionRawResultController(BaseActionExecutionNestedController):
         response.body = response_body
         return response
 
+    def _get_result_path_value(self, id, result, path, pretty_format=False):
+        """
+        Decode the stored result once and return JSON serialized sub-tree which is selected by
+        the provided path.
+        """
+        if isinstance(result, dict):
+            # Old non JSON field storage format
+            result = mongoescape.unescape_chars(result)
+        elif result is not None:
+            result = orjson.loads(result)
+
+        try:
+            value = json_path_utils.get_value_for_path(value=result, path=path)
+        except KeyError:
+            msg = 'Path "%s" not found in the result of execution with id %s' % (
+                path,
+                id,
+            )
+            abort(http_client.NOT_FOUND, msg)
+
+        if pretty_format:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+
+        return orjson.dumps(value)
+
 
 class ActionExecutionOutputController(
     ActionExecutionsControllerMixin, ResourceController
@@ -677,6 +734,154 @@ class ActionExecutionReRunController(
         )
 
 
+class ActionExecutionsBulkController(ActionExecutionsControllerMixin):
+    def post(self, bulk_api, requester_user, context_string=None):
+        """
+        Create multiple executions.
+
+        Handles requests:
+            POST /executions/bulk
+
+        Each execution request is validated on its own and all the valid ones are created using
+        bulk database inserts. Response contains the id of the created execution or an error
+        for each of the requests (in the same order as the requests).
+
+        Note: Unlike with a single execution request, no execution object is created for the
+        requests with parameters which fail to render.
+        """
+        if not requester_user:
+            requester_user = UserDB(name=cfg.CONF.system_user.user)
+
+        max_requests = cfg.CONF.api.max_bulk_execution_requests
+        if len(bulk_api.data) > max_requests:
+            msg = 'Number of execution requests "%s" exceeds the maximum of "%s".' % (
+                len(bulk_api.data),
+                max_requests,
+            )
+            abort(http_client.BAD_REQUEST, msg)
+
+        context = {}
+        if context_string:
+            context = self._get_context_from_string(context_string=context_string)
+
+        # Action, runner and parameters schema are shared by all the requests for the same action
+        actions = {}
+        rbac_contexts = {}
+
+        results = [None] * len(bulk_api.data)
+        requests = []
+
+        for index, item in enumerate(bulk_api.data):
+            liveaction_api = LiveActionCreateAPI(**item)
+
+            try:
+                request = self._prepare_request(
+                    liveaction_api=liveaction_api,
+                    requester_user=requester_user,
+                    context=context,
+                    actions=actions,
+                    rbac_contexts=rbac_contexts,
+                )
+            except (
+                ValueError,
+                param_exc.ParamException,
+                rbac_exc.AccessDeniedError,
+            ) as e:
+                results[index] = {"error": six.text_type(e)}
+                continue
+            except jsonschema.ValidationError as e:
+                msg = getattr(e, "message", six.text_type(e))
+                results[index] = {"error": re.sub("u'([^']*)'", r"'\1'", msg)}
+                continue
+            except Exception as e:
+                LOG.exception("Failed to prepare execution request.")
+                results[index] = {"error": six.text_type(e)}
+                continue
+
+            requests.append((index, request))
+
+        created_requests = action_service.create_requests(
+            requests=[request for _, request in requests]
+        )
+
+        for (index, _), created_request in zip(requests, created_requests):
+            if isinstance(created_request, Exception):
+                results[index] = {"error": six.text_type(created_request)}
+                continue
+
+            liveaction_db, execution_db = created_request
+            action_service.publish_request(liveaction_db, execution_db)
+            results[index] = {"id": str(execution_db.id)}
+
+        return Response(json=results, status=http_client.OK)
+
+    def _prepare_request(
+        self, liveaction_api, requester_user, context, actions, rbac_contexts
+    ):
+        """
+        Validate a single execution request and return (liveaction, action, runner) tuple which
+        can be passed to the "create_requests" service function.
+        """
+        rbac_utils = get_rbac_backend().get_utils_class()
+
+        action_ref = liveaction_api.action
+        if action_ref not in actions:
+            action_db = action_utils.get_action_by_ref(action_ref)
+
+            if not action_db:
+                raise ValueError('Action "%s" cannot be found.' % (action_ref))
+
+            rbac_utils.assert_user_has_resource_db_permission(
+                user_db=requester_user,
+                resource_db=action_db,
+                permission_type=PermissionType.ACTION_EXECUTE,
+            )
+
+            runnertype_db = action_utils.get_runnertype_by_name(
+                action_db.runner_type["name"]
+            )
+            schema = util_schema.get_schema_for_action_parameters(
+                action_db, runnertype_db
+            )
+            actions[action_ref] = (action_db, runnertype_db, schema)
+
+        action_db, runnertype_db, schema = actions[action_ref]
+
+        # Validate that the authenticated user is admin if user attribute is provided
+        user = getattr(liveaction_api, "user", None) or requester_user.name
+        rbac_utils.assert_user_is_admin_if_user_query_param_is_provided(
+            user_db=requester_user, user=user
+        )
+
+        if not hasattr(liveaction_api, "context"):
+            liveaction_api.context = dict()
+
+        liveaction_api.context["user"] = user
+        liveaction_api.context["pack"] = action_db.pack
+        liveaction_api.context.update(copy.deepcopy(context))
+
+        if user not in rbac_contexts:
+            rbac_contexts[user] = self._get_rbac_context(user=user)
+
+        if rbac_contexts[user]:
+            liveaction_api.context["rbac"] = rbac_contexts[user]
+
+        liveaction_db = LiveActionAPI.to_model(liveaction_api)
+        liveaction_db.parameters = param_utils.render_live_params(
+            runnertype_db.runner_parameters,
+            action_db.parameters,
+            liveaction_db.parameters,
+            liveaction_db.context,
+        )
+
+        return action_service.prepare_request(
+            liveaction=liveaction_db,
+            action_db=action_db,
+            runnertype_db=runnertype_db,
+            schema=schema,
+        )
+
+
 class ActionExecutionsController(
     BaseResourceIsolationControllerMixin,
     ActionExecutionsControllerMixin,
@@ -697,6 +902,8 @@ class ActionExecutionsController(
     # ResourceController attributes
     query_options = {"sort": ["-start_timestamp", "action.ref"]}
     supported_filters = SUPPORTED_EXECUTIONS_FILTERS
+    cursor_field = "start_timestamp"
+    stream_list_responses = True
     filter_transform_functions = {
         "timestamp_gt": lambda value: isotime.parse(value=value),
         "timestamp_lt": lambda value: isotime.parse(value=value),
@@ -712,6 +919,8 @@ class ActionExecutionsController(
         show_secrets=False,
         include_attributes=None,
         advanced_filters=None,
+        cursor=None,
+        include_count=True,
         **raw_filters,
     ):
         """
@@ -747,6 +956,8 @@ class ActionExecutionsController(
             raw_filters=raw_filters,
             advanced_filters=advanced_filters,
             requester_user=requester_user,
+            cursor=cursor,
+            include_count=include_count,
         )
 
     def get_one(
@@ -1114,6 +1325,8 @@ class ActionExecutionsController(
         raw_filters=None,
         from_model_kwargs=None,
         requester_user=None,
+        cursor=None,
+        include_count=True,
     ):
         """
         :param exclude_fields: A list of object fields to exclude.
@@ -1143,10 +1356,13 @@ class ActionExecutionsController(
             raw_filters=raw_filters,
             advanced_filters=advanced_filters,
             requester_user=requester_user,
+            cursor=cursor,
+            include_count=include_count,
         )
 
 
 action_executions_controller = ActionExecutionsController()
+action_executions_bulk_controller = ActionExecutionsBulkController()
 action_execution_output_controller = ActionExecutionOutputController()
 action_execution_rerun_controller = ActionExecutionReRunController()
 action_execution_attribute_controller = ActionExecutionAttributeController()
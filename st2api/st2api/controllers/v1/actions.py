@@ -71,6 +71,7 @@ class ActionsController(resource.ContentPackResourceController):
 
     model = ActionAPI
     access = Action
+    revision_access = [Action]
     supported_filters = {"name": "name", "pack": "pack", "tags": "tags.name"}
 
     query_options = {"sort": ["pack", "name"]}
@@ -89,6 +90,7 @@ class ActionsController(resource.ContentPackResourceController):
         offset=0,
         limit=None,
         requester_user=None,
+        if_none_match=None,
         **raw_filters,
     ):
         return super(ActionsController, self)._get_all(
@@ -99,6 +101,7 @@ class ActionsController(resource.ContentPackResourceController):
             limit=limit,
             raw_filters=raw_filters,
             requester_user=requester_user,
+            if_none_match=if_none_match,
         )
 
     def get_one(self, ref_or_id, requester_user):
@@ -361,6 +361,7 @@ class PacksController(BasePacksController):
 
     model = PackAPI
     access = Pack
+    revision_access = [Pack]
     supported_filters = {"name": "name", "ref": "ref"}
 
     query_options = {"sort": ["ref"]}
@@ -384,6 +385,7 @@ class PacksController(BasePacksController):
         offset=0,
         limit=None,
         requester_user=None,
+        if_none_match=None,
         **raw_filters,
     ):
         return super(PacksController, self)._get_all(
@@ -394,6 +396,7 @@ class PacksController(BasePacksController):
             limit=limit,
             raw_filters=raw_filters,
             requester_user=requester_user,
+            if_none_match=if_none_match,
         )
 
     def get_one(self, ref_or_id, requester_user):
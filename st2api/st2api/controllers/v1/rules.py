@@ -29,6 +29,7 @@ from st2api.controllers.v1.rule_views import RuleViewController
 from st2common.models.api.rule import RuleAPI
 from st2common.models.db.auth import UserDB
 from st2common.persistence.rule import Rule
+from st2common.persistence.trigger import Trigger
 from st2common.rbac.types import PermissionType
 from st2common.rbac.backends import get_rbac_backend
 from st2common.router import exc
@@ -58,6 +59,8 @@ class RuleController(
 
     model = RuleAPI
     access = Rule
+    # NOTE: Rule API model includes data from the referenced trigger
+    revision_access = [Rule, Trigger]
     supported_filters = {
         "name": "name",
         "pack": "pack",
@@ -82,6 +85,7 @@ class RuleController(
         limit=None,
         show_secrets=False,
         requester_user=None,
+        if_none_match=None,
         **raw_filters,
     ):
         from_model_kwargs = {
@@ -99,6 +103,7 @@ class RuleController(
             limit=limit,
             raw_filters=raw_filters,
             requester_user=requester_user,
+            if_none_match=if_none_match,
         )
 
     def get_one(self, ref_or_id, requester_user, show_secrets=False):
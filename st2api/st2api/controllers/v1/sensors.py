@@ -35,6 +35,7 @@ LOG = logging.getLogger(__name__)
 class SensorTypeController(resource.ContentPackResourceController):
     model = SensorTypeAPI
     access = SensorType
+    revision_access = [SensorType]
     supported_filters = {
         "name": "name",
         "pack": "pack",
@@ -54,6 +55,7 @@ class SensorTypeController(resource.ContentPackResourceController):
         offset=0,
         limit=None,
         requester_user=None,
+        if_none_match=None,
         **raw_filters,
     ):
         return super(SensorTypeController, self)._get_all(
@@ -64,6 +66,7 @@ class SensorTypeController(resource.ContentPackResourceController):
             limit=limit,
             raw_filters=raw_filters,
             requester_user=requester_user,
+            if_none_match=if_none_match,
         )
 
     def get_one(self, ref_or_id, requester_user):
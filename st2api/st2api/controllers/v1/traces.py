@@ -32,6 +32,7 @@ class TracesController(ResourceController):
     }
 
     query_options = {"sort": ["-start_timestamp", "trace_tag"]}
+    stream_list_responses = True
 
     def get_all(
         self,
@@ -44,6 +44,7 @@ class TriggerTypeController(resource.ContentPackResourceController):
 
     model = TriggerTypeAPI
     access = TriggerType
+    revision_access = [TriggerType]
     supported_filters = {"name": "name", "pack": "pack"}
 
     options = {"sort": ["pack", "name"]}
@@ -58,6 +59,7 @@ class TriggerTypeController(resource.ContentPackResourceController):
         offset=0,
         limit=None,
         requester_user=None,
+        if_none_match=None,
         **raw_filters,
     ):
         return self._get_all(
@@ -68,6 +70,7 @@ class TriggerTypeController(resource.ContentPackResourceController):
             limit=limit,
             raw_filters=raw_filters,
             requester_user=requester_user,
+            if_none_match=if_none_match,
         )
 
     def get_one(self, triggertype_ref_or_id):
@@ -435,6 +438,7 @@ class TriggerInstanceController(
     }
 
     query_options = {"sort": ["-occurrence_time", "trigger"]}
+    stream_list_responses = True
 
     def __init__(self):
         super(TriggerInstanceController, self).__init__()
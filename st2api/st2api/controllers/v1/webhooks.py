@@ -15,6 +15,7 @@
 
 import six
 import uuid
+from oslo_config import cfg
 from six.moves.urllib import parse as urlparse  # pylint: disable=import-error
 from six.moves import http_client
 
@@ -24,6 +25,7 @@ from st2common.constants.auth import (
     HEADER_ATTRIBUTE_NAME,
 )
 from st2common.constants.triggers import WEBHOOK_TRIGGER_TYPES
+from st2common.exceptions.triggers import TriggerDispatchQueueFullError
 from st2common.models.api.trace import TraceContext
 from st2common.models.api.trigger import TriggerAPI
 from st2common.models.db.webhook import WebhookDB
@@ -32,6 +34,7 @@ from st2common.rbac.types import PermissionType
 from st2common.rbac.backends import get_rbac_backend
 from st2common.services.triggerwatcher import TriggerWatcher
 from st2common.services.trigger_dispatcher import TriggerDispatcherService
+from st2common.services.trigger_dispatcher import BatchingTriggerDispatcherService
 from st2common.router import abort
 from st2common.router import Response
 from st2common.util.jsonify import get_json_type_for_python_value
@@ -89,6 +92,8 @@ class WebhooksController(object):
         self._trigger_types = list(WEBHOOK_TRIGGER_TYPES.keys())
 
         self._trigger_dispatcher_service = TriggerDispatcherService(LOG)
+        # Created on first use when asynchronous dispatch is enabled
+        self._batching_trigger_dispatcher_service = None
         queue_suffix = self.__class__.__name__
         self._trigger_watcher = TriggerWatcher(
             create_handler=self._handle_create_trigger,
@@ -156,12 +161,7 @@ class WebhooksController(object):
                 msg = "Trigger not specified."
                 return abort(http_client.BAD_REQUEST, msg)
 
-            self._trigger_dispatcher_service.dispatch_with_context(
-                trigger=trigger,
-                payload=payload,
-                trace_context=trace_context,
-                throw_on_validation_error=True,
-            )
+            triggers = [trigger]
         else:
             if not self._is_valid_hook(hook):
                 self._log_request("Invalid hook.", headers, body)
@@ -175,22 +175,41 @@ class WebhooksController(object):
             payload["headers_lower"] = {k.lower(): v for k, v in headers.items()}
             payload["body"] = body
 
-            # Dispatch trigger instance for each of the trigger found
-            for trigger_dict in triggers:
-                # TODO: Instead of dispatching the whole dict we should just
-                # dispatch TriggerDB.ref or similar
-                self._trigger_dispatcher_service.dispatch_with_context(
-                    trigger=trigger_dict,
-                    payload=payload,
-                    trace_context=trace_context,
-                    throw_on_validation_error=True,
-                )
+        # Dispatch trigger instance for each of the trigger found
+        # TODO: Instead of dispatching the whole dict we should just
+        # dispatch TriggerDB.ref or similar
+        try:
+            self._get_trigger_dispatcher_service().dispatch_many_with_context(
+                triggers=triggers,
+                payload=payload,
+                trace_context=trace_context,
+                throw_on_validation_error=True,
+            )
+        except TriggerDispatchQueueFullError as e:
+            LOG.warning("Rejecting webhook request for hook %s: %s", hook, e)
+            return abort(http_client.SERVICE_UNAVAILABLE, six.text_type(e))
 
         # NOTE: For url encoded request bodies, values will be bytes instead of unicode and this
         # doesn't work with orjson so we first need to "cast" all the values from bytes to unicode
 
         return Response(json=body, status=http_client.ACCEPTED)
 
+    def _get_trigger_dispatcher_service(self):
+        if not cfg.CONF.api.webhook_async_dispatch:
+            return self._trigger_dispatcher_service
+
+        if not self._batching_trigger_dispatcher_service:
+            self._batching_trigger_dispatcher_service = (
+                BatchingTriggerDispatcherService(
+                    LOG,
+                    queue_size=cfg.CONF.api.webhook_dispatch_queue_size,
+                    batch_size=cfg.CONF.api.webhook_dispatch_batch_size,
+                    name="webhooks",
+                )
+            )
+
+        return self._batching_trigger_dispatcher_service
+
     def _is_valid_hook(self, hook):
         # TODO: Validate hook payload with payload_schema.
         return hook in self._hooks
@@ -32,6 +32,7 @@ from st2common.persistence.action import Action
 import st2common.validators.api.action as action_validator
 from st2common.constants.pack import SYSTEM_PACK_NAME
 from st2common.persistence.pack import Pack
+from st2api.controllers import resource
 from st2api.controllers.v1.actions import ActionsController
 from st2tests.fixtures.packs.dummy_pack_1.fixture import (
     PACK_NAME as DUMMY_PACK_1,
@@ -397,6 +398,68 @@ class ActionsControllerTestCase(
         self.__do_delete(action_1_id)
         self.__do_delete(action_2_id)
 
+    @mock.patch.object(
+        action_validator, "validate_action", mock.MagicMock(return_value=True)
+    )
+    def test_get_all_conditional_request(self):
+        action_1_id = self.__get_action_id(self.__do_post(ACTION_1))
+
+        resp = self.app.get("/v1/actions")
+        self.assertEqual(resp.status_int, 200)
+        etag = resp.headers["ETag"]
+
+        # 1. Nothing has changed
+        resp = self.app.get("/v1/actions", headers={"If-None-Match": etag})
+        self.assertEqual(resp.status_int, 304)
+        self.assertEqual(resp.headers["ETag"], etag)
+        self.assertEqual(resp.body, b"")
+
+        # 2. Different query parameters result in a different ETag
+        resp = self.app.get("/v1/actions?limit=1", headers={"If-None-Match": etag})
+        self.assertEqual(resp.status_int, 200)
+        self.assertNotEqual(resp.headers["ETag"], etag)
+
+        # 3. Collection has changed
+        action_2_id = self.__get_action_id(self.__do_post(ACTION_2))
+
+        resp = self.app.get("/v1/actions", headers={"If-None-Match": etag})
+        self.assertEqual(resp.status_int, 200)
+        self.assertEqual(len(resp.json), 2)
+        self.assertNotEqual(resp.headers["ETag"], etag)
+
+        self.__do_delete(action_1_id)
+        self.__do_delete(action_2_id)
+
+    @mock.patch.object(
+        action_validator, "validate_action", mock.MagicMock(return_value=True)
+    )
+    def test_get_all_list_response_cache(self):
+        resource.enable_list_response_cache(size=10)
+        self.addCleanup(resource.disable_list_response_cache)
+
+        action_1_id = self.__get_action_id(self.__do_post(ACTION_1))
+
+        resp_1 = self.app.get("/v1/actions")
+        self.assertEqual(len(resp_1.json), 1)
+
+        with mock.patch.object(Action, "query") as mock_query:
+            resp_2 = self.app.get("/v1/actions")
+            self.assertFalse(mock_query.called)
+
+        self.assertEqual(resp_2.body, resp_1.body)
+        self.assertEqual(resp_2.headers["ETag"], resp_1.headers["ETag"])
+        self.assertEqual(resp_2.headers["X-Total-Count"], "1")
+
+        # Cached response is not used once the collection changes
+        action_2_id = self.__get_action_id(self.__do_post(ACTION_2))
+
+        resp_3 = self.app.get("/v1/actions")
+        self.assertEqual(len(resp_3.json), 2)
+        self.assertNotEqual(resp_3.headers["ETag"], resp_1.headers["ETag"])
+
+        self.__do_delete(action_1_id)
+        self.__do_delete(action_2_id)
+
     @mock.patch(
         "st2common.rbac.backends.noop.NoOpRBACUtils.user_is_admin",
         mock.Mock(return_value=False),
@@ -678,6 +678,86 @@ class ActionExecutionControllerTestCase(
         self.assertEqual(resp.status_int, 200)
         self.assertTrue(len(resp.json), 0)
 
+    def test_get_query_with_cursor(self):
+        execution_ids = []
+        for _ in range(5):
+            execution_ids.append(
+                self._get_actionexecution_id(self._do_post(LIVE_ACTION_1))
+            )
+
+        # 1. Executions are returned using the same order as when using offset pagination
+        resp = self.app.get("/v1/executions?limit=-1")
+        self.assertEqual(resp.status_int, 200)
+        expected_ids = [execution["id"] for execution in resp.json]
+        self.assertCountEqual(expected_ids, execution_ids)
+
+        resp = self.app.get("/v1/executions?limit=2&cursor=*&include_count=false")
+        self.assertEqual(resp.status_int, 200)
+        self.assertEqual(len(resp.json), 2)
+        self.assertNotIn("X-Total-Count", resp.headers)
+        self.assertIn("X-Next-Cursor", resp.headers)
+        self.assertIn(
+            "cursor=%s" % (resp.headers["X-Next-Cursor"]), resp.headers["Link"]
+        )
+        self.assertIn('rel="next"', resp.headers["Link"])
+
+        actual_ids = [execution["id"] for execution in resp.json]
+        while "X-Next-Cursor" in resp.headers:
+            resp = self.app.get(
+                "/v1/executions?limit=2&cursor=%s" % (resp.headers["X-Next-Cursor"])
+            )
+            self.assertEqual(resp.status_int, 200)
+            self.assertEqual(resp.headers["X-Total-Count"], "5")
+            actual_ids.extend([execution["id"] for execution in resp.json])
+
+        self.assertEqual(actual_ids, expected_ids)
+
+        # 2. Cursor can't be combined with offset
+        resp = self.app.get(
+            "/v1/executions?limit=2&offset=2&cursor=*", expect_errors=True
+        )
+        self.assertEqual(resp.status_int, 400)
+        self.assertIn("are mutually exclusive", resp.json["faultstring"])
+
+        # 3. Invalid cursor
+        resp = self.app.get("/v1/executions?limit=2&cursor=invalid", expect_errors=True)
+        self.assertEqual(resp.status_int, 400)
+        self.assertEqual(resp.json["faultstring"], 'Invalid cursor "invalid" specified')
+
+        # 4. Unsupported sort field
+        resp = self.app.get(
+            "/v1/executions?limit=2&cursor=*&sort=status", expect_errors=True
+        )
+        self.assertEqual(resp.status_int, 400)
+        self.assertEqual(
+            resp.json["faultstring"],
+            'Cursor pagination is only supported when sorting by "start_timestamp"',
+        )
+
+    @mock.patch.object(ActionExecutionsController, "stream_batch_size", 2)
+    def test_get_all_streamed_in_batches(self):
+        for _ in range(5):
+            self._get_actionexecution_id(self._do_post(LIVE_ACTION_1))
+
+        resp = self.app.get("/v1/executions?limit=-1")
+        self.assertEqual(resp.status_int, 200)
+        self.assertEqual(resp.headers["X-Total-Count"], "5")
+        self.assertEqual(len(resp.json), 5)
+        self.assertEqual(len(set([execution["id"] for execution in resp.json])), 5)
+
+        # Attributes are filtered while the response is being streamed
+        resp = self.app.get("/v1/executions?limit=-1&exclude_attributes=result")
+        self.assertEqual(resp.status_int, 200)
+        self.assertEqual(len(resp.json), 5)
+        for execution in resp.json:
+            self.assertIn("status", execution)
+            self.assertNotIn("result", execution)
+
+        resp = self.app.get("/v1/executions?limit=-1&include_attributes=status")
+        self.assertEqual(resp.status_int, 200)
+        for execution in resp.json:
+            self.assertEqual(sorted(execution.keys()), ["id", "status"])
+
     def test_get_one_fail(self):
         resp = self.app.get("/v1/executions/100", expect_errors=True)
         self.assertEqual(resp.status_int, 404)
@@ -830,6 +910,96 @@ class ActionExecutionControllerTestCase(
         self.assertEqual(resp.status_int, 400)
         self.assertIn("Unable to convert st2-context", resp.json["faultstring"])
 
+    def test_post_bulk(self):
+        invalid_live_action = copy.deepcopy(LIVE_ACTION_1)
+        invalid_live_action["parameters"] = {}
+
+        nonexistent_live_action = copy.deepcopy(LIVE_ACTION_1)
+        nonexistent_live_action["action"] = "mock.foobar"
+
+        live_actions = [
+            copy.deepcopy(LIVE_ACTION_1),
+            invalid_live_action,
+            copy.deepcopy(LIVE_ACTION_2),
+            nonexistent_live_action,
+            copy.deepcopy(LIVE_ACTION_1),
+        ]
+        headers = {"st2-context": json.dumps({"other": {"k1": "v1"}})}
+        resp = self.app.post_json("/v1/executions/bulk", live_actions, headers=headers)
+        self.assertEqual(resp.status_int, 200)
+        self.assertEqual(len(resp.json), 5)
+
+        self.assertEqual(resp.json[1], {"error": "'hosts' is a required property"})
+        self.assertEqual(
+            resp.json[3], {"error": 'Action "mock.foobar" cannot be found.'}
+        )
+
+        for index in [0, 2, 4]:
+            execution_id = resp.json[index]["id"]
+            get_resp = self._do_get_one(execution_id)
+            self.assertEqual(get_resp.status_int, 200)
+            self.assertEqual(get_resp.json["status"], "requested")
+            self.assertEqual(
+                get_resp.json["action"]["ref"], live_actions[index]["action"]
+            )
+            self.assertEqual(get_resp.json["context"]["other"], {"k1": "v1"})
+
+            execution_db = ActionExecution.get_by_id(execution_id)
+            liveaction_db = LiveAction.get_by_id(execution_db.liveaction["id"])
+            self.assertEqual(liveaction_db.status, "requested")
+
+            trace_db = trace_service.get_trace_db_by_action_execution(
+                action_execution_id=execution_id
+            )
+            self.assertEqual(trace_db.trace_tag, "execution-%s" % (liveaction_db.id))
+
+    def test_post_bulk_per_request_errors(self):
+        # 1. Trace which doesn't exist
+        live_action_with_trace = copy.deepcopy(LIVE_ACTION_1)
+        live_action_with_trace["context"] = {
+            "trace_context": {"id_": "5e1d5d5d5d5d5d5d5d5d5d5d"}
+        }
+
+        live_actions = [live_action_with_trace, copy.deepcopy(LIVE_ACTION_1)]
+        resp = self.app.post_json("/v1/executions/bulk", live_actions)
+        self.assertEqual(resp.status_int, 200)
+
+        self.assertIn("error", resp.json[0])
+        execution_id = resp.json[1]["id"]
+        execution_db = ActionExecution.get_by_id(execution_id)
+        self.assertEqual(execution_db.status, "requested")
+
+        # 2. Unexpected error (e.g. runner type which doesn't exist)
+        with mock.patch.object(
+            action_db_util,
+            "get_runnertype_by_name",
+            mock.MagicMock(side_effect=Exception("Runner type not found")),
+        ):
+            resp = self.app.post_json(
+                "/v1/executions/bulk", [copy.deepcopy(LIVE_ACTION_1)]
+            )
+
+        self.assertEqual(resp.status_int, 200)
+        self.assertEqual(resp.json, [{"error": "Runner type not found"}])
+
+    def test_post_bulk_too_many_requests(self):
+        cfg.CONF.set_override(
+            name="max_bulk_execution_requests", override=1, group="api"
+        )
+        self.addCleanup(
+            cfg.CONF.clear_override, name="max_bulk_execution_requests", group="api"
+        )
+
+        live_actions = [copy.deepcopy(LIVE_ACTION_1), copy.deepcopy(LIVE_ACTION_1)]
+        resp = self.app.post_json(
+            "/v1/executions/bulk", live_actions, expect_errors=True
+        )
+        self.assertEqual(resp.status_int, 400)
+        self.assertEqual(
+            resp.json["faultstring"],
+            'Number of execution requests "2" exceeds the maximum of "1".',
+        )
+
     def test_re_run_success(self):
         # Create a new execution
         post_resp = self._do_post(LIVE_ACTION_1)
@@ -1699,6 +1869,51 @@ class ActionExecutionControllerTestCase(
         )
         self.assertEqual(get_resp.body, expected_result)
 
+    def test_get_raw_result_path(self):
+        post_resp = self._do_post(LIVE_ACTION_1)
+        execution_id = self._get_actionexecution_id(post_resp)
+
+        result = {
+            "stdout": "foobar",
+            "result": {"items": [{"id": "a", "tags": ["x/y"]}, {"id": "b"}]},
+        }
+        put_resp = self._do_put(execution_id, {"status": "succeeded", "result": result})
+        self.assertEqual(put_resp.status_int, 200)
+
+        url = "/v1/executions/%s/result?path=%s"
+
+        # 1. JSONPath expressions
+        get_resp = self.app.get(url % (execution_id, "stdout"))
+        self.assertEqual(get_resp.headers["Content-Type"], "text/json")
+        self.assertEqual(get_resp.body, b'"foobar"')
+
+        get_resp = self.app.get(url % (execution_id, "result.items[1].id"))
+        self.assertEqual(get_resp.body, b'"b"')
+
+        get_resp = self.app.get(url % (execution_id, "result.items[*].id"))
+        self.assertEqual(get_resp.body, b'["a","b"]')
+
+        # 2. JSON pointers
+        get_resp = self.app.get(url % (execution_id, "/result/items/0"))
+        self.assertEqual(get_resp.body, b'{"id":"a","tags":["x/y"]}')
+
+        get_resp = self.app.get(
+            url % (execution_id, "/result/items/0") + "&pretty_format=1"
+        )
+        self.assertEqual(get_resp.json, {"id": "a", "tags": ["x/y"]})
+        self.assertIn(b"\n", get_resp.body)
+
+        # 3. Path which doesn't exist
+        for path in ["stderr", "result.items[5].id", "/result/items/5"]:
+            get_resp = self.app.get(url % (execution_id, path), expect_errors=True)
+            self.assertEqual(get_resp.status_int, 404)
+            self.assertIn('Path "%s" not found' % (path), get_resp.json["faultstring"])
+
+        # 4. Invalid JSONPath expression
+        get_resp = self.app.get(url % (execution_id, "result["), expect_errors=True)
+        self.assertEqual(get_resp.status_int, 400)
+        self.assertIn("Invalid JSONPath expression", get_resp.json["faultstring"])
+
     def test_get_include_attributes_overlapping_values(self):
         resp = self.app.get(
             "/v1/actionexecutions?include_attributes=context,context.user,action"
@@ -22,12 +22,15 @@ from oslo_config import cfg
 import st2common.services.triggers as trigger_service
 
 with mock.patch.object(trigger_service, "create_trigger_type_db", mock.MagicMock()):
+    from st2api.controllers.v1 import webhooks as webhooks_controllers
     from st2api.controllers.v1.webhooks import WebhooksController, HooksHolder
 
 from st2common.constants.triggers import WEBHOOK_TRIGGER_TYPES
 from st2common.models.api.trigger import TriggerAPI
 from st2common.models.db.trigger import TriggerDB
 from st2common.models.db.trigger import TriggerTypeDB
+from st2common.services import trigger_dispatcher
+from st2common.services.trigger_dispatcher import BatchingTriggerDispatcherService
 from st2common.transport.reactor import TriggerInstancePublisher
 
 from st2tests.api import FunctionalTest
@@ -193,6 +196,71 @@ class TestWebhooksController(FunctionalTest):
         self.assertEqual(post_resp.status_int, http_client.ACCEPTED)
         self.assertEqual(dispatch_mock.call_args[1]["trace_context"].trace_tag, "tag1")
 
+    @mock.patch.object(
+        TriggerInstancePublisher, "publish_trigger", mock.MagicMock(return_value=True)
+    )
+    @mock.patch(
+        "st2common.services.triggers.get_trigger_type_db",
+        mock.MagicMock(return_value=DUMMY_TRIGGER_TYPE_DB),
+    )
+    @mock.patch("st2common.transport.reactor.TriggerDispatcher.dispatch_many")
+    def test_st2_webhook_async_dispatch(self, dispatch_many_mock):
+        cfg.CONF.set_override(name="webhook_async_dispatch", group="api", override=True)
+        self.addCleanup(self._reset_async_dispatch)
+
+        post_resp = self.__do_post("st2", ST2_WEBHOOK)
+        self.assertEqual(post_resp.status_int, http_client.ACCEPTED)
+
+        # Trigger is published in the background
+        controller = webhooks_controllers.webhooks_controller
+        controller._batching_trigger_dispatcher_service.join()
+        self.assertEqual(dispatch_many_mock.call_count, 1)
+
+        batch = dispatch_many_mock.call_args[0][0]
+        self.assertEqual(len(batch), 1)
+        self.assertEqual(batch[0][0], "git.pr-merged")
+        self.assertEqual(batch[0][1], ST2_WEBHOOK["payload"])
+
+        # Payload is still validated before the request is accepted
+        data = {"trigger": "git.pr-merged", "payload": "invalid"}
+        post_resp = self.__do_post("st2", data, expect_errors=True)
+        self.assertEqual(post_resp.status_int, http_client.BAD_REQUEST)
+        self.assertIn(
+            "Trigger payload validation failed", post_resp.json["faultstring"]
+        )
+
+    @mock.patch.object(
+        TriggerInstancePublisher, "publish_trigger", mock.MagicMock(return_value=True)
+    )
+    @mock.patch(
+        "st2common.services.triggers.get_trigger_type_db",
+        mock.MagicMock(return_value=DUMMY_TRIGGER_TYPE_DB),
+    )
+    @mock.patch.object(
+        BatchingTriggerDispatcherService, "_publish_batches", mock.MagicMock()
+    )
+    @mock.patch("st2common.transport.reactor.TriggerDispatcher.dispatch_many")
+    def test_st2_webhook_async_dispatch_queue_full(self, dispatch_many_mock):
+        cfg.CONF.set_override(name="webhook_async_dispatch", group="api", override=True)
+        cfg.CONF.set_override(
+            name="webhook_dispatch_queue_size", group="api", override=1
+        )
+        self.addCleanup(self._reset_async_dispatch)
+
+        # Publisher thread is not running so the buffer is never drained
+        post_resp = self.__do_post("st2", ST2_WEBHOOK)
+        self.assertEqual(post_resp.status_int, http_client.ACCEPTED)
+
+        post_resp = self.__do_post("st2", ST2_WEBHOOK, expect_errors=True)
+        self.assertEqual(post_resp.status_int, http_client.SERVICE_UNAVAILABLE)
+        self.assertIn("Trigger dispatch queue is full", post_resp.json["faultstring"])
+        self.assertFalse(dispatch_many_mock.called)
+
+        # Buffered triggers are published on shutdown
+        trigger_dispatcher.shutdown_batching_trigger_dispatchers()
+        self.assertEqual(dispatch_many_mock.call_count, 1)
+        self.assertEqual(len(dispatch_many_mock.call_args[0][0]), 1)
+
     @mock.patch.object(
         TriggerInstancePublisher, "publish_trigger", mock.MagicMock(return_value=True)
     )
@@ -411,6 +479,15 @@ class TestWebhooksController(FunctionalTest):
             "customvalue",
         )
 
+    def _reset_async_dispatch(self):
+        cfg.CONF.clear_override(name="webhook_async_dispatch", group="api")
+        cfg.CONF.clear_override(name="webhook_dispatch_queue_size", group="api")
+
+        controller = webhooks_controllers.webhooks_controller
+        if controller._batching_trigger_dispatcher_service:
+            controller._batching_trigger_dispatcher_service.shutdown()
+            controller._batching_trigger_dispatcher_service = None
+
     def __do_post(self, hook, webhook, expect_errors=False, headers=None):
         return self.app.post_json(
             "/v1/webhooks/" + hook,
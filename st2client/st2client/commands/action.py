@@ -1304,6 +1304,14 @@ class ActionRunCommand(ActionRunCommandMixin, resource.ResourceCommand):
                 default=None,
                 help="User under which to run the action (admins only).",
             )
+            self.parser.add_argument(
+                "--bulk-file",
+                dest="bulk_file",
+                default=None,
+                help="Path to a JSON or YAML file with a list of parameter objects. An "
+                "execution is requested for each of the objects using a single API request. "
+                "Parameters specified on the command line are used for all the executions.",
+            )
 
         if self.name == "run":
             self.parser.set_defaults(action_async=False)
@@ -1351,6 +1359,16 @@ class ActionRunCommand(ActionRunCommandMixin, resource.ResourceCommand):
 
         action_exec_mgr = self.app.client.managers["Execution"]
 
+        if getattr(args, "bulk_file", None):
+            executions = []
+
+            for parameters in self._get_bulk_parameters(args.bulk_file):
+                bulk_execution = copy.deepcopy(execution)
+                bulk_execution.parameters = dict(action_parameters, **parameters)
+                executions.append(bulk_execution)
+
+            return action_exec_mgr.create_bulk(executions, **kwargs)
+
         execution = action_exec_mgr.create(execution, **kwargs)
         execution = self._get_execution_result(
             execution=execution, action_exec_mgr=action_exec_mgr, args=args, **kwargs
@@ -1358,6 +1376,40 @@ class ActionRunCommand(ActionRunCommandMixin, resource.ResourceCommand):
 
         return execution
 
+    @add_auth_token_to_kwargs_from_cli
+    def run_and_print(self, args, **kwargs):
+        if not getattr(args, "bulk_file", None):
+            return super(ActionRunCommand, self).run_and_print(args, **kwargs)
+
+        if self._print_help(args, **kwargs):
+            return
+
+        results = self.run(args, **kwargs)
+        executions = [Execution(**result) for result in results]
+        self.print_output(
+            executions,
+            table.MultiColumnTable,
+            attributes=["id", "error"],
+            json=args.json,
+            yaml=args.yaml,
+        )
+
+        if any(getattr(execution, "error", None) for execution in executions):
+            # Exit with non zero if any of the executions has not been requested
+            sys.exit(1)
+
+    def _get_bulk_parameters(self, file_path):
+        data = resource.load_meta_file(os.path.abspath(os.path.expanduser(file_path)))
+
+        if not isinstance(data, list) or not all(
+            isinstance(item, dict) for item in data
+        ):
+            raise ValueError(
+                'File "%s" needs to contain a list of parameter objects.' % (file_path)
+            )
+
+        return data
+
 
 class ActionExecutionBranch(resource.ResourceBranch):
     def __init__(self, description, app, subparsers, parent_parser=None):
@@ -1501,6 +1553,18 @@ class ActionExecutionListCommand(ResourceViewCommand):
             ),
         )
         self.parser.add_argument("-l", "--showall", action="store_true", help="")
+        self.parser.add_argument(
+            "--cursor",
+            type=str,
+            dest="cursor",
+            default=None,
+            help=(
+                "Use cursor pagination and return the page which follows the provided "
+                'cursor. Use "*" for the first page. This is considerably faster than '
+                "paging through a large number of %s using the offset."
+                % self.resource_name
+            ),
+        )
 
         # Display options
         self.parser.add_argument(
@@ -1552,11 +1616,23 @@ class ActionExecutionListCommand(ResourceViewCommand):
         if include_attributes:
             kwargs["include_attributes"] = ",".join(include_attributes)
 
+        if args.cursor:
+            # Total count is expensive to calculate on large collections and not needed here
+            return self.manager.query_with_cursor(
+                limit=args.last, cursor=args.cursor, include_count=False, **kwargs
+            )
+
         return self.manager.query_with_count(limit=args.last, **kwargs)
 
     def run_and_print(self, args, **kwargs):
 
-        result, count = self.run(args, **kwargs)
+        if args.cursor:
+            result, next_cursor = self.run(args, **kwargs)
+            count = None
+        else:
+            result, count = self.run(args, **kwargs)
+            next_cursor = None
+
         instances = format_wf_instances(result)
 
         if args.json or args.yaml:
@@ -1584,6 +1660,12 @@ class ActionExecutionListCommand(ResourceViewCommand):
             if args.last and count and count > args.last:
                 table.SingleRowTable.note_box(self.resource_name, args.last)
 
+            if next_cursor:
+                table.SingleRowTable.message_box(
+                    'Note: Use --cursor "%s" flag to display the next page.'
+                    % (next_cursor)
+                )
+
 
 class ActionExecutionGetCommand(ActionRunCommandMixin, ResourceViewCommand):
     display_attributes = [
@@ -297,6 +297,11 @@ class SingleRowTable(object):
                 "Note: Only first %s %s are displayed. Use -n/--last flag for more results."
                 % (limit, entity)
             )
+
+        SingleRowTable.message_box(message)
+
+    @staticmethod
+    def message_box(message):
         # adding default padding
         message_length = len(message) + 3
         m = MultiColumnTable()
@@ -353,6 +353,24 @@ class ResourceManager(object):
         else:
             return (instances, None)
 
+    @add_auth_token_to_kwargs_from_env
+    def query_with_cursor(self, cursor="*", **kwargs):
+        """
+        Retrieve a single page of the results using cursor (keyset) pagination.
+
+        :param cursor: Cursor returned by the previous call or "*" for the first page.
+        :type cursor: ``str``
+
+        :return: (instances, next_cursor) tuple. next_cursor is None when there are no more
+                 results.
+        :rtype: ``tuple``
+        """
+        instances, response = self._query_details(cursor=cursor, **kwargs)
+        if response and "X-Next-Cursor" in response.headers:
+            return (instances, response.headers["X-Next-Cursor"])
+        else:
+            return (instances, None)
+
     @add_auth_token_to_kwargs_from_env
     def get_by_name(self, name, **kwargs):
         instances = self.query(name=name, **kwargs)
@@ -534,6 +552,24 @@ class ExecutionResourceManager(ResourceManager):
         instance = self.resource.deserialize(parse_api_response(response))
         return instance
 
+    @add_auth_token_to_kwargs_from_env
+    def create_bulk(self, instances, **kwargs):
+        """
+        Request multiple executions using a single API request.
+
+        :return: A list with the id of the created execution or an error for each of the
+                 provided executions.
+        :rtype: ``list`` of ``dict``
+        """
+        url = "/%s/bulk" % (self.resource.get_url_path_name())
+        data = [instance.serialize() for instance in instances]
+
+        response = self.client.post(url, data, **kwargs)
+        if response.status_code != http_client.OK:
+            self.handle_error(response)
+
+        return parse_api_response(response)
+
     @add_auth_token_to_kwargs_from_env
     def get_output(self, execution_id, output_type=None, **kwargs):
         url = "/%s/%s/output" % (self.resource.get_url_path_name(), execution_id)
@@ -548,9 +584,12 @@ class ExecutionResourceManager(ResourceManager):
         return response.text
 
     @add_auth_token_to_kwargs_from_env
-    def get_result(self, execution_id, **kwargs):
+    def get_result(self, execution_id, path=None, **kwargs):
         url = "/%s/%s/result" % (self.resource.get_url_path_name(), execution_id)
 
+        if path:
+            url += "?" + urllib.parse.urlencode({"path": path})
+
         response = self.client.get(url, **kwargs)
         if response.status_code != http_client.OK:
             self.handle_error(response)
@@ -14,9 +14,11 @@
 # limitations under the License.
 
 from __future__ import absolute_import
+import os
 import json
 import mock
 import logging
+import tempfile
 
 from tests import base
 
@@ -103,6 +105,47 @@ class ActionCommandTestCase(base.BaseCLITestCase):
         super(ActionCommandTestCase, self).__init__(*args, **kwargs)
         self.shell = shell.Shell()
 
+    @mock.patch.object(
+        models.ResourceManager,
+        "get_by_ref_or_id",
+        mock.MagicMock(side_effect=get_by_ref),
+    )
+    @mock.patch.object(
+        models.ResourceManager, "get_by_name", mock.MagicMock(side_effect=get_by_name)
+    )
+    @mock.patch.object(
+        httpclient.HTTPClient,
+        "post",
+        mock.MagicMock(
+            return_value=base.FakeResponse(
+                json.dumps([{"id": "123"}, {"error": "invalid"}]), 200, "OK"
+            )
+        ),
+    )
+    def test_run_bulk(self):
+        fd, path = tempfile.mkstemp(suffix=".json")
+        self.addCleanup(os.remove, path)
+
+        with os.fdopen(fd, "w") as fp:
+            json.dump([{"int": 1}, {"int": 2, "str": "b"}], fp)
+
+        ret = self.shell.run(["run", "mockety.mock1", "str=a", "--bulk-file", path])
+        self.assertEqual(ret, 1)
+
+        expected = [
+            {
+                "action": "mockety.mock1",
+                "user": None,
+                "parameters": {"str": "a", "int": 1},
+            },
+            {
+                "action": "mockety.mock1",
+                "user": None,
+                "parameters": {"str": "b", "int": 2},
+            },
+        ]
+        httpclient.HTTPClient.post.assert_called_with("/executions/bulk", expected)
+
     @mock.patch.object(
         models.ResourceManager,
         "get_by_ref_or_id",
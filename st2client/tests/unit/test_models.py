@@ -147,6 +147,26 @@ class TestResourceManager(unittest.TestCase):
         self.assertEqual(actual, expected)
         self.assertEqual(count, 50)
 
+    @mock.patch.object(
+        httpclient.HTTPClient,
+        "get",
+        mock.MagicMock(
+            return_value=base.FakeResponse(
+                json.dumps([base.RESOURCES[0]]), 200, "OK", {"X-Next-Cursor": "abc"}
+            )
+        ),
+    )
+    def test_resource_query_with_cursor(self):
+        mgr = models.ResourceManager(base.FakeResource, base.FAKE_ENDPOINT)
+        resources, next_cursor = mgr.query_with_cursor(name="abc", limit=1)
+        actual = [resource.serialize() for resource in resources]
+        expected = json.loads(json.dumps([base.RESOURCES[0]]))
+        self.assertEqual(actual, expected)
+        self.assertEqual(next_cursor, "abc")
+
+        url = httpclient.HTTPClient.get.call_args[0][0]
+        self.assertIn("cursor=%2A", url)
+
     @mock.patch.object(
         httpclient.HTTPClient,
         "get",
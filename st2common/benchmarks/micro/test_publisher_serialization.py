@@ -0,0 +1,102 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Micro benchmark which compares payload size and encode / decode time of pickle and JSON message
+bus serializers for execution objects with results of different sizes.
+"""
+
+from st2common.util.monkey_patch import monkey_patch
+
+monkey_patch()
+
+import os
+import json
+
+import pytest
+from bson.objectid import ObjectId
+from kombu.serialization import dumps
+from kombu.serialization import loads
+from kombu.serialization import prepare_accept_content
+
+from st2common.models.db.liveaction import LiveActionDB
+from st2common.transport import serializers
+
+from common import FIXTURES_DIR
+from common import PYTEST_FIXTURE_FILE_PARAM_DECORATOR
+
+SERIALIZERS = {
+    "pickle": "pickle",
+    "json": serializers.JSON_SERIALIZER,
+}
+
+ACCEPT_CONTENT = prepare_accept_content(serializers.ACCEPT_CONTENT)
+
+
+def get_live_action_db(fixture_file):
+    with open(os.path.join(FIXTURES_DIR, fixture_file), "r") as fp:
+        content = fp.read()
+
+    live_action_db = LiveActionDB()
+    live_action_db.id = ObjectId()
+    live_action_db.status = "succeeded"
+    live_action_db.action = "core.local"
+    live_action_db.parameters = {"cmd": "cat data.json"}
+    live_action_db.context = {"user": "stanley"}
+    live_action_db.result = json.loads(content)
+    return live_action_db
+
+
+@PYTEST_FIXTURE_FILE_PARAM_DECORATOR
+@pytest.mark.parametrize(
+    "serializer",
+    ["pickle", "json"],
+    ids=[
+        "pickle",
+        "json",
+    ],
+)
+@pytest.mark.benchmark(group="message_encode")
+def test_message_encode(benchmark, fixture_file: str, serializer: str) -> None:
+    live_action_db = get_live_action_db(fixture_file=fixture_file)
+
+    def run_benchmark():
+        return dumps(live_action_db, serializer=SERIALIZERS[serializer])
+
+    _, _, data = benchmark(run_benchmark)
+    benchmark.extra_info["payload_size"] = len(data)
+
+
+@PYTEST_FIXTURE_FILE_PARAM_DECORATOR
+@pytest.mark.parametrize(
+    "serializer",
+    ["pickle", "json"],
+    ids=[
+        "pickle",
+        "json",
+    ],
+)
+@pytest.mark.benchmark(group="message_decode")
+def test_message_decode(benchmark, fixture_file: str, serializer: str) -> None:
+    live_action_db = get_live_action_db(fixture_file=fixture_file)
+    content_type, content_encoding, data = dumps(
+        live_action_db, serializer=SERIALIZERS[serializer]
+    )
+
+    def run_benchmark():
+        return loads(data, content_type, content_encoding, accept=ACCEPT_CONTENT)
+
+    result = benchmark(run_benchmark)
+    assert result.id == live_action_db.id
+    assert result.result == live_action_db.result
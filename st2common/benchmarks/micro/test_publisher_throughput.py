@@ -0,0 +1,88 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Micro benchmark which measures PoolPublisher throughput (messages per second) with and without
+long lived publisher channels and publisher confirms.
+
+NOTE: This benchmark requires a running RabbitMQ server.
+"""
+
+from st2common.util.monkey_patch import monkey_patch
+
+monkey_patch()
+
+import time
+
+import pytest
+from oslo_config import cfg
+
+from st2common.models.db.liveaction import LiveActionDB
+from st2common.transport import publishers
+from st2common.transport.kombu import Exchange
+from st2tests import config as tests_config
+
+tests_config.parse_args()
+
+MESSAGES_COUNT = 1000
+
+
+@pytest.mark.parametrize(
+    "mode",
+    [
+        "default",
+        "channel_reuse",
+        "channel_reuse_confirms",
+    ],
+    ids=[
+        "default",
+        "channel_reuse",
+        "channel_reuse_confirms",
+    ],
+)
+@pytest.mark.benchmark(group="publish_throughput")
+def test_publish_throughput(benchmark, mode: str) -> None:
+    cfg.CONF.set_override(
+        name="publisher_channel_reuse",
+        group="messaging",
+        override=mode in ["channel_reuse", "channel_reuse_confirms"],
+    )
+    cfg.CONF.set_override(
+        name="publisher_confirms",
+        group="messaging",
+        override=mode == "channel_reuse_confirms",
+    )
+
+    publisher = publishers.PoolPublisher()
+    exchange = Exchange("st2.execution.test", type="topic")
+
+    live_action_db = LiveActionDB()
+    live_action_db.status = "running"
+    live_action_db.action = "core.local"
+    live_action_db.result = {"stdout": "line\n"}
+
+    def run_benchmark():
+        start_ts = time.time()
+
+        for index in range(0, MESSAGES_COUNT):
+            publisher.publish(
+                payload=live_action_db, exchange=exchange, routing_key="update"
+            )
+
+        return MESSAGES_COUNT / (time.time() - start_ts)
+
+    messages_per_second = benchmark.pedantic(run_benchmark, iterations=1, rounds=5)
+    benchmark.extra_info["messages_per_second"] = round(messages_per_second, 2)
+
+    assert messages_per_second > 0
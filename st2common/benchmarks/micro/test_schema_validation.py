@@ -0,0 +1,114 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Micro benchmark which measures action parameters validation throughput with and without compiled
+validator caching.
+"""
+
+from st2common.util.monkey_patch import monkey_patch
+
+monkey_patch()
+
+import os
+
+import pytest
+import jsonschema
+import yaml
+
+from st2common.util import schema as util_schema
+from st2common.util.deep_copy import fast_deepcopy_dict
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RUNNER_METADATA_PATH = os.path.abspath(
+    os.path.join(
+        BASE_DIR, "../../../contrib/runners/local_runner/local_runner/runner.yaml"
+    )
+)
+
+
+def get_action_parameters_schema(parameters_count):
+    with open(RUNNER_METADATA_PATH, "r") as fp:
+        runner_parameters = yaml.safe_load(fp)[0]["runner_parameters"]
+
+    properties = fast_deepcopy_dict(runner_parameters)
+
+    for index in range(0, parameters_count):
+        properties["param_%s" % (index)] = {
+            "description": "Parameter %s" % (index),
+            "type": "string",
+            "default": "value_%s" % (index),
+        }
+
+    schema = {
+        "type": "object",
+        "properties": properties,
+        "additionalProperties": False,
+    }
+    return schema
+
+
+@pytest.mark.parametrize(
+    "implementation",
+    ["jsonschema_validate", "st2_validate"],
+    ids=[
+        "jsonschema_validate",
+        "st2_validate",
+    ],
+)
+@pytest.mark.parametrize(
+    "parameters_count",
+    [0, 10, 100],
+    ids=[
+        "0_parameters",
+        "10_parameters",
+        "100_parameters",
+    ],
+)
+@pytest.mark.benchmark(group="schema_validation")
+def test_validate_action_parameters(benchmark, parameters_count, implementation):
+    schema = get_action_parameters_schema(parameters_count=parameters_count)
+    validator = util_schema.get_validator()
+    instance = {"cmd": "echo 1", "timeout": 100}
+
+    def run_benchmark():
+        if implementation == "jsonschema_validate":
+            # Equivalent of what validate() used to do before compiled validators were cached
+            modified_schema = util_schema.modify_schema_allow_default_none(
+                schema=schema
+            )
+            cleaned = util_schema.assign_default_values(
+                instance=instance, schema=modified_schema
+            )
+            jsonschema.validate(
+                instance=cleaned,
+                schema=modified_schema,
+                cls=validator,
+                registry=util_schema._LOCAL_SCHEMA_REGISTRY,
+            )
+            return cleaned
+        elif implementation == "st2_validate":
+            return util_schema.validate(
+                instance=instance,
+                schema=schema,
+                cls=validator,
+                use_default=True,
+                allow_default_none=True,
+            )
+        else:
+            raise ValueError("Invalid implementation: %s" % (implementation))
+
+    result = benchmark(run_benchmark)
+    assert result["cmd"] == "echo 1"
+    assert result["sudo"] is False
@@ -0,0 +1,104 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Load test which measures how long it takes to fan out a single stream event to 500 simulated SSE
+clients when the event is encoded once and shared by all the clients versus when it's encoded for
+each client separately.
+"""
+
+from st2common.util.monkey_patch import monkey_patch
+
+monkey_patch()
+
+import os
+import json
+
+import pytest
+
+from st2common.stream.listener import BaseListener
+from st2common.util.jsonify import json_encode
+
+from common import FIXTURES_DIR
+
+CLIENTS_COUNT = 500
+
+EVENT_NAME = "st2.announcement__chatops"
+
+
+class FakeListener(BaseListener):
+    def get_consumers(self, consumer, channel):
+        return []
+
+
+def encode_per_client(pack):
+    (event, body) = pack
+    return ("event: %s\ndata: %s\n\n" % (event, json_encode(body, indent=None))).encode(
+        "utf-8"
+    )
+
+
+def encode_once(pack):
+    return pack.encode()
+
+
+@pytest.mark.parametrize(
+    "fixture_file",
+    [
+        "tiny_1.json",
+        "json_61kb.json",
+        "json_647kb.json",
+    ],
+    ids=[
+        "tiny_1",
+        "json_61kb",
+        "json_647kb",
+    ],
+)
+@pytest.mark.parametrize(
+    "encoding",
+    ["per_client", "once"],
+    ids=[
+        "per_client",
+        "once",
+    ],
+)
+@pytest.mark.benchmark(group="stream_fanout")
+def test_stream_fanout(benchmark, fixture_file: str, encoding: str) -> None:
+    with open(os.path.join(FIXTURES_DIR, fixture_file), "r") as fp:
+        body = json.loads(fp.read())
+
+    encode_func = encode_once if encoding == "once" else encode_per_client
+
+    listener = FakeListener(connection=None)
+    clients = [listener.generator(events=[EVENT_NAME]) for _ in range(CLIENTS_COUNT)]
+
+    # Start the generators which registers the subscriptions
+    for client in clients:
+        next(client)
+
+    def run_benchmark():
+        listener.emit(EVENT_NAME, body)
+
+        sent_bytes = 0
+        for client in clients:
+            sent_bytes += len(encode_func(next(client)))
+
+        return sent_bytes
+
+    sent_bytes = benchmark(run_benchmark)
+    benchmark.extra_info["sent_bytes"] = sent_bytes
+
+    for client in clients:
+        client.close()
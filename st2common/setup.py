@@ -51,6 +51,7 @@ setup(
         "bin/st2-bootstrap-rmq",
         "bin/st2-cleanup-db",
         "bin/st2-register-content",
+        "bin/st2-archive-executions",
         "bin/st2-purge-executions",
         "bin/st2-purge-workflows",
         "bin/st2-purge-task-executions",
@@ -0,0 +1,145 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A utility script that archives st2 executions older than certain timestamp together with their
+output objects and traces to compressed files and purges them from the database.
+
+It can also be used to retrieve an archived execution by id (--execution-id).
+"""
+
+from __future__ import absolute_import
+
+import sys
+from datetime import datetime
+
+import six
+import pytz
+from oslo_config import cfg
+
+from st2common import config
+from st2common import log as logging
+from st2common.config import do_register_cli_opts
+from st2common.database_setup import db_setup
+from st2common.script_setup import setup as common_setup
+from st2common.script_setup import teardown as common_teardown
+from st2common.constants.exit_codes import SUCCESS_EXIT_CODE
+from st2common.constants.exit_codes import FAILURE_EXIT_CODE
+from st2common.garbage_collection.archive import ExecutionArchiveReader
+from st2common.garbage_collection.archive import ExecutionArchiveWriter
+from st2common.garbage_collection.executions import purge_executions
+from st2common.util.jsonify import json_encode
+
+__all__ = ["main"]
+
+LOG = logging.getLogger(__name__)
+
+
+def _register_cli_opts():
+    cli_opts = [
+        cfg.StrOpt(
+            "archive-dir",
+            default=None,
+            help="Directory where the archive files are stored.",
+        ),
+        cfg.StrOpt(
+            "timestamp",
+            default=None,
+            help="Will archive and delete execution and liveaction models older than "
+            + "this UTC timestamp. "
+            + "Example value: 2015-03-13T19:01:27.255542Z.",
+        ),
+        cfg.StrOpt(
+            "action-ref", default="", help="action-ref to archive executions for."
+        ),
+        cfg.BoolOpt(
+            "purge-incomplete",
+            default=False,
+            help="Archive and purge all models irrespective of their ``status``."
+            + 'By default, only executions in completed states such as "succeeeded" '
+            + ', "failed", "canceled" and "timed_out" are archived.',
+        ),
+        cfg.StrOpt(
+            "execution-id",
+            default=None,
+            help="Print archived execution with this id instead of archiving executions.",
+        ),
+    ]
+    do_register_cli_opts(cli_opts)
+
+
+def _print_archived_execution(archive_dir, execution_id):
+    record = ExecutionArchiveReader(archive_dir=archive_dir).get_execution(
+        execution_id=execution_id
+    )
+
+    if not record:
+        LOG.error('Execution "%s" not found in the archive.' % (execution_id))
+        return FAILURE_EXIT_CODE
+
+    sys.stdout.write(json_encode(record, indent=2) + "\n")
+    return SUCCESS_EXIT_CODE
+
+
+def main():
+    _register_cli_opts()
+    common_setup(config=config, setup_db=False, register_mq_exchanges=False)
+
+    # Get config values
+    archive_dir = cfg.CONF.archive_dir
+    timestamp = cfg.CONF.timestamp
+    action_ref = cfg.CONF.action_ref
+    purge_incomplete = cfg.CONF.purge_incomplete
+    execution_id = cfg.CONF.execution_id
+
+    if not archive_dir:
+        LOG.error("Please supply an archive directory. Aborting.")
+        return 1
+
+    # Retrieving archived executions doesn't require database
+    if execution_id:
+        try:
+            return _print_archived_execution(
+                archive_dir=archive_dir, execution_id=execution_id
+            )
+        except Exception as e:
+            LOG.exception(six.text_type(e))
+            return FAILURE_EXIT_CODE
+        finally:
+            common_teardown()
+
+    if not timestamp:
+        LOG.error("Please supply a timestamp for archiving models. Aborting.")
+        return 1
+    else:
+        timestamp = datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%fZ")
+        timestamp = timestamp.replace(tzinfo=pytz.UTC)
+
+    db_setup()
+
+    try:
+        purge_executions(
+            logger=LOG,
+            timestamp=timestamp,
+            action_ref=action_ref,
+            purge_incomplete=purge_incomplete,
+            archive_writer=ExecutionArchiveWriter(archive_dir=archive_dir),
+        )
+    except Exception as e:
+        LOG.exception(six.text_type(e))
+        return FAILURE_EXIT_CODE
+    finally:
+        common_teardown()
+
+    return SUCCESS_EXIT_CODE
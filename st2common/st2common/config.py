@@ -169,6 +169,23 @@ def register_opts(ignore_errors=False):
             "default. Use a comma-separated list for multiple indexes if you "
             'want to get other packs discovered with "st2 pack search".',
         ),
+        cfg.BoolOpt(
+            "resource_cache_enabled",
+            default=False,
+            help="True to cache actions, runner types, triggers, trigger types and policies "
+            "retrieved by reference in the memory of each service. Cached entries are "
+            "invalidated on resource create, update and delete events.",
+        ),
+        cfg.IntOpt(
+            "resource_cache_ttl",
+            default=600,
+            help="How long (in seconds) a cached resource is valid for.",
+        ),
+        cfg.IntOpt(
+            "resource_cache_size",
+            default=1000,
+            help="Maximum number of cached resources per resource type.",
+        ),
     ]
 
     do_register_opts(content_opts, "content", ignore_errors)
@@ -409,6 +426,80 @@ def register_opts(ignore_errors=False):
             default="st2",
             help="Prefix for all exchange and queue names.",
         ),
+        cfg.StrOpt(
+            "serializer",
+            default="pickle",
+            choices=["pickle", "json"],
+            help="Serializer to use for database model objects (e.g. executions) which are "
+            "sent over the message bus. json sends compact JSON documents instead of pickled "
+            "objects. Consumers accept both formats so all the services should be upgraded "
+            "before switching to json.",
+        ),
+        cfg.BoolOpt(
+            "publisher_channel_reuse",
+            default=False,
+            help="True to keep a long lived channel and producer for each pooled publisher "
+            "connection instead of opening a new channel and creating a new producer for each "
+            "published message.",
+        ),
+        cfg.BoolOpt(
+            "publisher_confirms",
+            default=False,
+            help="True to enable RabbitMQ publisher confirms on long lived publisher channels. "
+            "Only used when publisher_channel_reuse is enabled.",
+        ),
+        cfg.IntOpt(
+            "publisher_confirms_batch_size",
+            default=100,
+            help="Number of unconfirmed messages published on a channel after which publisher "
+            "waits for the broker to confirm all of them.",
+        ),
+        cfg.IntOpt(
+            "publisher_confirms_timeout",
+            default=10,
+            help="How long to wait (in seconds) for the broker to confirm published messages.",
+        ),
+        cfg.FloatOpt(
+            "publisher_confirms_flush_interval",
+            default=1.0,
+            help="How often (in seconds) to wait for confirms of messages which have been "
+            "published but not confirmed yet, regardless of publisher_confirms_batch_size.",
+        ),
+        cfg.BoolOpt(
+            "slim_execution_updates",
+            default=False,
+            help="True to publish slim execution update messages which only contain the "
+            "execution state fields instead of the whole execution document (result, "
+            "parameters, etc.). Consumers which need the whole document retrieve it from the "
+            "database. All the services should be upgraded before enabling this option.",
+        ),
+        cfg.IntOpt(
+            "prefetch_count",
+            default=None,
+            min=1,
+            help="Maximum number of unacknowledged messages the broker delivers to a service "
+            "queue consumer (actionrunner, scheduler, workflow engine, notifier, rules engine). "
+            "Defaults to 1 or to the consumer dispatcher pool size when ack_after_processing is "
+            "enabled.",
+        ),
+        cfg.DictOpt(
+            "service_prefetch_count",
+            default={},
+            help="Per service prefetch count which takes precedence over prefetch_count (e.g. "
+            "notifier:50,workflow_engine:20). Valid service names are actionrunner, scheduler, "
+            "workflow_engine, notifier and rulesengine.",
+        ),
+        cfg.BoolOpt(
+            "ack_after_processing",
+            default=False,
+            help="True to acknowledge service queue messages after they have been processed "
+            "instead of when they are received. Number of messages which are being processed "
+            "is then bound by the prefetch count so the broker holds back the remaining "
+            "messages when services can't keep up. Messages which are being processed when a "
+            "service is stopped are delivered again. Action runner messages are always "
+            "acknowledged when they are received since actions can run for longer than the "
+            "broker consumer timeout.",
+        ),
     ]
 
     do_register_opts(messaging_opts, "messaging", ignore_errors)
@@ -480,6 +571,42 @@ def register_opts(ignore_errors=False):
             'set this value to strict. Setting it to "unset" will default to the behavior '
             "in previous releases and not set this SameSite header value.",
         ),
+        cfg.BoolOpt(
+            "list_response_cache_enabled",
+            default=False,
+            help="True to cache serialized list responses of the action, rule, pack, sensor type "
+            "and trigger type API endpoints for the queries without filters in the memory of "
+            "each API process. Cached responses are validated using the collection revisions.",
+        ),
+        cfg.IntOpt(
+            "list_response_cache_size",
+            default=100,
+            help="Maximum number of cached list responses.",
+        ),
+        cfg.IntOpt(
+            "max_bulk_execution_requests",
+            default=1000,
+            help="Maximum number of executions which can be requested using a single bulk "
+            "execution API request.",
+        ),
+        cfg.BoolOpt(
+            "webhook_async_dispatch",
+            default=False,
+            help="True to validate webhook requests, put the triggers into an in-memory buffer, "
+            "respond with 202 right away and publish the buffered triggers in batches in the "
+            "background. Triggers which are still in the buffer are lost if the API process dies.",
+        ),
+        cfg.IntOpt(
+            "webhook_dispatch_queue_size",
+            default=10000,
+            help="Maximum number of triggers in the asynchronous webhook dispatch buffer. Webhook "
+            "requests are rejected with 503 while the buffer is full.",
+        ),
+        cfg.IntOpt(
+            "webhook_dispatch_batch_size",
+            default=100,
+            help="Maximum number of buffered webhook triggers which are published in one batch.",
+        ),
     ]
 
     do_register_opts(api_opts, "api", ignore_errors)
@@ -697,7 +824,24 @@ def register_opts(ignore_errors=False):
             "See https://docs.stackstorm.com/reference/"
             "sharing_code_sensors_actions.html "
             "for details.",
-        )
+        ),
+        cfg.BoolOpt(
+            "config_cache_enabled",
+            default=False,
+            help="True to cache resolved pack configs (per pack and user) in the action runner "
+            "process. Cache entries are invalidated on pack config, config schema and datastore "
+            "changes.",
+        ),
+        cfg.IntOpt(
+            "config_cache_ttl",
+            default=300,
+            help="How long (in seconds) a resolved pack config is cached for.",
+        ),
+        cfg.IntOpt(
+            "config_cache_size",
+            default=1000,
+            help="Maximum number of resolved pack configs which are cached.",
+        ),
     ]
 
     do_register_opts(pack_lib_opts, group="packs", ignore_errors=ignore_errors)
@@ -738,7 +882,47 @@ def register_opts(ignore_errors=False):
             "heartbeat",
             default=25,
             help="Send empty message every N seconds to keep connection open",
-        )
+        ),
+        cfg.FloatOpt(
+            "coalesce_window",
+            default=1.0,
+            help="How long (in seconds) to hold execution and live action update events for "
+            "clients which request coalescing. Only the latest state of an object received "
+            "within this window is sent to the client.",
+        ),
+        cfg.IntOpt(
+            "max_buffered_events",
+            default=0,
+            help="Maximum number of events which are buffered for a single stream client. "
+            "Once a slow client reaches this limit, buffer_overflow_policy is applied. 0 means "
+            "no limit. Note: Clients need to handle st2.stream__resync event before the resync "
+            "policy is enabled, otherwise they silently miss the dropped events. Execution "
+            "output streams are not limited.",
+        ),
+        cfg.StrOpt(
+            "buffer_overflow_policy",
+            default="resync",
+            choices=["drop", "resync"],
+            help="What to do when the client buffer is full. drop drops the oldest buffered "
+            "event and resync replaces all the buffered events with a single "
+            "st2.stream__resync event which tells the client to re-list the resources.",
+        ),
+        cfg.IntOpt(
+            "replay_buffer_size",
+            default=0,
+            help="Number of recent events which are kept in memory and replayed to the clients "
+            "which reconnect with Last-Event-ID header. Clients which missed more events receive "
+            "a st2.stream__resync event. 0 disables event ids and replay. Note: When enabled, "
+            "every event is encoded when it's received (and the whole execution is retrieved "
+            "for slim execution updates) even if no client is subscribed to it.",
+        ),
+        cfg.IntOpt(
+            "replay_buffer_max_bytes",
+            default=64 * 1024 * 1024,
+            help="Maximum total size in bytes of the encoded events which are kept in the replay "
+            "buffer. The oldest events are removed from the buffer once this size is reached. 0 "
+            "means the buffer is only bound by replay_buffer_size.",
+        ),
     ]
 
     do_register_opts(stream_opts, group="stream", ignore_errors=ignore_errors)
@@ -905,6 +1089,37 @@ def register_opts(ignore_errors=False):
         workflow_engine_opts, group="workflow_engine", ignore_errors=ignore_errors
     )
 
+    # Trace options
+    trace_opts = [
+        cfg.BoolOpt(
+            "write_behind",
+            default=False,
+            help="True to put trace updates into an in-memory queue and write them to the "
+            "database in batches from a background thread instead of updating traces "
+            "synchronously when trigger instances are processed and executions are created. "
+            "Queued trace updates are written on service shutdown, but they are lost if the "
+            "process dies.",
+        ),
+        cfg.FloatOpt(
+            "write_behind_flush_interval",
+            default=0.5,
+            help="How long to wait (in seconds) for more trace updates before writing a batch.",
+        ),
+        cfg.IntOpt(
+            "write_behind_batch_size",
+            default=500,
+            help="Maximum number of trace updates which are written using a single bulk write.",
+        ),
+        cfg.IntOpt(
+            "write_behind_queue_size",
+            default=10000,
+            help="Maximum number of queued trace updates. When the queue is full, trace updates "
+            "block until there is space in the queue.",
+        ),
+    ]
+
+    do_register_opts(trace_opts, group="trace", ignore_errors=ignore_errors)
+
 
 class St2EnvironmentConfigurationSource(EnvironmentConfigurationSource):
     @staticmethod
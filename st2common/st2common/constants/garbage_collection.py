@@ -16,6 +16,7 @@
 __all__ = [
     "DEFAULT_COLLECTION_INTERVAL",
     "DEFAULT_SLEEP_DELAY",
+    "DEFAULT_PURGE_BATCH_SIZE",
     "MINIMUM_TTL_DAYS",
     "MINIMUM_TTL_DAYS_EXECUTION_OUTPUT",
 ]
@@ -27,6 +28,9 @@ DEFAULT_COLLECTION_INTERVAL = 600
 # How to long to wait / sleep between collection of different object types (in seconds)
 DEFAULT_SLEEP_DELAY = 2
 
+# Maximum number of objects which are deleted in a single batch
+DEFAULT_PURGE_BATCH_SIZE = 1000
+
 # Minimum TTL in days for action executions and trigger instances.
 MINIMUM_TTL_DAYS = 1
 
@@ -0,0 +1,41 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+from st2common.exceptions import StackStormBaseException
+
+__all__ = ["PublisherConfirmTimeoutError", "PublishNotConfirmedError"]
+
+
+class PublisherConfirmTimeoutError(StackStormBaseException):
+    """
+    Raised when the broker doesn't confirm published messages in time.
+    """
+
+    pass
+
+
+class PublishNotConfirmedError(StackStormBaseException):
+    """
+    Raised when the broker rejects (nacks) published messages.
+    """
+
+    def __init__(self, messages):
+        super(PublishNotConfirmedError, self).__init__(
+            "Broker rejected %s published message(s)." % (len(messages))
+        )
+
+        # A list of (exchange, publish kwargs) tuples for the rejected messages
+        self.messages = messages
@@ -19,3 +19,7 @@ from st2common.exceptions import StackStormBaseException
 
 class TriggerDoesNotExistException(StackStormBaseException):
     pass
+
+
+class TriggerDispatchQueueFullError(StackStormBaseException):
+    pass
@@ -0,0 +1,355 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module for archiving action executions to compressed files before they are purged and for reading
+the archived executions back.
+
+Archive files are zstd compressed JSON lines files which are partitioned by the day of the
+execution start timestamp (<archive dir>/<YYYY>/<MM>/<DD>/executions-<time>.jsonl.zst). Each
+line contains an execution together with its output objects and trace.
+
+Executions are streamed into zstd frames of up to FRAME_SIZE bytes of uncompressed data and the
+offset and length of the frame is stored for each execution in a JSON lines index file next to the
+archive file (<archive file>.index). This way a single execution can be retrieved by decompressing
+a single small frame. The archive files themselves are still valid zstd files which can be decompressed using
+the standard tools (e.g. "zstdcat executions-*.jsonl.zst").
+"""
+
+from __future__ import absolute_import
+
+import glob
+import io
+import os
+
+import zstandard
+
+from st2common.models.api.execution import ActionExecutionAPI
+from st2common.models.api.execution import ActionExecutionOutputAPI
+from st2common.models.api.trace import TraceAPI
+from st2common.persistence.execution import ActionExecution
+from st2common.persistence.execution import ActionExecutionOutput
+from st2common.persistence.trace import Trace
+from st2common.util.date import get_datetime_utc_now
+from st2common.util.jsonify import json_decode
+from st2common.util.jsonify import json_encode
+
+__all__ = [
+    "ExecutionArchiveWriter",
+    "ExecutionArchiveReader",
+    "build_archive_index",
+]
+
+ARCHIVE_FILE_EXTENSION = ".jsonl.zst"
+INDEX_FILE_EXTENSION = ".index"
+
+DEFAULT_COMPRESSION_LEVEL = 3
+
+# Size of uncompressed data after which a new frame is started. A single execution is never split
+# across frames so a frame can be larger if it contains a large execution.
+FRAME_SIZE = 1024 * 1024
+
+
+class ExecutionArchiveWriter(object):
+    """
+    Class which writes action executions, their output objects and traces to archive files.
+    """
+
+    def __init__(
+        self,
+        archive_dir,
+        compression_level=DEFAULT_COMPRESSION_LEVEL,
+        mask_secrets=True,
+    ):
+        """
+        :param archive_dir: Directory where archive files are written to.
+        :type archive_dir: ``str``
+
+        :param mask_secrets: True to mask secret parameters and results in the archived data.
+        :type mask_secrets: ``bool``
+        """
+        self._archive_dir = archive_dir
+        self._compressor = zstandard.ZstdCompressor(level=compression_level)
+        self._mask_secrets = mask_secrets
+
+        # All the files written by this writer share the same name and only differ in the
+        # partition directory
+        self._file_name = "executions-%s%s" % (
+            get_datetime_utc_now().strftime("%Y%m%dT%H%M%S.%f"),
+            ARCHIVE_FILE_EXTENSION,
+        )
+
+    def archive_executions(self, execution_ids):
+        """
+        Archive executions with the provided ids together with their output objects and traces.
+
+        This method returns once the data has been written to disk so the executions can be
+        safely deleted afterwards.
+
+        :param execution_ids: Ids of the executions to archive.
+        :type execution_ids: ``list``
+
+        :return: Number of archived executions.
+        :rtype: ``int``
+        """
+        execution_ids = [str(execution_id) for execution_id in execution_ids]
+
+        trace_dbs = {}
+        for trace_db in Trace.query(action_executions__object_id__in=execution_ids):
+            for component in trace_db.action_executions:
+                trace_dbs[component.object_id] = trace_db
+
+        # NOTE: Executions and their output objects can be large so they are retrieved and
+        # written one by one instead of holding the whole batch in memory
+        execution_dbs = ActionExecution.query(
+            id__in=execution_ids, order_by=["start_timestamp"]
+        ).no_cache()
+
+        # Records are written to the partition (day) they belong to. Executions are sorted by the
+        # start timestamp so only a single partition is written at a time.
+        partition = None
+        partition_writer = None
+        count = 0
+
+        try:
+            for execution_db in execution_dbs:
+                execution_partition = execution_db.start_timestamp.strftime("%Y/%m/%d")
+
+                if execution_partition != partition:
+                    if partition_writer:
+                        partition_writer.close()
+
+                    partition = execution_partition
+                    partition_writer = self._open_partition(partition=partition)
+
+                partition_writer.write(
+                    self._get_record(
+                        execution_db=execution_db,
+                        trace_db=trace_dbs.get(str(execution_db.id), None),
+                    )
+                )
+                count += 1
+        finally:
+            if partition_writer:
+                partition_writer.close()
+
+        return count
+
+    def _get_record(self, execution_db, trace_db):
+        execution_id = str(execution_db.id)
+        output_dbs = ActionExecutionOutput.query(
+            execution_id=execution_id, order_by=["timestamp"]
+        ).no_cache()
+
+        return {
+            "id": execution_id,
+            "execution": ActionExecutionAPI.from_model(
+                execution_db, mask_secrets=self._mask_secrets
+            ),
+            "output": [
+                ActionExecutionOutputAPI.from_model(
+                    output_db, mask_secrets=self._mask_secrets
+                )
+                for output_db in output_dbs
+            ],
+            "trace": TraceAPI.from_model(trace_db) if trace_db else None,
+        }
+
+    def _open_partition(self, partition):
+        partition_dir = os.path.join(self._archive_dir, partition)
+        if not os.path.isdir(partition_dir):
+            os.makedirs(partition_dir)
+
+        return _ArchiveFileWriter(
+            archive_path=os.path.join(partition_dir, self._file_name),
+            compressor=self._compressor,
+        )
+
+
+class _ArchiveFileWriter(object):
+    """
+    Class which streams records into zstd frames of an archive file and adds the records to the
+    index once the frame they are in has been written.
+    """
+
+    def __init__(self, archive_path, compressor):
+        self._fp = open(archive_path, "ab")
+        self._index_fp = open(archive_path + INDEX_FILE_EXTENSION, "a")
+        self._writer = compressor.stream_writer(self._fp, closefd=False)
+
+        # Offset of the current frame, ids of the records in it and size of their uncompressed
+        # data
+        self._frame_offset = self._fp.tell()
+        self._frame_ids = []
+        self._frame_size = 0
+
+    def write(self, record):
+        data = (json_encode(record) + "\n").encode("utf-8")
+        self._writer.write(data)
+
+        self._frame_ids.append(record["id"])
+        self._frame_size += len(data)
+
+        if self._frame_size >= FRAME_SIZE:
+            self._end_frame()
+
+    def close(self):
+        """
+        Write the last frame and make sure all the data has been written to disk.
+        """
+        if self._fp.closed:
+            return
+
+        try:
+            self._end_frame()
+
+            for fp in [self._fp, self._index_fp]:
+                fp.flush()
+                os.fsync(fp.fileno())
+        finally:
+            # NOTE: Stream writer is not closed since that would write an empty frame
+            self._fp.close()
+            self._index_fp.close()
+
+    def _end_frame(self):
+        if not self._frame_ids:
+            return
+
+        self._writer.flush(zstandard.FLUSH_FRAME)
+
+        offset = self._frame_offset
+        length = self._fp.tell() - offset
+
+        self._index_fp.write(
+            "".join(
+                json_encode({"id": execution_id, "offset": offset, "length": length})
+                + "\n"
+                for execution_id in self._frame_ids
+            )
+        )
+
+        self._frame_offset += length
+        self._frame_ids = []
+        self._frame_size = 0
+
+
+class ExecutionArchiveReader(object):
+    """
+    Class for retrieving archived executions.
+    """
+
+    def __init__(self, archive_dir):
+        self._archive_dir = archive_dir
+
+    def get_archive_paths(self):
+        """
+        Return paths to all the archive files sorted from the oldest to the newest partition.
+
+        :rtype: ``list`` of ``str``
+        """
+        pattern = os.path.join(self._archive_dir, "*", "*", "*")
+        pattern += os.path.sep + "*" + ARCHIVE_FILE_EXTENSION
+        return sorted(glob.glob(pattern))
+
+    def get_execution(self, execution_id):
+        """
+        Retrieve archived execution record with the provided id.
+
+        :return: Record with "execution", "output" and "trace" keys or None if the execution
+                 hasn't been archived.
+        :rtype: ``dict``
+        """
+        execution_id = str(execution_id)
+
+        for archive_path in reversed(self.get_archive_paths()):
+            index_path = archive_path + INDEX_FILE_EXTENSION
+            if not os.path.isfile(index_path):
+                build_archive_index(archive_path=archive_path)
+
+            entry = self._get_index_entry(index_path, execution_id)
+            if not entry:
+                continue
+
+            with open(archive_path, "rb") as fp:
+                fp.seek(entry["offset"])
+                frame = fp.read(entry["length"])
+
+            for record in _iter_frame_records(frame):
+                if record["id"] == execution_id:
+                    return record
+
+        return None
+
+    def iter_executions(self, archive_path):
+        """
+        Iterate over all the execution records in the provided archive file.
+        """
+        dctx = zstandard.ZstdDecompressor()
+
+        with open(archive_path, "rb") as fp:
+            reader = dctx.stream_reader(fp, read_across_frames=True)
+            for line in io.TextIOWrapper(reader, encoding="utf-8"):
+                yield json_decode(line)
+
+    def _get_index_entry(self, index_path, execution_id):
+        with open(index_path, "r") as fp:
+            for line in fp:
+                # Avoid decoding all the lines which can't match
+                if execution_id not in line:
+                    continue
+
+                entry = json_decode(line)
+                if entry["id"] == execution_id:
+                    return entry
+
+        return None
+
+
+def build_archive_index(archive_path):
+    """
+    (Re)build index file for the provided archive file (e.g. if the index file has been lost).
+
+    :return: Number of indexed executions.
+    :rtype: ``int``
+    """
+    with open(archive_path, "rb") as fp:
+        data = memoryview(fp.read())
+
+    index_lines = []
+    offset = 0
+
+    while offset < len(data):
+        dobj = zstandard.ZstdDecompressor().decompressobj()
+        content = dobj.decompress(data[offset:])
+        length = len(data) - offset - len(dobj.unused_data)
+
+        for line in content.decode("utf-8").splitlines():
+            record = json_decode(line)
+            index_lines.append(
+                json_encode({"id": record["id"], "offset": offset, "length": length})
+                + "\n"
+            )
+
+        offset += length
+
+    with open(archive_path + INDEX_FILE_EXTENSION, "w") as fp:
+        fp.write("".join(index_lines))
+
+    return len(index_lines)
+
+
+def _iter_frame_records(frame):
+    content = zstandard.ZstdDecompressor().decompressobj().decompress(frame)
+    for line in content.decode("utf-8").splitlines():
+        yield json_decode(line)
@@ -26,6 +26,8 @@ import six
 from mongoengine.errors import InvalidQueryError
 
 from st2common.constants import action as action_constants
+from st2common.constants.garbage_collection import DEFAULT_PURGE_BATCH_SIZE
+from st2common.garbage_collection.utils import delete_by_query_in_batches
 from st2common.persistence.liveaction import LiveAction
 from st2common.persistence.execution import ActionExecution
 from st2common.persistence.execution import ActionExecutionOutput
@@ -42,7 +44,15 @@ DONE_STATES = [
 ]
 
 
-def purge_executions(logger, timestamp, action_ref=None, purge_incomplete=False):
+def purge_executions(
+    logger,
+    timestamp,
+    action_ref=None,
+    purge_incomplete=False,
+    batch_size=DEFAULT_PURGE_BATCH_SIZE,
+    max_deletes_per_second=None,
+    archive_writer=None,
+):
     """
     Purge action executions and corresponding live action, execution output objects.
 
@@ -54,6 +64,17 @@ def purge_executions(logger, timestamp, action_ref=None, purge_incomplete=False)
 
     :param purge_incomplete: True to also delete executions which are not in a done state.
     :type purge_incomplete: ``bool``
+
+    :param batch_size: Maximum number of objects which are deleted in a single batch.
+    :type batch_size: ``int``
+
+    :param max_deletes_per_second: Maximum number of objects of each type deleted per second.
+    :type max_deletes_per_second: ``int``
+
+    :param archive_writer: If specified, each batch of executions is archived together with the
+                           execution output objects and traces before it's deleted. If
+                           archiving or deleting a batch fails, the error is re-raised.
+    :type archive_writer: :class:`st2common.garbage_collection.archive.ExecutionArchiveWriter`
     """
     if not timestamp:
         raise ValueError("Specify a valid timestamp to purge.")
@@ -80,17 +101,37 @@ def purge_executions(logger, timestamp, action_ref=None, purge_incomplete=False)
     if action_ref:
         liveaction_filters["action"] = action_ref
 
-    to_delete_execution_dbs = []
+    output_deleted_counts = []
+    archived_counts = []
 
-    # 1. Delete ActionExecutionDB objects
-    try:
-        # Note: We call list() on the query set object because it's lazyily evaluated otherwise
-        to_delete_execution_dbs = list(
-            ActionExecution.query(
-                only_fields=["id"], no_dereference=True, **exec_filters
+    def delete_execution_output_objects(execution_ids):
+        # Batch is only deleted once it has been archived. If archiving fails, the batch and
+        # all the following batches are left in the database
+        if archive_writer:
+            archived_counts.append(
+                archive_writer.archive_executions(execution_ids=execution_ids)
             )
+
+        # Execution output objects are deleted for each batch of executions before the executions
+        # themselves so no output objects are left behind if the purge is interrupted
+        output_dbs_filters = {}
+        output_dbs_filters["execution_id"] = {
+            "$in": [str(execution_id) for execution_id in execution_ids]
+        }
+        output_deleted_counts.append(
+            ActionExecutionOutput.delete_by_query(**output_dbs_filters)
+        )
+
+    # 1. Delete ActionExecutionDB and corresponding ActionExecutionOutputDB objects
+    try:
+        deleted_count = delete_by_query_in_batches(
+            model=ActionExecution,
+            timestamp_field="start_timestamp",
+            query_filters=exec_filters,
+            batch_size=batch_size,
+            max_deletes_per_second=max_deletes_per_second,
+            before_delete=delete_execution_output_objects,
         )
-        deleted_count = ActionExecution.delete_by_query(**exec_filters)
     except InvalidQueryError as e:
         msg = (
             "Bad query (%s) used to delete execution instances: %s"
@@ -106,12 +147,28 @@ def purge_executions(logger, timestamp, action_ref=None, purge_incomplete=False)
             "Deletion of execution models failed for query with filters: %s.",
             exec_filters,
         )
+
+        if archive_writer:
+            # Keep live actions of the executions which haven't been archived and let the caller
+            # know the executions haven't been archived
+            raise
     else:
         logger.info("Deleted %s action execution objects" % (deleted_count))
 
+    if archive_writer:
+        logger.info("Archived %s action execution objects" % (sum(archived_counts)))
+
+    logger.info("Deleted %s execution output objects" % (sum(output_deleted_counts)))
+
     # 2. Delete LiveActionDB objects
     try:
-        deleted_count = LiveAction.delete_by_query(**liveaction_filters)
+        deleted_count = delete_by_query_in_batches(
+            model=LiveAction,
+            timestamp_field="start_timestamp",
+            query_filters=liveaction_filters,
+            batch_size=batch_size,
+            max_deletes_per_second=max_deletes_per_second,
+        )
     except InvalidQueryError as e:
         msg = (
             "Bad query (%s) used to delete liveaction instances: %s"
@@ -130,35 +187,8 @@ def purge_executions(logger, timestamp, action_ref=None, purge_incomplete=False)
     else:
         logger.info("Deleted %s liveaction objects" % (deleted_count))
 
-    # 3. Delete ActionExecutionOutputDB objects
-    to_delete_exection_ids = [
-        str(execution_db.id) for execution_db in to_delete_execution_dbs
-    ]
-    output_dbs_filters = {}
-    output_dbs_filters["execution_id"] = {"$in": to_delete_exection_ids}
-
-    try:
-        deleted_count = ActionExecutionOutput.delete_by_query(**output_dbs_filters)
-    except InvalidQueryError as e:
-        msg = (
-            "Bad query (%s) used to delete execution output instances: %s"
-            "Please contact support." % (output_dbs_filters, six.text_type(e))
-        )
-        raise InvalidQueryError(msg)
-    except:
-        logger.exception(
-            "Deletion of execution output models failed for query with filters: %s.",
-            output_dbs_filters,
-        )
-    else:
-        logger.info("Deleted %s execution output objects" % (deleted_count))
-
-    zombie_execution_instances = len(
-        ActionExecution.query(only_fields=["id"], no_dereference=True, **exec_filters)
-    )
-    zombie_liveaction_instances = len(
-        LiveAction.query(only_fields=["id"], no_dereference=True, **liveaction_filters)
-    )
+    zombie_execution_instances = ActionExecution.count(**exec_filters)
+    zombie_liveaction_instances = LiveAction.count(**liveaction_filters)
 
     if (zombie_execution_instances > 0) or (zombie_liveaction_instances > 0):
         logger.error("Zombie execution instances left: %d.", zombie_execution_instances)
@@ -170,7 +200,13 @@ def purge_executions(logger, timestamp, action_ref=None, purge_incomplete=False)
     logger.info("All execution models older than timestamp %s were deleted.", timestamp)
 
 
-def purge_execution_output_objects(logger, timestamp, action_ref=None):
+def purge_execution_output_objects(
+    logger,
+    timestamp,
+    action_ref=None,
+    batch_size=DEFAULT_PURGE_BATCH_SIZE,
+    max_deletes_per_second=None,
+):
     """
     Purge action executions output objects.
 
@@ -179,6 +215,12 @@ def purge_execution_output_objects(logger, timestamp, action_ref=None):
 
     :param action_ref: Only delete objects for the provided actions.
     :type action_ref: ``str``
+
+    :param batch_size: Maximum number of objects which are deleted in a single batch.
+    :type batch_size: ``int``
+
+    :param max_deletes_per_second: Maximum number of objects deleted per second.
+    :type max_deletes_per_second: ``int``
     """
     if not timestamp:
         raise ValueError("Specify a valid timestamp to purge.")
@@ -195,7 +237,13 @@ def purge_execution_output_objects(logger, timestamp, action_ref=None):
         filters["action_ref"] = action_ref
 
     try:
-        deleted_count = ActionExecutionOutput.delete_by_query(**filters)
+        deleted_count = delete_by_query_in_batches(
+            model=ActionExecutionOutput,
+            timestamp_field="timestamp",
+            query_filters=filters,
+            batch_size=batch_size,
+            max_deletes_per_second=max_deletes_per_second,
+        )
     except InvalidQueryError as e:
         msg = (
             "Bad query (%s) used to delete execution output instances: %s"
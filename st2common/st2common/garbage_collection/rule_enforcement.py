@@ -21,16 +21,26 @@ from __future__ import absolute_import
 import six
 from mongoengine.errors import InvalidQueryError
 
+from st2common.constants.garbage_collection import DEFAULT_PURGE_BATCH_SIZE
+from st2common.garbage_collection.utils import delete_by_query_in_batches
 from st2common.persistence.rule_enforcement import RuleEnforcement
 from st2common.util import isotime
 
 __all__ = ["purge_rule_enforcements"]
 
 
-def purge_rule_enforcements(logger, timestamp):
+def purge_rule_enforcements(
+    logger, timestamp, batch_size=DEFAULT_PURGE_BATCH_SIZE, max_deletes_per_second=None
+):
     """
     :param timestamp: Rule enforcement instances older than this timestamp will be deleted.
     :type timestamp: ``datetime.datetime
+
+    :param batch_size: Maximum number of objects which are deleted in a single batch.
+    :type batch_size: ``int``
+
+    :param max_deletes_per_second: Maximum number of objects deleted per second.
+    :type max_deletes_per_second: ``int``
     """
     if not timestamp:
         raise ValueError("Specify a valid timestamp to purge.")
@@ -43,7 +53,13 @@ def purge_rule_enforcements(logger, timestamp):
     query_filters = {"enforced_at__lt": isotime.parse(timestamp)}
 
     try:
-        deleted_count = RuleEnforcement.delete_by_query(**query_filters)
+        deleted_count = delete_by_query_in_batches(
+            model=RuleEnforcement,
+            timestamp_field="enforced_at",
+            query_filters=query_filters,
+            batch_size=batch_size,
+            max_deletes_per_second=max_deletes_per_second,
+        )
     except InvalidQueryError as e:
         msg = (
             "Bad query (%s) used to delete rule enforcements: %s"
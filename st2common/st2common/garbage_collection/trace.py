@@ -21,16 +21,26 @@ from __future__ import absolute_import
 import six
 from mongoengine.errors import InvalidQueryError
 
+from st2common.constants.garbage_collection import DEFAULT_PURGE_BATCH_SIZE
+from st2common.garbage_collection.utils import delete_by_query_in_batches
 from st2common.persistence.trace import Trace
 from st2common.util import isotime
 
 __all__ = ["purge_traces"]
 
 
-def purge_traces(logger, timestamp):
+def purge_traces(
+    logger, timestamp, batch_size=DEFAULT_PURGE_BATCH_SIZE, max_deletes_per_second=None
+):
     """
     :param timestamp: Trace instances older than this timestamp will be deleted.
     :type timestamp: ``datetime.datetime
+
+    :param batch_size: Maximum number of objects which are deleted in a single batch.
+    :type batch_size: ``int``
+
+    :param max_deletes_per_second: Maximum number of objects deleted per second.
+    :type max_deletes_per_second: ``int``
     """
     if not timestamp:
         raise ValueError("Specify a valid timestamp to purge.")
@@ -43,7 +53,13 @@ def purge_traces(logger, timestamp):
     query_filters = {"start_timestamp__lt": isotime.parse(timestamp)}
 
     try:
-        deleted_count = Trace.delete_by_query(**query_filters)
+        deleted_count = delete_by_query_in_batches(
+            model=Trace,
+            timestamp_field="start_timestamp",
+            query_filters=query_filters,
+            batch_size=batch_size,
+            max_deletes_per_second=max_deletes_per_second,
+        )
     except InvalidQueryError as e:
         msg = (
             "Bad query (%s) used to delete trace instances: %s"
@@ -22,16 +22,26 @@ from __future__ import absolute_import
 import six
 from mongoengine.errors import InvalidQueryError
 
+from st2common.constants.garbage_collection import DEFAULT_PURGE_BATCH_SIZE
+from st2common.garbage_collection.utils import delete_by_query_in_batches
 from st2common.persistence.trigger import TriggerInstance
 from st2common.util import isotime
 
 __all__ = ["purge_trigger_instances"]
 
 
-def purge_trigger_instances(logger, timestamp):
+def purge_trigger_instances(
+    logger, timestamp, batch_size=DEFAULT_PURGE_BATCH_SIZE, max_deletes_per_second=None
+):
     """
     :param timestamp: Trigger instances older than this timestamp will be deleted.
     :type timestamp: ``datetime.datetime
+
+    :param batch_size: Maximum number of objects which are deleted in a single batch.
+    :type batch_size: ``int``
+
+    :param max_deletes_per_second: Maximum number of objects deleted per second.
+    :type max_deletes_per_second: ``int``
     """
     if not timestamp:
         raise ValueError("Specify a valid timestamp to purge.")
@@ -44,7 +54,13 @@ def purge_trigger_instances(logger, timestamp):
     query_filters = {"occurrence_time__lt": isotime.parse(timestamp)}
 
     try:
-        deleted_count = TriggerInstance.delete_by_query(**query_filters)
+        deleted_count = delete_by_query_in_batches(
+            model=TriggerInstance,
+            timestamp_field="occurrence_time",
+            query_filters=query_filters,
+            batch_size=batch_size,
+            max_deletes_per_second=max_deletes_per_second,
+        )
     except InvalidQueryError as e:
         msg = (
             "Bad query (%s) used to delete trigger instances: %s"
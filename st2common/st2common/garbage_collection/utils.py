@@ -0,0 +1,109 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Utility functions for deleting old objects in bounded batches.
+"""
+
+from __future__ import absolute_import
+
+import copy
+import time
+
+from st2common.constants.garbage_collection import DEFAULT_PURGE_BATCH_SIZE
+from st2common.util import concurrency
+
+__all__ = ["delete_by_query_in_batches"]
+
+
+def delete_by_query_in_batches(
+    model,
+    timestamp_field,
+    query_filters,
+    batch_size=DEFAULT_PURGE_BATCH_SIZE,
+    max_deletes_per_second=None,
+    before_delete=None,
+):
+    """
+    Delete objects which match the provided query in batches.
+
+    Objects are retrieved in the ascending order of the (indexed) timestamp field and each batch
+    continues where the previous one ended so only a single batch of object ids is kept in memory
+    and each delete query only contains the ids of a single batch.
+
+    :param model: Persistence model class.
+
+    :param timestamp_field: Name of the indexed timestamp field which is used to walk the objects.
+    :type timestamp_field: ``str``
+
+    :param query_filters: Filters for the objects which should be deleted.
+    :type query_filters: ``dict``
+
+    :param batch_size: Maximum number of objects deleted in a single batch.
+    :type batch_size: ``int``
+
+    :param max_deletes_per_second: If specified, sleep between batches so no more than this many
+                                   objects are deleted per second.
+    :type max_deletes_per_second: ``int``
+
+    :param before_delete: Optional function which is called with a list of object ids of each
+                          batch before the objects are deleted (e.g. to delete child objects).
+    :type before_delete: ``callable``
+
+    :return: Number of deleted objects.
+    :rtype: ``int``
+    """
+    deleted_count = 0
+    last_timestamp = None
+
+    while True:
+        batch_start = time.time()
+
+        filters = copy.copy(query_filters)
+        if last_timestamp is not None:
+            filters["%s__gte" % (timestamp_field)] = last_timestamp
+
+        instances = list(
+            model.query(
+                only_fields=["id", timestamp_field],
+                no_dereference=True,
+                order_by=[timestamp_field],
+                limit=batch_size,
+                **filters,
+            )
+        )
+
+        if not instances:
+            break
+
+        ids = [instance.id for instance in instances]
+        last_timestamp = getattr(instances[-1], timestamp_field)
+
+        if before_delete:
+            before_delete(ids)
+
+        batch_deleted_count = model.delete_by_query(id__in=ids)
+        deleted_count += batch_deleted_count
+
+        if len(instances) < batch_size or not batch_deleted_count:
+            break
+
+        if max_deletes_per_second:
+            sleep_delay = batch_deleted_count / float(max_deletes_per_second) - (
+                time.time() - batch_start
+            )
+            if sleep_delay > 0:
+                concurrency.sleep(sleep_delay)
+
+    return deleted_count
@@ -23,6 +23,8 @@ import six
 from mongoengine.errors import InvalidQueryError
 
 from st2common.constants import action as action_constants
+from st2common.constants.garbage_collection import DEFAULT_PURGE_BATCH_SIZE
+from st2common.garbage_collection.utils import delete_by_query_in_batches
 from st2common.persistence.workflow import WorkflowExecution
 from st2common.persistence.workflow import TaskExecution
 
@@ -104,7 +106,13 @@ def purge_workflow_executions(logger, timestamp, purge_incomplete=False):
     )
 
 
-def purge_task_executions(logger, timestamp, purge_incomplete=False):
+def purge_task_executions(
+    logger,
+    timestamp,
+    purge_incomplete=False,
+    batch_size=DEFAULT_PURGE_BATCH_SIZE,
+    max_deletes_per_second=None,
+):
     """
     Purge task execution output objects.
 
@@ -113,6 +121,12 @@ def purge_task_executions(logger, timestamp, purge_incomplete=False):
 
     :param purge_incomplete: True to also delete executions which are not in a done state.
     :type purge_incomplete: ``bool``
+
+    :param batch_size: Maximum number of objects which are deleted in a single batch.
+    :type batch_size: ``int``
+
+    :param max_deletes_per_second: Maximum number of objects deleted per second.
+    :type max_deletes_per_second: ``int``
     """
     if not timestamp:
         raise ValueError("Specify a valid timestamp to purge.")
@@ -133,7 +147,13 @@ def purge_task_executions(logger, timestamp, purge_incomplete=False):
 
     exec_filters = copy.copy(filters)
     try:
-        deleted_count = TaskExecution.delete_by_query(**exec_filters)
+        deleted_count = delete_by_query_in_batches(
+            model=TaskExecution,
+            timestamp_field="start_timestamp",
+            query_filters=exec_filters,
+            batch_size=batch_size,
+            max_deletes_per_second=max_deletes_per_second,
+        )
     except InvalidQueryError as e:
         msg = (
             "Bad query (%s) used to delete task execution instances: %s"
@@ -148,9 +168,7 @@ def purge_task_executions(logger, timestamp, purge_incomplete=False):
     else:
         logger.info("Deleted %s task execution objects" % deleted_count)
 
-    zombie_execution_instances = len(
-        TaskExecution.query(only_fields=["id"], no_dereference=True, **exec_filters)
-    )
+    zombie_execution_instances = TaskExecution.count(**exec_filters)
 
     if zombie_execution_instances > 0:
         logger.error(
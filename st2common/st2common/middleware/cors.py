@@ -21,6 +21,7 @@ from st2common.constants.api import REQUEST_ID_HEADER
 from st2common.constants.auth import HEADER_ATTRIBUTE_NAME
 from st2common.constants.auth import HEADER_API_KEY_ATTRIBUTE_NAME
 from st2common.util.types import OrderedSet
+from st2common.util.pagination import NEXT_CURSOR_HEADER
 from st2common.router import Request
 from st2common.router import Response
 
@@ -77,11 +78,15 @@ class CorsMiddleware(object):
                 HEADER_ATTRIBUTE_NAME,
                 HEADER_API_KEY_ATTRIBUTE_NAME,
                 REQUEST_ID_HEADER,
+                "If-None-Match",
             ]
             response_headers_allowed = [
                 "Content-Type",
                 "X-Limit",
                 "X-Total-Count",
+                NEXT_CURSOR_HEADER,
+                "Link",
+                "ETag",
                 REQUEST_ID_HEADER,
             ]
 
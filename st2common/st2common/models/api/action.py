@@ -41,6 +41,7 @@ __all__ = [
     "ActionCreateAPI",
     "LiveActionAPI",
     "LiveActionCreateAPI",
+    "LiveActionBulkCreateAPI",
     "RunnerTypeAPI",
     "AliasExecutionAPI",
     "AliasMatchAndExecuteInputAPI",
@@ -512,6 +513,23 @@ class LiveActionCreateAPI(LiveActionAPI):
     }
 
 
+class LiveActionBulkCreateAPI(BaseAPI):
+    """
+    API model for bulk action execution create operations.
+
+    Individual execution requests are validated against the ExecutionRequest API spec.
+    """
+
+    schema = {
+        "type": "object",
+        "properties": {
+            # Holds a list of execution requests
+            "data": {"type": "array", "items": {"type": "object"}, "required": True}
+        },
+        "additionalProperties": False,
+    }
+
+
 class ActionExecutionStateAPI(BaseAPI):
     """
     System entity that represents state of an action in the system.
@@ -81,6 +81,7 @@ MODEL_MODULE_NAMES = [
     "st2common.models.db.pack",
     "st2common.models.db.policy",
     "st2common.models.db.rbac",
+    "st2common.models.db.revision",
     "st2common.models.db.rule",
     "st2common.models.db.rule_enforcement",
     "st2common.models.db.runner",
@@ -280,7 +281,7 @@ def db_setup(
     return connection
 
 
-def db_ensure_indexes(model_classes=None):
+def db_ensure_indexes(model_classes=None, ttl_indexes=None):
     """
     This function ensures that indexes for all the models have been created and the
     extra indexes cleaned up.
@@ -294,6 +295,12 @@ def db_ensure_indexes(model_classes=None):
     :param model_classes: DB model classes to ensure indexes for. If not specified, indexes are
                           ensured for all the models.
     :type model_classes: ``list``
+
+    :param ttl_indexes: Optional TTL indexes to ensure keyed by the model class name. Value is a
+                        tuple of a date field name and the number of seconds after which the
+                        documents expire. If the number of seconds is None, the TTL index is
+                        dropped. Models which are not specified here keep their TTL indexes.
+    :type ttl_indexes: ``dict``
     """
     LOG.debug("Ensuring database indexes...")
 
@@ -327,6 +334,14 @@ def db_ensure_indexes(model_classes=None):
             exc_cls = type(e)
             raise exc_cls(msg)
 
+        if ttl_indexes and class_name in ttl_indexes:
+            field_name, expire_after_seconds = ttl_indexes[class_name]
+            ensure_ttl_index(
+                model_class=model_class,
+                field_name=field_name,
+                expire_after_seconds=expire_after_seconds,
+            )
+
         if model_class.__name__ in INDEX_CLEANUP_MODEL_NAMES_BLACKLIST:
             LOG.debug(
                 'Skipping index cleanup for blacklisted model "%s"...' % (class_name)
@@ -346,9 +361,77 @@ def db_ensure_indexes(model_classes=None):
     )
 
 
+def ensure_ttl_index(model_class, field_name, expire_after_seconds):
+    """
+    Ensure a TTL index on the provided date field which makes MongoDB delete the documents
+    ``expire_after_seconds`` after the date stored in that field.
+
+    TTL indexes are not defined in the model meta since the expiration is configurable, but they
+    are not removed by cleanup_extra_indexes().
+
+    :param expire_after_seconds: Number of seconds after which the documents expire. If None, the
+                                 TTL index is dropped.
+    :type expire_after_seconds: ``int``
+    """
+    class_name = model_class.__name__
+    index_name = "%s_ttl" % (field_name)
+    key = [(field_name, 1)]
+
+    c = model_class._get_collection()
+    info = c.index_information()
+
+    for name, value in six.iteritems(info):
+        if name == index_name or [tuple(item) for item in value["key"]] != key:
+            continue
+
+        # MongoDB doesn't allow two indexes with the same key so a regular index on the same
+        # field needs to be replaced with the TTL one
+        if expire_after_seconds is not None:
+            LOG.debug(
+                'Dropping index "%s" for model "%s" in favor of the TTL index'
+                % (name, class_name)
+            )
+            c.drop_index(name)
+
+    existing_index = info.get(index_name, None)
+
+    if expire_after_seconds is None:
+        if existing_index:
+            LOG.info(
+                'Dropping TTL index "%s" for model "%s"' % (index_name, class_name)
+            )
+            c.drop_index(index_name)
+        return
+
+    if not existing_index:
+        LOG.info(
+            'Creating TTL index "%s" (expireAfterSeconds=%s) for model "%s"'
+            % (index_name, expire_after_seconds, class_name)
+        )
+        c.create_index(
+            key,
+            name=index_name,
+            expireAfterSeconds=expire_after_seconds,
+            background=True,
+        )
+    elif existing_index.get("expireAfterSeconds", None) != expire_after_seconds:
+        # Changing the expiration doesn't require the index to be rebuilt
+        LOG.info(
+            'Updating TTL index "%s" (expireAfterSeconds=%s) for model "%s"'
+            % (index_name, expire_after_seconds, class_name)
+        )
+        c.database.command(
+            "collMod",
+            c.name,
+            index={"name": index_name, "expireAfterSeconds": expire_after_seconds},
+        )
+
+
 def cleanup_extra_indexes(model_class):
     """
     Finds any extra indexes and removes those from mongodb.
+
+    Note: TTL indexes are managed by ensure_ttl_index() and are never removed here.
     """
     extra_indexes = model_class.compare_indexes().get("extra", None)
     if not extra_indexes:
@@ -358,7 +441,17 @@ def cleanup_extra_indexes(model_class):
     # pymongo interfaces via some private methods.
     removed_count = 0
     c = model_class._get_collection()
+
+    ttl_index_keys = [
+        [tuple(item) for item in value["key"]]
+        for value in c.index_information().values()
+        if "expireAfterSeconds" in value
+    ]
+
     for extra_index in extra_indexes:
+        if [tuple(item) for item in extra_index] in ttl_index_keys:
+            continue
+
         try:
             c.drop_index(extra_index)
             LOG.debug(
@@ -631,6 +724,23 @@ class MongoDBAccess(object):
         instance = self.model.objects.insert(instance)
         return self._undo_dict_field_escape(instance)
 
+    def insert_many(self, instances):
+        # NOTE: We use the collection directly since mongoengine refuses to bulk insert documents
+        # with pre-generated ids (e.g. action executions) and it re-loads all the inserted
+        # documents from the database
+        documents = [instance.to_mongo() for instance in instances]
+
+        try:
+            self.model._get_collection().insert_many(documents)
+        finally:
+            # NOTE: pymongo assigns ids to the documents before they are inserted so ids are also
+            # set for the documents which have been inserted before a failure
+            for instance, document in zip(instances, documents):
+                if document.get("_id", None):
+                    instance.id = document["_id"]
+
+        return [self._undo_dict_field_escape(instance) for instance in instances]
+
     def add_or_update(self, instance, validate=True):
         instance.save(validate=validate)
         return self._undo_dict_field_escape(instance)
@@ -0,0 +1,39 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import mongoengine as me
+
+from st2common.models.db import MongoDBAccess
+from st2common.models.db import stormbase
+
+__all__ = ["ResourceRevisionDB"]
+
+
+class ResourceRevisionDB(stormbase.StormFoundationDB):
+    """
+    Database entity which holds a revision counter for a collection of resources. The counter is
+    incremented every time a resource in that collection is created, updated or deleted.
+    """
+
+    collection = me.StringField(
+        required=True, unique=True, help_text="Name of the resource collection."
+    )
+    revision = me.IntField(default=0, help_text="Revision of the collection.")
+
+
+resource_revision_access = MongoDBAccess(ResourceRevisionDB)
+
+MODELS = [ResourceRevisionDB]
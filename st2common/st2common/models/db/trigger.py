@@ -150,7 +150,9 @@ class TriggerInstanceDB(stormbase.StormFoundationDB):
 
     meta = {
         "indexes": [
-            {"fields": ["occurrence_time"]},
+            # NOTE: There is intentionally no single field index on "occurrence_time". Queries
+            # on that field use the compound index below and the garbage collector can create a
+            # TTL index on it (see "use_ttl_indexes" option).
             {"fields": ["trigger"]},
             {"fields": ["-occurrence_time", "trigger"]},
             {"fields": ["status"]},
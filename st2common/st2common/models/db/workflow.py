@@ -78,6 +78,7 @@ class TaskExecutionDB(stormbase.StormFoundationDB, stormbase.ChangeRevisionField
         "indexes": [
             {"fields": ["workflow_execution"]},
             {"fields": ["task_id"]},
+            {"fields": ["start_timestamp"]},
             {"fields": ["task_id", "task_route"]},
             {"fields": ["workflow_execution", "task_id"]},
             {"fields": ["workflow_execution", "task_id", "task_route"]},
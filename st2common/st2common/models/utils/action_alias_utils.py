@@ -42,6 +42,7 @@ else:
     )
 
 
+from st2common.util.cache import ExpiringLRUCache
 from st2common.util.jinja import render_values
 from st2common.constants import keyvalue as kv_constants
 from st2common.services import keyvalues as kv_service
@@ -52,6 +53,7 @@ __all__ = [
     "ActionAliasFormatParser",
     "extract_parameters_for_action_alias_db",
     "extract_parameters",
+    "get_format_string_regex",
     "search_regex_tokens",
 ]
 
@@ -60,6 +62,12 @@ LOG = log.getLogger(__name__)
 
 SUBPATTERN_INDEX = 3
 
+# Maximum number of compiled format strings which are kept in memory
+FORMAT_CACHE_SIZE = 1000
+
+# Optional parameters and regex only depend on the format string so we only compile them once
+_COMPILED_FORMATS = ExpiringLRUCache(size=FORMAT_CACHE_SIZE)
+
 
 class ActionAliasFormatParser(object):
     def __init__(self, alias_format=None, param_stream=None):
@@ -76,11 +84,30 @@ class ActionAliasFormatParser(object):
         # and cutting them from the command string afterwards.
         self._kv_pairs, self._param_stream = self.match_kv_pairs_at_end()
 
-        # 2. Matching optional parameters (with default values).
-        self._optional = self.generate_optional_params_regex()
+        compiled = _COMPILED_FORMATS.get(self._format)
 
-        # 3. Convert the mangled format string into a regex object
-        self._regex = self.transform_format_string_into_regex()
+        if compiled is None:
+            # 2. Matching optional parameters (with default values).
+            optional = self.generate_optional_params_regex()
+
+            # 3. Convert the mangled format string into a regex object
+            regex = self.transform_format_string_into_regex()
+
+            compiled = (optional, regex)
+            _COMPILED_FORMATS.set(self._format, compiled)
+
+        self._optional, self._regex = compiled
+
+    @property
+    def param_stream(self):
+        """
+        Command string with the arbitrary key-value pairs at the end removed.
+        """
+        return self._param_stream
+
+    @property
+    def regex(self):
+        return self._regex
 
     def generate_snippets(self):
         # I'll split the whole convoluted regex into snippets to make it
@@ -254,6 +281,16 @@ def extract_parameters(format_str, param_stream, match_multiple=False):
         return parser.get_extracted_param_value()
 
 
+def get_format_string_regex(format_str):
+    """
+    Return compiled regex for the provided format string.
+
+    Note: Regex needs to be matched against the command with arbitrary key-value pairs at the end
+    removed (see ActionAliasFormatParser.param_stream).
+    """
+    return ActionAliasFormatParser(alias_format=format_str).regex
+
+
 def inject_immutable_parameters(
     action_alias_db, multiple_execution_parameters, action_context
 ):
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 from __future__ import absolute_import
+from st2common import transport
 from st2common.models.db.action import action_access
 from st2common.persistence import base as persistence
 from st2common.persistence.actionalias import ActionAlias
@@ -34,7 +35,15 @@ __all__ = [
 
 class Action(persistence.ContentPackResource):
     impl = action_access
+    track_revisions = True
+    publisher = None
 
     @classmethod
     def _get_impl(cls):
         return cls.impl
+
+    @classmethod
+    def _get_publisher(cls):
+        if not cls.publisher:
+            cls.publisher = transport.content.ContentCUDPublisher()
+        return cls.publisher
@@ -19,12 +19,14 @@ from typing import Optional
 from typing import List
 
 import abc
+import copy
 
 import six
 
 from st2common import log as logging
 from st2common.exceptions.db import StackStormDBObjectConflictError
 from st2common.models.system.common import ResourceReference
+from st2common.util.cache import ExpiringLRUCache
 
 
 __all__ = ["Access", "ContentPackResource", "StatusBasedResource"]
@@ -48,6 +50,15 @@ class Access(object):
     # used when dispatching a trigger
     operation_to_trigger_ref_map = {}
 
+    # In-process cache for resource lookups (see enable_cache). Caching is disabled by default
+    # and only classes which explicitly support it consult the cache.
+    cache = None
+
+    # True to maintain a revision counter for the collection of this resource. The counter is
+    # bumped when a create, update or delete event is published and used by the API to generate
+    # ETags for the resource list responses.
+    track_revisions = False
+
     @classmethod
     @abc.abstractmethod
     def _get_impl(cls):
@@ -77,6 +88,70 @@ class Access(object):
     def _get_by_object(cls, object):
         return None
 
+    @classmethod
+    def enable_cache(cls, size, ttl=None):
+        """
+        Enable in-process cache for lookups of this resource.
+
+        Cache should only be enabled in a process which also runs a watcher which invalidates the
+        cache on resource CUD events published by other processes (see
+        st2common.services.content_cache).
+        """
+        cls.cache = ExpiringLRUCache(size=size, ttl=ttl)
+
+    @classmethod
+    def disable_cache(cls):
+        cls.cache = None
+
+    @classmethod
+    def invalidate_cache(cls):
+        # NOTE: Content changes are rare so we simply invalidate all the cached entries. This way
+        # we don't need to track renamed resources.
+        if cls.cache is not None:
+            cls.cache.clear()
+
+    @classmethod
+    def _get_from_cache(cls, key):
+        son = cls.cache.get(key)
+
+        if son is None:
+            return None
+
+        # Each caller gets its own copy of the object so callers can't affect each other
+        return cls._get_impl().model._from_son(copy.deepcopy(son))
+
+    @classmethod
+    def _add_to_cache(cls, key, model_object, generation):
+        cls.cache.set(key, model_object.to_mongo(), generation=generation)
+
+    @classmethod
+    def get_revision(cls):
+        """
+        Return current revision of the collection of this resource.
+
+        :rtype: ``str``
+        """
+        # Late import to avoid circular import
+        from st2common.persistence.revision import ResourceRevision
+
+        collection = cls._get_impl().model._get_collection_name()
+        return ResourceRevision.get_revision(collection=collection)
+
+    @classmethod
+    def bump_revision(cls):
+        if not cls.track_revisions:
+            return
+
+        # Late import to avoid circular import
+        from st2common.persistence.revision import ResourceRevision
+
+        collection = cls._get_impl().model._get_collection_name()
+
+        try:
+            ResourceRevision.bump(collection=collection)
+        except Exception:
+            LOG.exception('Failed to bump revision of "%s" collection.', collection)
+
     @classmethod
     def get_by_name(cls, value):
         return cls._get_impl().get_by_name(value)
@@ -137,6 +212,7 @@ class Access(object):
             raise ValueError("id for object %s was unexpected." % model_object)
         try:
             model_object = cls._get_impl().insert(model_object)
+            cls.invalidate_cache()
         except NotUniqueError as e:
             if log_not_unique_error_as_debug:
                 LOG.debug("Conflict while trying to save in DB: %s.", six.text_type(e))
@@ -167,6 +243,36 @@ class Access(object):
 
         return model_object
 
+    @classmethod
+    def insert_many(cls, model_objects, publish=True, dispatch_trigger=True):
+        """
+        Insert multiple new objects using a single bulk insert operation.
+
+        :rtype: ``list``
+        """
+        if not model_objects:
+            return []
+
+        model_objects = cls._get_impl().insert_many(model_objects)
+        cls.invalidate_cache()
+
+        for model_object in model_objects:
+            # Publish internal event on the message bus
+            if publish:
+                try:
+                    cls.publish_create(model_object)
+                except:
+                    LOG.exception("Publish failed.")
+
+            # Dispatch trigger
+            if dispatch_trigger:
+                try:
+                    cls.dispatch_create_trigger(model_object)
+                except:
+                    LOG.exception("Trigger dispatch failed.")
+
+        return model_objects
+
     @classmethod
     def add_or_update(
         cls,
@@ -183,6 +289,7 @@ class Access(object):
         pre_persist_id = model_object.id
         try:
             model_object = cls._get_impl().add_or_update(model_object, validate=True)
+            cls.invalidate_cache()
         except NotUniqueError as e:
             if log_not_unique_error_as_debug:
                 LOG.debug("Conflict while trying to save in DB: %s.", six.text_type(e))
@@ -229,6 +336,7 @@ class Access(object):
         * special operators like push, push_all are to be used.
         """
         cls._get_impl().update(model_object, **kwargs)
+        cls.invalidate_cache()
         # update does not return the object but a flag; likely success/fail but docs
         # are not very good on this one so ignoring. Explicitly get the object from
         # DB abd return.
@@ -253,6 +361,7 @@ class Access(object):
     @classmethod
     def delete(cls, model_object, publish=True, dispatch_trigger=True):
         persisted_object = cls._get_impl().delete(model_object)
+        cls.invalidate_cache()
 
         # Publish internal event on the message bus
         if publish:
@@ -276,18 +385,24 @@ class Access(object):
 
     @classmethod
     def publish_create(cls, model_object):
+        cls.bump_revision()
+
         publisher = cls._get_publisher()
         if publisher:
             publisher.publish_create(model_object)
 
     @classmethod
     def publish_update(cls, model_object):
+        cls.bump_revision()
+
         publisher = cls._get_publisher()
         if publisher:
             publisher.publish_update(model_object)
 
     @classmethod
     def publish_delete(cls, model_object):
+        cls.bump_revision()
+
         publisher = cls._get_publisher()
         if publisher:
             publisher.publish_delete(model_object)
@@ -369,11 +484,25 @@ class ContentPackResource(Access):
         if not ref:
             return None
 
+        # Partial objects are never cached
+        use_cache = cls.cache is not None and not only_fields
+
+        if use_cache:
+            result = cls._get_from_cache(ref)
+
+            if result is not None:
+                return result
+
+            generation = cls.cache.generation
+
         ref_obj = ResourceReference.from_string_reference(ref=ref)
         result = cls.query(
             name=ref_obj.name, pack=ref_obj.pack, only_fields=only_fields
         ).first()
 
+        if use_cache and result is not None:
+            cls._add_to_cache(ref, result, generation=generation)
+
         return result
 
     @classmethod
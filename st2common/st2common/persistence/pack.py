@@ -14,6 +14,7 @@
 # limitations under the License.
 
 from __future__ import absolute_import
+from st2common import transport
 from st2common.persistence import base
 from st2common.models.db.pack import pack_access
 from st2common.models.db.pack import config_schema_access
@@ -24,6 +25,7 @@ __all__ = ["Pack", "ConfigSchema", "Config"]
 
 class Pack(base.Access):
     impl = pack_access
+    track_revisions = True
 
     @classmethod
     def _get_impl(cls):
@@ -32,15 +34,29 @@ class Pack(base.Access):
 
 class ConfigSchema(base.Access):
     impl = config_schema_access
+    publisher = None
 
     @classmethod
     def _get_impl(cls):
         return cls.impl
 
+    @classmethod
+    def _get_publisher(cls):
+        if not cls.publisher:
+            cls.publisher = transport.pack.PackConfigCUDPublisher()
+        return cls.publisher
+
 
 class Config(base.Access):
     impl = config_access
+    publisher = None
 
     @classmethod
     def _get_impl(cls):
         return cls.impl
+
+    @classmethod
+    def _get_publisher(cls):
+        if not cls.publisher:
+            cls.publisher = transport.pack.PackConfigCUDPublisher()
+        return cls.publisher
@@ -0,0 +1,57 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+from st2common.models.db.revision import resource_revision_access
+from st2common.persistence import base as persistence
+
+__all__ = ["ResourceRevision"]
+
+
+class ResourceRevision(persistence.Access):
+    impl = resource_revision_access
+
+    @classmethod
+    def _get_impl(cls):
+        return cls.impl
+
+    @classmethod
+    def bump(cls, collection):
+        """
+        Atomically increment revision of the provided collection.
+        """
+        model = cls._get_impl().model
+        model.objects(collection=collection).update_one(inc__revision=1, upsert=True)
+
+    @classmethod
+    def get_revision(cls, collection):
+        """
+        Return revision of the provided collection.
+
+        Revision includes the id of the counter document so the revisions are not repeated if
+        the counter is ever reset.
+
+        :rtype: ``str``
+        """
+        model = cls._get_impl().model
+        revision_db = model.objects(collection=collection).first()
+
+        if not revision_db:
+            model.objects(collection=collection).update_one(
+                set_on_insert__revision=0, upsert=True
+            )
+            revision_db = model.objects(collection=collection).first()
+
+        return "%s-%s" % (revision_db.id, revision_db.revision)
@@ -20,6 +20,7 @@ from st2common.persistence.base import Access, ContentPackResource
 
 class Rule(ContentPackResource):
     impl = rule_access
+    track_revisions = True
 
     @classmethod
     def _get_impl(cls):
@@ -14,17 +14,39 @@
 # limitations under the License.
 
 from __future__ import absolute_import
+from st2common import transport
 from st2common.persistence import base as persistence
 from st2common.models.db.runner import runnertype_access
 
 
 class RunnerType(persistence.Access):
     impl = runnertype_access
+    publisher = None
 
     @classmethod
     def _get_impl(cls):
         return cls.impl
 
+    @classmethod
+    def _get_publisher(cls):
+        if not cls.publisher:
+            cls.publisher = transport.content.ContentCUDPublisher()
+        return cls.publisher
+
+    @classmethod
+    def get_by_name(cls, value):
+        if cls.cache is None:
+            return super(RunnerType, cls).get_by_name(value)
+
+        result = cls._get_from_cache(value)
+
+        if result is None:
+            generation = cls.cache.generation
+            result = super(RunnerType, cls).get_by_name(value)
+            cls._add_to_cache(value, result, generation=generation)
+
+        return result
+
     @classmethod
     def _get_by_object(cls, object):
         # For RunnerType name is unique.
@@ -24,6 +24,7 @@ __all__ = ["SensorType"]
 
 class SensorType(ContentPackResource):
     impl = sensor_type_access
+    track_revisions = True
     publisher = None
 
     @classmethod
@@ -32,14 +32,23 @@ LOG = logging.getLogger(__name__)
 
 class TriggerType(ContentPackResource):
     impl = triggertype_access
+    track_revisions = True
+    publisher = None
 
     @classmethod
     def _get_impl(cls):
         return cls.impl
 
+    @classmethod
+    def _get_publisher(cls):
+        if not cls.publisher:
+            cls.publisher = transport.content.ContentCUDPublisher()
+        return cls.publisher
+
 
 class Trigger(ContentPackResource):
     impl = trigger_access
+    track_revisions = True
     publisher = None
 
     @classmethod
@@ -59,6 +68,7 @@ class Trigger(ContentPackResource):
         delete_query = model_object._object_key
         delete_query["ref_count__lte"] = 0
         cls._get_impl().delete_by_query(**delete_query)
+        cls.invalidate_cache()
 
         # Since delete_by_query cannot tell if teh delete actually happened check with a get call
         # if the trigger was deleted. Unfortuantely, this opens up to races on delete.
@@ -16,6 +16,7 @@
 from __future__ import absolute_import
 
 import functools
+import itertools
 import re
 import six
 import sys
@@ -38,6 +39,7 @@ from st2common import log as logging
 from st2common.persistence.auth import User
 from st2common.rbac.backends import get_rbac_backend
 from st2common.util import date as date_utils
+from st2common.util import pagination as pagination_utils
 from st2common.util.jsonify import json_encode
 from st2common.util.jsonify import json_decode
 from st2common.util.jsonify import get_json_type_for_python_value
@@ -47,6 +49,7 @@ from st2common.util.deep_copy import fast_deepcopy_dict
 __all__ = [
     "Router",
     "Response",
+    "StreamingJSONListResponse",
     "NotFoundException",
     "abort",
     "abort_unauthorized",
@@ -215,6 +218,88 @@ class Response(webob.Response):
     json = json_body = property(_json_body__get, _json_body__set, _json_body__del)
 
 
+class StreamingJSONListResponse(Response):
+    """
+    Response which serializes the provided items one by one and streams the resulting JSON array
+    to the client in chunks.
+
+    Items are consumed lazily while the response is being written so the memory usage doesn't
+    depend on the number of items in the response.
+    """
+
+    # Approximate size of the chunks (in bytes) which are written to the client
+    chunk_size = 64 * 1024
+
+    def __init__(self, items, status=None, headerlist=None, *args, **kwargs):
+        """
+        :param items: Iterable of JSON serializable items.
+        """
+        self.items = items
+
+        # Functions which are applied to each item before it's serialized
+        self.item_filters = []
+
+        super(StreamingJSONListResponse, self).__init__(
+            None,
+            status,
+            headerlist,
+            self._get_chunks(),
+            "application/json",
+            *args,
+            **kwargs,
+        )
+
+    def prefetch(self):
+        """
+        Serialize the first chunk of the response.
+
+        This retrieves and serializes the first items before the response is returned so errors
+        (e.g. an invalid query) are still handled by the error handling middleware instead of
+        resulting in a truncated response with 200 status code.
+        """
+        chunks = self._get_chunks()
+        first_chunk = next(chunks)
+        self.app_iter = itertools.chain([first_chunk], chunks)
+
+    def _get_chunks(self):
+        chunk = [b"["]
+        chunk_size = 1
+        started = False
+
+        try:
+            for index, item in enumerate(self.items):
+                if self.item_filters and hasattr(item, "__json__"):
+                    item = item.__json__()
+
+                for item_filter in self.item_filters:
+                    item = item_filter(item)
+
+                data = json_encode(item).encode("utf-8")
+
+                if index > 0:
+                    chunk.append(b",")
+
+                chunk.append(data)
+                chunk_size += len(data) + 1
+
+                if chunk_size >= self.chunk_size:
+                    started = True
+                    yield b"".join(chunk)
+                    chunk = []
+                    chunk_size = 0
+        except Exception:
+            if started:
+                # Status and headers have already been sent. Exception is propagated to the WSGI
+                # server which closes the connection without terminating the response so the
+                # client sees an incomplete response instead of a valid, but truncated JSON array
+                LOG.exception("Failed to stream list response, closing the connection.")
+
+            raise
+
+        chunk.append(b"]")
+        yield b"".join(chunk)
+
+
 class Router(object):
     def __init__(self, arguments=None, debug=False, auth=True, is_gunicorn=True):
         self.debug = debug
@@ -226,6 +311,8 @@ class Router(object):
         self.spec = {}
         self.spec_resolver = None
         self.routes = routes.Mapper()
+        # Compiled request body validators keyed on (operation id, argument name)
+        self.body_validators = {}
 
     def add_spec(self, spec, transforms):
         info = spec.get("info", {})
@@ -237,6 +324,7 @@ class Router(object):
 
         self.spec = spec
         self.spec_resolver = jsonschema.RefResolver("", self.spec)
+        self.body_validators = {}
 
         validate_spec(fast_deepcopy_dict(self.spec))
 
@@ -532,8 +620,15 @@ class Router(object):
                     # Convert bytes to text type (string / unicode)
                     data = data.decode("utf-8")
 
+                validator_key = (endpoint["operationId"], argument_name)
+                validator = self.body_validators.get(validator_key, None)
+
+                if validator is None:
+                    validator = CustomValidator(schema, resolver=self.spec_resolver)
+                    self.body_validators[validator_key] = validator
+
                 try:
-                    CustomValidator(schema, resolver=self.spec_resolver).validate(data)
+                    validator.validate(data)
                 except (jsonschema.ValidationError, ValueError) as e:
                     raise exc.HTTPBadRequest(
                         detail=getattr(e, "message", six.text_type(e)),
@@ -674,8 +769,22 @@ class Router(object):
             "x-is-streaming-endpoint", bool("st2stream" in operation_id)
         )
 
-        if (
+        # NOTE: Streaming list responses are filtered while being written to the client
+        is_streaming_list = isinstance(resp, StreamingJSONListResponse)
+
+        if is_streaming_list and has_include_or_exclude_attributes:
+            mandatory_include_fields = getattr(
+                controller_instance, "mandatory_include_fields_response", []
+            )
+            item_filter = self._get_response_item_filter(
+                mandatory_include_fields=mandatory_include_fields,
+                include_attributes=include_attributes,
+                exclude_attributes=exclude_attributes,
+            )
+            resp.item_filters.append(item_filter)
+        elif (
             not is_streamming_controller
+            and not is_streaming_list
             and resp.body
             and has_include_or_exclude_attributes
         ):
@@ -692,6 +801,11 @@ class Router(object):
             )
             resp.json = data
 
+        if is_streaming_list:
+            # Retrieve the first items before returning the response so errors are still handled
+            # by the error handling middleware
+            resp.prefetch()
+
         responses = endpoint.get("responses", {})
         response_spec = responses.get(str(resp.status_code), None)
         default_response_spec = responses.get("default", None)
@@ -715,6 +829,7 @@ class Router(object):
             response_spec
             and "schema" in response_spec
             and not has_include_or_exclude_attributes
+            and not is_streaming_list
             and validate_response
         ):
             # NOTE: We don't perform response validation when include or exclude attributes are
@@ -742,6 +857,13 @@ class Router(object):
                 'No response spec found for endpoint "%s"' % (endpoint["operationId"])
             )
 
+        # Include a link to the next page for list responses which use cursor pagination
+        next_cursor = resp.headers.get(pagination_utils.NEXT_CURSOR_HEADER, None)
+        if next_cursor and "Link" not in resp.headers:
+            resp.headers["Link"] = pagination_utils.get_next_page_link(
+                path=req.path, params=req.GET.items(), cursor=next_cursor
+            )
+
         if cookie_token:
             resp.headerlist.append(("Set-Cookie", cookie_token))
 
@@ -785,6 +907,47 @@ class Router(object):
         :param data: Response data.
         :type: data: ``list`` or ``dict``
         """
+        process_item = self._get_response_item_filter(
+            mandatory_include_fields=mandatory_include_fields,
+            include_attributes=include_attributes,
+            exclude_attributes=exclude_attributes,
+        )
+
+        #  Common case - filters are not provided
+        if not process_item:
+            return data
+
+        # Skip processing of error responses
+        if isinstance(data, dict) and data.get("faultstring", None):
+            return data
+
+        result = None
+        if isinstance(data, (list, tuple)):
+            # get_all response
+            result = []
+            for item in data:
+                item = process_item(item)
+                result.append(item)
+        elif isinstance(data, dict):
+            # get_one response
+            result = process_item(data)
+        else:
+            raise ValueError("Unsupported type: %s" % (type(data)))
+
+        return result
+
+    def _get_response_item_filter(
+        self,
+        mandatory_include_fields=None,
+        include_attributes=None,
+        exclude_attributes=None,
+    ):
+        """
+        Return function which removes attributes from a single response item based on the values
+        of exclude_attributes and include_attributes query param filters.
+
+        :return: Filter function or None if no filters are provided.
+        """
         mandatory_include_fields = mandatory_include_fields or []
         include_attributes = include_attributes or []
         exclude_attributes = exclude_attributes or []
@@ -797,13 +960,8 @@ class Router(object):
             )
             raise ValueError(msg)
 
-        #  Common case - filters are not provided
         if not include_attributes and not exclude_attributes:
-            return data
-
-        # Skip processing of error responses
-        if isinstance(data, dict) and data.get("faultstring", None):
-            return data
+            return None
 
         # We only care about the first part of the field name since deep filtering happens inside
         # MongoDB. Deep filtering here would also be quite expensive and waste of CPU cycles.
@@ -833,17 +991,4 @@ class Router(object):
 
             return result
 
-        result = None
-        if isinstance(data, (list, tuple)):
-            # get_all response
-            result = []
-            for item in data:
-                item = process_item(item)
-                result.append(item)
-        elif isinstance(data, dict):
-            # get_one response
-            result = process_item(data)
-        else:
-            raise ValueError("Unsupported type: %s" % (type(data)))
-
-        return result
+        return process_item
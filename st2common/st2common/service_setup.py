@@ -45,6 +45,9 @@ from st2common.rbac.migrations import run_all as run_all_rbac_migrations
 from st2common.logging.filters import LogLevelFilter
 from st2common.util import system_info
 from st2common.services import coordination
+from st2common.services import content_cache
+from st2common.services import trace_writer
+from st2common.transport import publishers
 from st2common.logging.misc import add_global_filters_for_all_loggers
 from st2common.constants.error_messages import PYTHON2_DEPRECATION
 from st2common.services.coordination import get_driver_name
@@ -110,6 +113,7 @@ def setup(
     6. Register internal trigger types
     7. Register all the runners which are installed inside StackStorm virtualenv.
     8. Register service in the service registry with the provided capabilities
+    9. Start content resource cache watcher (if enabled)
 
     :param service: Name of the service.
     :param config: Config object to use to parse args.
@@ -271,6 +275,9 @@ def setup(
 
     metrics_initialize()
 
+    if cfg.CONF.content.resource_cache_enabled and setup_db and register_mq_exchanges:
+        content_cache.start_watcher()
+
     # Register service in the service registry
     if cfg.CONF.coordination.service_registry and service_registry:
         # NOTE: It's important that we pass start_heart=True to start the hearbeat process
@@ -297,13 +304,22 @@ def teardown():
     """
     Common teardown function.
     """
-    # 1. Tear down the database
+    # 1. Write queued trace updates
+    trace_writer.shutdown_trace_writer()
+
+    # 2. Wait for pending publisher confirms
+    publishers.shutdown_publishers()
+
+    # 3. Tear down the database
     db_teardown()
 
-    # 2. Tear down the coordinator
+    # 4. Tear down the coordinator
     coordinator = coordination.get_coordinator_if_set()
     coordination.coordinator_teardown(coordinator)
 
+    # 5. Stop the content resource cache watcher
+    content_cache.stop_watcher()
+
 
 def register_service_in_service_registry(service, capabilities=None, start_heart=True):
     """
@@ -18,6 +18,7 @@ import six
 
 from st2common import log as logging
 from st2common.constants import action as action_constants
+from st2common.constants.trace import TRACE_CONTEXT
 from st2common.exceptions import actionrunner as runner_exc
 from st2common.exceptions import db as db_exc
 from st2common.exceptions import trace as trace_exc
@@ -40,6 +41,8 @@ from st2common.util import schema as util_schema
 __all__ = [
     "request",
     "create_request",
+    "create_requests",
+    "prepare_request",
     "publish_request",
     "is_action_canceled_or_canceling",
     "request_pause",
@@ -76,10 +79,87 @@ def create_request(
     :return: (liveaction, execution)
     :rtype: tuple
     """
-    # We import this here to avoid conflicts w/ runners that might import this
-    # file since the runners don't have the config context by default.
-    from st2common.metrics.base import get_driver
+    liveaction, action_db, runnertype_db = prepare_request(
+        liveaction=liveaction,
+        action_db=action_db,
+        runnertype_db=runnertype_db,
+        validate_params=validate_params,
+    )
+
+    return _save_request(
+        liveaction=liveaction, action_db=action_db, runnertype_db=runnertype_db
+    )
+
+
+def create_requests(requests):
+    """
+    Create multiple action executions using bulk inserts.
+
+    Live action, action execution and trace objects for the executions which were requested by
+    hand are inserted into the database using a single bulk insert per collection. Executions
+    which are part of an existing trace or workflow are created one by one.
+
+    A failure to create one of the executions doesn't affect the other ones so the caller can
+    still publish the executions which have been created.
+
+    :param requests: A list of (liveaction, action_db, runnertype_db) tuples. Live actions need
+                     to be prepared and validated using "prepare_request" first.
+    :type requests: ``list``
+
+    :return: A list with a (liveaction, execution) tuple for each created execution and the
+             exception for each request which failed (in the same order as the requests).
+    :rtype: ``list``
+    """
+    results = [None] * len(requests)
+    bulk_requests = []
+
+    for index, (liveaction, action_db, runnertype_db) in enumerate(requests):
+        has_trace_context = bool(liveaction.context.get(TRACE_CONTEXT, None))
+        has_parent_context = bool(executions.get_parent_context(liveaction))
 
+        if not has_trace_context and not has_parent_context:
+            bulk_requests.append((index, liveaction, action_db, runnertype_db))
+            continue
+
+        try:
+            results[index] = _save_request(
+                liveaction=liveaction, action_db=action_db, runnertype_db=runnertype_db
+            )
+        except trace_exc.TraceNotFoundException as e:
+            results[index] = e
+        except Exception as e:
+            LOG.exception("Failed to create action execution.")
+            results[index] = e
+
+    if not bulk_requests:
+        return results
+
+    try:
+        created_requests = _save_requests(requests=bulk_requests)
+    except Exception as e:
+        LOG.exception("Failed to create %s action executions." % (len(bulk_requests)))
+        created_requests = [e] * len(bulk_requests)
+
+    for (index, _, _, _), created_request in zip(bulk_requests, created_requests):
+        results[index] = created_request
+
+    return results
+
+
+def prepare_request(
+    liveaction, action_db=None, runnertype_db=None, validate_params=True, schema=None
+):
+    """
+    Validate the live action and populate the attributes which are set when an action execution
+    is requested.
+
+    :param schema: Action parameters schema. If not provided, it's generated from the action and
+                   runner parameters. Useful when requesting many executions of the same action.
+    :type schema: ``dict``
+
+    :return: (liveaction, action_db, runnertype_db)
+    :rtype: tuple
+    """
     # Use the user context from the parent action execution. Subtasks in a workflow
     # action can be invoked by a system user and so we want to use the user context
     # from the original workflow action.
@@ -112,9 +192,13 @@ def create_request(
     liveaction.context["pack"] = action_db.pack
 
     # Validate action parameters.
-    schema = util_schema.get_schema_for_action_parameters(action_db, runnertype_db)
-    validator = util_schema.get_validator()
     if validate_params:
+        if schema is None:
+            schema = util_schema.get_schema_for_action_parameters(
+                action_db, runnertype_db
+            )
+
+        validator = util_schema.get_validator()
         util_schema.validate(
             liveaction.parameters,
             schema,
@@ -150,6 +234,64 @@ def create_request(
     # Set the "action_is_workflow" attribute
     liveaction.action_is_workflow = action_db.is_workflow()
 
+    return liveaction, action_db, runnertype_db
+
+
+def _save_requests(requests):
+    """
+    Save live action, action execution and trace objects for the provided requests using a
+    single bulk insert per collection.
+
+    :param requests: A list of (index, liveaction, action_db, runnertype_db) tuples.
+    :type requests: ``list``
+
+    :rtype: ``list`` of ``tuple``
+    """
+    # We import this here to avoid conflicts w/ runners that might import this
+    # file since the runners don't have the config context by default.
+    from st2common.metrics.base import get_driver
+
+    liveaction_dbs = [liveaction for _, liveaction, _, _ in requests]
+    execution_dbs = []
+
+    # Publish creation after both liveaction and actionexecution are created.
+    try:
+        liveaction_dbs = LiveAction.insert_many(liveaction_dbs, publish=False)
+
+        for liveaction_db, (_, _, action_db, runnertype_db) in zip(
+            liveaction_dbs, requests
+        ):
+            execution_db = executions.build_execution_object(
+                liveaction=liveaction_db,
+                action_db=action_db,
+                runnertype_db=runnertype_db,
+            )
+            execution_dbs.append(execution_db)
+
+        execution_dbs = ActionExecution.insert_many(execution_dbs, publish=False)
+
+        trace_service.create_traces_for_action_executions(
+            action_executions=list(zip(execution_dbs, liveaction_dbs))
+        )
+    except Exception:
+        # Objects which have already been inserted are never published so they would stay in
+        # requested state forever
+        _cleanup_requests(liveaction_dbs=liveaction_dbs, execution_dbs=execution_dbs)
+        raise
+
+    get_driver().inc_counter(
+        "action.executions.%s" % (action_constants.LIVEACTION_STATUS_REQUESTED),
+        amount=len(requests),
+    )
+
+    return list(zip(liveaction_dbs, execution_dbs))
+
+
+def _save_request(liveaction, action_db, runnertype_db):
+    # We import this here to avoid conflicts w/ runners that might import this
+    # file since the runners don't have the config context by default.
+    from st2common.metrics.base import get_driver
+
     # Publish creation after both liveaction and actionexecution are created.
     liveaction = LiveAction.add_or_update(liveaction, publish=False)
     # Get trace_db if it exists. This could throw. If it throws, we have to cleanup
@@ -569,6 +711,28 @@ def _cleanup_liveaction(liveaction):
         pass
 
 
+def _cleanup_requests(liveaction_dbs, execution_dbs):
+    execution_ids = [
+        execution_db.id for execution_db in execution_dbs if execution_db.id
+    ]
+    liveaction_ids = [
+        liveaction_db.id for liveaction_db in liveaction_dbs if liveaction_db.id
+    ]
+
+    try:
+        if execution_ids:
+            ActionExecution.delete_by_query(id__in=execution_ids)
+
+        if liveaction_ids:
+            LiveAction.delete_by_query(id__in=liveaction_ids)
+    except:
+        LOG.exception(
+            "Failed cleaning up LiveActions %s and ActionExecutions %s.",
+            liveaction_ids,
+            execution_ids,
+        )
+
+
 def _is_notify_empty(notify_db):
     """
     notify_db is considered to be empty if notify_db is None and neither
@@ -0,0 +1,93 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module containing a watcher which keeps the in-process precompiled action alias matcher (see
+st2common.util.actionalias_matching.ActionAliasMatcher) up to date.
+"""
+
+from __future__ import absolute_import
+
+from st2common import log as logging
+from st2common.services.resource_watcher import ResourceWatcher
+from st2common.transport.actionalias import get_queue
+from st2common.util import actionalias_matching
+import st2common.util.queues as queue_utils
+
+__all__ = ["ActionAliasMatcherWatcher", "start_watcher", "stop_watcher"]
+
+LOG = logging.getLogger(__name__)
+
+# Reference to the watcher which is running inside this process
+WATCHER = None
+
+
+class ActionAliasMatcherWatcher(ResourceWatcher):
+    """
+    Watcher which enables precompiled action alias matcher on start and rebuilds it on action
+    alias CUD events.
+    """
+
+    def __init__(self, queue_suffix="actionalias_matcher"):
+        queue_name = queue_utils.get_queue_name(
+            queue_name_base="st2.actionalias.watch",
+            queue_name_suffix=queue_suffix,
+            add_random_uuid_to_suffix=True,
+        )
+        queues = [
+            get_queue(
+                name=queue_name, routing_key="#", exclusive=True, auto_delete=True
+            )
+        ]
+        super(ActionAliasMatcherWatcher, self).__init__(
+            queues=queues, handler=self._handle_event
+        )
+        self._matcher = None
+
+    def start(self):
+        super(ActionAliasMatcherWatcher, self).start()
+        self._matcher = actionalias_matching.enable_matcher()
+
+    def stop(self):
+        actionalias_matching.disable_matcher()
+        self._matcher = None
+        super(ActionAliasMatcherWatcher, self).stop()
+
+    def _handle_event(self, body, routing_key):
+        if not self._matcher:
+            return
+
+        LOG.debug("Rebuilding action alias matcher (%s event)", routing_key)
+        self._matcher.invalidate()
+
+
+def start_watcher():
+    """
+    Start action alias matcher watcher in this process (if not already running).
+    """
+    global WATCHER
+
+    if not WATCHER:
+        WATCHER = ActionAliasMatcherWatcher()
+        WATCHER.start()
+
+    return WATCHER
+
+
+def stop_watcher():
+    global WATCHER
+
+    if WATCHER:
+        WATCHER.stop()
+        WATCHER = None
@@ -0,0 +1,89 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module containing a watcher which keeps the in-process resolved pack config cache
+(st2common.util.config_loader.CONFIG_CACHE) up to date.
+"""
+
+from __future__ import absolute_import
+
+from oslo_config import cfg
+
+from st2common import log as logging
+from st2common.models.db.keyvalue import KeyValuePairDB
+from st2common.models.db.pack import ConfigDB
+from st2common.models.db.pack import ConfigSchemaDB
+from st2common.services.resource_watcher import ResourceWatcher
+from st2common.transport.keyvalue import get_keyvalue_cud_queue
+from st2common.transport.pack import get_pack_config_cud_queue
+from st2common.util.config_loader import CONFIG_CACHE
+import st2common.util.queues as queue_utils
+
+__all__ = ["PackConfigCacheWatcher"]
+
+LOG = logging.getLogger(__name__)
+
+
+class PackConfigCacheWatcher(ResourceWatcher):
+    """
+    Watcher which enables the resolved pack config cache on start and invalidates cache entries on
+    Config, ConfigSchema and KeyValuePair CUD events.
+    """
+
+    def __init__(self, queue_suffix="config_cache"):
+        queues = [
+            get_pack_config_cud_queue(
+                name=self._get_queue_name("st2.pack_config.watch", queue_suffix),
+                routing_key="#",
+                exclusive=True,
+                auto_delete=True,
+            ),
+            get_keyvalue_cud_queue(
+                name=self._get_queue_name("st2.keyvalue.watch", queue_suffix),
+                routing_key="#",
+                exclusive=True,
+                auto_delete=True,
+            ),
+        ]
+        super(PackConfigCacheWatcher, self).__init__(
+            queues=queues, handler=self._handle_event
+        )
+
+    def start(self):
+        super(PackConfigCacheWatcher, self).start()
+        CONFIG_CACHE.enable(
+            ttl=cfg.CONF.packs.config_cache_ttl, size=cfg.CONF.packs.config_cache_size
+        )
+
+    def stop(self):
+        CONFIG_CACHE.disable()
+        super(PackConfigCacheWatcher, self).stop()
+
+    def _handle_event(self, body, routing_key):
+        if isinstance(body, (ConfigDB, ConfigSchemaDB)):
+            LOG.debug('Invalidating cached configs for pack "%s"', body.pack)
+            CONFIG_CACHE.invalidate_pack(pack_name=body.pack)
+        elif isinstance(body, KeyValuePairDB):
+            # Any datastore change can affect dynamic config values of any pack and user
+            LOG.debug("Invalidating cached configs with dynamic values")
+            CONFIG_CACHE.invalidate_dynamic()
+
+    @staticmethod
+    def _get_queue_name(queue_name_base, queue_suffix):
+        return queue_utils.get_queue_name(
+            queue_name_base=queue_name_base,
+            queue_name_suffix=queue_suffix,
+            add_random_uuid_to_suffix=True,
+        )
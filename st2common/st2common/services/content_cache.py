@@ -0,0 +1,134 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module containing a watcher which keeps in-process caches of content resources (see
+st2common.persistence.base.Access.enable_cache) up to date.
+"""
+
+from __future__ import absolute_import
+
+from oslo_config import cfg
+
+from st2common import log as logging
+from st2common.models.db.action import ActionDB
+from st2common.models.db.policy import PolicyDB
+from st2common.models.db.runner import RunnerTypeDB
+from st2common.models.db.trigger import TriggerDB
+from st2common.models.db.trigger import TriggerTypeDB
+from st2common.persistence.action import Action
+from st2common.persistence.policy import Policy
+from st2common.persistence.runner import RunnerType
+from st2common.persistence.trigger import Trigger
+from st2common.persistence.trigger import TriggerType
+from st2common.services.resource_watcher import ResourceWatcher
+from st2common.transport.content import get_content_cud_queue
+from st2common.transport.reactor import get_trigger_cud_queue
+import st2common.util.queues as queue_utils
+
+__all__ = ["ContentCacheWatcher", "start_watcher", "stop_watcher"]
+
+LOG = logging.getLogger(__name__)
+
+# Maps model class to the corresponding persistence class which holds the cache
+CACHED_RESOURCES = {
+    ActionDB: Action,
+    PolicyDB: Policy,
+    RunnerTypeDB: RunnerType,
+    TriggerDB: Trigger,
+    TriggerTypeDB: TriggerType,
+}
+
+# Reference to the watcher which is running inside this process
+WATCHER = None
+
+
+class ContentCacheWatcher(ResourceWatcher):
+    """
+    Watcher which enables content resource caches on start and invalidates them on the
+    corresponding resource CUD events.
+    """
+
+    def __init__(self, queue_suffix="content_cache"):
+        queues = [
+            get_content_cud_queue(
+                name=self._get_queue_name("st2.content.watch", queue_suffix),
+                routing_key="#",
+                exclusive=True,
+                auto_delete=True,
+            ),
+            get_trigger_cud_queue(
+                name=self._get_queue_name("st2.trigger.watch", queue_suffix),
+                routing_key="#",
+                exclusive=True,
+            ),
+        ]
+        super(ContentCacheWatcher, self).__init__(
+            queues=queues, handler=self._handle_event
+        )
+
+    def start(self):
+        super(ContentCacheWatcher, self).start()
+
+        for persistence_cls in CACHED_RESOURCES.values():
+            persistence_cls.enable_cache(
+                size=cfg.CONF.content.resource_cache_size,
+                ttl=cfg.CONF.content.resource_cache_ttl,
+            )
+
+    def stop(self):
+        for persistence_cls in CACHED_RESOURCES.values():
+            persistence_cls.disable_cache()
+
+        super(ContentCacheWatcher, self).stop()
+
+    def _handle_event(self, body, routing_key):
+        persistence_cls = CACHED_RESOURCES.get(type(body), None)
+
+        if not persistence_cls:
+            return
+
+        LOG.debug(
+            "Invalidating %s cache (%s event)", persistence_cls.__name__, routing_key
+        )
+        persistence_cls.invalidate_cache()
+
+    @staticmethod
+    def _get_queue_name(queue_name_base, queue_suffix):
+        return queue_utils.get_queue_name(
+            queue_name_base=queue_name_base,
+            queue_name_suffix=queue_suffix,
+            add_random_uuid_to_suffix=True,
+        )
+
+
+def start_watcher():
+    """
+    Start content cache watcher in this process (if not already running).
+    """
+    global WATCHER
+
+    if not WATCHER:
+        WATCHER = ContentCacheWatcher()
+        WATCHER.start()
+
+    return WATCHER
+
+
+def stop_watcher():
+    global WATCHER
+
+    if WATCHER:
+        WATCHER.stop()
+        WATCHER = None
@@ -49,14 +49,17 @@ from st2common.models.db.execution import ActionExecutionDB
 from st2common.runners import utils as runners_utils
 from st2common.metrics.base import Timer
 from st2common.services import coordination
+from st2common.transport.execution import is_slim_execution
 from six.moves import range
 
 
 __all__ = [
     "create_execution_object",
+    "build_execution_object",
     "update_execution",
     "abandon_execution_if_incomplete",
     "is_execution_canceled",
+    "get_full_execution",
     "AscendingSortedDescendantView",
     "DFSDescendantView",
     "get_descendants",
@@ -105,6 +108,44 @@ def _create_execution_log_entry(status, timestamp=None):
 def create_execution_object(
     liveaction, action_db=None, runnertype_db=None, publish=True
 ):
+    parent = _get_parent_execution(liveaction)
+    execution = _build_execution_object(
+        liveaction=liveaction,
+        action_db=action_db,
+        runnertype_db=runnertype_db,
+        parent=parent,
+    )
+
+    # NOTE: User input data is already validate as part of the API request,
+    # other data is set by us. Skipping validation here makes operation 10%-30% faster
+    execution = ActionExecution.add_or_update(
+        execution, publish=publish, validate=False
+    )
+
+    if parent and str(execution.id) not in parent.children:
+        values = {}
+        values["push__children"] = str(execution.id)
+        ActionExecution.update(parent, **values)
+
+    return execution
+
+
+def build_execution_object(liveaction, action_db=None, runnertype_db=None):
+    """
+    Build (but don't save) action execution object for the provided live action.
+
+    :rtype: :class:`ActionExecutionDB`
+    """
+    parent = _get_parent_execution(liveaction)
+    return _build_execution_object(
+        liveaction=liveaction,
+        action_db=action_db,
+        runnertype_db=runnertype_db,
+        parent=parent,
+    )
+
+
+def _build_execution_object(liveaction, action_db, runnertype_db, parent):
     if not action_db:
         action_db = action_utils.get_action_by_ref(liveaction.action)
 
@@ -141,7 +182,6 @@ def create_execution_object(
         attrs["trigger"] = vars(TriggerAPI.from_model(trigger))
         attrs["trigger_type"] = vars(TriggerTypeAPI.from_model(trigger_type))
 
-    parent = _get_parent_execution(liveaction)
     if parent:
         attrs["parent"] = str(parent.id)
 
@@ -153,17 +193,6 @@ def create_execution_object(
     execution.id = ObjectId()
     execution.web_url = _get_web_url_for_execution(str(execution.id))
 
-    # NOTE: User input data is already validate as part of the API request,
-    # other data is set by us. Skipping validation here makes operation 10%-30% faster
-    execution = ActionExecution.add_or_update(
-        execution, publish=publish, validate=False
-    )
-
-    if parent and str(execution.id) not in parent.children:
-        values = {}
-        values["push__children"] = str(execution.id)
-        ActionExecution.update(parent, **values)
-
     return execution
 
 
@@ -279,6 +308,17 @@ def is_execution_canceled(execution_id):
         return False  # XXX: What to do here?
 
 
+def get_full_execution(execution_db):
+    """
+    Return the whole execution document for an execution received in a slim execution update
+    message. Other executions are returned as is.
+    """
+    if not is_slim_execution(execution_db):
+        return execution_db
+
+    return ActionExecution.get_by_id(str(execution_db.id))
+
+
 def get_parent_context(liveaction_db):
     """
     Returns context of the parent execution.
@@ -0,0 +1,103 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import six
+from kombu.mixins import ConsumerMixin
+
+from st2common import log as logging
+from st2common.transport import utils as transport_utils
+from st2common.transport.serializers import ACCEPT_CONTENT
+from st2common.util import concurrency
+
+__all__ = ["ResourceWatcher"]
+
+LOG = logging.getLogger(__name__)
+
+
+class ResourceWatcher(ConsumerMixin):
+    """
+    Generic watcher which consumes resource CUD events from one or more queues and passes each
+    event to a handler.
+
+    It's primarily used by in-process caches to invalidate entries when the corresponding
+    resource is created, updated or deleted. Queues are expected to be exclusive to the watcher
+    (e.g. use a random suffix) so each process receives every event.
+    """
+
+    def __init__(self, queues, handler):
+        """
+        :param queues: Queues to consume the CUD events from.
+        :type queues: ``list`` of :class:`kombu.Queue`
+
+        :param handler: Function which is called with the message body and the routing key (e.g.
+                        "create", "update", "delete") for each received event.
+        :type handler: ``callable``
+        """
+        self._queues = queues
+        self._handler = handler
+
+        self.connection = None
+        self._updates_thread = None
+
+    def get_consumers(self, Consumer, channel):
+        consumers = [
+            Consumer(
+                queues=self._queues,
+                accept=ACCEPT_CONTENT,
+                callbacks=[self.process_task],
+            )
+        ]
+        return consumers
+
+    def process_task(self, body, message):
+        routing_key = message.delivery_info.get("routing_key", "")
+
+        try:
+            self._handler(body, routing_key)
+        except Exception as e:
+            LOG.exception(
+                "Handling failed. Message body: %s. Exception: %s",
+                body,
+                six.text_type(e),
+            )
+        finally:
+            message.ack()
+
+    def start(self):
+        try:
+            self.connection = transport_utils.get_connection()
+            self._updates_thread = concurrency.spawn(self.run)
+        except:
+            LOG.exception("Failed to start %s.", self.__class__.__name__)
+            if self.connection:
+                self.connection.release()
+
+    def stop(self):
+        LOG.debug("Shutting down %s.", self.__class__.__name__)
+        try:
+            if self._updates_thread:
+                self._updates_thread = concurrency.kill(self._updates_thread)
+
+            if self.connection:
+                channel = self.connection.channel()
+                for queue in self._queues:
+                    try:
+                        queue(channel).delete()
+                    except:
+                        LOG.error("Unable to delete watcher queue: %s", queue)
+        finally:
+            if self.connection:
+                self.connection.release()
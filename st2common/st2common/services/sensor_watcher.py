@@ -25,6 +25,7 @@ from kombu.mixins import ConsumerMixin
 from st2common import log as logging
 from st2common.transport import reactor, publishers
 from st2common.transport import utils as transport_utils
+from st2common.transport.serializers import ACCEPT_CONTENT
 from st2common.util import concurrency
 import st2common.util.queues as queue_utils
 
@@ -64,7 +65,7 @@ class SensorWatcher(ConsumerMixin):
         consumers = [
             Consumer(
                 queues=[self._sensor_watcher_q],
-                accept=["pickle"],
+                accept=ACCEPT_CONTENT,
                 callbacks=[self.process_task],
             )
         ]
@@ -14,6 +14,8 @@
 # limitations under the License.
 
 from __future__ import absolute_import
+
+import bson
 from mongoengine import ValidationError
 
 from st2common import log as logging
@@ -27,6 +29,7 @@ from st2common.models.system.common import ResourceReference
 from st2common.persistence.execution import ActionExecution
 from st2common.persistence.trace import Trace
 from st2common.services import executions
+from st2common.services import trace_writer
 import six
 
 LOG = logging.getLogger(__name__)
@@ -38,6 +41,7 @@ __all__ = [
     "get_trace",
     "add_or_update_given_trace_context",
     "add_or_update_given_trace_db",
+    "create_traces_for_action_executions",
     "get_trace_component_for_action_execution",
     "get_trace_component_for_rule",
     "get_trace_component_for_trigger_instance",
@@ -85,9 +89,30 @@ def _get_single_trace_by_component(**component_filter):
     return traces[0]
 
 
+def _get_pending_trace_by_component(component_type, object_id):
+    """
+    Return trace with write-behind updates which haven't been written yet which contains the
+    provided component.
+    """
+    writer = trace_writer.get_trace_writer()
+    if not writer:
+        return None
+
+    return writer.get_pending_trace_by_component(
+        component_type=component_type, object_id=object_id
+    )
+
+
 def get_trace_db_by_action_execution(action_execution=None, action_execution_id=None):
     if action_execution:
         action_execution_id = str(action_execution.id)
+
+    trace_db = _get_pending_trace_by_component(
+        component_type="action_executions", object_id=action_execution_id
+    )
+    if trace_db:
+        return trace_db
+
     return _get_single_trace_by_component(
         action_executions__object_id=action_execution_id
     )
@@ -103,6 +128,13 @@ def get_trace_db_by_rule(rule=None, rule_id=None):
 def get_trace_db_by_trigger_instance(trigger_instance=None, trigger_instance_id=None):
     if trigger_instance:
         trigger_instance_id = str(trigger_instance.id)
+
+    trace_db = _get_pending_trace_by_component(
+        component_type="trigger_instances", object_id=trigger_instance_id
+    )
+    if trace_db:
+        return trace_db
+
     return _get_single_trace_by_component(
         trigger_instances__object_id=trigger_instance_id
     )
@@ -125,6 +157,11 @@ def get_trace(trace_context, ignore_trace_tag=False):
         raise ValueError("Atleast one of id_ or trace_tag should be specified.")
 
     if trace_context.id_:
+        writer = trace_writer.get_trace_writer()
+        trace_db = writer.get_pending_trace(trace_context.id_) if writer else None
+        if trace_db:
+            return trace_db
+
         try:
             return Trace.get_by_id(trace_context.id_)
         except (ValidationError, ValueError):
@@ -177,7 +214,9 @@ def get_trace_db_by_live_action(liveaction):
         # found a trace_context but no trace_db. This implies a user supplied
         # trace_tag so create a new trace_db
         if not trace_db:
-            trace_db = TraceDB(trace_tag=trace_context.trace_tag)
+            trace_db = _get_new_trace_db(
+                trace_tag=trace_context.trace_tag, liveaction_id=liveaction.id
+            )
             created = True
         return (created, trace_db)
     # 2. If not found then check if parent context contains an execution_id.
@@ -191,6 +230,14 @@ def get_trace_db_by_live_action(liveaction):
             trace_db = get_trace_db_by_action_execution(
                 action_execution_id=parent_execution_id
             )
+
+            if not trace_db and trace_writer.get_trace_writer():
+                # Trace update of the parent execution could still be queued in the process
+                # which created the parent execution
+                created, trace_db = _get_write_behind_trace_db_by_parent_execution(
+                    parent_execution_id=parent_execution_id
+                )
+
             if not trace_db:
                 raise StackStormDBObjectNotFoundError(
                     "No trace found for execution %s" % parent_execution_id
@@ -203,11 +250,79 @@ def get_trace_db_by_live_action(liveaction):
     # 4. No trace_db found, therefore create one. This typically happens
     #    when execution is run by hand.
     if not trace_db:
-        trace_db = TraceDB(trace_tag="execution-%s" % str(liveaction.id))
+        trace_db = _get_new_trace_db(
+            trace_tag="execution-%s" % str(liveaction.id), liveaction_id=liveaction.id
+        )
         created = True
     return (created, trace_db)
 
 
+def _get_new_trace_db(trace_tag, liveaction_id):
+    """
+    Return a new TraceDB for a trace which is started by the provided live action.
+
+    With write-behind trace updates, the trace uses the id of the live action so the trace of an
+    execution which hasn't been written yet can be identified in other processes and all the
+    upserts for it update the same trace.
+
+    :rtype: ``TraceDB``
+    """
+    trace_db = TraceDB(trace_tag=trace_tag)
+
+    if trace_writer.get_trace_writer():
+        trace_db.id = bson.ObjectId(str(liveaction_id))
+
+    return trace_db
+
+
+def _get_write_behind_trace_db_by_parent_execution(parent_execution_id):
+    """
+    Return TraceDB for the trace of a parent execution which hasn't been written yet.
+
+    The trace is identified by the trace context of the closest ancestor execution which has one
+    (executions triggered by a rule or with a user supplied trace context). Otherwise, the trace
+    of the execution which has been run by hand is used. Traces which haven't been written yet
+    are identified by the id of the live action which started them (see _get_new_trace_db()) and
+    the returned TraceDB is upserted by the trace writer.
+
+    :returns: (boolean, TraceDB) if the TraceDB was created(but not saved to DB) or
+               retrieved from the DB and the TraceDB itself.
+    :rtype: ``tuple``
+    """
+    execution_db = ActionExecution.get_by_id(parent_execution_id)
+    trace_context = execution_db.context.get(TRACE_CONTEXT, None)
+
+    while not trace_context:
+        parent_execution_id = execution_db.context.get("parent", {}).get(
+            "execution_id", None
+        )
+        if not parent_execution_id:
+            break
+
+        execution_db = ActionExecution.get_by_id(parent_execution_id)
+        trace_context = execution_db.context.get(TRACE_CONTEXT, None)
+
+    if trace_context:
+        trace_context = _get_valid_trace_context(trace_context)
+        if trace_context.id_:
+            return (
+                False,
+                TraceDB(id=trace_context.id_, trace_tag=trace_context.trace_tag),
+            )
+        trace_tag = trace_context.trace_tag
+    else:
+        trace_tag = "execution-%s" % (execution_db.liveaction["id"])
+
+    traces = Trace.query(trace_tag=trace_tag)
+    if len(traces) == 1:
+        return (False, traces[0])
+
+    trace_db = TraceDB(
+        id=bson.ObjectId(str(execution_db.liveaction["id"])), trace_tag=trace_tag
+    )
+    return (True, trace_db)
+
+
 def add_or_update_given_trace_context(
     trace_context, action_executions=None, rules=None, trigger_instances=None
 ):
@@ -294,6 +409,16 @@ def add_or_update_given_trace_db(
         for trigger_instance in trigger_instances
     ]
 
+    # With write-behind trace updates enabled, the update is queued and written later
+    writer = trace_writer.get_trace_writer()
+    if writer:
+        return writer.add(
+            trace_db,
+            action_executions=action_executions,
+            rules=rules,
+            trigger_instances=trigger_instances,
+        )
+
     # If an id exists then this is an update and we do not want to perform
     # an upsert so use push_components which will use the push operator.
     if trace_db.id:
@@ -311,6 +436,29 @@ def add_or_update_given_trace_db(
     return Trace.add_or_update(trace_db)
 
 
+def create_traces_for_action_executions(action_executions):
+    """
+    Create a new trace for each of the provided action executions which were requested by
+    hand (not a part of an existing trace) using a single bulk insert.
+
+    :param action_executions: A list of (ActionExecutionDB, LiveActionDB) tuples.
+    :type action_executions: ``list``
+
+    :rtype: ``list`` of ``TraceDB``
+    """
+    trace_dbs = []
+
+    for action_execution_db, liveaction_db in action_executions:
+        trace_component = get_trace_component_for_action_execution(
+            action_execution_db, liveaction_db
+        )
+        trace_db = TraceDB(trace_tag="execution-%s" % str(liveaction_db.id))
+        trace_db.action_executions = [_to_trace_component_db(trace_component)]
+        trace_dbs.append(trace_db)
+
+    return Trace.insert_many(trace_dbs)
+
+
 def get_trace_component_for_action_execution(action_execution_db, liveaction_db):
     """
     Returns the trace_component compatible dict representation of an actionexecution.
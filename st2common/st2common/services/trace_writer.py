@@ -0,0 +1,290 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module containing a write-behind writer which takes trace updates off the critical path of the
+rules engine and execution creation (see "[trace] write_behind" option).
+"""
+
+from __future__ import absolute_import
+
+import time
+
+import bson
+import eventlet
+import eventlet.queue
+from oslo_config import cfg
+from pymongo import UpdateOne
+
+from st2common import log as logging
+from st2common.metrics.base import get_driver
+from st2common.persistence.trace import Trace
+
+__all__ = [
+    "TraceWriter",
+    "get_trace_writer",
+    "flush_trace_writer",
+    "shutdown_trace_writer",
+]
+
+LOG = logging.getLogger(__name__)
+
+COMPONENT_TYPES = ["action_executions", "rules", "trigger_instances"]
+
+# Reference to the writer which is running inside this process
+WRITER = None
+
+
+class TraceWriter(object):
+    """
+    Writer which puts trace updates into a bounded in-memory queue and writes them to the
+    database from a background green thread.
+
+    Each batch is written using a single bulk write with one upsert per trace which pushes all the
+    queued components of that trace. Upserts also carry the trace fields in $setOnInsert so the
+    updates can be written in any order (e.g. by different processes) and a trace is created by
+    whichever update is written first.
+
+    Traces with queued updates can be retrieved using get_pending_trace() and
+    get_pending_trace_by_component() so lookups inside the same process don't depend on the updates
+    having been written.
+    """
+
+    def __init__(self, queue_size=10000, batch_size=500, flush_interval=0.5):
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue = eventlet.queue.Queue(maxsize=queue_size)
+
+        # Traces with queued updates keyed by trace id. Value is a list of the local trace object
+        # (including the queued components), number of queued updates and the component keys
+        self._pending_traces = {}
+
+        # Maps (component type, object id) to the id of a trace with queued updates
+        self._pending_components = {}
+
+        self._writer_thread = eventlet.greenthread.spawn(self._write_batches)
+
+    @property
+    def queue_depth(self):
+        return self._queue.qsize()
+
+    def add(self, trace_db, action_executions=None, rules=None, trigger_instances=None):
+        """
+        Queue an update which adds the provided components to the trace. If the trace doesn't have
+        an id yet, one is assigned and the trace is created by the update.
+
+        :param trace_db: The TraceDB to update.
+        :type trace_db: ``TraceDB``
+
+        :param action_executions: Action execution components to add to the trace.
+        :type action_executions: ``list`` of ``TraceComponentDB``
+
+        :rtype: ``TraceDB``
+        """
+        components = {
+            "action_executions": action_executions or [],
+            "rules": rules or [],
+            "trigger_instances": trigger_instances or [],
+        }
+
+        if not trace_db.id:
+            trace_db.id = bson.ObjectId()
+
+        trace_id = str(trace_db.id)
+
+        # Fields other than components are only written when the trace is created
+        set_on_insert = trace_db.to_mongo().to_dict()
+        set_on_insert.pop("_id", None)
+        for component_type in COMPONENT_TYPES:
+            set_on_insert.pop(component_type, None)
+
+        pushes = {}
+        for component_type, component_dbs in components.items():
+            if not component_dbs:
+                continue
+
+            # Keep local copy of the trace up to date like Trace.push_components() would
+            setattr(
+                trace_db,
+                component_type,
+                list(getattr(trace_db, component_type) or []) + component_dbs,
+            )
+            pushes[component_type] = [
+                component_db.to_mongo().to_dict() for component_db in component_dbs
+            ]
+
+        pending = self._pending_traces.setdefault(trace_id, [trace_db, 0, set()])
+        pending[0] = trace_db
+        pending[1] += 1
+
+        for component_type, component_dbs in components.items():
+            for component_db in component_dbs:
+                key = (component_type, component_db.object_id)
+                self._pending_components[key] = trace_id
+                pending[2].add(key)
+
+        # NOTE: When the queue is full, this blocks until there is space in the queue
+        self._queue.put((trace_id, set_on_insert, pushes))
+        get_driver().set_gauge("trace.write_behind.queue_depth", self.queue_depth)
+
+        return trace_db
+
+    def get_pending_trace(self, trace_id):
+        """
+        Return trace with the provided id if it has updates which haven't been written yet.
+
+        :rtype: ``TraceDB``
+        """
+        pending = self._pending_traces.get(str(trace_id), None)
+        return pending[0] if pending else None
+
+    def get_pending_trace_by_component(self, component_type, object_id):
+        """
+        Return trace with queued updates which contains the provided component.
+
+        :param component_type: Component type (action_executions, rules, trigger_instances).
+        :type component_type: ``str``
+
+        :rtype: ``TraceDB``
+        """
+        trace_id = self._pending_components.get((component_type, str(object_id)), None)
+        return self.get_pending_trace(trace_id) if trace_id else None
+
+    def flush(self):
+        """
+        Write all the queued trace updates and block until they have been written.
+        """
+        batch = []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+            if len(batch) >= self._batch_size:
+                self._write_batch(batch)
+                batch = []
+
+        if batch:
+            self._write_batch(batch)
+
+        # Wait for the batch which is currently being written by the writer thread (if any)
+        self._queue.join()
+
+    def shutdown(self):
+        self.flush()
+        self._writer_thread.kill()
+
+    def _write_batches(self):
+        while True:
+            # Blocks until there is at least one update in the queue
+            batch = [self._queue.get()]
+
+            # Wait a bit for more updates so they can be written together
+            deadline = time.time() + self._flush_interval
+            while len(batch) < self._batch_size:
+                timeout = deadline - time.time()
+                if timeout <= 0:
+                    break
+
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except eventlet.queue.Empty:
+                    break
+
+            self._write_batch(batch)
+
+    def _write_batch(self, batch):
+        metrics_driver = get_driver()
+        metrics_driver.set_gauge("trace.write_behind.batch_size", len(batch))
+
+        # Merge all the updates for the same trace into a single upsert
+        updates = {}
+        for trace_id, set_on_insert, pushes in batch:
+            update = updates.setdefault(trace_id, {"$setOnInsert": set_on_insert})
+
+            for component_type, components in pushes.items():
+                push = update.setdefault("$push", {})
+                push.setdefault(component_type, {"$each": []})["$each"].extend(
+                    components
+                )
+
+        requests = [
+            UpdateOne({"_id": bson.ObjectId(trace_id)}, update, upsert=True)
+            for trace_id, update in updates.items()
+        ]
+
+        try:
+            Trace._get_impl().model._get_collection().bulk_write(
+                requests, ordered=False
+            )
+            Trace.bump_revision()
+        except Exception:
+            metrics_driver.inc_counter("trace.write_behind.write_failed")
+            LOG.exception("Failed to write %s trace updates.", len(batch))
+        finally:
+            for trace_id, _, _ in batch:
+                self._remove_pending_update(trace_id)
+                self._queue.task_done()
+
+        metrics_driver.set_gauge("trace.write_behind.queue_depth", self.queue_depth)
+
+    def _remove_pending_update(self, trace_id):
+        pending = self._pending_traces[trace_id]
+        pending[1] -= 1
+
+        if pending[1] > 0:
+            return
+
+        del self._pending_traces[trace_id]
+        for key in pending[2]:
+            if self._pending_components.get(key, None) == trace_id:
+                del self._pending_components[key]
+
+
+def get_trace_writer():
+    """
+    Return trace writer for this process or None if write-behind trace updates are disabled.
+
+    :rtype: :class:`TraceWriter`
+    """
+    global WRITER
+
+    if not cfg.CONF.trace.write_behind:
+        return None
+
+    if not WRITER:
+        WRITER = TraceWriter(
+            queue_size=cfg.CONF.trace.write_behind_queue_size,
+            batch_size=cfg.CONF.trace.write_behind_batch_size,
+            flush_interval=cfg.CONF.trace.write_behind_flush_interval,
+        )
+
+    return WRITER
+
+
+def flush_trace_writer():
+    """
+    Write all the queued trace updates (if any).
+    """
+    if WRITER:
+        WRITER.flush()
+
+
+def shutdown_trace_writer():
+    """
+    Write all the queued trace updates and stop the writer thread.
+    """
+    global WRITER
+
+    if WRITER:
+        WRITER.shutdown()
+        WRITER = None
@@ -15,15 +15,28 @@
 
 from __future__ import absolute_import
 
+import weakref
+
+import eventlet
+import eventlet.queue
 import six
 from oslo_config import cfg
 from jsonschema import ValidationError
 
+from st2common.exceptions.triggers import TriggerDispatchQueueFullError
+from st2common.metrics.base import get_driver
 from st2common.models.api.trace import TraceContext
 from st2common.transport.reactor import TriggerDispatcher
 from st2common.validators.api.reactor import validate_trigger_payload
 
-__all__ = ["TriggerDispatcherService"]
+__all__ = [
+    "TriggerDispatcherService",
+    "BatchingTriggerDispatcherService",
+    "shutdown_batching_trigger_dispatchers",
+]
+
+# All the batching trigger dispatcher services which have been created inside this process
+BATCHING_DISPATCHERS = weakref.WeakSet()
 
 
 class TriggerDispatcherService(object):
@@ -85,6 +98,47 @@ class TriggerDispatcherService(object):
                                           True) instead of logging the error.
         :type throw_on_validation_error: ``boolean``
         """
+        if not self._validate_trigger_payload(
+            trigger=trigger,
+            payload=payload,
+            throw_on_validation_error=throw_on_validation_error,
+        ):
+            return None
+
+        self._logger.debug("Dispatching trigger %s with payload %s.", trigger, payload)
+        return self._dispatcher.dispatch(
+            trigger, payload=payload, trace_context=trace_context
+        )
+
+    def dispatch_many_with_context(
+        self,
+        triggers,
+        payload=None,
+        trace_context=None,
+        throw_on_validation_error=False,
+    ):
+        """
+        Method which dispatches the same payload for multiple triggers.
+
+        :param triggers: List of references to the TriggerTypeDB (<pack>.<name>) or TriggerDB
+                         objects.
+        :type triggers: ``list``
+        """
+        for trigger in triggers:
+            self.dispatch_with_context(
+                trigger,
+                payload=payload,
+                trace_context=trace_context,
+                throw_on_validation_error=throw_on_validation_error,
+            )
+
+    def _validate_trigger_payload(self, trigger, payload, throw_on_validation_error):
+        """
+        Validate the trigger payload.
+
+        :return: True if the trigger should be dispatched.
+        :rtype: ``bool``
+        """
         # Note: We perform validation even if it's disabled in the config so we can at least warn
         # the user if validation fals (but not throw if it's disabled)
         try:
@@ -112,9 +166,135 @@ class TriggerDispatcherService(object):
                     raise ValueError(msg)
 
                 self._logger.warning(msg)
-                return None
+                return False
 
-        self._logger.debug("Dispatching trigger %s with payload %s.", trigger, payload)
-        return self._dispatcher.dispatch(
-            trigger, payload=payload, trace_context=trace_context
+        return True
+
+
+class BatchingTriggerDispatcherService(TriggerDispatcherService):
+    """
+    Trigger dispatcher service which validates the triggers synchronously, puts them into a
+    bounded in-memory buffer and publishes them in batches from a background green thread. Each
+    batch is published using a single connection and channel.
+
+    When the buffer is full, TriggerDispatchQueueFullError is thrown instead of blocking the
+    caller.
+    """
+
+    def __init__(self, logger, queue_size=10000, batch_size=100, name=None):
+        super(BatchingTriggerDispatcherService, self).__init__(logger=logger)
+
+        self._queue_size = queue_size
+        self._batch_size = batch_size
+        self._queue = eventlet.queue.Queue(maxsize=queue_size)
+
+        metrics_prefix = "trigger_dispatcher.%s" % (name or "batching")
+        self._queue_depth_metrics_key = metrics_prefix + ".queue_depth"
+        self._rejected_metrics_key = metrics_prefix + ".rejected"
+        self._batch_size_metrics_key = metrics_prefix + ".batch_size"
+        self._publish_failed_metrics_key = metrics_prefix + ".publish_failed"
+
+        self._publisher_thread = eventlet.greenthread.spawn(self._publish_batches)
+
+        BATCHING_DISPATCHERS.add(self)
+
+    @property
+    def queue_depth(self):
+        return self._queue.qsize()
+
+    def dispatch_with_context(
+        self, trigger, payload=None, trace_context=None, throw_on_validation_error=False
+    ):
+        self.dispatch_many_with_context(
+            [trigger],
+            payload=payload,
+            trace_context=trace_context,
+            throw_on_validation_error=throw_on_validation_error,
         )
+
+    def dispatch_many_with_context(
+        self,
+        triggers,
+        payload=None,
+        trace_context=None,
+        throw_on_validation_error=False,
+    ):
+        triggers = [
+            trigger
+            for trigger in triggers
+            if self._validate_trigger_payload(
+                trigger=trigger,
+                payload=payload,
+                throw_on_validation_error=throw_on_validation_error,
+            )
+        ]
+
+        # Either all the triggers for a request are buffered or none of them are
+        if self._queue_size - self._queue.qsize() < len(triggers):
+            get_driver().inc_counter(self._rejected_metrics_key)
+            raise TriggerDispatchQueueFullError(
+                "Trigger dispatch queue is full (%s items)." % (self._queue_size)
+            )
+
+        for trigger in triggers:
+            self._queue.put_nowait((trigger, payload, trace_context))
+
+        get_driver().set_gauge(self._queue_depth_metrics_key, self.queue_depth)
+
+    def join(self):
+        """
+        Publish all the buffered triggers and block until they have been published.
+        """
+        # Buffered triggers are published by the calling thread so this also works when the
+        # publisher thread is not running
+        while not self._queue.empty():
+            self._publish_batch(self._get_batch(block=False))
+
+        # Wait for the batch which is currently being published by the publisher thread (if any)
+        self._queue.join()
+
+    def shutdown(self):
+        """
+        Publish all the buffered triggers and stop the publisher thread.
+        """
+        self.join()
+        self._publisher_thread.kill()
+        BATCHING_DISPATCHERS.discard(self)
+
+    def _publish_batches(self):
+        while True:
+            # Blocks until there is at least one trigger in the queue
+            self._publish_batch(self._get_batch(block=True))
+
+    def _get_batch(self, block):
+        batch = [self._queue.get(block=block)]
+
+        while len(batch) < self._batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+        return batch
+
+    def _publish_batch(self, batch):
+        metrics_driver = get_driver()
+        metrics_driver.set_gauge(self._batch_size_metrics_key, len(batch))
+
+        try:
+            self._logger.debug("Dispatching batch of %s triggers.", len(batch))
+            self._dispatcher.dispatch_many(batch)
+        except Exception:
+            metrics_driver.inc_counter(self._publish_failed_metrics_key, len(batch))
+            self._logger.exception("Failed to dispatch %s triggers.", len(batch))
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+        metrics_driver.set_gauge(self._queue_depth_metrics_key, self.queue_depth)
+
+
+def shutdown_batching_trigger_dispatchers():
+    """
+    Publish the buffered triggers of all the batching trigger dispatcher services in this process
+    and stop them.
+    """
+    for dispatcher in list(BATCHING_DISPATCHERS):
+        dispatcher.shutdown()
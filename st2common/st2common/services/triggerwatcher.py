@@ -23,6 +23,7 @@ from st2common import log as logging
 from st2common.persistence.trigger import Trigger
 from st2common.transport import reactor, publishers
 from st2common.transport import utils as transport_utils
+from st2common.transport.serializers import ACCEPT_CONTENT
 from st2common.util import concurrency
 import st2common.util.queues as queue_utils
 
@@ -83,7 +84,7 @@ class TriggerWatcher(ConsumerMixin):
         return [
             Consumer(
                 queues=[self._trigger_watch_q],
-                accept=["pickle"],
+                accept=ACCEPT_CONTENT,
                 callbacks=[self.process_task],
             )
         ]
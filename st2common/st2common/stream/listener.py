@@ -15,6 +15,10 @@
 
 from __future__ import absolute_import
 import fnmatch
+import glob
+import time
+from collections import defaultdict
+from collections import deque
 
 import eventlet
 
@@ -24,7 +28,14 @@ from oslo_config import cfg
 from st2common.models.api.action import LiveActionAPI, ActionAliasAPI
 from st2common.models.api.execution import ActionExecutionAPI
 from st2common.models.api.execution import ActionExecutionOutputAPI
+from st2common.models.db.execution import ActionExecutionDB
+from st2common.models.db.execution import ActionExecutionOutputDB
+from st2common.models.db.liveaction import LiveActionDB
+from st2common.services import executions as execution_service
 from st2common.transport import utils as transport_utils
+from st2common.transport.execution import mark_slim_execution
+from st2common.transport.serializers import ACCEPT_CONTENT
+from st2common.util.jsonify import json_encode
 from st2common.transport.queues import STREAM_ACTIONALIAS_QUEUE
 from st2common.transport.queues import STREAM_ANNOUNCEMENT_WORK_QUEUE
 from st2common.transport.queues import STREAM_EXECUTION_ALL_WORK_QUEUE
@@ -34,6 +45,9 @@ from st2common.transport.queues import STREAM_EXECUTION_OUTPUT_QUEUE
 from st2common import log as logging
 
 __all__ = [
+    "StreamEvent",
+    "ReplayBuffer",
+    "Subscription",
     "StreamListener",
     "ExecutionOutputListener",
     "get_listener",
@@ -43,17 +57,369 @@ __all__ = [
 LOG = logging.getLogger(__name__)
 
 
+# Event which tells the client it has missed some events and needs to re-list the resources
+RESYNC_EVENT = "st2.stream__resync"
+
+# Events which are not subject to the subscription filters
+CONTROL_EVENTS = [RESYNC_EVENT]
+
+# Events for which only the latest state per object is delivered when coalescing is enabled
+COALESCED_EVENTS = ["st2.execution__update", "st2.liveaction__update"]
+
+OVERFLOW_POLICY_DROP = "drop"
+OVERFLOW_POLICY_RESYNC = "resync"
+
 # Stores references to instantiated listeners
 _stream_listener = None
 _execution_output_listener = None
 
 
+class StreamEvent(tuple):
+    """
+    (event name, body) pair which is shared by all the subscriptions the event is dispatched to.
+
+    The event is encoded into the SSE wire format only once and the same immutable buffer is then
+    written to all the subscribed clients. Secrets in the body are masked as per the "[api]
+    mask_secrets" option when the body is converted from the database model.
+    """
+
+    SSE_MESSAGE_FORMAT = "event: %s\ndata: %s\n\n"
+
+    def __new__(cls, event, body, event_id=None):
+        stream_event = super(StreamEvent, cls).__new__(cls, (event, body))
+        stream_event.event_id = event_id
+        stream_event._encoded = None
+        return stream_event
+
+    @property
+    def event(self):
+        return self[0]
+
+    @property
+    def body(self):
+        return self[1]
+
+    def encode(self):
+        """
+        Return event encoded into the SSE wire format.
+
+        :rtype: ``bytes``
+        """
+        if self._encoded is None:
+            body = json_encode(self.body, indent=None)
+            encoded = self.SSE_MESSAGE_FORMAT % (self.event, body)
+            if self.event_id:
+                encoded = "id: %s\n%s" % (self.event_id, encoded)
+            self._encoded = encoded.encode("utf-8")
+
+        return self._encoded
+
+
+class ReplayEntry(StreamEvent):
+    """
+    Event stored in the replay buffer.
+
+    Only the event encoded into the SSE wire format and the fields which are needed by the
+    subscription filters are kept so the buffer doesn't hold on to the execution documents. The
+    event is encoded when it's received so the replayed event contains the state at that time.
+    """
+
+    def __new__(
+        cls,
+        seq,
+        event,
+        encoded,
+        action_ref=None,
+        execution_id=None,
+        status=None,
+    ):
+        entry = super(ReplayEntry, cls).__new__(cls, event, None)
+        entry._encoded = encoded
+        entry.seq = seq
+        entry.action_ref = action_ref
+        entry.execution_id = execution_id
+        entry.status = status
+        return entry
+
+    @property
+    def size(self):
+        return len(self._encoded)
+
+
+class ReplayBuffer(object):
+    """
+    Bounded in-memory ring buffer of the recent events which is used to replay events a client
+    has missed while it was disconnected (SSE Last-Event-ID).
+
+    The buffer is bound both by the number of events and by the total size of the encoded events.
+
+    Event ids consist of the buffer epoch and a sequence number. The epoch changes each time the
+    service is restarted so ids issued by a different process are recognized as a gap.
+    """
+
+    def __init__(self, size, max_bytes=0):
+        self.epoch = "%x" % (int(time.time() * 1000))
+        self._size = size
+        self._max_bytes = max_bytes
+        self._entries = deque()
+        self._bytes = 0
+        self._last_seq = 0
+
+    @property
+    def bytes(self):
+        return self._bytes
+
+    def get_next_id(self):
+        """
+        Return (sequence number, event id) tuple for the next event.
+        """
+        self._last_seq += 1
+        return self._last_seq, "%s-%s" % (self.epoch, self._last_seq)
+
+    def append(self, entry):
+        self._entries.append(entry)
+        self._bytes += entry.size
+
+        while self._entries and (
+            len(self._entries) > self._size
+            or (self._max_bytes and self._bytes > self._max_bytes)
+        ):
+            self._bytes -= self._entries.popleft().size
+
+    def get_entries_since(self, last_event_id):
+        """
+        Return entries for the events which came after the provided event id or None if some of
+        those events are not in the buffer anymore.
+        """
+        try:
+            epoch, seq = last_event_id.rsplit("-", 1)
+            seq = int(seq)
+        except (AttributeError, ValueError):
+            return None
+
+        if epoch != self.epoch or seq > self._last_seq:
+            return None
+
+        oldest_seq = self._entries[0].seq if self._entries else self._last_seq + 1
+        if seq < oldest_seq - 1:
+            return None
+
+        return [entry for entry in self._entries if entry.seq > seq]
+
+
+class CoalescedEventSlot(object):
+    """
+    Queue placeholder for a coalesced event. The latest event for the slot key is only retrieved
+    once the slot reaches the head of the queue and the coalesce window has passed.
+    """
+
+    __slots__ = ["key", "not_before"]
+
+    def __init__(self, key, not_before):
+        self.key = key
+        self.not_before = not_before
+
+
+class Subscription(object):
+    """
+    Stream subscription of a single client with the filters provided by that client.
+
+    When coalescing is enabled, execution and live action updates for the same object which
+    arrive within the coalesce window are collapsed so only the latest state is delivered. When
+    the number of buffered events reaches the limit, the oldest events are either dropped or the
+    whole buffer is replaced with a resync event which tells the client to re-list the resources.
+    """
+
+    def __init__(
+        self,
+        queue,
+        events=None,
+        action_refs=None,
+        execution_ids=None,
+        end_event=None,
+        end_statuses=None,
+        end_execution_id=None,
+        coalesce=False,
+        coalesce_window=0,
+        max_buffered_events=0,
+        overflow_policy=OVERFLOW_POLICY_RESYNC,
+    ):
+        self.queue = queue
+        self.events = events
+        self.action_refs = action_refs
+        self.execution_ids = execution_ids
+        self.end_event = end_event
+        self.end_statuses = end_statuses
+        self.end_execution_id = end_execution_id
+
+        self.coalesce = coalesce
+        self.coalesce_window = coalesce_window
+        self.max_buffered_events = max_buffered_events
+        self.overflow_policy = overflow_policy
+
+        # Latest undelivered event for each coalesced event slot
+        self._coalesced_events = {}
+        self.dropped_events_count = 0
+
+    def put(self, stream_event):
+        """
+        Buffer the provided event for delivery to the client.
+        """
+        key = self._get_coalesce_key(stream_event) if self.coalesce else None
+
+        if key is not None and key in self._coalesced_events:
+            # Replace undelivered state with the latest one
+            self._coalesced_events[key] = stream_event
+            return
+
+        if self.max_buffered_events and self.queue.qsize() >= self.max_buffered_events:
+            self._handle_overflow()
+
+        if key is not None:
+            self._coalesced_events[key] = stream_event
+            stream_event = CoalescedEventSlot(
+                key=key, not_before=time.time() + self.coalesce_window
+            )
+
+        self.queue.put(stream_event)
+
+    def get(self, timeout=None):
+        """
+        Return the next event which should be delivered to the client.
+        """
+        item = self.queue.get(timeout=timeout)
+
+        if isinstance(item, CoalescedEventSlot):
+            delay = item.not_before - time.time()
+            if delay > 0:
+                # Updates which arrive in the meantime replace the buffered state
+                eventlet.sleep(delay)
+
+            item = self._coalesced_events.pop(item.key, None)
+
+        return item
+
+    def _handle_overflow(self):
+        if self.overflow_policy == OVERFLOW_POLICY_DROP:
+            self._discard(self.queue.get_nowait())
+            self.dropped_events_count += 1
+            LOG.debug("Dropped oldest event for a slow stream client.")
+            return
+
+        while not self.queue.empty():
+            self._discard(self.queue.get_nowait())
+            self.dropped_events_count += 1
+
+        LOG.debug("Stream client buffer is full, sending resync event.")
+        self.queue.put(
+            StreamEvent(
+                RESYNC_EVENT,
+                {"reason": "buffer_overflow", "dropped": self.dropped_events_count},
+            )
+        )
+
+    def _discard(self, item):
+        if isinstance(item, CoalescedEventSlot):
+            self._coalesced_events.pop(item.key, None)
+
+    def _get_coalesce_key(self, stream_event):
+        (event_name, body) = stream_event
+
+        if event_name not in COALESCED_EVENTS:
+            return None
+
+        object_id = getattr(body, "id", None)
+        if not object_id:
+            return None
+
+        return (event_name, str(object_id))
+
+    @property
+    def event_names(self):
+        """
+        Event names this subscription is limited to or None if it's not limited to a set of
+        exact event names (no filter or a glob filter).
+        """
+        if not self.events:
+            return None
+
+        for event_name in self.events:
+            if glob.has_magic(event_name):
+                return None
+
+        return set(self.events)
+
+    def is_end_event(self, event_name, body):
+        """
+        Return True if this is the last event which should be sent to the client.
+        """
+        if event_name != self.end_event or body is None:
+            return False
+
+        return self.is_end_execution(event_name, str(body.id), body.status)
+
+    def is_end_execution(self, event_name, execution_id, status):
+        """
+        Return True if the event for the provided execution state is the last event which should
+        be sent to the client.
+        """
+        if event_name != self.end_event:
+            return False
+
+        return (
+            self.end_execution_id is not None
+            and status in self.end_statuses
+            and execution_id == self.end_execution_id
+        )
+
+    def matches(self, event_name, action_ref=None, execution_id=None):
+        """
+        Return True if the provided event matches all the subscription filters.
+        """
+        if self.events and not any(
+            [fnmatch.fnmatch(event_name, glob_) for glob_ in self.events]
+        ):
+            return False
+
+        if self.action_refs and action_ref not in self.action_refs:
+            return False
+
+        if self.execution_ids and execution_id not in self.execution_ids:
+            return False
+
+        return True
+
+
 class BaseListener(ConsumerMixin):
+    # True to retrieve the whole execution document for slim execution update messages
+    fetch_full_executions = True
+
+    # True to keep recent events in a replay buffer and assign ids to them
+    replay_events = True
+
+    # True to limit the number of events buffered for each client (see max_buffered_events)
+    bounded_client_buffers = True
+
     def __init__(self, connection):
         self.connection = connection
-        self.queues = []
         self._stopped = False
 
+        # Recent events which are replayed to the clients which reconnect with Last-Event-ID
+        self._replay_buffer = None
+        if self.replay_events and cfg.CONF.stream.replay_buffer_size:
+            self._replay_buffer = ReplayBuffer(
+                size=cfg.CONF.stream.replay_buffer_size,
+                max_bytes=cfg.CONF.stream.replay_buffer_max_bytes,
+            )
+
+        # Subscriptions are indexed so each event is only dispatched to the interested clients.
+        # Subscriptions which are limited to a set of execution ids are indexed by execution id,
+        # subscriptions which are limited to a set of exact event names by event name and the
+        # rest of them are matched against every event.
+        self._subscriptions_by_execution_id = defaultdict(set)
+        self._subscriptions_by_event_name = defaultdict(set)
+        self._other_subscriptions = set()
+
     def get_consumers(self, consumer, channel):
         raise NotImplementedError("get_consumers() is not implemented")
 
@@ -69,21 +435,122 @@ class BaseListener(ConsumerMixin):
             event_name = f"{event_prefix}__{meta.get('routing_key')}"
 
             try:
-                if model:
-                    body = model.from_model(
-                        body, mask_secrets=cfg.CONF.api.mask_secrets
+                body = mark_slim_execution(body, message)
+                subscriptions = self.get_subscriptions(event_name, body)
+
+                seq, event_id = None, None
+                if self._replay_buffer:
+                    seq, event_id = self._replay_buffer.get_next_id()
+
+                # Skip conversion of the events no client is interested in. Events are always
+                # converted when they are stored in the replay buffer.
+                stream_event = None
+                if subscriptions or self._replay_buffer:
+                    stream_event = self._get_stream_event(
+                        event_name, body, model=model, event_id=event_id
                     )
 
-                self.emit(event_name, body)
+                if subscriptions:
+                    self._dispatch(stream_event, subscriptions=subscriptions)
+                else:
+                    LOG.debug('Skipping event "%s" with no subscribers' % (event_name))
+
+                if self._replay_buffer:
+                    self._replay_buffer.append(
+                        ReplayEntry(
+                            seq=seq,
+                            event=event_name,
+                            encoded=stream_event.encode(),
+                            action_ref=self._get_action_ref_for_body(body=body),
+                            execution_id=self._get_execution_id_for_body(body=body),
+                            status=getattr(body, "status", None),
+                        )
+                    )
             finally:
                 message.ack()
 
         return process
 
-    def emit(self, event, body):
-        pack = (event, body)
-        for queue in self.queues:
-            queue.put(pack)
+    def emit(self, event, body, subscriptions=None):
+        if subscriptions is None:
+            subscriptions = self.get_subscriptions(event, body)
+
+        stream_event = StreamEvent(event, body)
+        self._dispatch(stream_event, subscriptions=subscriptions)
+
+    def _get_stream_event(self, event_name, body, model=None, event_id=None):
+        if self.fetch_full_executions:
+            body = execution_service.get_full_execution(body)
+
+        # Event is converted and encoded once and shared by all the subscriptions
+        if model:
+            body = model.from_model(body, mask_secrets=cfg.CONF.api.mask_secrets)
+
+        return StreamEvent(event_name, body, event_id=event_id)
+
+    def _replay(self, subscription, last_event_id):
+        """
+        Put events which came after the provided event id on the subscription queue.
+        """
+        entries = None
+        if self._replay_buffer:
+            entries = self._replay_buffer.get_entries_since(last_event_id)
+
+        if entries is None:
+            LOG.debug(
+                'Unable to replay events since "%s", sending resync event.'
+                % (last_event_id)
+            )
+            subscription.put(StreamEvent(RESYNC_EVENT, {"reason": "replay_gap"}))
+            return
+
+        for entry in entries:
+            if subscription.matches(entry.event, entry.action_ref, entry.execution_id):
+                subscription.put(entry)
+
+    def _dispatch(self, stream_event, subscriptions):
+        for subscription in subscriptions:
+            subscription.put(stream_event)
+
+    def get_subscriptions(self, event_name, body):
+        """
+        Return subscriptions which are interested in the provided event.
+        """
+        action_ref = self._get_action_ref_for_body(body=body)
+        execution_id = self._get_execution_id_for_body(body=body)
+
+        subscriptions = set(self._other_subscriptions)
+        subscriptions.update(self._subscriptions_by_event_name.get(event_name, ()))
+        if execution_id:
+            subscriptions.update(
+                self._subscriptions_by_execution_id.get(execution_id, ())
+            )
+
+        return [
+            subscription
+            for subscription in subscriptions
+            if subscription.matches(event_name, action_ref, execution_id)
+            or subscription.is_end_event(event_name, body)
+        ]
+
+    def subscribe(self, subscription):
+        index_keys = self._get_index_keys(subscription)
+
+        if not index_keys:
+            self._other_subscriptions.add(subscription)
+
+        for index, keys in index_keys:
+            for key in keys:
+                index[key].add(subscription)
+
+    def unsubscribe(self, subscription):
+        for index, keys in self._get_index_keys(subscription):
+            for key in keys:
+                index[key].discard(subscription)
+                if not index[key]:
+                    del index[key]
+
+        self._other_subscriptions.discard(subscription)
 
     def generator(
         self,
@@ -93,77 +560,93 @@ class BaseListener(ConsumerMixin):
         end_event=None,
         end_statuses=None,
         end_execution_id=None,
+        coalesce=False,
+        last_event_id=None,
     ):
         queue = eventlet.Queue()
         queue.put("")
-        self.queues.append(queue)
+        subscription = Subscription(
+            queue=queue,
+            events=events,
+            action_refs=action_refs,
+            execution_ids=execution_ids,
+            end_event=end_event,
+            end_statuses=end_statuses,
+            end_execution_id=end_execution_id,
+            coalesce=coalesce,
+            coalesce_window=cfg.CONF.stream.coalesce_window,
+            max_buffered_events=(
+                cfg.CONF.stream.max_buffered_events
+                if self.bounded_client_buffers
+                else 0
+            ),
+            overflow_policy=cfg.CONF.stream.buffer_overflow_policy,
+        )
+        self.subscribe(subscription)
+        if last_event_id:
+            self._replay(subscription, last_event_id)
         try:
             stop = False
             while not self._stopped and not stop:
                 try:
                     # TODO: Move to common option
-                    message = queue.get(timeout=cfg.CONF.stream.heartbeat)
+                    message = subscription.get(timeout=cfg.CONF.stream.heartbeat)
                     if not message:
                         yield message
                         continue
                     event_name, body = message
-                    # check to see if this is the last message to send.
-                    if event_name == end_event:
-                        if (
-                            body is not None
-                            and body.status in end_statuses
-                            and end_execution_id is not None
-                            and body.id == end_execution_id
-                        ):
-                            stop = True
-                    # TODO: We now do late filtering, but this could also be performed on the
-                    # message bus level if we modified our exchange layout and utilize routing keys
-                    # Filter on event name
-                    include_event = self._should_include_event(
-                        event_names_whitelist=events, event_name=event_name
-                    )
-                    if not include_event:
-                        LOG.debug('Skipping event "%s"' % (event_name))
-                        continue
 
-                    # Filter on action ref
-                    action_ref = self._get_action_ref_for_body(body=body)
-                    if action_refs and action_ref not in action_refs:
-                        LOG.debug(
-                            'Skipping event "%s" with action_ref "%s"'
-                            % (event_name, action_ref)
-                        )
-                        continue
-                    # Filter on execution id
-                    execution_id = self._get_execution_id_for_body(body=body)
-                    if execution_ids and execution_id not in execution_ids:
-                        LOG.debug(
-                            'Skipping event "%s" with execution_id "%s"'
-                            % (event_name, execution_id)
+                    if isinstance(message, ReplayEntry):
+                        # Replayed events only contain the fields used by the filters
+                        action_ref = message.action_ref
+                        execution_id = message.execution_id
+                        is_end_event = subscription.is_end_execution(
+                            event_name, execution_id, message.status
                         )
+                    else:
+                        action_ref = self._get_action_ref_for_body(body=body)
+                        execution_id = self._get_execution_id_for_body(body=body)
+                        is_end_event = subscription.is_end_event(event_name, body)
+
+                    # check to see if this is the last message to send.
+                    if is_end_event:
+                        stop = True
+
+                    # Events are already dispatched only to the interested subscriptions, but the
+                    # filters are still verified here since messages can be put directly on the
+                    # queue
+                    if event_name not in CONTROL_EVENTS and not subscription.matches(
+                        event_name, action_ref, execution_id
+                    ):
+                        LOG.debug('Skipping event "%s"' % (event_name))
                         continue
 
                     yield message
                 except eventlet.queue.Empty:
                     yield
         finally:
-            self.queues.remove(queue)
+            self.unsubscribe(subscription)
 
     def shutdown(self):
         self._stopped = True
 
-    def _should_include_event(self, event_names_whitelist, event_name):
+    def _get_index_keys(self, subscription):
         """
-        Return True if particular event should be included based on the event names filter.
+        Return (index, keys) tuples for the indexes the provided subscription belongs to.
         """
-        if not event_names_whitelist:
-            return True
+        if subscription.execution_ids:
+            keys = set(subscription.execution_ids)
+            if subscription.end_execution_id:
+                keys.add(subscription.end_execution_id)
+            return [(self._subscriptions_by_execution_id, keys)]
 
-        for event_name_filter_glob in event_names_whitelist:
-            if fnmatch.fnmatch(event_name, event_name_filter_glob):
-                return True
+        event_names = subscription.event_names
+        if event_names:
+            if subscription.end_event:
+                event_names.add(subscription.end_event)
+            return [(self._subscriptions_by_event_name, event_names)]
 
-        return False
+        return []
 
     def _get_action_ref_for_body(self, body):
         """
@@ -174,11 +657,11 @@ class BaseListener(ConsumerMixin):
 
         action_ref = None
 
-        if isinstance(body, ActionExecutionAPI):
+        if isinstance(body, (ActionExecutionAPI, ActionExecutionDB)):
             action_ref = body.action.get("ref", None) if body.action else None
-        elif isinstance(body, LiveActionAPI):
+        elif isinstance(body, (LiveActionAPI, LiveActionDB)):
             action_ref = body.action
-        elif isinstance(body, (ActionExecutionOutputAPI)):
+        elif isinstance(body, (ActionExecutionOutputAPI, ActionExecutionOutputDB)):
             action_ref = body.action_ref
 
         return action_ref
@@ -189,11 +672,11 @@ class BaseListener(ConsumerMixin):
 
         execution_id = None
 
-        if isinstance(body, ActionExecutionAPI):
+        if isinstance(body, (ActionExecutionAPI, ActionExecutionDB)):
             execution_id = str(body.id)
-        elif isinstance(body, LiveActionAPI):
+        elif isinstance(body, (LiveActionAPI, LiveActionDB)):
             execution_id = None
-        elif isinstance(body, (ActionExecutionOutputAPI)):
+        elif isinstance(body, (ActionExecutionOutputAPI, ActionExecutionOutputDB)):
             execution_id = body.execution_id
 
         return execution_id
@@ -210,27 +693,27 @@ class StreamListener(BaseListener):
         return [
             consumer(
                 queues=[STREAM_ACTIONALIAS_QUEUE],
-                accept=["pickle"],
+                accept=ACCEPT_CONTENT,
                 callbacks=[self.processor(ActionAliasAPI)],
             ),
             consumer(
                 queues=[STREAM_ANNOUNCEMENT_WORK_QUEUE],
-                accept=["pickle"],
+                accept=ACCEPT_CONTENT,
                 callbacks=[self.processor()],
             ),
             consumer(
                 queues=[STREAM_EXECUTION_ALL_WORK_QUEUE],
-                accept=["pickle"],
+                accept=ACCEPT_CONTENT,
                 callbacks=[self.processor(ActionExecutionAPI)],
             ),
             consumer(
                 queues=[STREAM_LIVEACTION_WORK_QUEUE],
-                accept=["pickle"],
+                accept=ACCEPT_CONTENT,
                 callbacks=[self.processor(LiveActionAPI)],
             ),
             consumer(
                 queues=[STREAM_EXECUTION_OUTPUT_QUEUE],
-                accept=["pickle"],
+                accept=ACCEPT_CONTENT,
                 callbacks=[self.processor(ActionExecutionOutputAPI)],
             ),
         ]
@@ -243,16 +726,26 @@ class ExecutionOutputListener(BaseListener):
     Only listens to action execution work and output queue.
     """
 
+    # Only execution status is used to determine when to close the output stream
+    fetch_full_executions = False
+
+    # Output streams start with the existing output and don't support resuming
+    replay_events = False
+
+    # Output lines can't be dropped or replaced with a resync event since output streams can't
+    # be resynced
+    bounded_client_buffers = False
+
     def get_consumers(self, consumer, channel):
         return [
             consumer(
                 queues=[STREAM_EXECUTION_UPDATE_WORK_QUEUE],
-                accept=["pickle"],
+                accept=ACCEPT_CONTENT,
                 callbacks=[self.processor(ActionExecutionAPI)],
             ),
             consumer(
                 queues=[STREAM_EXECUTION_OUTPUT_QUEUE],
-                accept=["pickle"],
+                accept=ACCEPT_CONTENT,
                 callbacks=[self.processor(ActionExecutionOutputAPI)],
             ),
         ]
@@ -17,6 +17,7 @@ from __future__ import absolute_import
 
 from st2common.transport import liveaction, actionexecutionstate, execution, workflow
 from st2common.transport import publishers, reactor, utils, connection_retry_wrapper
+from st2common.transport import content, keyvalue, pack
 
 # TODO(manas) : Exchanges, Queues and RoutingKey design discussion pending.
 
@@ -27,6 +28,9 @@ __all__ = [
     "workflow",
     "publishers",
     "reactor",
+    "content",
+    "keyvalue",
+    "pack",
     "utils",
     "connection_retry_wrapper",
 ]
@@ -31,8 +31,11 @@ from st2common.transport.actionalias import ACTIONALIAS_XCHG
 from st2common.transport.actionexecutionstate import ACTIONEXECUTIONSTATE_XCHG
 from st2common.transport.announcement import ANNOUNCEMENT_XCHG
 from st2common.transport.connection_retry_wrapper import ConnectionRetryWrapper
+from st2common.transport.content import CONTENT_XCHG
 from st2common.transport.execution import EXECUTION_XCHG, EXECUTION_OUTPUT_XCHG
+from st2common.transport.keyvalue import KEYVALUE_XCHG
 from st2common.transport.liveaction import LIVEACTION_XCHG, LIVEACTION_STATUS_MGMT_XCHG
+from st2common.transport.pack import PACK_CONFIG_XCHG
 from st2common.transport.reactor import SENSOR_CUD_XCHG
 from st2common.transport.reactor import TRIGGER_CUD_XCHG, TRIGGER_INSTANCE_XCHG
 from st2common.transport import reactor
@@ -66,10 +69,13 @@ EXCHANGES = [
     ACTIONALIAS_XCHG,
     ACTIONEXECUTIONSTATE_XCHG,
     ANNOUNCEMENT_XCHG,
+    CONTENT_XCHG,
     EXECUTION_XCHG,
     EXECUTION_OUTPUT_XCHG,
+    KEYVALUE_XCHG,
     LIVEACTION_XCHG,
     LIVEACTION_STATUS_MGMT_XCHG,
+    PACK_CONFIG_XCHG,
     TRIGGER_CUD_XCHG,
     TRIGGER_INSTANCE_XCHG,
     SENSOR_CUD_XCHG,
@@ -17,10 +17,14 @@ from __future__ import absolute_import
 import abc
 import six
 
+from eventlet.semaphore import Semaphore
 from kombu.mixins import ConsumerMixin
 from oslo_config import cfg
 
 from st2common import log as logging
+from st2common.metrics.base import get_driver
+from st2common.transport.execution import mark_slim_execution
+from st2common.transport.serializers import ACCEPT_CONTENT
 from st2common.util.greenpooldispatch import BufferedDispatcher
 from st2common.util import concurrency
 
@@ -38,48 +42,136 @@ LOG = logging.getLogger(__name__)
 class QueueConsumer(ConsumerMixin):
     def __init__(self, connection, queues, handler):
         self.connection = connection
-        self._dispatcher = BufferedDispatcher()
         self._queues = queues
         self._handler = handler
 
+        self._setup_dispatchers()
+        self._setup_flow_control()
+
     def shutdown(self):
         self.should_stop = True
         self._dispatcher.shutdown()
 
     def get_consumers(self, Consumer, channel):
         consumer = Consumer(
-            queues=self._queues, accept=["pickle"], callbacks=[self.process]
+            queues=self._queues, accept=ACCEPT_CONTENT, callbacks=[self.process]
         )
+        consumer.qos(prefetch_count=self.get_prefetch_count())
+
+        return [consumer]
+
+    def get_prefetch_count(self):
+        """
+        Return maximum number of unacknowledged messages the broker delivers to this consumer.
+        """
+        service_prefetch_count = cfg.CONF.messaging.service_prefetch_count or {}
+        service_name = getattr(self._handler, "service_name", None)
+        prefetch_count = service_prefetch_count.get(service_name, None)
+
+        if prefetch_count:
+            return int(prefetch_count)
+
+        if cfg.CONF.messaging.prefetch_count:
+            return cfg.CONF.messaging.prefetch_count
+
+        if self._ack_after_processing:
+            # Messages are acked once processed so the dispatchers never buffer more messages
+            # than they can process at once
+            return sum([dispatcher.pool_size for dispatcher in self._get_dispatchers()])
 
         # use prefetch_count=1 for fair dispatch. This way workers that finish an item get the next
         # task and the work does not get queued behind any single large item.
-        consumer.qos(prefetch_count=1)
-
-        return [consumer]
+        return 1
 
     def process(self, body, message):
+        self._on_message_received()
+
+        ack = True
         try:
             if not isinstance(body, self._handler.message_type):
                 raise TypeError(
                     'Received an unexpected type "%s" for payload.' % type(body)
                 )
 
-            self._dispatcher.dispatch(self._process_message, body)
+            body = mark_slim_execution(body, message)
+            ack = not self._dispatch(self._dispatcher, body, message)
         except:
             LOG.exception(
                 "%s failed to process message: %s", self.__class__.__name__, body
             )
         finally:
-            # At this point we will always ack a message.
-            message.ack()
+            # Unless message is acked after processing, at this point we will always ack it.
+            if ack:
+                self._ack(message)
 
-    def _process_message(self, body):
+    def _process_message(self, body, message=None):
         try:
             self._handler.process(body)
         except:
             LOG.exception(
                 "%s failed to process message: %s", self.__class__.__name__, body
             )
+        finally:
+            if message is not None:
+                self._ack(message)
+
+    def _setup_dispatchers(self):
+        self._dispatcher = BufferedDispatcher()
+
+    def _setup_flow_control(self):
+        self._ack_after_processing = cfg.CONF.messaging.ack_after_processing
+        self._ack_lock = Semaphore()
+        self._in_flight = 0
+
+        handler_name = self._handler.__class__.__name__.lower()
+        self._in_flight_metrics_key = "amqp.consumer.%s.in_flight" % (handler_name)
+        self._buffer_depth_metrics_key = "amqp.consumer.%s.buffer_depth" % (
+            handler_name
+        )
+
+    def _get_dispatchers(self):
+        return [self._dispatcher]
+
+    def _dispatch(self, dispatcher, body, message):
+        """
+        Dispatch message for processing.
+
+        :return: True if message will be acknowledged once it has been processed.
+        :rtype: ``bool``
+        """
+        if self._ack_after_processing:
+            dispatcher.dispatch(self._process_message, body, message)
+            return True
+
+        dispatcher.dispatch(self._process_message, body)
+        return False
+
+    def _on_message_received(self):
+        self._in_flight += 1
+        self._report_gauges()
+
+    def _ack(self, message):
+        # Messages can be acked from multiple dispatcher threads which share the same channel
+        with self._ack_lock:
+            try:
+                message.ack()
+            except Exception:
+                LOG.exception(
+                    "%s failed to acknowledge message.", self.__class__.__name__
+                )
+            finally:
+                self._in_flight -= 1
+
+        self._report_gauges()
+
+    def _report_gauges(self):
+        buffer_depth = sum(
+            [dispatcher.buffer_depth for dispatcher in self._get_dispatchers()]
+        )
+
+        metrics_driver = get_driver()
+        metrics_driver.set_gauge(self._in_flight_metrics_key, self._in_flight)
+        metrics_driver.set_gauge(self._buffer_depth_metrics_key, buffer_depth)
 
 
 class StagedQueueConsumer(QueueConsumer):
@@ -88,20 +180,24 @@ class StagedQueueConsumer(QueueConsumer):
     """
 
     def process(self, body, message):
+        self._on_message_received()
+
+        ack = True
         try:
             if not isinstance(body, self._handler.message_type):
                 raise TypeError(
                     'Received an unexpected type "%s" for payload.' % type(body)
                 )
             response = self._handler.pre_ack_process(body)
-            self._dispatcher.dispatch(self._process_message, response)
+            ack = not self._dispatch(self._dispatcher, response, message)
         except:
             LOG.exception(
                 "%s failed to process message: %s", self.__class__.__name__, body
             )
         finally:
-            # At this point we will always ack a message.
-            message.ack()
+            # Unless message is acked after processing, at this point we will always ack it.
+            if ack:
+                self._ack(message)
 
 
 class ActionsQueueConsumer(QueueConsumer):
@@ -114,12 +210,7 @@ class ActionsQueueConsumer(QueueConsumer):
     This way we can ensure workflow actions never block non-workflow actions.
     """
 
-    def __init__(self, connection, queues, handler):
-        self.connection = connection
-
-        self._queues = queues
-        self._handler = handler
-
+    def _setup_dispatchers(self):
         workflows_pool_size = cfg.CONF.actionrunner.workflows_pool_size
         actions_pool_size = cfg.CONF.actionrunner.actions_pool_size
         self._workflows_dispatcher = BufferedDispatcher(
@@ -129,7 +220,18 @@ class ActionsQueueConsumer(QueueConsumer):
             dispatch_pool_size=actions_pool_size, name="actions-dispatcher"
         )
 
+    def _setup_flow_control(self):
+        super(ActionsQueueConsumer, self)._setup_flow_control()
+
+        # NOTE: Actions can run for longer than RabbitMQ consumer_timeout after which the broker
+        # closes the channel and delivers unacknowledged messages again (the action would run
+        # twice) so action runner messages are always acknowledged when they are received
+        self._ack_after_processing = False
+
     def process(self, body, message):
+        self._on_message_received()
+
+        ack = True
         try:
             if not isinstance(body, self._handler.message_type):
                 raise TypeError(
@@ -145,20 +247,24 @@ class ActionsQueueConsumer(QueueConsumer):
                 dispatcher = self._actions_dispatcher
 
             LOG.debug('Using BufferedDispatcher pool: "%s"', str(dispatcher))
-            dispatcher.dispatch(self._process_message, body)
+            ack = not self._dispatch(dispatcher, body, message)
         except:
             LOG.exception(
                 "%s failed to process message: %s", self.__class__.__name__, body
             )
         finally:
-            # At this point we will always ack a message.
-            message.ack()
+            # Unless message is acked after processing, at this point we will always ack it.
+            if ack:
+                self._ack(message)
 
     def shutdown(self):
         self._workflows_dispatcher.shutdown()
         self._actions_dispatcher.shutdown()
         self.should_stop = True
 
+    def _get_dispatchers(self):
+        return [self._workflows_dispatcher, self._actions_dispatcher]
+
 
 class VariableMessageQueueConsumer(QueueConsumer):
     """
@@ -166,26 +272,35 @@ class VariableMessageQueueConsumer(QueueConsumer):
     """
 
     def process(self, body, message):
+        self._on_message_received()
+
+        ack = True
         try:
             if not self._handler.message_types.get(type(body)):
                 raise TypeError(
                     'Received an unexpected type "%s" for payload.' % type(body)
                 )
 
-            self._dispatcher.dispatch(self._process_message, body)
+            body = mark_slim_execution(body, message)
+            ack = not self._dispatch(self._dispatcher, body, message)
         except:
             LOG.exception(
                 "%s failed to process message: %s", self.__class__.__name__, body
             )
         finally:
-            # At this point we will always ack a message.
-            message.ack()
+            # Unless message is acked after processing, at this point we will always ack it.
+            if ack:
+                self._ack(message)
 
 
 @six.add_metaclass(abc.ABCMeta)
 class MessageHandler(object):
     message_type = None
 
+    # Name of the service which uses this handler. Used to look up service specific consumer
+    # settings such as prefetch count.
+    service_name = None
+
     def __init__(self, connection, queues):
         self._queue_consumer = self.get_queue_consumer(
             connection=connection, queues=queues
@@ -17,12 +17,19 @@
 
 from __future__ import absolute_import
 
+from oslo_config import cfg
+
+from st2common.metrics.base import Timer
 from st2common.transport import publishers
 from st2common.transport.kombu import Exchange, Queue
 
 __all__ = [
     "ActionExecutionPublisher",
     "ActionExecutionOutputPublisher",
+    "get_slim_execution",
+    "is_slim_message",
+    "mark_slim_execution",
+    "is_slim_execution",
     "get_queue",
     "get_output_queue",
 ]
@@ -30,11 +37,50 @@ __all__ = [
 EXECUTION_XCHG = Exchange("st2.execution", type="topic")
 EXECUTION_OUTPUT_XCHG = Exchange("st2.execution.output", type="topic")
 
+# Header which marks slim execution update messages
+SLIM_MESSAGE_HEADER = "st2-slim"
+
+# Execution fields which are included in slim execution update messages. Large fields such as
+# result, parameters and log are left out and need to be retrieved from the database.
+SLIM_EXECUTION_FIELDS = [
+    "id",
+    "status",
+    "start_timestamp",
+    "end_timestamp",
+    "result_size",
+    "context",
+    "parent",
+    "children",
+    "workflow_execution",
+    "task_execution",
+    "delay",
+    "web_url",
+]
+
+# Keys which are included for the nested action, runner and liveaction dictionaries
+SLIM_EXECUTION_DICT_FIELDS = {
+    "action": ["id", "ref", "name", "pack", "runner_type"],
+    "runner": ["id", "name"],
+    "liveaction": ["id", "action"],
+}
+
 
 class ActionExecutionPublisher(publishers.CUDPublisher):
     def __init__(self):
         super(ActionExecutionPublisher, self).__init__(exchange=EXECUTION_XCHG)
 
+    def publish_update(self, payload):
+        if not cfg.CONF.messaging.slim_execution_updates:
+            return super(ActionExecutionPublisher, self).publish_update(payload)
+
+        with Timer(key="amqp.publish.update"):
+            self._publisher.publish(
+                get_slim_execution(payload),
+                self._exchange,
+                publishers.UPDATE_RK,
+                headers={SLIM_MESSAGE_HEADER: True},
+            )
+
 
 class ActionExecutionOutputPublisher(publishers.CUDPublisher):
     def __init__(self):
@@ -43,6 +89,55 @@ class ActionExecutionOutputPublisher(publishers.CUDPublisher):
         )
 
 
+def get_slim_execution(execution_db):
+    """
+    Return a copy of the provided execution which only contains the execution state fields.
+
+    :param execution_db: Execution to use.
+    :type execution_db: :class:`ActionExecutionDB`
+
+    :rtype: :class:`ActionExecutionDB`
+    """
+    values = {}
+
+    for field_name in SLIM_EXECUTION_FIELDS:
+        value = getattr(execution_db, field_name, None)
+
+        if value is not None:
+            values[field_name] = value
+
+    for field_name, keys in SLIM_EXECUTION_DICT_FIELDS.items():
+        value = getattr(execution_db, field_name, None) or {}
+        values[field_name] = dict([(key, value[key]) for key in keys if key in value])
+
+    return execution_db.__class__(**values)
+
+
+def is_slim_message(message):
+    """
+    Return True if the provided message is a slim execution update message.
+    """
+    headers = getattr(message, "headers", None) or {}
+    return bool(headers.get(SLIM_MESSAGE_HEADER, False))
+
+
+def mark_slim_execution(execution_db, message):
+    """
+    Mark the provided execution as slim if it was received in a slim execution update message.
+    """
+    if is_slim_message(message):
+        execution_db._slim = True
+
+    return execution_db
+
+
+def is_slim_execution(execution_db):
+    """
+    Return True if the provided execution only contains the execution state fields.
+    """
+    return getattr(execution_db, "_slim", False)
+
+
 def get_queue(name=None, routing_key=None, exclusive=False, auto_delete=False):
     return Queue(
         name,
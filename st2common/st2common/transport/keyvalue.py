@@ -0,0 +1,44 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+from st2common.transport import publishers
+from st2common.transport.kombu import Exchange, Queue
+
+__all__ = [
+    "KeyValuePairCUDPublisher",
+    "get_keyvalue_cud_queue",
+]
+
+KEYVALUE_XCHG = Exchange("st2.keyvalue", type="topic")
+
+
+class KeyValuePairCUDPublisher(publishers.CUDPublisher):
+    """
+    Publisher responsible for publishing KeyValuePair model CUD events.
+    """
+
+    def __init__(self):
+        super(KeyValuePairCUDPublisher, self).__init__(exchange=KEYVALUE_XCHG)
+
+
+def get_keyvalue_cud_queue(name, routing_key, exclusive=False, auto_delete=False):
+    return Queue(
+        name,
+        KEYVALUE_XCHG,
+        routing_key=routing_key,
+        exclusive=exclusive,
+        auto_delete=auto_delete,
+    )
@@ -16,20 +16,31 @@
 from __future__ import absolute_import
 
 import copy
+import socket
+import time
+import weakref
+from collections import OrderedDict
 
+from eventlet.semaphore import Semaphore
 from kombu.messaging import Producer
 from oslo_config import cfg
 
 from st2common import log as logging
+from st2common.exceptions.transport import PublisherConfirmTimeoutError
+from st2common.exceptions.transport import PublishNotConfirmedError
 from st2common.metrics.base import Timer
+from st2common.transport import serializers
 from st2common.transport import utils as transport_utils
 from st2common.transport.connection_retry_wrapper import ConnectionRetryWrapper
+from st2common.util import concurrency
 
 __all__ = [
+    "PublisherChannel",
     "PoolPublisher",
     "SharedPoolPublishers",
     "CUDPublisher",
     "StatePublisherMixin",
+    "shutdown_publishers",
 ]
 
 ANY_RK = "*"
@@ -39,6 +50,130 @@ DELETE_RK = "delete"
 
 LOG = logging.getLogger(__name__)
 
+# All the pool publishers which have been created inside this process
+PUBLISHERS = weakref.WeakSet()
+
+
+class PublisherChannel(object):
+    """
+    Long lived channel and producer bound to a single (pooled) connection.
+
+    When publisher confirms are enabled, the channel is put into confirm mode and confirms are
+    awaited in batches instead of after each published message. Messages are kept until they are
+    confirmed so they can be published again if the broker rejects them or if the channel is
+    dropped.
+    """
+
+    def __init__(self, connection, confirms=False):
+        self.connection = connection
+        self.channel = connection.channel()
+        self.producer = Producer(self.channel, auto_declare=False)
+
+        self.confirms = confirms
+        self.published = 0
+        self.confirmed = 0
+
+        # Messages which haven't been confirmed yet keyed by delivery tag. Value is a tuple of
+        # exchange and publish kwargs
+        self.unconfirmed_messages = OrderedDict()
+
+        # Messages which have been rejected by the broker since the last wait for confirms
+        self.nacked_messages = []
+
+        if self.confirms:
+            self.channel.confirm_select()
+            self.channel.events["basic_ack"].add(self._on_basic_ack)
+            self.channel.events["basic_nack"].add(self._on_basic_nack)
+
+    @property
+    def is_open(self):
+        # NOTE: Virtual (e.g. in-memory) transport channels don't have "is_open" attribute
+        is_open = getattr(self.channel, "is_open", True) and not getattr(
+            self.channel, "closed", False
+        )
+        return is_open and self.channel.connection is not None
+
+    @property
+    def unconfirmed(self):
+        return len(self.unconfirmed_messages)
+
+    def publish(self, exchange, **kwargs):
+        # Exchange is declared only once per connection (kombu caches declared entities)
+        self.producer.publish(exchange=exchange, declare=[exchange], **kwargs)
+        self.published += 1
+
+        if self.confirms:
+            # In confirm mode, delivery tags are assigned sequentially starting with 1
+            self.unconfirmed_messages[self.published] = (exchange, kwargs)
+
+    def wait_for_confirms(self, timeout=None):
+        """
+        Wait until the broker confirms all the messages published on this channel.
+
+        :raises PublisherConfirmTimeoutError: If the messages are not confirmed in time. Messages
+                                              which are still unconfirmed are kept and awaited
+                                              again on the next call.
+        :raises PublishNotConfirmedError: If the broker rejected some of the messages.
+        """
+        deadline = time.time() + timeout if timeout else None
+
+        while self.unconfirmed_messages:
+            remaining = deadline - time.time() if deadline else None
+
+            if remaining is not None and remaining <= 0:
+                raise PublisherConfirmTimeoutError(
+                    "%s published message(s) have not been confirmed in %s seconds."
+                    % (self.unconfirmed, timeout)
+                )
+
+            try:
+                self.connection.drain_events(timeout=remaining)
+            except socket.timeout:
+                continue
+
+        if self.nacked_messages:
+            messages = self.nacked_messages
+            self.nacked_messages = []
+            raise PublishNotConfirmedError(messages=messages)
+
+    def pop_unconfirmed_messages(self):
+        """
+        Remove and return all the messages which haven't been confirmed by the broker (e.g. when
+        the channel is dropped).
+
+        :rtype: ``list`` of ``tuple``
+        """
+        messages = self.nacked_messages + list(self.unconfirmed_messages.values())
+
+        self.nacked_messages = []
+        self.unconfirmed_messages = OrderedDict()
+
+        return messages
+
+    def close(self):
+        try:
+            self.channel.close()
+        except Exception:
+            LOG.debug("Error closing publisher channel.", exc_info=True)
+
+    def _on_basic_ack(self, delivery_tag, multiple):
+        self.confirmed += len(self._pop_messages(delivery_tag, multiple))
+
+    def _on_basic_nack(self, delivery_tag, multiple):
+        self.nacked_messages.extend(self._pop_messages(delivery_tag, multiple))
+
+    def _pop_messages(self, delivery_tag, multiple):
+        if multiple:
+            delivery_tags = [
+                tag for tag in self.unconfirmed_messages if tag <= delivery_tag
+            ]
+        else:
+            delivery_tags = (
+                [delivery_tag] if delivery_tag in self.unconfirmed_messages else []
+            )
+
+        return [self.unconfirmed_messages.pop(tag) for tag in delivery_tags]
+
 
 class PoolPublisher(object):
     def __init__(self, urls=None):
@@ -54,42 +189,272 @@ class PoolPublisher(object):
         self.pool = connection.Pool(limit=10)
         self.cluster_size = len(urls)
 
+        # Long lived channels keyed on the pooled connection they belong to
+        self._channels = weakref.WeakKeyDictionary()
+
+        # Locks which make sure pooled connections with a long lived channel are not used by the
+        # publishing green threads and the confirms flush thread at the same time
+        self._locks = weakref.WeakKeyDictionary()
+
+        self._flush_thread = None
+
+        PUBLISHERS.add(self)
+
     def errback(self, exc, interval):
         LOG.error("Rabbitmq connection error: %s", exc.message, exc_info=False)
 
-    def publish(self, payload, exchange, routing_key="", compression=None):
+    def publish(
+        self, payload, exchange, routing_key="", compression=None, headers=None
+    ):
+        with Timer(key="amqp.pool_publisher.publish_with_retries." + exchange.name):
+            self._publish_messages(
+                payloads=[payload],
+                exchange=exchange,
+                routing_key=routing_key,
+                compression=compression,
+                headers=headers,
+            )
+
+    def publish_many(
+        self, payloads, exchange, routing_key="", compression=None, headers=None
+    ):
+        """
+        Publish multiple messages to the same exchange using a single pooled connection and
+        channel.
+
+        :param payloads: List of message payloads.
+        :type payloads: ``list``
+        """
+        with Timer(
+            key="amqp.pool_publisher.publish_many_with_retries." + exchange.name
+        ):
+            self._publish_messages(
+                payloads=payloads,
+                exchange=exchange,
+                routing_key=routing_key,
+                compression=compression,
+                headers=headers,
+            )
+
+    def _publish_messages(
+        self, payloads, exchange, routing_key="", compression=None, headers=None
+    ):
         compression = compression or cfg.CONF.messaging.compression
 
-        with Timer(key="amqp.pool_publisher.publish_with_retries." + exchange.name):
-            with self.pool.acquire(block=True) as connection:
-                retry_wrapper = ConnectionRetryWrapper(
-                    cluster_size=self.cluster_size, logger=LOG
+        messages = []
+        for payload in payloads:
+            kwargs = {
+                "body": payload,
+                "routing_key": routing_key,
+                "serializer": serializers.get_serializer(
+                    payload, serializer=cfg.CONF.messaging.serializer
+                ),
+                "compression": compression,
+                "content_encoding": "utf-8",
+            }
+
+            if headers:
+                kwargs["headers"] = headers
+
+            messages.append(kwargs)
+
+        with self.pool.acquire(block=True) as connection:
+            if cfg.CONF.messaging.publisher_channel_reuse:
+                with self._get_lock(connection=connection):
+                    for kwargs in messages:
+                        self._publish_on_channel(
+                            connection=connection, exchange=exchange, **kwargs
+                        )
+                return
+
+            self._publish_many_with_retries(
+                connection=connection, exchange=exchange, messages=messages
+            )
+
+    def flush_confirms(self):
+        """
+        Wait for the broker to confirm all the messages published on long lived channels.
+        """
+        for connection, channel in list(self._channels.items()):
+            if not channel.unconfirmed and not channel.nacked_messages:
+                continue
+
+            with self._get_lock(connection=connection):
+                # Channel could have been dropped while waiting for the lock
+                if self._channels.get(connection, None) is not channel:
+                    continue
+
+                self._wait_for_confirms(connection=connection, channel=channel)
+
+    def shutdown(self):
+        """
+        Wait for pending publisher confirms and close all the long lived channels.
+        """
+        if self._flush_thread:
+            concurrency.kill(self._flush_thread)
+            self._flush_thread = None
+
+        self.flush_confirms()
+
+        for connection in list(self._channels.keys()):
+            with self._get_lock(connection=connection):
+                self._close_channel(connection=connection)
+
+    def _publish_with_retries(self, connection, exchange, **kwargs):
+        self._publish_many_with_retries(
+            connection=connection, exchange=exchange, messages=[kwargs]
+        )
+
+    def _publish_many_with_retries(self, connection, exchange, messages):
+        retry_wrapper = ConnectionRetryWrapper(
+            cluster_size=self.cluster_size, logger=LOG
+        )
+
+        # Messages which haven't been published yet. When the connection or channel fails in the
+        # middle of a batch, publishing is resumed with the first message which hasn't been
+        # published so the published ones are not duplicated.
+        pending = list(messages)
+
+        def do_publish(connection, channel):
+            # ProducerPool ends up creating its own ConnectionPool which ends up
+            # completely invalidating this ConnectionPool. Also, a ConnectionPool for
+            # producer does not really solve any problems for us so better to create a
+            # Producer for each publish.
+            # passing exchange to Producer __init__ allows auto_declare to declare
+            # anything that's missing (especially useful for tests).
+            producer = Producer(channel, exchange=exchange)
+
+            while pending:
+                retry_wrapper.ensured(
+                    connection=connection,
+                    obj=producer,
+                    to_ensure_func=producer.publish,
+                    **pending[0],
                 )
+                pending.pop(0)
 
-                def do_publish(connection, channel):
-                    # ProducerPool ends up creating its own ConnectionPool which ends up
-                    # completely invalidating this ConnectionPool. Also, a ConnectionPool for
-                    # producer does not really solve any problems for us so better to create a
-                    # Producer for each publish.
-                    # passing exchange to Producer __init__ allows auto_declare to declare
-                    # anything that's missing (especially useful for tests).
-                    producer = Producer(channel, exchange=exchange)
-                    kwargs = {
-                        "body": payload,
-                        "routing_key": routing_key,
-                        "serializer": "pickle",
-                        "compression": compression,
-                        "content_encoding": "utf-8",
-                    }
-
-                    retry_wrapper.ensured(
-                        connection=connection,
-                        obj=producer,
-                        to_ensure_func=producer.publish,
-                        **kwargs,
-                    )
-
-                retry_wrapper.run(connection=connection, wrapped_callback=do_publish)
+        retry_wrapper.run(connection=connection, wrapped_callback=do_publish)
+
+    def _publish_on_channel(self, connection, exchange, **kwargs):
+        """
+        Publish a message using a long lived channel and producer for the provided connection.
+        """
+        try:
+            channel = self._get_channel(connection=connection)
+            channel.publish(exchange=exchange, **kwargs)
+        except connection.connection_errors + connection.channel_errors as e:
+            # Fall back to a regular publish which takes care of re-establishing the connection
+            # and failing over to other nodes in a cluster. Message hasn't been published so
+            # there is no risk of a duplicate.
+            LOG.debug(
+                "Failed to publish message on a long lived channel, retrying: %s" % (e)
+            )
+            self._drop_channel(connection=connection)
+            self._publish_with_retries(
+                connection=connection, exchange=exchange, **kwargs
+            )
+            return
+
+        batch_size = cfg.CONF.messaging.publisher_confirms_batch_size
+        if channel.confirms and channel.unconfirmed >= batch_size:
+            self._wait_for_confirms(connection=connection, channel=channel)
+
+    def _wait_for_confirms(self, connection, channel):
+        """
+        Wait for confirms of the messages published on the provided channel.
+
+        Errors are handled here and not propagated since the waiting publisher is usually not the
+        one which published the affected messages.
+        """
+        with Timer(key="amqp.pool_publisher.wait_for_confirms"):
+            try:
+                channel.wait_for_confirms(
+                    timeout=cfg.CONF.messaging.publisher_confirms_timeout
+                )
+            except PublisherConfirmTimeoutError as e:
+                # Messages have been published, they are only awaited again on the next flush
+                LOG.warning("%s Waiting for them again on next flush.", e)
+            except PublishNotConfirmedError as e:
+                LOG.warning("%s Publishing them again.", e)
+                self._republish_messages(connection=connection, messages=e.messages)
+            except connection.connection_errors + connection.channel_errors as e:
+                LOG.debug(
+                    "Failed to wait for confirms on a long lived channel: %s" % (e)
+                )
+                self._drop_channel(connection=connection)
+
+    def _republish_messages(self, connection, messages):
+        for exchange, kwargs in messages:
+            try:
+                self._publish_with_retries(
+                    connection=connection, exchange=exchange, **kwargs
+                )
+            except Exception:
+                LOG.exception(
+                    "Failed to publish message to exchange %s again." % (exchange.name)
+                )
+
+    def _get_channel(self, connection):
+        channel = self._channels.get(connection, None)
+
+        if not channel or not channel.is_open:
+            if channel:
+                self._drop_channel(connection=connection)
+
+            channel = PublisherChannel(
+                connection=connection, confirms=cfg.CONF.messaging.publisher_confirms
+            )
+            self._channels[connection] = channel
+
+            if channel.confirms and not self._flush_thread:
+                self._flush_thread = concurrency.spawn(
+                    self._flush_confirms_periodically
+                )
+
+        return channel
+
+    def _get_lock(self, connection):
+        lock = self._locks.get(connection, None)
+
+        if not lock:
+            lock = Semaphore()
+            self._locks[connection] = lock
+
+        return lock
+
+    def _flush_confirms_periodically(self):
+        while True:
+            concurrency.sleep(cfg.CONF.messaging.publisher_confirms_flush_interval)
+
+            try:
+                self.flush_confirms()
+            except Exception:
+                LOG.exception("Failed to flush publisher confirms.")
+
+    def _drop_channel(self, connection):
+        """
+        Close the long lived channel for the provided connection and publish messages which have
+        not been confirmed on that channel again (confirms for them will never arrive).
+        """
+        channel = self._channels.get(connection, None)
+        if not channel:
+            return
+
+        messages = channel.pop_unconfirmed_messages()
+        self._close_channel(connection=connection)
+
+        if messages:
+            LOG.warning(
+                "Publishing %s unconfirmed message(s) from a dropped channel again."
+                % (len(messages))
+            )
+            self._republish_messages(connection=connection, messages=messages)
+
+    def _close_channel(self, connection):
+        channel = self._channels.pop(connection, None)
+
+        if channel:
+            channel.close()
 
 
 class SharedPoolPublishers(object):
@@ -146,3 +511,12 @@ class StatePublisherMixin(object):
             raise Exception("Unable to publish unassigned state.")
         with Timer(key="amqp.publish.state"):
             self._state_publisher.publish(payload, self._state_exchange, state)
+
+
+def shutdown_publishers():
+    """
+    Wait for pending publisher confirms and close long lived channels of all the pool publishers
+    inside this process.
+    """
+    for publisher in list(PUBLISHERS):
+        publisher.shutdown()
@@ -68,6 +68,9 @@ class TriggerInstancePublisher(object):
         # TODO: We should use trigger reference as a routing key
         self._publisher.publish(payload, TRIGGER_INSTANCE_XCHG, routing_key)
 
+    def publish_triggers(self, payloads, routing_key=None):
+        self._publisher.publish_many(payloads, TRIGGER_INSTANCE_XCHG, routing_key)
+
 
 class TriggerDispatcher(object):
     """
@@ -91,6 +94,35 @@ class TriggerDispatcher(object):
         :param trace_context: Trace context to associate with Trigger.
         :type trace_context: ``TraceContext``
         """
+        payload = self._get_trigger_instance_payload(
+            trigger=trigger, payload=payload, trace_context=trace_context
+        )
+        routing_key = "trigger_instance"
+
+        self._logger.debug(
+            "Dispatching trigger (trigger=%s,payload=%s)", trigger, payload
+        )
+        self._publisher.publish_trigger(payload=payload, routing_key=routing_key)
+
+    def dispatch_many(self, triggers):
+        """
+        Method which dispatches multiple triggers using a single connection and channel.
+
+        :param triggers: List of (trigger, payload, trace_context) tuples.
+        :type triggers: ``list``
+        """
+        payloads = [
+            self._get_trigger_instance_payload(
+                trigger=trigger, payload=payload, trace_context=trace_context
+            )
+            for trigger, payload, trace_context in triggers
+        ]
+        routing_key = "trigger_instance"
+
+        self._logger.debug("Dispatching %s triggers", len(payloads))
+        self._publisher.publish_triggers(payloads=payloads, routing_key=routing_key)
+
+    def _get_trigger_instance_payload(self, trigger, payload, trace_context):
         if payload and not isinstance(payload, dict):
             raise TypeError(
                 f"The payload has a value that is not a dictionary"
@@ -102,13 +134,7 @@ class TriggerDispatcher(object):
                 f" (was {type(trace_context)})."
             )
 
-        payload = {"trigger": trigger, "payload": payload, TRACE_CONTEXT: trace_context}
-        routing_key = "trigger_instance"
-
-        self._logger.debug(
-            "Dispatching trigger (trigger=%s,payload=%s)", trigger, payload
-        )
-        self._publisher.publish_trigger(payload=payload, routing_key=routing_key)
+        return {"trigger": trigger, "payload": payload, TRACE_CONTEXT: trace_context}
 
 
 def get_trigger_cud_queue(name, routing_key, exclusive=False):
@@ -0,0 +1,201 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Message bus serializers.
+
+By default all the messages are serialized using pickle. Alternatively, database model objects
+(e.g. LiveActionDB, ActionExecutionDB) can be serialized as compact JSON documents which contain
+model type tag and a dictionary representation of the document (see "[messaging] serializer"
+config option). Consumers rebuild model objects from those documents the same way as they are
+loaded from the database.
+
+Consumers always accept both formats which allows a rolling upgrade.
+"""
+
+from __future__ import absolute_import
+
+import datetime
+
+import mongoengine as me
+import orjson
+from bson.objectid import ObjectId
+from kombu import serialization
+from mongoengine.base.common import get_document
+
+from st2common.fields import JSONDictField
+
+__all__ = [
+    "JSON_SERIALIZER",
+    "JSON_CONTENT_TYPE",
+    "ACCEPT_CONTENT",
+    "encode_json",
+    "decode_json",
+    "get_serializer",
+]
+
+JSON_SERIALIZER = "st2-json"
+JSON_CONTENT_TYPE = "application/x-st2-json"
+
+# Content types which are accepted by all the consumers
+ACCEPT_CONTENT = ["pickle", JSON_SERIALIZER]
+
+# Maps model class to the names of JSONDictField fields. Values of those fields are included
+# as-is instead of being serialized to a JSON string by the field
+_JSON_DICT_FIELDS = {}
+
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def get_serializer(payload, serializer="pickle"):
+    """
+    Return serializer which should be used for the provided payload.
+
+    Only database model objects can be serialized using JSON serializer, everything else falls
+    back to pickle.
+    """
+    if serializer == "json" and isinstance(payload, me.Document):
+        return JSON_SERIALIZER
+
+    return "pickle"
+
+
+def encode_json(payload):
+    """
+    Serialize provided database model object to a JSON document.
+
+    :rtype: ``bytes``
+    """
+    if not isinstance(payload, me.Document):
+        raise TypeError(
+            "Only database model objects can be serialized (got: %s)" % type(payload)
+        )
+
+    model_cls = type(payload)
+    json_dict_fields = _get_json_dict_fields(model_cls)
+
+    if json_dict_fields:
+        fields = [name for name in model_cls._fields if name not in json_dict_fields]
+        data = payload.to_mongo(fields=fields)
+
+        for name in json_dict_fields:
+            value = payload._data.get(name, None)
+
+            if value is not None:
+                data[model_cls._fields[name].db_field] = value
+    else:
+        data = payload.to_mongo()
+
+    document = {"model": model_cls._class_name, "data": data}
+    return orjson.dumps(
+        document, default=_default, option=orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+
+def decode_json(data):
+    """
+    Deserialize JSON document and return database model object.
+    """
+    document = orjson.loads(data)
+
+    # NOTE: Only models which are registered with mongoengine can be loaded
+    model_cls = get_document(document["model"])
+    json_dict_fields = _get_json_dict_fields(model_cls)
+
+    data = document["data"]
+
+    # Values of JSONDictField fields are already parsed so they are set on the object directly
+    # (fields would otherwise treat them as legacy escaped values). Those are usually the largest
+    # values and they can't contain tagged values so there is no need to traverse them either.
+    json_dict_values = {}
+    for name in json_dict_fields:
+        db_field = model_cls._fields[name].db_field
+
+        if db_field in data:
+            json_dict_values[name] = data.pop(db_field)
+
+    for key, value in data.items():
+        data[key] = _restore_tagged_values(value)
+
+    model_db = model_cls._from_son(data)
+    model_db._data.update(json_dict_values)
+    return model_db
+
+
+def _get_json_dict_fields(model_cls):
+    json_dict_fields = _JSON_DICT_FIELDS.get(model_cls, None)
+
+    if json_dict_fields is None:
+        json_dict_fields = [
+            name
+            for name, field in model_cls._fields.items()
+            if isinstance(field, JSONDictField)
+        ]
+        _JSON_DICT_FIELDS[model_cls] = json_dict_fields
+
+    return json_dict_fields
+
+
+def _restore_tagged_values(value):
+    if isinstance(value, dict):
+        if len(value) == 1:
+            if "$oid" in value:
+                return ObjectId(value["$oid"])
+            elif "$date" in value:
+                return _microseconds_to_datetime(value["$date"])
+
+        for key, item in value.items():
+            value[key] = _restore_tagged_values(item)
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            value[index] = _restore_tagged_values(item)
+
+    return value
+
+
+def _microseconds_to_datetime(value):
+    result = datetime.datetime.fromtimestamp(value // 1000000, tz=datetime.timezone.utc)
+    return result.replace(microsecond=value % 1000000)
+
+
+def _datetime_to_microseconds(value):
+    if not value.tzinfo:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+
+    delta = value - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def _default(obj):
+    # ObjectId and datetime values are tagged so they can be restored when deserializing
+    if isinstance(obj, ObjectId):
+        return {"$oid": str(obj)}
+
+    if isinstance(obj, datetime.datetime):
+        return {"$date": _datetime_to_microseconds(obj)}
+
+    # Same as JSONDictField, sets are serialized as lists for backward compatibility
+    if isinstance(obj, set):
+        return list(obj)
+
+    raise TypeError
+
+
+serialization.register(
+    JSON_SERIALIZER,
+    encode_json,
+    decode_json,
+    content_type=JSON_CONTENT_TYPE,
+    content_encoding="binary",
+)
@@ -21,15 +21,23 @@ from mongoengine.queryset.visitor import Q
 from st2common.exceptions.content import ParseException
 from st2common.exceptions.actionalias import ActionAliasAmbiguityException
 from st2common.persistence.actionalias import ActionAlias
+from st2common.models.utils.action_alias_utils import ActionAliasFormatParser
 from st2common.models.utils.action_alias_utils import extract_parameters
+from st2common.models.utils.action_alias_utils import get_format_string_regex
 
 __all__ = [
+    "ActionAliasMatcher",
     "list_format_strings_from_aliases",
     "normalise_alias_format_string",
     "match_command_to_alias",
     "get_matching_alias",
+    "enable_matcher",
+    "disable_matcher",
 ]
 
+# Reference to the matcher which is used by get_matching_alias (if enabled)
+MATCHER = None
+
 
 def list_format_strings_from_aliases(aliases, match_multiple=False):
     """
@@ -132,6 +140,9 @@ def get_matching_alias(command):
     """
     Find a matching ActionAliasDB object (if any) for the provided command.
     """
+    if MATCHER:
+        return MATCHER.match(command=command)
+
     # 1. Get aliases
     action_alias_dbs = ActionAlias.query(
         Q(formats__match_multiple=None) | Q(formats__match_multiple=False), enabled=True
@@ -172,3 +183,138 @@ def get_matching_alias(command):
             )
 
     return matches[0]
+
+
+def enable_matcher():
+    """
+    Make get_matching_alias use an in-memory precompiled matcher instead of retrieving and
+    compiling all the aliases on each call.
+
+    Note: Caller is responsible for calling invalidate() on the returned matcher when action
+    aliases change.
+    """
+    global MATCHER
+
+    if not MATCHER:
+        MATCHER = ActionAliasMatcher()
+
+    return MATCHER
+
+
+def disable_matcher():
+    global MATCHER
+
+    MATCHER = None
+
+
+class ActionAliasMatcher(object):
+    """
+    Matcher which holds format strings of all the enabled action aliases with the corresponding
+    regexes compiled upfront.
+
+    Patterns are loaded lazily on first match after the matcher has been invalidated.
+    """
+
+    def __init__(self):
+        self._patterns = None
+        self._generation = 0
+
+    def invalidate(self):
+        self._generation += 1
+        self._patterns = None
+
+    def match(self, command):
+        """
+        Find a matching pattern for the provided command.
+
+        Behaves the same as get_matching_alias without a matcher.
+        """
+        patterns, multiple_patterns = self._get_patterns()
+
+        matches = self._match_patterns(command=command, patterns=patterns)
+
+        if len(matches) > 1:
+            raise ActionAliasAmbiguityException(
+                "Command '%s' matched more than 1 pattern" % command,
+                matches=matches,
+                command=command,
+            )
+        elif len(matches) == 0:
+            matches = self._match_patterns(command=command, patterns=multiple_patterns)
+
+            if len(matches) > 1:
+                raise ActionAliasAmbiguityException(
+                    "Command '%s' matched more than 1 (multi) pattern" % command,
+                    matches=matches,
+                    command=command,
+                )
+
+            if len(matches) == 0:
+                raise ActionAliasAmbiguityException(
+                    "Command '%s' matched no patterns" % command,
+                    matches=[],
+                    command=command,
+                )
+
+        return matches[0]
+
+    def _match_patterns(self, command, patterns):
+        # Arbitrary key-value pairs at the end are cut off the same way for every format string
+        param_stream = ActionAliasFormatParser(param_stream=command).param_stream
+
+        results = []
+        for format_, regex in patterns:
+            # Cheap first pass against the precompiled regex, only the candidates go through the
+            # full parameter extraction
+            if not regex.search(param_stream):
+                continue
+
+            try:
+                extract_parameters(
+                    format_str=format_["representation"], param_stream=command
+                )
+            except ParseException:
+                continue
+
+            results.append(format_)
+
+        return results
+
+    def _get_patterns(self):
+        patterns = self._patterns
+
+        if patterns is None:
+            generation = self._generation
+            patterns = self._load_patterns()
+
+            # Aliases were modified while we were loading them, next call will reload them
+            if generation == self._generation:
+                self._patterns = patterns
+
+        return patterns
+
+    def _load_patterns(self):
+        patterns = []
+        multiple_patterns = []
+
+        for action_alias_db in ActionAlias.query(enabled=True):
+            formats_match_multiple = [
+                isinstance(format_, dict) and format_.get("match_multiple", None)
+                for format_ in action_alias_db.formats
+            ]
+
+            # Mirrors the queries in get_matching_alias - alias is a candidate for the first
+            # pass if any of the formats doesn't have match_multiple set and for the second pass
+            # if any of the formats have it set
+            compiled = [
+                (format_, get_format_string_regex(format_["representation"]))
+                for format_ in list_format_strings_from_aliases([action_alias_db])
+            ]
+
+            if any(value in (None, False) for value in formats_match_multiple):
+                patterns.extend(compiled)
+
+            if any(value is True for value in formats_match_multiple):
+                multiple_patterns.extend(compiled)
+
+        return patterns, multiple_patterns
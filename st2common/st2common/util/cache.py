@@ -0,0 +1,89 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import time
+from collections import OrderedDict
+
+__all__ = ["ExpiringLRUCache"]
+
+
+class ExpiringLRUCache(object):
+    """
+    Simple in-memory LRU cache with an optional TTL for the entries.
+
+    Besides the entries, cache keeps a generation counter which is incremented on every
+    invalidation. Callers which populate the cache with a value retrieved from the database should
+    pass in the generation observed before the retrieval. This way a value which may have been
+    invalidated while it was being retrieved is never stored.
+    """
+
+    def __init__(self, size, ttl=None):
+        """
+        :param size: Maximum number of entries.
+        :type size: ``int``
+
+        :param ttl: How long (in seconds) an entry is valid for. None means entries don't expire.
+        :type ttl: ``int``
+        """
+        self.size = size
+        self.ttl = ttl
+        self.generation = 0
+
+        # key -> (expire timestamp, value)
+        self._entries = OrderedDict()
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key, None)
+
+        if entry is None:
+            return default
+
+        expire_timestamp, value = entry
+
+        if expire_timestamp is not None and expire_timestamp < time.time():
+            self._entries.pop(key, None)
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key, value, generation=None):
+        if generation is not None and generation != self.generation:
+            return False
+
+        expire_timestamp = time.time() + self.ttl if self.ttl else None
+
+        self._entries.pop(key, None)
+        self._entries[key] = (expire_timestamp, value)
+
+        while len(self._entries) > self.size:
+            self._entries.popitem(last=False)
+
+        return True
+
+    def delete(self, key):
+        self.generation += 1
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self.generation += 1
+        self._entries.clear()
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
@@ -43,6 +43,7 @@ __all__ = [
     "cancel",
     "kill",
     "sleep",
+    "wait_read",
     "get_greenlet_exit_exception_class",
     "get_green_pool_class",
     "is_green_pool_free",
@@ -131,6 +132,32 @@ def sleep(*args, **kwargs):
         raise ValueError("Unsupported concurrency library")
 
 
+def wait_read(fd, timeout=None):
+    """
+    Block the current green thread until the provided file descriptor is ready to read or the
+    timeout elapses.
+
+    :return: True if the file descriptor is ready to read, False on timeout.
+    :rtype: ``bool``
+    """
+    if CONCURRENCY_LIBRARY == "eventlet":
+        try:
+            eventlet.hubs.trampoline(fd, read=True, timeout=timeout)
+        except eventlet.timeout.Timeout:
+            return False
+    elif CONCURRENCY_LIBRARY == "gevent":
+        import gevent.socket  # pylint: disable=import-error # pants: no-infer-dep
+
+        try:
+            gevent.socket.wait_read(fd, timeout=timeout)
+        except gevent.socket.timeout:
+            return False
+    else:
+        raise ValueError("Unsupported concurrency library")
+
+    return True
+
+
 def get_greenlet_exit_exception_class():
     if CONCURRENCY_LIBRARY == "eventlet":
         return eventlet.support.greenlets.GreenletExit
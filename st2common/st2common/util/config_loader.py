@@ -16,26 +16,143 @@
 from __future__ import absolute_import
 import copy
 import re
+import time
+from collections import OrderedDict
 
 import six
 
 from oslo_config import cfg
 
 from st2common import log as logging
+from st2common.metrics.base import get_driver
+from st2common.metrics.base import Timer
 from st2common.models.db.pack import ConfigDB
 from st2common.persistence.pack import ConfigSchema
 from st2common.persistence.pack import Config
 from st2common.content import utils as content_utils
 from st2common.util import jinja as jinja_utils
+from st2common.util.crypto import AESKey
+from st2common.util.crypto import symmetric_decrypt
+from st2common.util.crypto import symmetric_encrypt
+from st2common.util.jsonify import json_decode
+from st2common.util.jsonify import json_encode
 from st2common.util.templating import render_template_with_system_and_user_context
 from st2common.util.config_parser import ContentPackConfigParser
 from st2common.exceptions.db import StackStormDBObjectNotFoundError
 
-__all__ = ["ContentPackConfigLoader"]
+__all__ = ["ContentPackConfigLoader", "ContentPackConfigCache", "CONFIG_CACHE"]
 
 LOG = logging.getLogger(__name__)
 
 
+class ContentPackConfigCache(object):
+    """
+    In-memory cache of resolved pack configs keyed on (pack name, user).
+
+    The cache is disabled by default. It should only be enabled in a process which also runs a
+    watcher which invalidates entries on Config, ConfigSchema and KeyValuePair CUD events (see
+    st2common.services.config_cache).
+
+    Entries which contain values resolved from the datastore (and as such potentially decrypted
+    secrets) are kept encrypted with an ephemeral process local key and are only decrypted when
+    they are retrieved from the cache.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.generation = 0
+
+        self._ttl = 0
+        self._size = 0
+        self._crypto_key = None
+
+        # (pack name, user) -> (expire timestamp, has dynamic values, config or ciphertext)
+        self._entries = OrderedDict()
+
+    def enable(self, ttl, size):
+        self._ttl = ttl
+        self._size = size
+        self._crypto_key = AESKey.generate()
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+        self.clear()
+
+    def get(self, pack_name, user):
+        """
+        Return a copy of the cached config or None if the config is not cached.
+
+        :rtype: ``dict`` or ``None``
+        """
+        entry = self._entries.get((pack_name, user), None)
+
+        if not entry:
+            return None
+
+        expire_timestamp, has_dynamic_values, value = entry
+
+        if expire_timestamp < time.time():
+            self._entries.pop((pack_name, user), None)
+            return None
+
+        if has_dynamic_values:
+            return json_decode(symmetric_decrypt(self._crypto_key, value))
+
+        return copy.deepcopy(value)
+
+    def set(self, pack_name, user, config, has_dynamic_values, generation):
+        """
+        Store resolved config in the cache.
+
+        :param generation: Cache generation at the time config resolution has started. If the
+                           cache has been invalidated in the mean time, resolved config may
+                           already be stale so it's not stored.
+        :type generation: ``int``
+        """
+        if not self.enabled or generation != self.generation:
+            return
+
+        if has_dynamic_values:
+            value = symmetric_encrypt(self._crypto_key, json_encode(config))
+        else:
+            value = copy.deepcopy(config)
+
+        key = (pack_name, user)
+        self._entries.pop(key, None)
+        self._entries[key] = (time.time() + self._ttl, has_dynamic_values, value)
+
+        while len(self._entries) > self._size:
+            self._entries.popitem(last=False)
+
+    def invalidate_pack(self, pack_name):
+        """
+        Invalidate cached configs for all the users of the provided pack.
+        """
+        self.generation += 1
+
+        for key in list(self._entries.keys()):
+            if key[0] == pack_name:
+                self._entries.pop(key, None)
+
+    def invalidate_dynamic(self):
+        """
+        Invalidate all the cached configs which contain values resolved from the datastore.
+        """
+        self.generation += 1
+
+        for key, entry in list(self._entries.items()):
+            if entry[1]:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        self.generation += 1
+        self._entries.clear()
+
+
+CONFIG_CACHE = ContentPackConfigCache()
+
+
 class ContentPackConfigLoader(object):
     """
     Class which loads and resolves all the config values and returns a dictionary of resolved values
@@ -57,7 +174,38 @@ class ContentPackConfigLoader(object):
         self.pack_path = content_utils.get_pack_base_path(pack_name=pack_name)
         self._config_parser = ContentPackConfigParser(pack_name=pack_name)
 
+        # True if any of the config values has been resolved from the datastore
+        self._has_dynamic_values = False
+
     def get_config(self):
+        cache_enabled = CONFIG_CACHE.enabled
+
+        if cache_enabled:
+            config = CONFIG_CACHE.get(pack_name=self.pack_name, user=self.user)
+
+            if config is not None:
+                get_driver().inc_counter("pack_config.cache.hit")
+                return config
+
+            get_driver().inc_counter("pack_config.cache.miss")
+
+        generation = CONFIG_CACHE.generation
+
+        with Timer(key="pack_config.resolve"):
+            config = self._load_config()
+
+        if cache_enabled:
+            CONFIG_CACHE.set(
+                pack_name=self.pack_name,
+                user=self.user,
+                config=config,
+                has_dynamic_values=self._has_dynamic_values,
+                generation=generation,
+            )
+
+        return config
+
+    def _load_config(self):
         result = {}
 
         # Retrieve corresponding ConfigDB and ConfigSchemaDB object
@@ -378,6 +526,8 @@ class ContentPackConfigLoader(object):
         """
         from st2common.services.config import deserialize_key_value
 
+        self._has_dynamic_values = True
+
         config_schema_item = config_schema_item or {}
         secret = config_schema_item.get("secret", False)
         if secret or "decrypt_kv" in value:
@@ -17,9 +17,10 @@ from __future__ import absolute_import
 import time
 
 import eventlet
-import six.moves.queue
+import eventlet.queue
 
 from st2common import log as logging
+from st2common.metrics.base import get_driver
 
 __all__ = ["BufferedDispatcher"]
 
@@ -36,6 +37,17 @@ LOG = logging.getLogger(__name__)
 
 
 class BufferedDispatcher(object):
+    """
+    Dispatches work to a pool of green threads and buffers it while all of the threads are busy.
+
+    Buffered work is started as soon as a thread becomes free. The dispatch thread blocks on the
+    work buffer and on the pool semaphore which is released when a thread finishes so no polling
+    is involved.
+
+    NOTE: monitor_thread_empty_q_sleep_time and monitor_thread_no_workers_sleep_time arguments
+    are not used anymore and are only kept for backward compatibility.
+    """
+
     def __init__(
         self,
         dispatch_pool_size=50,
@@ -45,66 +57,79 @@ class BufferedDispatcher(object):
     ):
         self._pool_limit = dispatch_pool_size
         self._dispatcher_pool = eventlet.GreenPool(dispatch_pool_size)
-        self._dispatch_monitor_thread = eventlet.greenthread.spawn(self._flush)
-        self._monitor_thread_empty_q_sleep_time = monitor_thread_empty_q_sleep_time
-        self._monitor_thread_no_workers_sleep_time = (
-            monitor_thread_no_workers_sleep_time
-        )
         self._name = name
 
-        self._work_buffer = six.moves.queue.Queue()
+        self._work_buffer = eventlet.queue.Queue()
 
         # Internal attributes we use to track how long the pool is busy without any free workers
         self._pool_last_free_ts = time.time()
 
+        metrics_prefix = "dispatcher.%s" % (self.name)
+        self._queue_wait_time_metrics_key = metrics_prefix + ".queue_wait_time"
+        self._pool_utilization_metrics_key = metrics_prefix + ".pool_utilization"
+        self._buffer_depth_metrics_key = metrics_prefix + ".buffer_depth"
+
+        self._dispatch_monitor_thread = eventlet.greenthread.spawn(self._flush)
+
     @property
     def name(self):
         return self._name or id(self)
 
+    @property
+    def pool_size(self):
+        return self._pool_limit
+
+    @property
+    def buffer_depth(self):
+        return self._work_buffer.qsize()
+
     def dispatch(self, handler, *args):
-        self._work_buffer.put((handler, args), block=True, timeout=1)
-        self._flush_now()
+        self._check_pool_busy()
+        self._work_buffer.put((handler, args, time.time()))
 
     def shutdown(self):
         self._dispatch_monitor_thread.kill()
 
     def _flush(self):
         while True:
-            while self._work_buffer.empty():
-                eventlet.greenthread.sleep(self._monitor_thread_empty_q_sleep_time)
-            while self._dispatcher_pool.free() <= 0:
-                eventlet.greenthread.sleep(self._monitor_thread_no_workers_sleep_time)
-            self._flush_now()
+            # Blocks until there is work in the buffer
+            (handler, args, dispatch_ts) = self._work_buffer.get()
+
+            # Blocks until one of the pool threads finishes
+            self._dispatcher_pool.spawn(self._run, handler, args, dispatch_ts)
 
-    def _flush_now(self):
-        if self._dispatcher_pool.free() <= 0:
-            now = time.time()
+    def _run(self, handler, args, dispatch_ts):
+        # Failure to report metrics shouldn't prevent the dispatched work from running
+        try:
+            self._report_metrics(queue_wait_time=time.time() - dispatch_ts)
+        except Exception:
+            LOG.exception('Failed to report metrics for dispatcher "%s".', self.name)
 
-            if (now - self._pool_last_free_ts) >= POOL_BUSY_THRESHOLD_SECONDS:
-                LOG.info(
-                    POOL_BUSY_LOG_MESSAGE % (self.name, POOL_BUSY_THRESHOLD_SECONDS)
-                )
+        handler(*args)
 
+    def _check_pool_busy(self):
+        now = time.time()
+
+        if self._dispatcher_pool.free() > 0:
+            # Update the time of when there were free threads available
+            self._pool_last_free_ts = now
             return
 
-        # Update the time of when there were free threads available
-        self._pool_last_free_ts = time.time()
+        if (now - self._pool_last_free_ts) >= POOL_BUSY_THRESHOLD_SECONDS:
+            LOG.info(POOL_BUSY_LOG_MESSAGE % (self.name, POOL_BUSY_THRESHOLD_SECONDS))
 
-        while not self._work_buffer.empty() and self._dispatcher_pool.free() > 0:
-            (handler, args) = self._work_buffer.get_nowait()
-            self._dispatcher_pool.spawn(handler, *args)
+    def _report_metrics(self, queue_wait_time):
+        pool_utilization = self._dispatcher_pool.running() / float(self._pool_limit)
+
+        metrics_driver = get_driver()
+        metrics_driver.time(self._queue_wait_time_metrics_key, queue_wait_time)
+        metrics_driver.set_gauge(self._pool_utilization_metrics_key, pool_utilization)
+        metrics_driver.set_gauge(self._buffer_depth_metrics_key, self.buffer_depth)
 
     def __repr__(self):
         free_count = self._dispatcher_pool.free()
-        values = (
-            self.name,
-            self._pool_limit,
-            free_count,
-            self._monitor_thread_empty_q_sleep_time,
-            self._monitor_thread_no_workers_sleep_time,
-        )
+        values = (self.name, self._pool_limit, free_count, self.buffer_depth)
         return (
             "<BufferedDispatcher name=%s,dispatch_pool_size=%s,free_threads=%s,"
-            "monitor_thread_empty_q_sleep_time=%s,monitor_thread_no_workers_sleep_time=%s>"
-            % values
+            "buffer_depth=%s>" % values
         )
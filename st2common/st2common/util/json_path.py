@@ -0,0 +1,112 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Utility functions for selecting a sub-tree of a JSON document using a JSON pointer (RFC 6901) or
+a JSONPath expression.
+"""
+
+from __future__ import absolute_import
+
+import jsonpath_rw
+from jsonpath_rw import jsonpath
+
+__all__ = [
+    "get_value_for_path",
+    "get_value_for_json_pointer",
+    "get_value_for_jsonpath",
+]
+
+
+def get_value_for_path(value, path):
+    """
+    Return sub-tree of the provided value which is selected by the provided path.
+
+    Paths which start with "/" are treated as JSON pointers (e.g. /items/0/id) and all the other
+    paths are treated as JSONPath expressions (e.g. items[0].id).
+
+    :param value: Decoded JSON document.
+
+    :param path: JSON pointer or JSONPath expression.
+    :type path: ``str``
+
+    :raises KeyError: If the path doesn't match any value.
+    :raises ValueError: If the path is not valid.
+    """
+    if not path or path.startswith("/"):
+        return get_value_for_json_pointer(value=value, pointer=path)
+
+    return get_value_for_jsonpath(value=value, expression=path)
+
+
+def get_value_for_json_pointer(value, pointer):
+    """
+    Return value which is referenced by the provided JSON pointer.
+
+    :raises KeyError: If the pointer doesn't reference an existing value.
+    """
+    if not pointer:
+        return value
+
+    if not pointer.startswith("/"):
+        raise ValueError('Invalid JSON pointer "%s"' % (pointer))
+
+    for token in pointer[1:].split("/"):
+        token = token.replace("~1", "/").replace("~0", "~")
+
+        if isinstance(value, dict) and token in value:
+            value = value[token]
+        elif isinstance(value, list) and token.isdigit() and int(token) < len(value):
+            value = value[int(token)]
+        else:
+            raise KeyError(pointer)
+
+    return value
+
+
+def get_value_for_jsonpath(value, expression):
+    """
+    Return value which matches the provided JSONPath expression.
+
+    Expressions which can only match a single value (e.g. items[0].id) return that value and all
+    the other expressions (e.g. items[*].id) return a list of all the matched values.
+
+    :raises KeyError: If the expression doesn't match any value.
+    """
+    try:
+        expr = jsonpath_rw.parse(expression)
+    except Exception:
+        raise ValueError('Invalid JSONPath expression "%s"' % (expression))
+
+    matches = [match.value for match in expr.find(value)]
+
+    if not _is_singular_expression(expr):
+        return matches
+
+    if not matches:
+        raise KeyError(expression)
+
+    return matches[0]
+
+
+def _is_singular_expression(expr):
+    if isinstance(expr, jsonpath.Child):
+        return _is_singular_expression(expr.left) and _is_singular_expression(
+            expr.right
+        )
+
+    if isinstance(expr, jsonpath.Fields):
+        return len(expr.fields) == 1 and expr.fields[0] != "*"
+
+    return isinstance(expr, (jsonpath.Root, jsonpath.This, jsonpath.Index))
@@ -0,0 +1,101 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Utility functions for cursor (keyset) based pagination of API list responses.
+
+Cursors are opaque to the clients. Internally, a cursor holds the value of the sort field and
+the id of the last item on the previous page so the next page can be retrieved using an index
+range scan instead of skipping over all the preceding documents.
+"""
+
+from __future__ import absolute_import
+
+import base64
+import binascii
+
+import bson
+from six.moves import urllib
+
+from st2common.util.jsonify import json_encode
+from st2common.util.jsonify import json_decode
+
+__all__ = [
+    "FIRST_PAGE_CURSOR",
+    "NEXT_CURSOR_HEADER",
+    "encode_cursor",
+    "decode_cursor",
+    "get_next_page_link",
+]
+
+# Special cursor value which clients use to request the first page using cursor pagination
+FIRST_PAGE_CURSOR = "*"
+
+# Name of the response header which contains the cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(value, id):
+    """
+    Encode the sort field value and the id of the last item on a page into an opaque cursor.
+
+    :param value: JSON serializable (database) value of the sort field.
+    :param id: Id of the last item on the page.
+    :type id: ``str``
+
+    :rtype: ``str``
+    """
+    data = json_encode([value, str(id)], indent=None)
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("utf-8")
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor which was previously returned by ``encode_cursor``.
+
+    :return: (value, id) tuple.
+    :rtype: ``tuple``
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor.encode("utf-8"))
+        value, id = json_decode(data.decode("utf-8"))
+    except (TypeError, ValueError, UnicodeError, binascii.Error):
+        raise ValueError('Invalid cursor "%s" specified' % (cursor))
+
+    if not bson.ObjectId.is_valid(id):
+        raise ValueError('Invalid cursor "%s" specified' % (cursor))
+
+    return (value, id)
+
+
+def get_next_page_link(path, params, cursor):
+    """
+    Return value for the "Link" header which points to the next page of the results.
+
+    :param path: Absolute path of the current request.
+    :type path: ``str``
+
+    :param params: Query parameters of the current request.
+    :type params: ``list`` of ``tuple``
+
+    :param cursor: Cursor for the next page.
+    :type cursor: ``str``
+
+    :rtype: ``str``
+    """
+    params = [(key, value) for key, value in params if key not in ["cursor", "offset"]]
+    params.append(("cursor", cursor))
+
+    url = "%s?%s" % (path, urllib.parse.urlencode(params))
+    return '<%s>; rel="next"' % (url)
@@ -15,6 +15,7 @@
 
 from __future__ import absolute_import
 
+import functools
 import re
 import six
 import networkx as nx
@@ -49,6 +50,16 @@ __all__ = [
     "render_final_params",
 ]
 
+# Maximum number of parsed and compiled parameter templates which are kept in memory. Templates
+# come from action / runner parameter schemas, rules and workflow definitions so the set of
+# distinct templates used by a deployment is small and stable.
+TEMPLATE_CACHE_SIZE = 1000
+
+# Names of the nodes which are always present in the dependency graph (see _create_graph)
+RESERVED_CONTEXT_NAMES = frozenset(
+    [DATASTORE_PARENT_SCOPE, ACTION_CONTEXT_KV_PREFIX, PACK_CONFIG_CONTEXT_KV_PREFIX]
+)
+
 
 def _split_params(runner_parameters, action_parameters, mixed_params):
     def pf(params, skips):
@@ -117,6 +128,46 @@ def _create_graph(action_context, config):
     return G
 
 
+def _get_template_source(value):
+    """
+    Return string representation of the provided value which is parsed by Jinja.
+    """
+    if isinstance(value, list) or isinstance(value, dict):
+        return str(value)
+
+    return value
+
+
+def _is_template(value):
+    """
+    Determines whether the provided parameter value (string or complex type) is a Jinja template.
+    """
+    return jinja_utils.is_jinja_expression(_get_template_source(value))
+
+
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _get_template_dependencies(template_source):
+    """
+    Parse the template and return a set of variables it depends on.
+
+    Result is cached so each distinct template is only parsed once per process.
+    """
+    template_ast = ENV.parse(template_source)
+    LOG.debug("Template ast: %s", template_ast)
+
+    return frozenset(meta.find_undeclared_variables(template_ast))
+
+
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _get_template(template_source):
+    """
+    Return compiled Jinja template for the provided template string.
+
+    Result is cached so each distinct template is only compiled once per process.
+    """
+    return ENV.from_string(template_source)
+
+
 def _process(G, name, value):
     """
     Determines whether parameter is a template or a value. Adds graph nodes and edges accordingly.
@@ -126,25 +177,15 @@ def _process(G, name, value):
     if isinstance(value, str):
         value = to_unicode(value)
 
-    complex_value_str = None
-    if isinstance(value, list) or isinstance(value, dict):
-        complex_value_str = str(value)
-
-    is_jinja_expr = jinja_utils.is_jinja_expression(
-        value
-    ) or jinja_utils.is_jinja_expression(complex_value_str)
-
-    if is_jinja_expr:
+    if _is_template(value):
         try:
-            template_ast = ENV.parse(value)
+            dependencies = _get_template_dependencies(_get_template_source(value))
             G.add_node(name, template=value)
 
-            LOG.debug("Template ast: %s", template_ast)
             # Dependencies of the node represent jinja variables used in the template
             # We're connecting nodes with an edge for every depencency to traverse them
             # in the right order and also make sure that we don't have missing or cyclic
             # dependencies upfront.
-            dependencies = meta.find_undeclared_variables(template_ast)
             LOG.debug("Dependencies: %s", dependencies)
             if dependencies:
                 for dependency in dependencies:
@@ -220,7 +261,7 @@ def _render(node, render_context):
 
         LOG.debug("Rendering node: %s with context: %s", node, render_context)
 
-        result = ENV.from_string(str(node["template"])).render(render_context)
+        result = _get_template(str(node["template"])).render(render_context)
 
         LOG.debug("Render complete: %s", result)
 
@@ -251,6 +292,50 @@ def _resolve_dependencies(G):
     return context
 
 
+def _resolve_literal_params(params, schemas, contexts=None):
+    """
+    Fast path for the common case where none of the parameters and none of the applicable default
+    values are Jinja templates.
+
+    It produces the same context as _process, _process_defaults and _resolve_dependencies would,
+    without building, validating and sorting the dependency graph and without retrieving the pack
+    config and datastore contexts which are only referenced by templates.
+
+    :param params: Parameters which are inspected for templates.
+    :param schemas: Parameter schemas whose default values are applied.
+    :param contexts: Values which are added to the context as they are (never rendered).
+
+    :return: Resolved context or ``None`` if a template has been encountered and the full
+             dependency graph based rendering is needed.
+    :rtype: ``dict`` or ``None``
+    """
+    context = dict(contexts or {})
+
+    for name, value in six.iteritems(params):
+        if name in RESERVED_CONTEXT_NAMES or _is_template(value):
+            return None
+
+        context[name] = value
+
+    for schema in schemas:
+        for name, value in six.iteritems(schema):
+            if name in RESERVED_CONTEXT_NAMES:
+                return None
+
+            absent = name not in context
+            is_none = context.get(name) is None
+            immutable = value.get("immutable", False)
+            if absent or is_none or immutable:
+                default = value.get("default")
+
+                if _is_template(default):
+                    return None
+
+                context[name] = default
+
+    return context
+
+
 def _cast_params_from(params, context, schemas):
     """
     Pick a list of parameters from context and cast each of them according to the schemas provided
@@ -314,6 +399,11 @@ def render_live_params(
     dict of plain rendered parameters.
     """
     additional_contexts = additional_contexts or {}
+    schemas = [action_parameters, runner_parameters]
+
+    context = _resolve_literal_params(params, schemas, contexts=additional_contexts)
+    if context is not None:
+        return _cast_params_from(params, context, schemas)
 
     pack = action_context.get("pack")
     user = action_context.get("user")
@@ -335,13 +425,11 @@ def render_live_params(
         G.add_node(name, value=value)
 
     [_process(G, name, value) for name, value in six.iteritems(params)]
-    _process_defaults(G, [action_parameters, runner_parameters])
+    _process_defaults(G, schemas)
     _validate(G)
 
     context = _resolve_dependencies(G)
-    live_params = _cast_params_from(
-        params, context, [action_parameters, runner_parameters]
-    )
+    live_params = _cast_params_from(params, context, schemas)
 
     return live_params
 
@@ -352,19 +440,24 @@ def render_final_params(runner_parameters, action_parameters, params, action_con
     plain values instead of trying to render them again. Returns dicts for action and runner
     parameters.
     """
+    schemas = [action_parameters, runner_parameters]
+
+    # by that point, all params should already be resolved so any template should be treated value
+    context = _resolve_literal_params({}, schemas, contexts=params)
+    if context is not None:
+        context = _cast_params_from(context, context, schemas)
+        return _split_params(runner_parameters, action_parameters, context)
+
     config = get_config(action_context.get("pack"), action_context.get("user"))
 
     G = _create_graph(action_context, config)
 
-    # by that point, all params should already be resolved so any template should be treated value
     [G.add_node(name, value=value) for name, value in six.iteritems(params)]
-    _process_defaults(G, [action_parameters, runner_parameters])
+    _process_defaults(G, schemas)
     _validate(G)
 
     context = _resolve_dependencies(G)
-    context = _cast_params_from(
-        context, context, [action_parameters, runner_parameters]
-    )
+    context = _cast_params_from(context, context, schemas)
 
     return _split_params(runner_parameters, action_parameters, context)
 
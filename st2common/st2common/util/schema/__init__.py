@@ -17,6 +17,7 @@ from __future__ import absolute_import
 
 import os
 
+import orjson
 import six
 import jsonschema
 from referencing import Registry, Resource
@@ -26,11 +27,13 @@ from jsonschema.validators import Draft3Validator, Draft4Validator, create
 
 from st2common.exceptions.action import InvalidActionParameterException
 from st2common.util import jsonify
+from st2common.util.cache import ExpiringLRUCache
 from st2common.util.misc import deep_update
 from st2common.util.deep_copy import fast_deepcopy_dict
 
 __all__ = [
     "get_validator",
+    "get_compiled_validator",
     "get_draft_schema",
     "get_action_parameters_schema",
     "get_schema_for_action_parameters",
@@ -92,6 +95,13 @@ SCHEMA_ANY_TYPE = {
     ]
 }
 
+# Maximum number of compiled validators which are kept in memory. Validators are keyed on the
+# content of the schema so new action / API model revisions result in a new entry and stale
+# entries are evicted.
+VALIDATOR_CACHE_SIZE = 1000
+
+_VALIDATOR_CACHE = ExpiringLRUCache(size=VALIDATOR_CACHE_SIZE)
+
 RUNNER_PARAM_OVERRIDABLE_ATTRS = [
     "default",
     "description",
@@ -245,6 +255,15 @@ def assign_default_values(instance, schema):
     return instance
 
 
+def _copy_default_value(value):
+    # Default values are shared with the schema which may be cached so we never hand out
+    # references to mutable defaults
+    if isinstance(value, (dict, list)):
+        return fast_deepcopy_dict(value)
+
+    return value
+
+
 def _assign_default_values_object(instance, schema):
     # assert is_attribute_type_object(schema.get("type"))
     if not isinstance(instance, dict):
@@ -275,7 +294,7 @@ def _assign_default_values_object(instance, schema):
         # Assign default value on the instance so the validation doesn't fail if requires is true
         # but the value is not provided
         if has_default_value and instance.get(property_name, None) is None:
-            instance[property_name] = default_value
+            instance[property_name] = _copy_default_value(default_value)
 
         attribute_instance = instance.get(property_name, None)
         if attribute_instance is None:
@@ -335,7 +354,7 @@ def _assign_default_values_array(instance, schema):
         # Assign default value in the instance so the validation doesn't fail if requires is true
         # but the value is not provided
         if has_default_value and instance[index] is None:
-            instance[index] = default_value
+            instance[index] = _copy_default_value(default_value)
 
         item_instance = instance[index]
         if item_instance is None:
@@ -445,20 +464,79 @@ def validate(
     schema_type = schema.get("type", None)
     instance_is_dict = isinstance(instance, dict)
 
-    if use_default and allow_default_none:
+    allow_default_none = use_default and allow_default_none
+
+    # Compiled validators can only be reused when no custom validator arguments are provided
+    compiled = None
+    if not args and not kwargs:
+        compiled = get_compiled_validator(
+            schema=schema, cls=cls, allow_default_none=allow_default_none
+        )
+
+    if compiled:
+        schema, validator = compiled
+    elif allow_default_none:
         schema = modify_schema_allow_default_none(schema=schema)
 
     # TODO: expand default handling to more than just objects
     if use_default and schema_type == "object" and instance_is_dict:
         instance = assign_default_values(instance=instance, schema=schema)
 
-    # pylint: disable=assignment-from-no-return
-    kwargs.setdefault("registry", _LOCAL_SCHEMA_REGISTRY)
-    jsonschema.validate(instance=instance, schema=schema, cls=cls, *args, **kwargs)
+    if compiled:
+        error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+        if error is not None:
+            raise error
+    else:
+        # pylint: disable=assignment-from-no-return
+        kwargs.setdefault("registry", _LOCAL_SCHEMA_REGISTRY)
+        jsonschema.validate(instance=instance, schema=schema, cls=cls, *args, **kwargs)
 
     return instance
 
 
+def get_compiled_validator(schema, cls=None, allow_default_none=False):
+    """
+    Return a validator instance for the provided schema.
+
+    Validator instances are cached and keyed on the schema content so the (expensive) schema
+    check against the meta schema and validator construction only happens once per unique
+    schema.
+
+    :param allow_default_none: True to allow None for attributes with default value of None.
+    :type allow_default_none: ``bool``
+
+    :return: Tuple of (schema, validator) or None if the schema can't be cached.
+    :rtype: ``tuple``
+    """
+    try:
+        fingerprint = orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        # Schema contains values which can't be serialized so we can't key on it
+        return None
+
+    key = (cls, allow_default_none, fingerprint)
+    compiled = _VALIDATOR_CACHE.get(key)
+
+    if compiled is None:
+        if allow_default_none:
+            schema = modify_schema_allow_default_none(schema=schema)
+        else:
+            schema = fast_deepcopy_dict(schema)
+
+        if cls is None:
+            validator_cls = jsonschema.validators.validator_for(schema)
+        else:
+            validator_cls = cls
+
+        validator_cls.check_schema(schema)
+        validator = validator_cls(schema, registry=_LOCAL_SCHEMA_REGISTRY)
+
+        compiled = (schema, validator)
+        _VALIDATOR_CACHE.set(key, compiled)
+
+    return compiled
+
+
 VALIDATORS = {"draft4": jsonschema.Draft4Validator, "custom": CustomValidator}
 
 
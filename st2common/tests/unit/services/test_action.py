@@ -26,6 +26,7 @@ from st2common.models.db.liveaction import LiveActionDB
 from st2common.models.api.action import RunnerTypeAPI, ActionAPI
 from st2common.models.system.common import ResourceReference
 from st2common.persistence.action import Action
+from st2common.persistence.execution import ActionExecution
 from st2common.persistence.liveaction import LiveAction
 from st2common.persistence.runner import RunnerType
 from st2common.runners import utils as runners_utils
@@ -287,6 +288,30 @@ class TestActionExecutionService(DbTestCase):
         self.assertDictEqual(ex.parameters, req.parameters)
         self.assertEqual(ex.status, action_constants.LIVEACTION_STATUS_REQUESTED)
 
+    def test_create_requests_cleans_up_on_bulk_insert_failure(self):
+        requests = []
+        for _ in range(2):
+            liveaction = LiveActionDB(
+                action=ACTION_REF,
+                context={"user": USERNAME},
+                parameters={"hosts": "127.0.0.1", "cmd": "uname -a"},
+            )
+            requests.append(action_service.prepare_request(liveaction))
+
+        with mock.patch.object(
+            ActionExecution, "insert_many", side_effect=Exception("insert failed")
+        ):
+            results = action_service.create_requests(requests)
+
+        self.assertEqual(len(results), 2)
+        for result in results:
+            self.assertIsInstance(result, Exception)
+
+        # Live actions which have already been inserted are removed
+        liveaction_ids = [liveaction.id for liveaction, _, _ in requests]
+        self.assertTrue(all(liveaction_ids))
+        self.assertEqual(len(LiveAction.query(id__in=liveaction_ids)), 0)
+
     def test_req_invalid_parameters(self):
         parameters = {"hosts": "127.0.0.1", "cmd": "uname -a", "arg_default_value": 123}
         liveaction = LiveActionDB(action=ACTION_REF, parameters=parameters)
@@ -19,13 +19,19 @@ import copy
 from collections import OrderedDict
 
 import bson
+import mock
+from oslo_config import cfg
 from unittest import TestCase
 
 from st2common.exceptions.db import StackStormDBObjectNotFoundError
 from st2common.exceptions.trace import UniqueTraceNotFoundException
 from st2common.models.api.trace import TraceContext
+from st2common.models.db.execution import ActionExecutionDB
+from st2common.models.db.trace import TraceDB
+from st2common.persistence.execution import ActionExecution
 from st2common.persistence.trace import Trace
 from st2common.services import trace as trace_service
+from st2common.services import trace_writer
 from st2tests.fixtures.traces.fixture import PACK_NAME as FIXTURES_PACK
 from st2tests.fixturesloader import FixturesLoader
 from st2tests import DbTestCase
@@ -610,6 +616,169 @@ class TestTraceService(DbTestCase):
         }
         self.assertEqual(trace_component, expected)
 
+    def test_write_behind_trace_updates(self):
+        cfg.CONF.set_override("write_behind", True, group="trace")
+        self.addCleanup(cfg.CONF.clear_override, "write_behind", group="trace")
+        self.addCleanup(trace_writer.shutdown_trace_writer)
+
+        # New trace
+        trace_db = trace_service.add_or_update_given_trace_context(
+            {"trace_tag": "write-behind-trace"},
+            trigger_instances=["trigger_instance_wb"],
+        )
+        self.assertIsNotNone(trace_db.id)
+        self.assertEqual(len(Trace.query(trace_tag="write-behind-trace")), 0)
+
+        # Queued updates are visible to lookups inside the same process
+        retrieved_trace_db = trace_service.get_trace_db_by_trigger_instance(
+            trigger_instance_id="trigger_instance_wb"
+        )
+        self.assertEqual(retrieved_trace_db.id, trace_db.id)
+
+        trace_service.add_or_update_given_trace_context(
+            {"id_": str(trace_db.id)}, rules=["rule_wb"]
+        )
+
+        # Existing trace
+        existing_trace_db = Trace.add_or_update(TraceDB(trace_tag="existing-trace"))
+        trace_service.add_or_update_given_trace_context(
+            {"id_": str(existing_trace_db.id)},
+            action_executions=["action_execution_wb"],
+        )
+
+        # All the queued updates are written using a single bulk write
+        collection = Trace._get_impl().model._get_collection()
+        with mock.patch.object(
+            type(collection), "bulk_write", side_effect=collection.bulk_write
+        ) as mock_bulk_write:
+            trace_writer.flush_trace_writer()
+
+        self.assertEqual(mock_bulk_write.call_count, 1)
+        self.assertEqual(len(mock_bulk_write.call_args[0][0]), 2)
+
+        retrieved_trace_db = Trace.get_by_id(trace_db.id)
+        self.assertEqual(retrieved_trace_db.trace_tag, "write-behind-trace")
+        self.assertEqual(
+            [component.object_id for component in retrieved_trace_db.trigger_instances],
+            ["trigger_instance_wb"],
+        )
+        self.assertEqual(
+            [component.object_id for component in retrieved_trace_db.rules],
+            ["rule_wb"],
+        )
+
+        retrieved_trace_db = Trace.get_by_id(existing_trace_db.id)
+        self.assertEqual(retrieved_trace_db.trace_tag, "existing-trace")
+        self.assertEqual(
+            [component.object_id for component in retrieved_trace_db.action_executions],
+            ["action_execution_wb"],
+        )
+
+        writer = trace_writer.get_trace_writer()
+        self.assertIsNone(writer.get_pending_trace(trace_db.id))
+
+        Trace.delete(Trace.get_by_id(trace_db.id))
+        Trace.delete(retrieved_trace_db)
+
+    def test_write_behind_get_trace_db_by_live_action_parent_not_written(self):
+        cfg.CONF.set_override("write_behind", True, group="trace")
+        self.addCleanup(cfg.CONF.clear_override, "write_behind", group="trace")
+        self.addCleanup(trace_writer.shutdown_trace_writer)
+
+        # Parent execution triggered by a rule whose trace update hasn't been written yet
+        trace_id = str(bson.ObjectId())
+        parent_execution = ActionExecutionDB(
+            action=self.traceable_execution.action,
+            runner=self.traceable_execution.runner,
+            liveaction=self.traceable_execution.liveaction,
+            status=self.traceable_execution.status,
+            context={"trace_context": {"id_": trace_id, "trace_tag": "rule-trace"}},
+        )
+        parent_execution = ActionExecution.add_or_update(parent_execution)
+        self.addCleanup(ActionExecution.delete, parent_execution)
+
+        traceable_liveaction = copy.copy(self.traceable_liveaction)
+        traceable_liveaction.context = {
+            "parent": {"execution_id": str(parent_execution.id)}
+        }
+
+        created, trace_db = trace_service.get_trace_db_by_live_action(
+            traceable_liveaction
+        )
+        self.assertFalse(created)
+        self.assertEqual(str(trace_db.id), trace_id)
+        self.assertEqual(trace_db.trace_tag, "rule-trace")
+
+        # Parent execution which has been run by hand
+        parent_execution.context = {}
+        parent_execution = ActionExecution.add_or_update(parent_execution)
+
+        created, trace_db = trace_service.get_trace_db_by_live_action(
+            traceable_liveaction
+        )
+        self.assertTrue(created)
+        self.assertEqual(str(trace_db.id), self.traceable_execution.liveaction["id"])
+        self.assertEqual(
+            trace_db.trace_tag,
+            "execution-%s" % (self.traceable_execution.liveaction["id"]),
+        )
+
+    def test_write_behind_parent_trace_queued_in_another_process(self):
+        cfg.CONF.set_override("write_behind", True, group="trace")
+        self.addCleanup(cfg.CONF.clear_override, "write_behind", group="trace")
+
+        # Each writer represents a different process
+        parent_writer = trace_writer.TraceWriter()
+        self.addCleanup(parent_writer.shutdown)
+        child_writer = trace_writer.TraceWriter()
+        self.addCleanup(child_writer.shutdown)
+
+        # Parent execution which has been run by hand and whose trace update is queued in
+        # another process
+        parent_liveaction = copy.copy(self.traceable_liveaction)
+        parent_liveaction.id = bson.ObjectId()
+        parent_liveaction.context = {}
+
+        parent_execution = ActionExecutionDB(
+            action=self.traceable_execution.action,
+            runner=self.traceable_execution.runner,
+            liveaction={"id": str(parent_liveaction.id)},
+            status=self.traceable_execution.status,
+            context={},
+        )
+        parent_execution = ActionExecution.add_or_update(parent_execution)
+        self.addCleanup(ActionExecution.delete, parent_execution)
+
+        with mock.patch.object(trace_writer, "WRITER", parent_writer):
+            _, trace_db = trace_service.get_trace_db_by_live_action(parent_liveaction)
+            trace_service.add_or_update_given_trace_db(
+                trace_db, action_executions=[str(parent_execution.id)]
+            )
+
+        child_liveaction = copy.copy(self.traceable_liveaction)
+        child_liveaction.context = {
+            "parent": {"execution_id": str(parent_execution.id)}
+        }
+
+        with mock.patch.object(trace_writer, "WRITER", child_writer):
+            _, trace_db = trace_service.get_trace_db_by_live_action(child_liveaction)
+            trace_service.add_or_update_given_trace_db(
+                trace_db, action_executions=["child_execution"]
+            )
+
+        # Update of the child process is written first
+        child_writer.flush()
+        parent_writer.flush()
+
+        traces = Trace.query(trace_tag="execution-%s" % (parent_liveaction.id))
+        self.assertEqual(len(traces), 1)
+        self.assertEqual(
+            sorted(component.object_id for component in traces[0].action_executions),
+            sorted([str(parent_execution.id), "child_execution"]),
+        )
+
+        Trace.delete(traces[0])
+
 
 class TestTraceContext(TestCase):
     def test_str_method(self):
@@ -14,6 +14,9 @@
 # limitations under the License.
 
 from __future__ import absolute_import
+
+import mock
+
 from st2common.persistence.pack import Config
 from st2common.models.db.pack import ConfigDB
 from st2common.models.db.keyvalue import KeyValuePairDB
@@ -21,7 +24,9 @@ from st2common.exceptions.db import StackStormDBObjectNotFoundError
 from st2common.persistence.keyvalue import KeyValuePair
 from st2common.models.api.keyvalue import KeyValuePairAPI
 from st2common.services.config import set_datastore_value_for_config_key
+from st2common.services.config_cache import PackConfigCacheWatcher
 from st2common.util.config_loader import ContentPackConfigLoader
+from st2common.util.config_loader import CONFIG_CACHE
 from st2common.util import crypto
 
 from st2tests.base import CleanDbTestCase
@@ -854,3 +859,48 @@ class ContentPackConfigLoaderTestCase(CleanDbTestCase):
         loader = ContentPackConfigLoader(pack_name=pack_name)
         config = loader.get_config()
         self.assertEqual(config, {})
+
+    @mock.patch.object(Config, "get_by_pack", mock.MagicMock(wraps=Config.get_by_pack))
+    def test_get_config_cache(self):
+        kvp_db = set_datastore_value_for_config_key(
+            pack_name=DUMMY_PACK_5,
+            key_name="api_secret",
+            value="some_api_secret",
+            secret=True,
+            user="joe",
+        )
+
+        Config.get_by_pack.reset_mock()
+        CONFIG_CACHE.enable(ttl=60, size=10)
+
+        try:
+            # 1. First retrieval resolves the config, second one is served from the cache
+            loader = ContentPackConfigLoader(pack_name=DUMMY_PACK_5, user="joe")
+            config = loader.get_config()
+            self.assertEqual(config["api_secret"], "some_api_secret")
+            self.assertEqual(Config.get_by_pack.call_count, 1)
+
+            config["api_secret"] = "modified"
+
+            loader = ContentPackConfigLoader(pack_name=DUMMY_PACK_5, user="joe")
+            config = loader.get_config()
+            self.assertEqual(config["api_secret"], "some_api_secret")
+            self.assertEqual(Config.get_by_pack.call_count, 1)
+
+            # 2. Config with resolved datastore values is stored encrypted
+            cached_value = CONFIG_CACHE._entries[(DUMMY_PACK_5, "joe")][2]
+            self.assertNotIn(b"some_api_secret", cached_value)
+
+            # 3. Datastore change invalidates the cached config
+            watcher = PackConfigCacheWatcher()
+            watcher._handle_event(kvp_db, "update")
+
+            loader = ContentPackConfigLoader(pack_name=DUMMY_PACK_5, user="joe")
+            loader.get_config()
+            self.assertEqual(Config.get_by_pack.call_count, 2)
+
+            # 4. Config change invalidates the cached config
+            watcher._handle_event(Config.get_by_pack(DUMMY_PACK_5), "update")
+            self.assertEqual(CONFIG_CACHE._entries, {})
+        finally:
+            CONFIG_CACHE.disable()
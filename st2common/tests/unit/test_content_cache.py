@@ -0,0 +1,95 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import mock
+
+from st2common.models.db.action import ActionDB
+from st2common.models.db.runner import RunnerTypeDB
+from st2common.persistence.action import Action
+from st2common.persistence.runner import RunnerType
+from st2common.services.content_cache import ContentCacheWatcher
+from st2common.transport.publishers import PoolPublisher
+
+from st2tests import DbTestCase
+
+__all__ = ["ContentResourceCacheTestCase"]
+
+
+@mock.patch.object(PoolPublisher, "publish", mock.MagicMock())
+class ContentResourceCacheTestCase(DbTestCase):
+    def setUp(self):
+        super(ContentResourceCacheTestCase, self).setUp()
+
+        runnertype_db = RunnerTypeDB(
+            name="test-runner", enabled=True, runner_module="nomodule"
+        )
+        self.runnertype_db = RunnerType.add_or_update(runnertype_db)
+
+        action_db = ActionDB(
+            name="cached",
+            pack="core",
+            ref="core.cached",
+            enabled=True,
+            entry_point="",
+            runner_type={"name": "test-runner"},
+            parameters={"p1": {"type": "string"}},
+        )
+        self.action_db = Action.add_or_update(action_db)
+
+        Action.enable_cache(size=10, ttl=60)
+        RunnerType.enable_cache(size=10, ttl=60)
+
+    def tearDown(self):
+        Action.disable_cache()
+        RunnerType.disable_cache()
+
+        Action.delete(self.action_db)
+        RunnerType.delete(self.runnertype_db)
+
+        super(ContentResourceCacheTestCase, self).tearDown()
+
+    @mock.patch.object(Action, "query", mock.MagicMock(wraps=Action.query))
+    def test_get_by_ref_is_cached(self):
+        action_db_1 = Action.get_by_ref("core.cached")
+        action_db_2 = Action.get_by_ref("core.cached")
+        self.assertEqual(Action.query.call_count, 1)
+
+        # Each caller receives its own copy of the object
+        self.assertEqual(action_db_1.id, action_db_2.id)
+        self.assertEqual(action_db_2.parameters, {"p1": {"type": "string"}})
+        action_db_1.parameters["p2"] = {"type": "string"}
+        self.assertNotIn("p2", Action.get_by_ref("core.cached").parameters)
+        self.assertEqual(Action.query.call_count, 1)
+
+        # Partial objects are not cached
+        Action.get_by_ref("core.cached", only_fields=["name"])
+        self.assertEqual(Action.query.call_count, 2)
+
+        # Local write invalidates the cache
+        action_db = Action.get_by_ref("core.cached")
+        action_db.description = "updated"
+        Action.add_or_update(action_db)
+
+        self.assertEqual(Action.get_by_ref("core.cached").description, "updated")
+        self.assertEqual(Action.query.call_count, 3)
+
+    def test_cache_is_invalidated_on_cud_event(self):
+        RunnerType.get_by_name("test-runner")
+        self.assertEqual(len(RunnerType.cache), 1)
+
+        watcher = ContentCacheWatcher()
+        watcher._handle_event(self.runnertype_db, "update")
+        self.assertEqual(len(RunnerType.cache), 0)
@@ -38,8 +38,11 @@ from st2common.util import schema as util_schema
 from st2common.util import reference
 from st2common.models.db import db_setup
 from st2common.models.db import _get_tls_kwargs
+from st2common.models.db import cleanup_extra_indexes
+from st2common.models.db import db_ensure_indexes
 from st2common.util import date as date_utils
 from st2common.exceptions.db import StackStormDBObjectNotFoundError
+from st2common.models.db.auth import TokenDB
 from st2common.models.db.trigger import TriggerTypeDB, TriggerDB, TriggerInstanceDB
 from st2common.models.db.rule import RuleDB, ActionExecutionSpecDB
 from st2common.persistence.cleanup import db_cleanup
@@ -54,6 +57,7 @@ from st2tests.base import ALL_MODELS
 __all__ = [
     "DbConnectionTestCase",
     "DbConnectionTestCase",
+    "DbTTLIndexTestCase",
     "ReactorModelTestCase",
     "ActionModelTestCase",
     "KeyValuePairModelTestCase",
@@ -632,6 +636,40 @@ class DbCleanupTestCase(DbTestCase):
         self.assertNotIn(cfg.CONF.database.db_name, connection.list_database_names())
 
 
+class DbTTLIndexTestCase(DbTestCase):
+    def test_ensure_and_drop_ttl_index(self):
+        collection = TokenDB._get_collection()
+
+        db_ensure_indexes(
+            model_classes=[TokenDB], ttl_indexes={"TokenDB": ("expiry", 86400)}
+        )
+        info = collection.index_information()
+        self.assertEqual(info["expiry_ttl"]["key"], [("expiry", 1)])
+        self.assertEqual(info["expiry_ttl"]["expireAfterSeconds"], 86400)
+
+        # TTL index is not removed as an extra index
+        self.assertEqual(cleanup_extra_indexes(model_class=TokenDB), 0)
+        db_ensure_indexes(model_classes=[TokenDB])
+        self.assertIn("expiry_ttl", collection.index_information())
+
+        db_ensure_indexes(
+            model_classes=[TokenDB], ttl_indexes={"TokenDB": ("expiry", None)}
+        )
+        self.assertNotIn("expiry_ttl", collection.index_information())
+
+    def test_ttl_index_replaces_regular_index_on_the_same_field(self):
+        collection = TriggerInstanceDB._get_collection()
+        collection.create_index([("occurrence_time", 1)], name="occurrence_time_1")
+
+        db_ensure_indexes(
+            model_classes=[TriggerInstanceDB],
+            ttl_indexes={"TriggerInstanceDB": ("occurrence_time", 3600)},
+        )
+        info = collection.index_information()
+        self.assertNotIn("occurrence_time_1", info)
+        self.assertEqual(info["occurrence_time_ttl"]["expireAfterSeconds"], 3600)
+
+
 @mock.patch.object(PoolPublisher, "publish", mock.MagicMock())
 class ReactorModelTestCase(DbTestCase):
     def test_triggertype_crud(self):
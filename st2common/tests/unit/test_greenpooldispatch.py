@@ -14,6 +14,8 @@
 # limitations under the License.
 
 from __future__ import absolute_import
+import time
+
 import eventlet
 import mock
 
@@ -56,3 +58,60 @@ class TestGreenPoolDispatch(TestCase):
             (args[0][0], args[0][1]) for args in mock_handler.call_args_list
         ]
         assert expected == call_args_list
+
+    def test_dispatch_buffered_work_starts_when_thread_is_freed(self):
+        dispatcher = BufferedDispatcher(dispatch_pool_size=1)
+        started = []
+
+        def handler(i):
+            started.append((i, time.time()))
+            eventlet.sleep(0.05)
+
+        for i in range(5):
+            dispatcher.dispatch(handler, i)
+
+        self.assertEqual(dispatcher.buffer_depth, 5)
+
+        start_ts = time.time()
+        while len(started) < 5 and time.time() - start_ts < 5:
+            eventlet.sleep(0.01)
+        dispatcher.shutdown()
+
+        self.assertEqual([i for i, _ in started], list(range(5)))
+
+        # Buffered work should start right after the previous handler finishes instead of
+        # waiting for the next dispatcher poll
+        for (_, previous_ts), (_, ts) in zip(started, started[1:]):
+            self.assertLess(ts - previous_ts, 0.5)
+
+    @mock.patch("st2common.util.greenpooldispatch.get_driver")
+    def test_dispatch_metrics(self, mock_get_driver):
+        dispatcher = BufferedDispatcher(dispatch_pool_size=2, name="test")
+        mock_handler = mock.MagicMock()
+        dispatcher.dispatch(mock_handler, 1)
+        while mock_handler.call_count < 1:
+            eventlet.sleep(0.01)
+        dispatcher.shutdown()
+
+        mock_driver = mock_get_driver.return_value
+        mock_driver.time.assert_called_once_with(
+            "dispatcher.test.queue_wait_time", mock.ANY
+        )
+        mock_driver.set_gauge.assert_any_call("dispatcher.test.pool_utilization", 0.5)
+        mock_driver.set_gauge.assert_any_call("dispatcher.test.buffer_depth", 0)
+
+    @mock.patch(
+        "st2common.util.greenpooldispatch.get_driver",
+        mock.MagicMock(side_effect=Exception("No driver found")),
+    )
+    def test_dispatch_metrics_failure_doesnt_skip_handler(self):
+        dispatcher = BufferedDispatcher(dispatch_pool_size=2, name="test")
+        mock_handler = mock.MagicMock()
+        dispatcher.dispatch(mock_handler, 1)
+
+        start_ts = time.time()
+        while mock_handler.call_count < 1 and time.time() - start_ts < 5:
+            eventlet.sleep(0.01)
+        dispatcher.shutdown()
+
+        mock_handler.assert_called_once_with(1)
@@ -15,6 +15,8 @@
 
 from __future__ import absolute_import
 from unittest import TestCase
+
+import mock
 from jsonschema.exceptions import ValidationError
 
 from st2common.util import schema as util_schema
@@ -481,3 +483,49 @@ class JSONSchemaTestCase(TestCase):
         util_schema.validate(
             instance=instance, schema=TEST_SCHEMA_6, cls=validator, use_default=True
         )
+
+    def test_compiled_validators_are_cached(self):
+        validator = util_schema.get_validator()
+        schema = {
+            "type": "object",
+            "properties": {
+                "arg_list": {"type": "array", "default": []},
+                "arg_string": {"type": "string", "default": None},
+            },
+        }
+
+        with mock.patch.object(
+            validator, "check_schema", wraps=validator.check_schema
+        ) as check_schema:
+            for _ in range(3):
+                instance = util_schema.validate(
+                    instance={},
+                    schema=schema,
+                    cls=validator,
+                    use_default=True,
+                    allow_default_none=True,
+                )
+                instance["arg_list"].append("item")
+
+            self.assertEqual(check_schema.call_count, 1)
+
+            # Mutating assigned default values doesn't affect the cached schema
+            self.assertEqual(
+                util_schema.validate(
+                    instance={},
+                    schema=schema,
+                    cls=validator,
+                    use_default=True,
+                    allow_default_none=True,
+                ),
+                {"arg_list": [], "arg_string": None},
+            )
+            self.assertEqual(schema["properties"]["arg_list"]["default"], [])
+
+            # Different schema results in a new validator
+            schema["properties"]["arg_string"]["default"] = "foo"
+            instance = util_schema.validate(
+                instance={}, schema=schema, cls=validator, use_default=True
+            )
+            self.assertEqual(instance["arg_string"], "foo")
+            self.assertEqual(check_schema.call_count, 2)
@@ -855,6 +855,57 @@ class ParamsUtilsTest(DbTestCase):
         result = param_utils._cast_params_from({"templateparam": "4"}, context, schemas)
         self.assertEqual(result, {"templateparam": 4})
 
+    @mock.patch.object(
+        param_utils, "_create_graph", mock.MagicMock(wraps=param_utils._create_graph)
+    )
+    def test_literal_params_skip_dependency_graph(self):
+        runner_param_info = {"r1": {"default": "some", "type": "string"}}
+        action_param_info = {
+            "a1": {"default": 1, "type": "integer"},
+            "a2": {"default": "foo", "immutable": True},
+            "a3": {"type": "object"},
+        }
+        params = {"a1": "5", "a2": "bar", "a3": {"k": "v"}}
+        action_context = {"api_user": "noob"}
+
+        live_params = param_utils.render_live_params(
+            runner_param_info, action_param_info, params, action_context
+        )
+        self.assertEqual(live_params, {"a1": 5, "a2": "foo", "a3": {"k": "v"}})
+
+        r_runner_params, r_action_params = param_utils.render_final_params(
+            runner_param_info, action_param_info, live_params, action_context
+        )
+        self.assertEqual(r_runner_params, {"r1": "some"})
+        self.assertEqual(r_action_params, {"a1": 5, "a2": "foo", "a3": {"k": "v"}})
+        self.assertFalse(param_utils._create_graph.called)
+
+        # Template in one of the applied defaults requires the full graph
+        action_param_info["a4"] = {"default": "{{ a2 }}"}
+        live_params = param_utils.render_live_params(
+            runner_param_info, action_param_info, params, action_context
+        )
+        self.assertEqual(live_params["a4"], "foo")
+        self.assertTrue(param_utils._create_graph.called)
+
+    def test_templates_are_parsed_and_compiled_once(self):
+        runner_param_info = {"r1": {"default": "some"}}
+        action_param_info = {"r2": {"default": "{{ r1 }}-{{ r3 }}"}}
+        action_context = {"api_user": "noob"}
+
+        param_utils._get_template.cache_clear()
+        param_utils._get_template_dependencies.cache_clear()
+
+        for value in ["one", "two", "three"]:
+            live_params = param_utils.render_live_params(
+                runner_param_info, action_param_info, {"r3": value}, action_context
+            )
+            self.assertEqual(live_params["r2"], "some-%s" % (value))
+
+        self.assertEqual(param_utils._get_template.cache_info().misses, 1)
+        self.assertEqual(param_utils._get_template.cache_info().hits, 2)
+        self.assertEqual(param_utils._get_template_dependencies.cache_info().misses, 1)
+
     def test_render_final_params_and_shell_script_action_command_strings(self):
         runner_parameters = {}
         action_db_parameters = {
@@ -21,12 +21,18 @@ from st2common.util.monkey_patch import monkey_patch
 monkey_patch()
 
 import copy
+import os
+import shutil
+import tempfile
 from datetime import timedelta
 
 import mock
 import bson
 
 from st2common import log as logging
+from st2common.garbage_collection.archive import ExecutionArchiveReader
+from st2common.garbage_collection.archive import ExecutionArchiveWriter
+from st2common.garbage_collection.archive import build_archive_index
 from st2common.garbage_collection.executions import purge_executions
 from st2common.constants import action as action_constants
 from st2common.persistence.execution import ActionExecution
@@ -300,33 +306,206 @@ class TestPurgeExecutions(CleanDbTestCase):
         self, mock_ActionExecution, mock_LiveAction
     ):
         # Verify that whole execution objects are not loaded in memory and we just retrieve the
-        # id field
+        # id field in bounded batches
+        mock_ActionExecution.count.return_value = 0
+        mock_LiveAction.count.return_value = 0
+
         self.assertEqual(mock_ActionExecution.query.call_count, 0)
         self.assertEqual(mock_LiveAction.query.call_count, 0)
         now = date_utils.get_datetime_utc_now()
         purge_executions(
-            logger=LOG, timestamp=now - timedelta(days=10), purge_incomplete=True
+            logger=LOG,
+            timestamp=now - timedelta(days=10),
+            purge_incomplete=True,
+            batch_size=50,
         )
 
-        self.assertEqual(mock_ActionExecution.query.call_count, 2)
+        self.assertEqual(mock_ActionExecution.query.call_count, 1)
         self.assertEqual(mock_LiveAction.query.call_count, 1)
 
-        self.assertEqual(
-            mock_ActionExecution.query.call_args_list[0][1]["only_fields"], ["id"]
+        for mock_model in [mock_ActionExecution, mock_LiveAction]:
+            call_kwargs = mock_model.query.call_args_list[0][1]
+            self.assertEqual(call_kwargs["only_fields"], ["id", "start_timestamp"])
+            self.assertTrue(call_kwargs["no_dereference"])
+            self.assertEqual(call_kwargs["order_by"], ["start_timestamp"])
+            self.assertEqual(call_kwargs["limit"], 50)
+
+    @mock.patch("st2common.util.concurrency.sleep")
+    def test_purge_executions_in_batches(self, mock_sleep):
+        now = date_utils.get_datetime_utc_now()
+
+        execution_ids = []
+        for index in range(0, 5):
+            exec_model = copy.deepcopy(self.models["executions"]["execution1.yaml"])
+            exec_model["start_timestamp"] = now - timedelta(days=22, minutes=index)
+            exec_model["end_timestamp"] = now - timedelta(days=21)
+            exec_model["status"] = action_constants.LIVEACTION_STATUS_SUCCEEDED
+            exec_model["id"] = bson.ObjectId()
+            ActionExecution.add_or_update(exec_model)
+            execution_ids.append(exec_model["id"])
+
+            self._insert_mock_stdout_and_stderr_objects_for_execution(
+                exec_model["id"], count=1
+            )
+
+        # Execution newer than cut-off threshold
+        self._insert_mock_stdout_and_stderr_objects_for_execution(
+            bson.ObjectId(), count=1
         )
-        self.assertTrue(
-            mock_ActionExecution.query.call_args_list[0][1]["no_dereference"]
+
+        with mock.patch.object(
+            ActionExecution,
+            "delete_by_query",
+            side_effect=ActionExecution.delete_by_query,
+        ) as mock_delete_by_query:
+            purge_executions(
+                logger=LOG,
+                timestamp=now - timedelta(days=20),
+                batch_size=2,
+                max_deletes_per_second=1,
+            )
+
+        # Executions are deleted in batches of at most 2 ids
+        self.assertEqual(mock_delete_by_query.call_count, 3)
+        for call in mock_delete_by_query.call_args_list:
+            self.assertLessEqual(len(call[1]["id__in"]), 2)
+
+        self.assertEqual(len(ActionExecution.get_all()), 0)
+        self.assertEqual(len(ActionExecutionOutput.get_all()), 2)
+
+        # Rate limit is enforced between the batches
+        self.assertTrue(mock_sleep.called)
+        self.assertGreater(mock_sleep.call_args_list[0][0][0], 1)
+
+    def test_purge_executions_with_archive(self):
+        archive_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, archive_dir)
+
+        now = date_utils.get_datetime_utc_now()
+
+        execution_ids = []
+        for index in range(0, 5):
+            exec_model = copy.deepcopy(self.models["executions"]["execution1.yaml"])
+            exec_model["start_timestamp"] = now - timedelta(days=22 + index % 2)
+            exec_model["end_timestamp"] = now - timedelta(days=21)
+            exec_model["status"] = action_constants.LIVEACTION_STATUS_SUCCEEDED
+            exec_model["id"] = bson.ObjectId()
+            ActionExecution.add_or_update(exec_model)
+            execution_ids.append(str(exec_model["id"]))
+
+            self._insert_mock_stdout_and_stderr_objects_for_execution(
+                exec_model["id"], count=1
+            )
+
+        purge_executions(
+            logger=LOG,
+            timestamp=now - timedelta(days=20),
+            batch_size=2,
+            archive_writer=ExecutionArchiveWriter(archive_dir=archive_dir),
         )
+
+        self.assertEqual(len(ActionExecution.get_all()), 0)
+        self.assertEqual(len(ActionExecutionOutput.get_all()), 0)
+
+        # Archive files are partitioned by the execution start day
+        reader = ExecutionArchiveReader(archive_dir=archive_dir)
+        archive_paths = reader.get_archive_paths()
+        self.assertEqual(len(archive_paths), 2)
+
+        archived_ids = []
+        for archive_path in archive_paths:
+            archived_ids.extend(
+                record["id"] for record in reader.iter_executions(archive_path)
+            )
+        self.assertCountEqual(archived_ids, execution_ids)
+
+        record = reader.get_execution(execution_ids[3])
+        self.assertEqual(record["execution"]["id"], execution_ids[3])
         self.assertEqual(
-            mock_ActionExecution.query.call_args_list[1][1]["only_fields"], ["id"]
-        )
-        self.assertTrue(
-            mock_ActionExecution.query.call_args_list[1][1]["no_dereference"]
+            [output["output_type"] for output in record["output"]],
+            ["stdout", "stderr"],
         )
-        self.assertEqual(
-            mock_LiveAction.query.call_args_list[0][1]["only_fields"], ["id"]
+        self.assertIsNone(record["trace"])
+        self.assertIsNone(reader.get_execution(str(bson.ObjectId())))
+
+        # Index can be rebuilt from the archive file
+        for archive_path in archive_paths:
+            os.remove(archive_path + ".index")
+
+        self.assertEqual(build_archive_index(archive_paths[0]), 2)
+
+        # Missing index is rebuilt on retrieval
+        record = reader.get_execution(execution_ids[4])
+        self.assertEqual(record["execution"]["id"], execution_ids[4])
+
+    def test_purge_executions_archive_failure_is_raised(self):
+        now = date_utils.get_datetime_utc_now()
+        start_ts = now - timedelta(days=15)
+        end_ts = now - timedelta(days=14)
+
+        liveaction_model = copy.deepcopy(self.models["liveactions"]["liveaction4.yaml"])
+        liveaction_model["start_timestamp"] = start_ts
+        liveaction_model["end_timestamp"] = end_ts
+        liveaction_model["status"] = action_constants.LIVEACTION_STATUS_SUCCEEDED
+        liveaction = LiveAction.add_or_update(liveaction_model)
+
+        exec_model = copy.deepcopy(self.models["executions"]["execution1.yaml"])
+        exec_model["start_timestamp"] = start_ts
+        exec_model["end_timestamp"] = end_ts
+        exec_model["status"] = action_constants.LIVEACTION_STATUS_SUCCEEDED
+        exec_model["id"] = bson.ObjectId()
+        exec_model["liveaction"]["id"] = str(liveaction.id)
+        ActionExecution.add_or_update(exec_model)
+
+        archive_writer = mock.Mock()
+        archive_writer.archive_executions.side_effect = IOError("disk full")
+
+        self.assertRaisesRegex(
+            IOError,
+            "disk full",
+            purge_executions,
+            logger=LOG,
+            timestamp=now - timedelta(days=10),
+            archive_writer=archive_writer,
         )
-        self.assertTrue(mock_LiveAction.query.call_args_list[0][1]["no_dereference"])
+
+        # Executions which haven't been archived are kept
+        self.assertEqual(len(ActionExecution.get_all()), 1)
+        self.assertEqual(len(LiveAction.get_all()), 1)
+
+    @mock.patch("st2common.garbage_collection.archive.FRAME_SIZE", 1)
+    def test_archive_executions_are_streamed_into_separate_frames(self):
+        archive_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, archive_dir)
+
+        now = date_utils.get_datetime_utc_now()
+
+        execution_ids = []
+        for index in range(0, 3):
+            exec_model = copy.deepcopy(self.models["executions"]["execution1.yaml"])
+            exec_model["start_timestamp"] = now - timedelta(seconds=index)
+            exec_model["id"] = bson.ObjectId()
+            ActionExecution.add_or_update(exec_model)
+            execution_ids.append(str(exec_model["id"]))
+
+        archive_writer = ExecutionArchiveWriter(archive_dir=archive_dir)
+        self.assertEqual(archive_writer.archive_executions(execution_ids), 3)
+
+        reader = ExecutionArchiveReader(archive_dir=archive_dir)
+        archive_path = reader.get_archive_paths()[0]
+
+        # Every execution is written to its own frame since the frame size is exceeded
+        with open(archive_path + ".index", "r") as fp:
+            index_lines = fp.read()
+
+        self.assertEqual(build_archive_index(archive_path), 3)
+
+        with open(archive_path + ".index", "r") as fp:
+            self.assertEqual(fp.read(), index_lines)
+
+        for execution_id in execution_ids:
+            record = reader.get_execution(execution_id)
+            self.assertEqual(record["execution"]["id"], execution_id)
 
     def _insert_mock_stdout_and_stderr_objects_for_execution(
         self, execution_id, count=5
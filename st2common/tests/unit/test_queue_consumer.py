@@ -16,6 +16,7 @@
 from __future__ import absolute_import
 import mock
 from kombu import Exchange, Queue
+from oslo_config import cfg
 
 from st2common.transport import consumers
 from st2common.util.greenpooldispatch import BufferedDispatcher
@@ -56,6 +57,86 @@ class QueueConsumerTest(DbTestCase):
         self.assertTrue(mock_message.ack.called)
         self.assertFalse(FakeMessageHandler.process.called)
 
+    def test_get_prefetch_count(self):
+        handler = get_handler()
+        self.assertEqual(handler._queue_consumer.get_prefetch_count(), 1)
+
+        cfg.CONF.set_override(name="prefetch_count", group="messaging", override=10)
+        self.addCleanup(cfg.CONF.clear_override, "prefetch_count", group="messaging")
+        self.assertEqual(handler._queue_consumer.get_prefetch_count(), 10)
+
+        # Service specific value takes precedence
+        cfg.CONF.set_override(
+            name="service_prefetch_count",
+            group="messaging",
+            override={"fake": "20"},
+        )
+        self.addCleanup(
+            cfg.CONF.clear_override, "service_prefetch_count", group="messaging"
+        )
+        self.assertEqual(handler._queue_consumer.get_prefetch_count(), 10)
+
+        with mock.patch.object(FakeMessageHandler, "service_name", "fake"):
+            self.assertEqual(handler._queue_consumer.get_prefetch_count(), 20)
+
+    @mock.patch.object(BufferedDispatcher, "dispatch", mock.MagicMock())
+    @mock.patch.object(FakeMessageHandler, "process", mock.MagicMock())
+    def test_process_message_ack_after_processing(self):
+        cfg.CONF.set_override(
+            name="ack_after_processing", group="messaging", override=True
+        )
+        self.addCleanup(
+            cfg.CONF.clear_override, "ack_after_processing", group="messaging"
+        )
+
+        payload = FakeModelDB()
+        handler = get_handler()
+        queue_consumer = handler._queue_consumer
+        mock_message = mock.MagicMock()
+
+        # Prefetch count is bound by the dispatcher pool size
+        self.assertEqual(
+            queue_consumer.get_prefetch_count(), queue_consumer._dispatcher.pool_size
+        )
+
+        # Message is only acked once it has been processed
+        queue_consumer.process(payload, mock_message)
+        BufferedDispatcher.dispatch.assert_called_once_with(
+            queue_consumer._process_message, payload, mock_message
+        )
+        self.assertFalse(mock_message.ack.called)
+        self.assertEqual(queue_consumer._in_flight, 1)
+
+        queue_consumer._process_message(payload, mock_message)
+        FakeMessageHandler.process.assert_called_once_with(payload)
+        self.assertTrue(mock_message.ack.called)
+        self.assertEqual(queue_consumer._in_flight, 0)
+
+    @mock.patch.object(BufferedDispatcher, "dispatch", mock.MagicMock())
+    def test_actions_queue_consumer_always_acks_on_receive(self):
+        cfg.CONF.set_override(
+            name="ack_after_processing", group="messaging", override=True
+        )
+        self.addCleanup(
+            cfg.CONF.clear_override, "ack_after_processing", group="messaging"
+        )
+
+        payload = FakeModelDB()
+        handler = get_handler()
+        queue_consumer = consumers.ActionsQueueConsumer(
+            connection=mock.MagicMock(), queues=[FAKE_WORK_Q], handler=handler
+        )
+        mock_message = mock.MagicMock()
+
+        self.assertEqual(queue_consumer.get_prefetch_count(), 1)
+
+        queue_consumer.process(payload, mock_message)
+        BufferedDispatcher.dispatch.assert_called_once_with(
+            queue_consumer._process_message, payload
+        )
+        self.assertTrue(mock_message.ack.called)
+        self.assertEqual(queue_consumer._in_flight, 0)
+
 
 class FakeStagedMessageHandler(consumers.StagedMessageHandler):
     message_type = FakeModelDB
@@ -0,0 +1,106 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import json
+import unittest
+
+import mock
+
+from st2common.router import Router
+from st2common.router import StreamingJSONListResponse
+
+__all__ = ["StreamingJSONListResponseTestCase"]
+
+
+class FakeAPIModel(object):
+    def __init__(self, **values):
+        self.__dict__.update(values)
+
+    def __json__(self):
+        return vars(self)
+
+
+class StreamingJSONListResponseTestCase(unittest.TestCase):
+    def test_empty_list(self):
+        resp = StreamingJSONListResponse(items=[])
+        self.assertEqual(resp.content_type, "application/json")
+        self.assertEqual(list(resp.app_iter), [b"[]"])
+
+    @mock.patch.object(StreamingJSONListResponse, "chunk_size", 100)
+    def test_items_are_consumed_lazily(self):
+        consumed = []
+
+        def get_items():
+            for index in range(20):
+                consumed.append(index)
+                yield {"id": str(index), "data": "a" * 20}
+
+        resp = StreamingJSONListResponse(items=get_items())
+        self.assertEqual(consumed, [])
+
+        app_iter = iter(resp.app_iter)
+        chunks = [next(app_iter)]
+
+        # Only the items which are needed for the first chunk have been consumed
+        self.assertLess(len(consumed), 20)
+
+        chunks.extend(app_iter)
+        self.assertGreater(len(chunks), 5)
+        self.assertEqual(len(consumed), 20)
+
+        data = json.loads(b"".join(chunks))
+        self.assertEqual(len(data), 20)
+        self.assertEqual(data[19], {"id": "19", "data": "a" * 20})
+
+    def test_item_filters(self):
+        items = [
+            FakeAPIModel(id="1", status="succeeded", result={"a": 1}),
+            FakeAPIModel(id="2", status="failed", result={"b": 2}),
+        ]
+
+        resp = StreamingJSONListResponse(items=items)
+        item_filter = Router()._get_response_item_filter(
+            mandatory_include_fields=["id"], include_attributes=["status"]
+        )
+        resp.item_filters.append(item_filter)
+
+        data = json.loads(b"".join(resp.app_iter))
+        self.assertEqual(
+            data, [{"id": "1", "status": "succeeded"}, {"id": "2", "status": "failed"}]
+        )
+
+    def test_prefetch_raises_errors_before_response_is_returned(self):
+        def get_items():
+            raise ValueError("invalid query")
+            yield
+
+        resp = StreamingJSONListResponse(items=get_items())
+        self.assertRaisesRegex(ValueError, "invalid query", resp.prefetch)
+
+    @mock.patch.object(StreamingJSONListResponse, "chunk_size", 10)
+    def test_error_after_first_chunk_is_not_swallowed(self):
+        def get_items():
+            yield {"id": "1", "data": "a" * 20}
+            raise ValueError("connection lost")
+
+        resp = StreamingJSONListResponse(items=get_items())
+        resp.prefetch()
+
+        app_iter = iter(resp.app_iter)
+        self.assertEqual(next(app_iter), b'[{"id":"1","data":"aaaaaaaaaaaaaaaaaaaa"}')
+
+        # Response is not terminated with a closing bracket
+        self.assertRaisesRegex(ValueError, "connection lost", next, app_iter)
@@ -13,9 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import eventlet
 import mock
 import unittest
 
+from oslo_config import cfg
+
 from st2common.stream import listener
 
 
@@ -69,3 +72,315 @@ class TestStream(unittest.TestCase):
         events = EVENTS.append("")
         for index, val in enumerate(app_iter):
             self.assertEqual(val, events[index])
+
+    def test_get_subscriptions(self):
+        listener_ = MockListener(connection=None)
+
+        execution_subscription = listener.Subscription(
+            queue=mock.Mock(), execution_ids=["1"]
+        )
+        event_subscription = listener.Subscription(
+            queue=mock.Mock(), events=["st2.execution__update"]
+        )
+        glob_subscription = listener.Subscription(
+            queue=mock.Mock(), events=["st2.announcement__*"]
+        )
+        for subscription in [
+            execution_subscription,
+            event_subscription,
+            glob_subscription,
+        ]:
+            listener_.subscribe(subscription)
+
+        self.assertEqual(
+            set(listener_._subscriptions_by_execution_id.keys()), set(["1"])
+        )
+        self.assertEqual(
+            set(listener_._subscriptions_by_event_name.keys()),
+            set(["st2.execution__update"]),
+        )
+        self.assertEqual(listener_._other_subscriptions, set([glob_subscription]))
+
+        with mock.patch.object(
+            listener_, "_get_execution_id_for_body", mock.Mock(return_value="1")
+        ):
+            subscriptions = listener_.get_subscriptions("st2.execution__update", {})
+            self.assertCountEqual(
+                subscriptions, [execution_subscription, event_subscription]
+            )
+
+            subscriptions = listener_.get_subscriptions("st2.execution__create", {})
+            self.assertEqual(subscriptions, [execution_subscription])
+
+        subscriptions = listener_.get_subscriptions("st2.announcement__chatops", {})
+        self.assertEqual(subscriptions, [glob_subscription])
+
+        listener_.unsubscribe(execution_subscription)
+        listener_.unsubscribe(event_subscription)
+        listener_.unsubscribe(glob_subscription)
+
+        self.assertEqual(listener_._subscriptions_by_execution_id, {})
+        self.assertEqual(listener_._subscriptions_by_event_name, {})
+        self.assertEqual(listener_._other_subscriptions, set())
+
+    def test_processor_skips_events_without_subscribers(self):
+        listener_ = MockListener(connection=None)
+        listener_.subscribe(
+            listener.Subscription(queue=mock.Mock(), events=["st2.execution__update"])
+        )
+
+        model = mock.Mock()
+        message = mock.Mock()
+        message.delivery_info = {"exchange": "st2.liveaction", "routing_key": "update"}
+        message.headers = {}
+
+        process = listener_.processor(model)
+        process({}, message)
+
+        self.assertFalse(model.from_model.called)
+        self.assertTrue(message.ack.called)
+
+    def test_events_are_encoded_once_for_all_the_clients(self):
+        listener_ = MockListener(connection=None)
+        clients_count = 500
+        events_count = 5
+
+        clients = [
+            listener_.generator(events=["st2.announcement__*"])
+            for _ in range(clients_count)
+        ]
+        # Start the generators which registers the subscriptions
+        for client in clients:
+            self.assertEqual(next(client), "")
+
+        with mock.patch.object(
+            listener, "json_encode", mock.Mock(side_effect=listener.json_encode)
+        ) as mock_json_encode:
+            for index in range(events_count):
+                listener_.emit("st2.announcement__chatops", {"index": index})
+
+            received = [
+                [next(client).encode() for _ in range(events_count)]
+                for client in clients
+            ]
+
+        # Each event is encoded only once regardless of the number of clients and all the clients
+        # share the same buffer
+        self.assertEqual(mock_json_encode.call_count, events_count)
+        for index in range(events_count):
+            self.assertEqual(
+                received[0][index],
+                b'event: st2.announcement__chatops\ndata: {"index":%d}\n\n' % (index),
+            )
+            for client_received in received:
+                self.assertIs(client_received[index], received[0][index])
+
+        for client in clients:
+            client.close()
+
+        self.assertEqual(listener_._other_subscriptions, set())
+
+    def test_subscription_coalesce(self):
+        subscription = listener.Subscription(
+            queue=eventlet.Queue(), coalesce=True, coalesce_window=0.05
+        )
+
+        subscription.put(listener.StreamEvent("st2.execution__create", MockBody("1")))
+        for status in ["running", "running", "succeeded"]:
+            body = MockBody("1")
+            body.status = status
+            subscription.put(listener.StreamEvent("st2.execution__update", body))
+        subscription.put(listener.StreamEvent("st2.execution__update", MockBody("2")))
+
+        self.assertEqual(subscription.queue.qsize(), 3)
+
+        event_name, body = subscription.get()
+        self.assertEqual(event_name, "st2.execution__create")
+
+        # Only the latest state is delivered
+        event_name, body = subscription.get()
+        self.assertEqual((event_name, body.id), ("st2.execution__update", "1"))
+        self.assertEqual(body.status, "succeeded")
+
+        event_name, body = subscription.get()
+        self.assertEqual((event_name, body.id), ("st2.execution__update", "2"))
+
+        self.assertEqual(subscription._coalesced_events, {})
+
+    def test_subscription_buffer_overflow(self):
+        # 1. Drop oldest events
+        subscription = listener.Subscription(
+            queue=eventlet.Queue(),
+            max_buffered_events=2,
+            overflow_policy=listener.OVERFLOW_POLICY_DROP,
+        )
+
+        for index in range(5):
+            subscription.put(listener.StreamEvent("st2.announcement__chatops", index))
+
+        self.assertEqual(subscription.queue.qsize(), 2)
+        self.assertEqual(subscription.dropped_events_count, 3)
+        self.assertEqual(subscription.get().body, 3)
+        self.assertEqual(subscription.get().body, 4)
+
+        # 2. Replace buffered events with a resync event
+        subscription = listener.Subscription(
+            queue=eventlet.Queue(),
+            max_buffered_events=2,
+            overflow_policy=listener.OVERFLOW_POLICY_RESYNC,
+        )
+
+        for index in range(3):
+            subscription.put(listener.StreamEvent("st2.announcement__chatops", index))
+
+        self.assertEqual(subscription.queue.qsize(), 2)
+        stream_event = subscription.get()
+        self.assertEqual(stream_event.event, listener.RESYNC_EVENT)
+        self.assertEqual(stream_event.body["dropped"], 2)
+        self.assertEqual(subscription.get().body, 2)
+
+    def test_client_buffers_are_not_bounded_by_default(self):
+        stream_listener = listener.StreamListener(connection=None)
+
+        gen = stream_listener.generator(execution_ids=["1"])
+        self.assertEqual(next(gen), "")
+
+        (subscription,) = stream_listener._subscriptions_by_execution_id["1"]
+        self.assertEqual(subscription.max_buffered_events, 0)
+        gen.close()
+
+    def test_execution_output_client_buffers_are_not_bounded(self):
+        cfg.CONF.set_override("max_buffered_events", 1000, group="stream")
+        self.addCleanup(cfg.CONF.clear_override, "max_buffered_events", group="stream")
+
+        stream_listener = listener.StreamListener(connection=None)
+        output_listener = listener.ExecutionOutputListener(connection=None)
+
+        for listener_, max_buffered_events in [
+            (stream_listener, 1000),
+            (output_listener, 0),
+        ]:
+            gen = listener_.generator(execution_ids=["1"])
+            self.assertEqual(next(gen), "")
+
+            (subscription,) = listener_._subscriptions_by_execution_id["1"]
+            self.assertEqual(subscription.max_buffered_events, max_buffered_events)
+            gen.close()
+
+    def test_replay_buffer(self):
+        replay_buffer = listener.ReplayBuffer(size=3)
+
+        event_ids = []
+        for index in range(5):
+            seq, event_id = replay_buffer.get_next_id()
+            event_ids.append(event_id)
+            replay_buffer.append(
+                listener.ReplayEntry(
+                    seq=seq, event="test", encoded=b"%d" % (index), execution_id="1"
+                )
+            )
+
+        self.assertEqual(event_ids[0], "%s-1" % (replay_buffer.epoch))
+
+        # Events which are still in the buffer
+        entries = replay_buffer.get_entries_since(event_ids[1])
+        self.assertEqual([entry.encode() for entry in entries], [b"2", b"3", b"4"])
+        self.assertEqual(replay_buffer.get_entries_since(event_ids[4]), [])
+
+        # Gap, unknown epoch and invalid ids
+        self.assertIsNone(replay_buffer.get_entries_since(event_ids[0]))
+        self.assertIsNone(replay_buffer.get_entries_since("abc-3"))
+        self.assertIsNone(replay_buffer.get_entries_since("invalid"))
+
+    def test_replay_buffer_is_bound_by_bytes(self):
+        replay_buffer = listener.ReplayBuffer(size=100, max_bytes=10)
+
+        event_ids = []
+        for index in range(5):
+            seq, event_id = replay_buffer.get_next_id()
+            event_ids.append(event_id)
+            replay_buffer.append(
+                listener.ReplayEntry(seq=seq, event="test", encoded=b"%04d" % (index))
+            )
+
+        # Only the last two 4 byte events fit into the buffer
+        self.assertEqual(replay_buffer.bytes, 8)
+        self.assertIsNone(replay_buffer.get_entries_since(event_ids[1]))
+
+        entries = replay_buffer.get_entries_since(event_ids[2])
+        self.assertEqual([entry.encode() for entry in entries], [b"0003", b"0004"])
+
+    def test_generator_replays_missed_events(self):
+        cfg.CONF.set_override("replay_buffer_size", 1000, group="stream")
+        self.addCleanup(cfg.CONF.clear_override, "replay_buffer_size", group="stream")
+
+        listener_ = MockListener(connection=None)
+        process = listener_.processor()
+
+        def process_event(index):
+            message = mock.Mock()
+            message.delivery_info = {
+                "exchange": "st2.announcement",
+                "routing_key": "chatops",
+            }
+            message.headers = {}
+            process({"index": index}, message)
+
+        # Events without subscribers are still stored in the replay buffer
+        for index in range(3):
+            process_event(index)
+
+        epoch = listener_._replay_buffer.epoch
+        client = listener_.generator(last_event_id="%s-1" % (epoch))
+        self.assertEqual(next(client), "")
+
+        for index in [1, 2]:
+            stream_event = next(client)
+            # Replayed events only keep the encoded event and not the message body
+            self.assertIsNone(stream_event.body)
+            self.assertEqual(
+                stream_event.encode(),
+                b'id: %s-%d\nevent: st2.announcement__chatops\ndata: {"index":%d}\n\n'
+                % (epoch.encode("utf-8"), index + 1, index),
+            )
+
+        # Live events follow the replayed ones
+        process_event(3)
+        self.assertEqual(next(client).body, {"index": 3})
+        client.close()
+
+        # Client which missed events that are not in the buffer anymore needs to resync
+        client = listener_.generator(last_event_id="unknown-1")
+        self.assertEqual(next(client), "")
+        self.assertEqual(next(client).event, listener.RESYNC_EVENT)
+        client.close()
+
+    def test_generator_replayed_end_event_stops_stream(self):
+        cfg.CONF.set_override("replay_buffer_size", 1000, group="stream")
+        self.addCleanup(cfg.CONF.clear_override, "replay_buffer_size", group="stream")
+
+        listener_ = MockListener(connection=None)
+        replay_buffer = listener_._replay_buffer
+
+        for execution_id, status in [("1", "running"), ("2", "succeeded")]:
+            seq, _ = replay_buffer.get_next_id()
+            replay_buffer.append(
+                listener.ReplayEntry(
+                    seq=seq,
+                    event="st2.execution__update",
+                    encoded=execution_id.encode("utf-8"),
+                    action_ref="core.local",
+                    execution_id=execution_id,
+                    status=status,
+                )
+            )
+
+        client = listener_.generator(
+            action_refs=["core.local"],
+            end_event="st2.execution__update",
+            end_statuses=["succeeded"],
+            end_execution_id="2",
+            last_event_id="%s-0" % (replay_buffer.epoch),
+        )
+        self.assertEqual(next(client), "")
+        self.assertEqual([event.encode() for event in client], [b"1", b"2"])
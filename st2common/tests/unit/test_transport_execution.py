@@ -0,0 +1,155 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import pickle
+import unittest
+
+import mock
+from bson.objectid import ObjectId
+from oslo_config import cfg
+
+import st2tests.config as tests_config
+
+from st2common.models.db.execution import ActionExecutionDB
+from st2common.services import executions as executions_service
+from st2common.transport import execution as execution_transport
+from st2common.transport import publishers
+from st2common.util import date as date_utils
+
+__all__ = ["SlimExecutionUpdatesTestCase"]
+
+
+class FakeMessage(object):
+    def __init__(self, headers=None):
+        self.headers = headers or {}
+
+
+class SlimExecutionUpdatesTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        tests_config.parse_args()
+
+    def tearDown(self):
+        cfg.CONF.set_override(
+            name="slim_execution_updates", group="messaging", override=False
+        )
+
+    def _get_execution_db(self):
+        return ActionExecutionDB(
+            id=ObjectId(),
+            status="succeeded",
+            action={
+                "ref": "core.local",
+                "name": "local",
+                "pack": "core",
+                "runner_type": "local-shell-cmd",
+                "parameters": {"cmd": {"type": "string"}},
+            },
+            runner={"name": "local-shell-cmd", "runner_parameters": {}},
+            liveaction={"id": str(ObjectId()), "action": "core.local"},
+            parameters={"cmd": "date"},
+            result={"stdout": "a" * 10000},
+            result_size=10015,
+            context={"user": "stanley"},
+            start_timestamp=date_utils.get_datetime_utc_now(),
+            end_timestamp=date_utils.get_datetime_utc_now(),
+            log=[{"status": "succeeded"}],
+        )
+
+    def test_get_slim_execution(self):
+        execution_db = self._get_execution_db()
+        slim_execution_db = execution_transport.get_slim_execution(execution_db)
+
+        self.assertIsInstance(slim_execution_db, ActionExecutionDB)
+        self.assertEqual(slim_execution_db.id, execution_db.id)
+        self.assertEqual(slim_execution_db.status, "succeeded")
+        self.assertEqual(slim_execution_db.context, {"user": "stanley"})
+        self.assertEqual(slim_execution_db.result_size, 10015)
+        self.assertEqual(slim_execution_db.end_timestamp, execution_db.end_timestamp)
+        self.assertEqual(slim_execution_db.action["ref"], "core.local")
+        self.assertNotIn("parameters", slim_execution_db.action)
+        self.assertEqual(slim_execution_db.runner, {"name": "local-shell-cmd"})
+        self.assertEqual(slim_execution_db.liveaction, execution_db.liveaction)
+
+        # Large fields are not included
+        self.assertEqual(slim_execution_db.result, {})
+        self.assertEqual(slim_execution_db.parameters, {})
+        self.assertEqual(slim_execution_db.log, [])
+        self.assertLess(
+            len(pickle.dumps(slim_execution_db)), len(pickle.dumps(execution_db)) / 5
+        )
+
+    def test_mark_slim_execution(self):
+        execution_db = self._get_execution_db()
+
+        execution_transport.mark_slim_execution(execution_db, FakeMessage())
+        self.assertFalse(execution_transport.is_slim_execution(execution_db))
+
+        execution_transport.mark_slim_execution(
+            execution_db,
+            FakeMessage({execution_transport.SLIM_MESSAGE_HEADER: True}),
+        )
+        self.assertTrue(execution_transport.is_slim_execution(execution_db))
+
+    @mock.patch.object(executions_service.ActionExecution, "get_by_id")
+    def test_get_full_execution(self, mock_get_by_id):
+        execution_db = self._get_execution_db()
+
+        # Regular executions are returned as is
+        self.assertEqual(
+            executions_service.get_full_execution(execution_db), execution_db
+        )
+        self.assertFalse(mock_get_by_id.called)
+
+        # Slim executions are retrieved from the database
+        mock_get_by_id.return_value = execution_db
+        slim_execution_db = execution_transport.mark_slim_execution(
+            execution_transport.get_slim_execution(execution_db),
+            FakeMessage({execution_transport.SLIM_MESSAGE_HEADER: True}),
+        )
+
+        self.assertEqual(
+            executions_service.get_full_execution(slim_execution_db), execution_db
+        )
+        mock_get_by_id.assert_called_once_with(str(execution_db.id))
+
+    @mock.patch.object(publishers.PoolPublisher, "publish")
+    def test_publish_update(self, mock_publish):
+        execution_db = self._get_execution_db()
+        publisher = execution_transport.ActionExecutionPublisher()
+
+        # 1. Whole document is published by default
+        publisher.publish_update(execution_db)
+
+        args, kwargs = mock_publish.call_args
+        self.assertEqual(
+            args, (execution_db, execution_transport.EXECUTION_XCHG, "update")
+        )
+        self.assertEqual(kwargs, {})
+
+        # 2. Slim update messages
+        cfg.CONF.set_override(
+            name="slim_execution_updates", group="messaging", override=True
+        )
+        publisher.publish_update(execution_db)
+
+        args, kwargs = mock_publish.call_args
+        self.assertEqual(args[0].result, {})
+        self.assertEqual(args[0].status, execution_db.status)
+        self.assertEqual(args[1:], (execution_transport.EXECUTION_XCHG, "update"))
+        self.assertEqual(
+            kwargs, {"headers": {execution_transport.SLIM_MESSAGE_HEADER: True}}
+        )
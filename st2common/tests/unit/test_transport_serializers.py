@@ -0,0 +1,98 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import datetime
+import unittest
+
+from bson.objectid import ObjectId
+from kombu.serialization import dumps
+from kombu.serialization import loads
+from kombu.serialization import prepare_accept_content
+
+from st2common.models.db.execution import ActionExecutionDB
+from st2common.models.db.liveaction import LiveActionDB
+from st2common.transport import serializers
+from st2common.util import date as date_utils
+
+__all__ = ["MessageSerializersTestCase"]
+
+
+class MessageSerializersTestCase(unittest.TestCase):
+    def test_get_serializer(self):
+        liveaction_db = LiveActionDB()
+
+        self.assertEqual(serializers.get_serializer(liveaction_db), "pickle")
+        self.assertEqual(
+            serializers.get_serializer(liveaction_db, serializer="json"),
+            serializers.JSON_SERIALIZER,
+        )
+
+        # Only model objects can be serialized as JSON
+        self.assertEqual(
+            serializers.get_serializer({"foo": "bar"}, serializer="json"), "pickle"
+        )
+        self.assertRaises(TypeError, serializers.encode_json, {"foo": "bar"})
+
+    def test_json_round_trip(self):
+        now = date_utils.get_datetime_utc_now()
+
+        liveaction_db = LiveActionDB(
+            id=ObjectId(),
+            status="succeeded",
+            action="core.local",
+            parameters={"cmd": "date", "key.with.dots": "value"},
+            context={"user": "stanley", "parent": {"execution_id": "1"}},
+            result={"stdout": "foo", "nested": {"$key": [1, 2, 3]}},
+            start_timestamp=now,
+        )
+        execution_db = ActionExecutionDB(
+            id=ObjectId(),
+            action={"ref": "core.local"},
+            runner={"name": "local-shell-cmd"},
+            liveaction={"id": str(liveaction_db.id)},
+            status="running",
+            result={"stdout": "foo"},
+            start_timestamp=now,
+            log=[
+                {"status": "requested", "timestamp": now},
+                {
+                    "status": "running",
+                    "timestamp": datetime.datetime(
+                        2020, 1, 1, tzinfo=datetime.timezone.utc
+                    ),
+                },
+            ],
+        )
+
+        for model_db in [liveaction_db, execution_db]:
+            content_type, content_encoding, data = dumps(
+                model_db, serializer=serializers.JSON_SERIALIZER
+            )
+            self.assertEqual(content_type, serializers.JSON_CONTENT_TYPE)
+
+            result = loads(
+                data,
+                content_type,
+                content_encoding,
+                accept=prepare_accept_content(serializers.ACCEPT_CONTENT),
+            )
+
+            self.assertIsInstance(result, type(model_db))
+            for name in model_db._fields:
+                self.assertEqual(getattr(result, name), getattr(model_db, name))
+
+        self.assertIsInstance(result.id, ObjectId)
+        self.assertEqual(result.log[1]["timestamp"].year, 2020)
@@ -17,6 +17,7 @@ from __future__ import absolute_import
 import unittest
 import mock
 
+from st2common.exceptions.actionalias import ActionAliasAmbiguityException
 from st2common.models.db.actionalias import ActionAliasDB
 import st2common.util.actionalias_matching as matching
 
@@ -169,3 +170,57 @@ class ActionAliasTestCase(unittest.TestCase):
         self.assertEqual(match[0]["representation"], "{{choice}} cross the {{target}}")
 
     # we need some more complex scenarios in here.
+
+    @mock.patch.object(matching.ActionAlias, "query")
+    def test_matcher(self, mock_query, mock_get_uid):
+        ALIASES = [
+            MemoryActionAliasDB(
+                name="spengler",
+                ref="ghostbusters.1",
+                formats=["{{choice}} cross the {{target}}"],
+            ),
+            MemoryActionAliasDB(
+                name="stantz",
+                ref="ghostbusters.2",
+                formats=[
+                    {
+                        "display": "bust {{ghost}}",
+                        "representation": ["bust {{ghost}}"],
+                        "match_multiple": True,
+                    }
+                ],
+            ),
+        ]
+        mock_query.return_value = ALIASES
+
+        matcher = matching.ActionAliasMatcher()
+
+        match = matcher.match("Don't cross the streams")
+        self.assertEqual(match["alias"].ref, "ghostbusters.1")
+
+        match = matcher.match("bust slimer")
+        self.assertEqual(match["alias"].ref, "ghostbusters.2")
+        self.assertEqual(match["representation"], "bust {{ghost}}")
+
+        self.assertRaisesRegex(
+            ActionAliasAmbiguityException,
+            "matched no patterns",
+            matcher.match,
+            "Who you gonna call",
+        )
+
+        # Aliases are only retrieved once until the matcher is invalidated
+        self.assertEqual(mock_query.call_count, 1)
+
+        ALIASES.append(
+            MemoryActionAliasDB(
+                name="venkman",
+                ref="ghostbusters.3",
+                formats=["Who you gonna call"],
+            )
+        )
+        matcher.invalidate()
+
+        match = matcher.match("Who you gonna call")
+        self.assertEqual(match["alias"].ref, "ghostbusters.3")
+        self.assertEqual(mock_query.call_count, 2)
@@ -0,0 +1,69 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import unittest
+
+import mock
+
+from st2common.util import cache as cache_utils
+from st2common.util.cache import ExpiringLRUCache
+
+__all__ = ["ExpiringLRUCacheTestCase"]
+
+
+class ExpiringLRUCacheTestCase(unittest.TestCase):
+    def test_get_set_and_lru_eviction(self):
+        cache = ExpiringLRUCache(size=2)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+
+        # "b" is the least recently used entry
+        cache.set("c", 3)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.get("d", "default"), "default")
+
+    @mock.patch.object(cache_utils, "time")
+    def test_ttl(self, mock_time):
+        mock_time.time.return_value = 100
+        cache = ExpiringLRUCache(size=10, ttl=10)
+        cache.set("a", 1)
+
+        mock_time.time.return_value = 110
+        self.assertEqual(cache.get("a"), 1)
+
+        mock_time.time.return_value = 111
+        self.assertIsNone(cache.get("a"))
+        self.assertNotIn("a", cache)
+
+    def test_stale_generation_is_not_stored(self):
+        cache = ExpiringLRUCache(size=10)
+
+        generation = cache.generation
+        cache.delete("a")
+        self.assertFalse(cache.set("a", 1, generation=generation))
+        self.assertIsNone(cache.get("a"))
+
+        generation = cache.generation
+        self.assertTrue(cache.set("a", 1, generation=generation))
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.generation, generation + 1)
@@ -0,0 +1,73 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import unittest
+
+from st2common.util import json_path as json_path_utils
+
+DOCUMENT = {
+    "stdout": "foo",
+    "a/b": {"c~d": 1},
+    "result": {"items": [{"id": "a"}, {"id": "b"}]},
+}
+
+
+class JSONPathUtilsTestCase(unittest.TestCase):
+    def test_get_value_for_json_pointer(self):
+        values = [
+            ("", DOCUMENT),
+            ("/stdout", "foo"),
+            ("/a~1b/c~0d", 1),
+            ("/result/items/1", {"id": "b"}),
+            ("/result/items/0/id", "a"),
+        ]
+
+        for path, expected_value in values:
+            value = json_path_utils.get_value_for_path(DOCUMENT, path)
+            self.assertEqual(value, expected_value)
+
+    def test_get_value_for_jsonpath(self):
+        values = [
+            ("stdout", "foo"),
+            ("$.stdout", "foo"),
+            ("result.items[1]", {"id": "b"}),
+            ("result.items[0].id", "a"),
+            # Expressions which can match multiple values always return a list
+            ("result.items[*].id", ["a", "b"]),
+            ("result..id", ["a", "b"]),
+            ("result.items[*].name", []),
+        ]
+
+        for path, expected_value in values:
+            value = json_path_utils.get_value_for_path(DOCUMENT, path)
+            self.assertEqual(value, expected_value)
+
+    def test_get_value_for_path_not_found(self):
+        paths = ["/stderr", "/result/items/2", "/stdout/0", "stderr", "result.items[2]"]
+
+        for path in paths:
+            self.assertRaises(
+                KeyError, json_path_utils.get_value_for_path, DOCUMENT, path
+            )
+
+    def test_get_value_for_path_invalid_expression(self):
+        self.assertRaisesRegex(
+            ValueError,
+            'Invalid JSONPath expression "result\\["',
+            json_path_utils.get_value_for_path,
+            DOCUMENT,
+            "result[",
+        )
@@ -0,0 +1,58 @@
+# Copyright 2026 The StackStorm Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import re
+import unittest
+
+from bson.objectid import ObjectId
+
+from st2common.util import pagination as pagination_utils
+
+
+class PaginationUtilsTestCase(unittest.TestCase):
+    def test_encode_and_decode_cursor(self):
+        id = str(ObjectId())
+
+        for value in [1792406841771118, "core.local", None]:
+            cursor = pagination_utils.encode_cursor(value=value, id=id)
+            self.assertEqual(pagination_utils.decode_cursor(cursor), (value, id))
+
+            # Cursor can be used in the URL as is
+            self.assertNotIn("/", cursor)
+            self.assertNotIn("+", cursor)
+
+    def test_decode_invalid_cursor(self):
+        cursors = [
+            "invalid",
+            pagination_utils.FIRST_PAGE_CURSOR,
+            pagination_utils.encode_cursor(value=1, id="invalid"),
+        ]
+
+        for cursor in cursors:
+            expected_msg = re.escape('Invalid cursor "%s" specified' % (cursor))
+            self.assertRaisesRegex(
+                ValueError, expected_msg, pagination_utils.decode_cursor, cursor
+            )
+
+    def test_get_next_page_link(self):
+        link = pagination_utils.get_next_page_link(
+            path="/v1/executions",
+            params=[("limit", "10"), ("offset", "0"), ("cursor", "*"), ("a", "b")],
+            cursor="abc=",
+        )
+        self.assertEqual(
+            link, '</v1/executions?limit=10&a=b&cursor=abc%3D>; rel="next"'
+        )
@@ -19,6 +19,7 @@ import os
 import sys
 import time
 import json
+import signal
 import subprocess
 
 from collections import defaultdict
@@ -34,6 +35,7 @@ from st2common.constants.system import AUTH_TOKEN_ENV_VARIABLE_NAME
 from st2common.constants.triggers import SENSOR_SPAWN_TRIGGER, SENSOR_EXIT_TRIGGER
 from st2common.constants.exit_codes import SUCCESS_EXIT_CODE
 from st2common.constants.exit_codes import FAILURE_EXIT_CODE
+from st2common.metrics.base import get_driver
 from st2common.models.system.common import ResourceReference
 from st2common.services.access import create_token
 from st2common.transport.reactor import TriggerDispatcher
@@ -59,7 +61,8 @@ SENSOR_MAX_RESPAWN_COUNTS = 2
 # being started and running successfully
 SENSOR_SUCCESSFUL_START_THRESHOLD = 10
 
-# How long to wait (in seconds) before respawning a dead process
+# How long to wait (in seconds) before respawning a dead process. First respawn happens right away
+# and each subsequent respawn is delayed by this many more seconds.
 SENSOR_RESPAWN_DELAY = 2.5
 
 # How long to wait for process to exit after sending SIGTERM signal. If the process doesn't
@@ -89,7 +92,9 @@ class ProcessSensorContainer(object):
         :param sensors: A list of sensor dicts.
         :type sensors: ``list`` of ``dict``
 
-        :param poll_interval: How long to sleep between each poll for running / dead sensors.
+        :param poll_interval: How long to sleep between each poll for running / dead sensors. When
+                              SIGCHLD notification is available, dead sensors are detected as
+                              soon as they exit and this is only an upper bound for the sleep.
         :type poll_interval: ``float``
 
         :param wrapper_script_path: Path to the sensor wrapper script.
@@ -128,6 +133,14 @@ class ProcessSensorContainer(object):
             int
         )  # maps sensor_id -> number of respawns
 
+        # Read end of the pipe which is used to wake up the main loop when a child process exits
+        # (see _setup_child_exit_notification)
+        self._child_exit_read_fd = None
+        self._child_exit_write_fd = None
+        self._child_exit_time = None  # time when the last SIGCHLD signal was received
+        self._original_sigchld_handler = None
+        self._original_wakeup_fd = None
+
         # A list of all the instance variables which hold internal state information about a
         # particular_sensor
         # Note: We don't clear respawn counts since we want to track this through the whole life
@@ -141,6 +154,7 @@ class ProcessSensorContainer(object):
         self._enable_common_pack_libs = cfg.CONF.packs.enable_common_libs or False
 
     def run(self):
+        self._setup_child_exit_notification()
         self._run_all_sensors()
 
         success_exception_cls = concurrency.get_greenlet_exit_exception_class()
@@ -156,7 +170,7 @@ class ProcessSensorContainer(object):
                 else:
                     LOG.debug("No active sensors")
 
-                concurrency.sleep(self._poll_interval)
+                self._wait_for_child_exit(timeout=self._poll_interval)
         except success_exception_cls:
             # This exception is thrown when sensor container manager
             # kills the thread which runs process container. Not sure
@@ -167,6 +181,8 @@ class ProcessSensorContainer(object):
             LOG.exception("Container failed to run sensors.")
             self._stopped = True
             return FAILURE_EXIT_CODE
+        finally:
+            self._teardown_child_exit_notification()
 
         self._stopped = True
         LOG.error("Process container stopped.")
@@ -178,6 +194,9 @@ class ProcessSensorContainer(object):
         """
         Main loop which polls sensor for results and detects dead sensors.
         """
+        child_exit_time = self._child_exit_time
+        self._child_exit_time = None
+
         for sensor_id in sensor_ids:
             now = int(time.time())
 
@@ -190,6 +209,13 @@ class ProcessSensorContainer(object):
                     "Process for sensor %s has exited with code %s", sensor_id, status
                 )
 
+                exit_time = time.time()
+                self._record_sensor_exit_metrics(
+                    sensor_id=sensor_id,
+                    exit_time=exit_time,
+                    child_exit_time=child_exit_time,
+                )
+
                 sensor = self._sensors[sensor_id]
                 self._delete_sensor(sensor_id)
 
@@ -202,6 +228,7 @@ class ProcessSensorContainer(object):
                     sensor_id=sensor_id,
                     sensor=sensor,
                     exit_code=status,
+                    exit_time=exit_time,
                 )
             else:
                 sensor_start_time = self._sensor_start_times[sensor_id]
@@ -407,25 +434,19 @@ class ProcessSensorContainer(object):
         # process to exit
         process.terminate()
 
-        timeout = 0
-        sleep_delay = 1
-        while timeout < exit_timeout:
-            status = process.poll()
-
-            if status is not None:
-                # Process has exited
-                break
-
-            timeout += sleep_delay
-            time.sleep(sleep_delay)
-
-        if status is None:
+        try:
+            process.wait(timeout=exit_timeout)
+        except subprocess.TimeoutExpired:
             # Process hasn't exited yet, forcefully kill it
             process.kill()
 
-    def _respawn_sensor(self, sensor_id, sensor, exit_code):
+    def _respawn_sensor(self, sensor_id, sensor, exit_code, exit_time=None):
         """
         Method for respawning a sensor which died with a non-zero exit code.
+
+        :param exit_time: Time when the sensor exit has been detected. Used to measure how long it
+                          took to restart the sensor.
+        :type exit_time: ``float``
         """
         extra = {"sensor_id": sensor_id, "sensor": sensor}
 
@@ -455,8 +476,11 @@ class ProcessSensorContainer(object):
         LOG.debug("Respawning dead sensor", extra=extra)
 
         self._sensor_respawn_counts[sensor_id] += 1
-        sleep_delay = SENSOR_RESPAWN_DELAY * self._sensor_respawn_counts[sensor_id]
-        concurrency.sleep(sleep_delay)
+        sleep_delay = SENSOR_RESPAWN_DELAY * (
+            self._sensor_respawn_counts[sensor_id] - 1
+        )
+        if sleep_delay > 0:
+            concurrency.sleep(sleep_delay)
 
         try:
             self._spawn_sensor_process(sensor=sensor)
@@ -464,7 +488,107 @@ class ProcessSensorContainer(object):
             LOG.warning(six.text_type(e), exc_info=True)
 
             # Disable sensor which we are unable to start
-            del self._sensors[sensor_id]
+            self._sensors.pop(sensor_id, None)
+            return
+
+        if exit_time:
+            get_driver().time(
+                "sensor.%s.restart_latency" % (sensor_id), time.time() - exit_time
+            )
+
+    def _setup_child_exit_notification(self):
+        """
+        Install SIGCHLD handler which wakes up the main loop as soon as a child process exits so
+        dead sensors are detected and respawned right away instead of on the next poll.
+
+        Signal handler only records the time and the actual wake up happens through a pipe which
+        is registered as a signal wakeup fd (the interpreter writes a byte to it for every
+        received signal) and which the main loop waits on.
+
+        If the handler can't be installed (e.g. container is not running in the main thread), the
+        container falls back to polling the sensor processes every poll_interval seconds.
+        """
+        if not hasattr(signal, "SIGCHLD"):
+            return
+
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+
+        try:
+            self._original_wakeup_fd = signal.set_wakeup_fd(write_fd)
+            self._original_sigchld_handler = signal.signal(
+                signal.SIGCHLD, self._handle_sigchld
+            )
+        except ValueError as e:
+            if self._original_wakeup_fd is not None:
+                signal.set_wakeup_fd(self._original_wakeup_fd)
+                self._original_wakeup_fd = None
+
+            os.close(read_fd)
+            os.close(write_fd)
+
+            LOG.debug(
+                "Unable to set up SIGCHLD handler, falling back to polling: %s",
+                six.text_type(e),
+            )
+            return
+
+        self._child_exit_read_fd = read_fd
+        self._child_exit_write_fd = write_fd
+
+    def _teardown_child_exit_notification(self):
+        if self._child_exit_read_fd is None:
+            return
+
+        try:
+            signal.signal(signal.SIGCHLD, self._original_sigchld_handler)
+            signal.set_wakeup_fd(self._original_wakeup_fd)
+        except ValueError:
+            LOG.debug("Unable to restore original SIGCHLD handler", exc_info=True)
+
+        os.close(self._child_exit_read_fd)
+        os.close(self._child_exit_write_fd)
+
+        self._child_exit_read_fd = None
+        self._child_exit_write_fd = None
+
+    def _handle_sigchld(self, signum, frame):
+        self._child_exit_time = time.time()
+
+        if callable(self._original_sigchld_handler):
+            self._original_sigchld_handler(signum, frame)
+
+    def _wait_for_child_exit(self, timeout):
+        """
+        Sleep until a child process exits or until the timeout elapses.
+        """
+        if self._child_exit_read_fd is None:
+            concurrency.sleep(timeout)
+            return
+
+        if concurrency.wait_read(self._child_exit_read_fd, timeout=timeout):
+            # Drain the pipe. A single read is enough since the pipe only holds a byte per signal
+            # and any bytes left over simply cause another poll pass.
+            # NOTE: This read doesn't block since the pipe is ready to read
+            os.read(self._child_exit_read_fd, 4096)
+
+    def _record_sensor_exit_metrics(self, sensor_id, exit_time, child_exit_time=None):
+        metrics_driver = get_driver()
+        metrics_driver.inc_counter("sensor.%s.exited" % (sensor_id))
+
+        sensor_start_time = self._sensor_start_times.get(sensor_id, None)
+        if sensor_start_time:
+            metrics_driver.time(
+                "sensor.%s.uptime" % (sensor_id), exit_time - sensor_start_time
+            )
+
+        if child_exit_time:
+            # How long it took from the process exit to the exit being detected
+            metrics_driver.time(
+                "sensor.%s.exit_detection_latency" % (sensor_id),
+                max(exit_time - child_exit_time, 0),
+            )
 
     def _should_respawn_sensor(self, sensor_id, sensor, exit_code):
         """
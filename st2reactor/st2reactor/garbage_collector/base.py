@@ -36,6 +36,10 @@ from st2common.constants.garbage_collection import MINIMUM_TTL_DAYS
 from st2common.constants.garbage_collection import MINIMUM_TTL_DAYS_EXECUTION_OUTPUT
 from st2common.util import isotime
 from st2common.util.date import get_datetime_utc_now
+from st2common.models.db import db_ensure_indexes
+from st2common.models.db.auth import TokenDB
+from st2common.models.db.trigger import TriggerInstanceDB
+from st2common.garbage_collection.archive import ExecutionArchiveWriter
 from st2common.garbage_collection.executions import purge_executions
 from st2common.garbage_collection.executions import purge_execution_output_objects
 from st2common.garbage_collection.executions import purge_orphaned_workflow_executions
@@ -86,6 +90,15 @@ class GarbageCollectorService(object):
         )
         self._task_executions_ttl = cfg.CONF.garbagecollector.task_executions_ttl
 
+        self._purge_batch_size = cfg.CONF.garbagecollector.purge_batch_size
+        self._purge_max_deletes_per_second = (
+            cfg.CONF.garbagecollector.purge_max_deletes_per_second
+        )
+        self._use_ttl_indexes = cfg.CONF.garbagecollector.use_ttl_indexes
+        self._action_executions_archive_dir = (
+            cfg.CONF.garbagecollector.action_executions_archive_dir
+        )
+
         self._validate_ttl_values()
 
         self._sleep_delay = sleep_delay
@@ -103,6 +116,7 @@ class GarbageCollectorService(object):
         success_exception_cls = concurrency.get_greenlet_exit_exception_class()
 
         try:
+            self._ensure_ttl_indexes()
             self._main_loop()
         except success_exception_cls:
             self._running = False
@@ -134,6 +148,35 @@ class GarbageCollectorService(object):
             )
             concurrency.sleep(self._collection_interval)
 
+    def _ensure_ttl_indexes(self):
+        """
+        Create (or drop when the retention mode is disabled) TTL indexes for objects which are
+        deleted by MongoDB instead of the garbage collector.
+
+        Note: TTL indexes only work on date fields so objects which store timestamps as integers
+        (execution output, traces, rule enforcements) are always handled by the garbage collector.
+        """
+        ttl_indexes = {
+            "TriggerInstanceDB": (
+                "occurrence_time",
+                self._get_ttl_index_expire_after_seconds(self._trigger_instances_ttl),
+            ),
+            "TokenDB": (
+                "expiry",
+                self._get_ttl_index_expire_after_seconds(self._tokens_ttl),
+            ),
+        }
+
+        db_ensure_indexes(
+            model_classes=[TriggerInstanceDB, TokenDB], ttl_indexes=ttl_indexes
+        )
+
+    def _get_ttl_index_expire_after_seconds(self, ttl_days):
+        if not self._use_ttl_indexes or not ttl_days or ttl_days < MINIMUM_TTL_DAYS:
+            return None
+
+        return ttl_days * 24 * 60 * 60
+
     def _validate_ttl_values(self):
         """
         Validate that a user has supplied reasonable TTL values.
@@ -191,6 +234,9 @@ class GarbageCollectorService(object):
 
         proc_message = "Performing garbage collection for %s."
         skip_message = "Skipping garbage collection for %s since it's not configured."
+        ttl_index_message = (
+            "Skipping garbage collection for %s since it's handled by TTL index."
+        )
 
         # Note: We sleep for a bit between garbage collection of each object type to prevent busy
         # waiting
@@ -220,7 +266,9 @@ class GarbageCollectorService(object):
 
         obj_type = "trigger instances"
 
-        if (
+        if self._use_ttl_indexes:
+            LOG.debug(ttl_index_message, obj_type)
+        elif (
             self._trigger_instances_ttl
             and self._trigger_instances_ttl >= MINIMUM_TTL_DAYS
         ):
@@ -241,7 +289,9 @@ class GarbageCollectorService(object):
 
         obj_type = "token"
 
-        if self._tokens_ttl and self._tokens_ttl >= MINIMUM_TTL_DAYS:
+        if self._use_ttl_indexes:
+            LOG.debug(ttl_index_message, obj_type)
+        elif self._tokens_ttl and self._tokens_ttl >= MINIMUM_TTL_DAYS:
 
             LOG.info(proc_message, obj_type)
             self._purge_tokens()
@@ -319,8 +369,20 @@ class GarbageCollectorService(object):
                 f" later than now in UTC ({utc_now})."
             )
 
+        archive_writer = None
+        if self._action_executions_archive_dir:
+            archive_writer = ExecutionArchiveWriter(
+                archive_dir=self._action_executions_archive_dir
+            )
+
         try:
-            purge_executions(logger=LOG, timestamp=timestamp)
+            purge_executions(
+                logger=LOG,
+                timestamp=timestamp,
+                batch_size=self._purge_batch_size,
+                max_deletes_per_second=self._purge_max_deletes_per_second,
+                archive_writer=archive_writer,
+            )
         except Exception as e:
             LOG.exception("Failed to delete executions: %s" % (six.text_type(e)))
 
@@ -374,7 +436,12 @@ class GarbageCollectorService(object):
         assert timestamp < utc_now
 
         try:
-            purge_task_executions(logger=LOG, timestamp=timestamp)
+            purge_task_executions(
+                logger=LOG,
+                timestamp=timestamp,
+                batch_size=self._purge_batch_size,
+                max_deletes_per_second=self._purge_max_deletes_per_second,
+            )
         except Exception as e:
             LOG.exception(
                 "Failed to delete workflow task executions: %s" % (six.text_type(e))
@@ -408,7 +475,12 @@ class GarbageCollectorService(object):
             )
 
         try:
-            purge_execution_output_objects(logger=LOG, timestamp=timestamp)
+            purge_execution_output_objects(
+                logger=LOG,
+                timestamp=timestamp,
+                batch_size=self._purge_batch_size,
+                max_deletes_per_second=self._purge_max_deletes_per_second,
+            )
         except Exception as e:
             LOG.exception(
                 "Failed to delete execution output objects: %s" % (six.text_type(e))
@@ -439,7 +511,12 @@ class GarbageCollectorService(object):
             )
 
         try:
-            purge_trigger_instances(logger=LOG, timestamp=timestamp)
+            purge_trigger_instances(
+                logger=LOG,
+                timestamp=timestamp,
+                batch_size=self._purge_batch_size,
+                max_deletes_per_second=self._purge_max_deletes_per_second,
+            )
         except Exception as e:
             LOG.exception("Failed to trigger instances: %s" % (six.text_type(e)))
 
@@ -468,7 +545,12 @@ class GarbageCollectorService(object):
             )
 
         try:
-            purge_traces(logger=LOG, timestamp=timestamp)
+            purge_traces(
+                logger=LOG,
+                timestamp=timestamp,
+                batch_size=self._purge_batch_size,
+                max_deletes_per_second=self._purge_max_deletes_per_second,
+            )
         except Exception as e:
             LOG.exception("Failed to delete trace: %s" % (six.text_type(e)))
 
@@ -526,7 +608,12 @@ class GarbageCollectorService(object):
             )
 
         try:
-            purge_rule_enforcements(logger=LOG, timestamp=timestamp)
+            purge_rule_enforcements(
+                logger=LOG,
+                timestamp=timestamp,
+                batch_size=self._purge_batch_size,
+                max_deletes_per_second=self._purge_max_deletes_per_second,
+            )
         except Exception as e:
             LOG.exception("Failed to delete rule enforcements: %s" % (six.text_type(e)))
 
@@ -22,6 +22,7 @@ from st2common.constants.system import VERSION_STRING
 from st2common.constants.system import DEFAULT_CONFIG_FILE_PATH
 from st2common.constants.garbage_collection import DEFAULT_COLLECTION_INTERVAL
 from st2common.constants.garbage_collection import DEFAULT_SLEEP_DELAY
+from st2common.constants.garbage_collection import DEFAULT_PURGE_BATCH_SIZE
 
 CONF = cfg.CONF
 
@@ -73,6 +74,28 @@ def _register_garbage_collector_opts(ignore_errors=False):
             help="How long to wait / sleep (in seconds) between "
             "collection of different object types.",
         ),
+        cfg.IntOpt(
+            "purge_batch_size",
+            default=DEFAULT_PURGE_BATCH_SIZE,
+            help="Maximum number of objects which are deleted using a single delete query. Old "
+            "objects are deleted in batches so the memory usage of the garbage collector and the "
+            "size of the delete queries stay bounded.",
+        ),
+        cfg.IntOpt(
+            "purge_max_deletes_per_second",
+            default=None,
+            help="Maximum number of objects of a single type which are deleted per second. "
+            "Garbage collector sleeps between batches when this limit is reached. Defaults to "
+            "None (no limit).",
+        ),
+        cfg.BoolOpt(
+            "use_ttl_indexes",
+            default=False,
+            help="Set to True to let MongoDB delete old trigger instances and tokens using TTL "
+            "indexes which are created based on the trigger_instances_ttl and tokens_ttl "
+            "options. Garbage collector won't run delete queries for those objects in that case. "
+            "Other objects are still deleted by the garbage collector.",
+        ),
     ]
 
     common_config.do_register_opts(
@@ -132,6 +155,22 @@ def _register_garbage_collector_opts(ignore_errors=False):
         ttl_opts, group="garbagecollector", ignore_errors=ignore_errors
     )
 
+    archive_opts = [
+        cfg.StrOpt(
+            "action_executions_archive_dir",
+            default=None,
+            help="If specified, action executions together with their output objects and traces "
+            "are archived to compressed files in this directory before they are deleted. Note: "
+            "Output objects are only archived if action_executions_output_ttl is not lower than "
+            "action_executions_ttl. Archived executions can be retrieved using "
+            "st2-archive-executions --execution-id.",
+        ),
+    ]
+
+    common_config.do_register_opts(
+        archive_opts, group="garbagecollector", ignore_errors=ignore_errors
+    )
+
     inquiry_opts = [
         cfg.BoolOpt(
             "purge_inquiries",
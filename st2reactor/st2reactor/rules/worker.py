@@ -35,6 +35,7 @@ LOG = logging.getLogger(__name__)
 
 class TriggerInstanceDispatcher(consumers.StagedMessageHandler):
     message_type = dict
+    service_name = "rulesengine"
 
     def __init__(self, connection, queues):
         super(TriggerInstanceDispatcher, self).__init__(connection, queues)
@@ -35,6 +35,9 @@ class GarbageCollectorServiceTest(unittest.TestCase):
     def tearDown(self):
         # Reset gc_max_idle_sec with a value of 1 to reenable for other tests.
         cfg.CONF.set_override("gc_max_idle_sec", 1, group="workflow_engine")
+        cfg.CONF.clear_override("use_ttl_indexes", group="garbagecollector")
+        cfg.CONF.clear_override("trigger_instances_ttl", group="garbagecollector")
+        cfg.CONF.clear_override("tokens_ttl", group="garbagecollector")
         super(GarbageCollectorServiceTest, self).tearDown()
 
     @mock.patch.object(
@@ -116,3 +119,73 @@ class GarbageCollectorServiceTest(unittest.TestCase):
         self.assertFalse(
             garbage_collector.GarbageCollectorService._purge_orphaned_workflow_executions.called
         )
+
+    @mock.patch.object(garbage_collector, "db_ensure_indexes", mock.MagicMock())
+    def test_ensure_ttl_indexes(self):
+        cfg.CONF.set_override("trigger_instances_ttl", 2, group="garbagecollector")
+        cfg.CONF.set_override("tokens_ttl", 1, group="garbagecollector")
+
+        # TTL indexes are dropped when the retention mode is disabled
+        gc = garbage_collector.GarbageCollectorService(sleep_delay=0)
+        gc._ensure_ttl_indexes()
+
+        ttl_indexes = garbage_collector.db_ensure_indexes.call_args[1]["ttl_indexes"]
+        self.assertEqual(
+            ttl_indexes,
+            {
+                "TriggerInstanceDB": ("occurrence_time", None),
+                "TokenDB": ("expiry", None),
+            },
+        )
+
+        cfg.CONF.set_override("use_ttl_indexes", True, group="garbagecollector")
+
+        gc = garbage_collector.GarbageCollectorService(sleep_delay=0)
+        gc._ensure_ttl_indexes()
+
+        ttl_indexes = garbage_collector.db_ensure_indexes.call_args[1]["ttl_indexes"]
+        self.assertEqual(
+            ttl_indexes,
+            {
+                "TriggerInstanceDB": ("occurrence_time", 2 * 24 * 60 * 60),
+                "TokenDB": ("expiry", 24 * 60 * 60),
+            },
+        )
+
+    @mock.patch.object(
+        garbage_collector.GarbageCollectorService,
+        "_purge_action_executions_output",
+        mock.MagicMock(return_value=None),
+    )
+    @mock.patch.object(
+        garbage_collector.GarbageCollectorService,
+        "_purge_trigger_instances",
+        mock.MagicMock(return_value=None),
+    )
+    @mock.patch.object(
+        garbage_collector.GarbageCollectorService,
+        "_purge_tokens",
+        mock.MagicMock(return_value=None),
+    )
+    @mock.patch.object(
+        garbage_collector.GarbageCollectorService,
+        "_timeout_inquiries",
+        mock.MagicMock(return_value=None),
+    )
+    @mock.patch.object(
+        garbage_collector.GarbageCollectorService,
+        "_purge_orphaned_workflow_executions",
+        mock.MagicMock(return_value=None),
+    )
+    def test_objects_with_ttl_indexes_are_not_purged(self):
+        cfg.CONF.set_override("trigger_instances_ttl", 2, group="garbagecollector")
+        cfg.CONF.set_override("tokens_ttl", 2, group="garbagecollector")
+        cfg.CONF.set_override("use_ttl_indexes", True, group="garbagecollector")
+
+        gc = garbage_collector.GarbageCollectorService(sleep_delay=0)
+        gc._perform_garbage_collection()
+
+        self.assertFalse(
+            garbage_collector.GarbageCollectorService._purge_trigger_instances.called
+        )
+        self.assertFalse(garbage_collector.GarbageCollectorService._purge_tokens.called)
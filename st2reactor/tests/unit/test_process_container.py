@@ -15,6 +15,7 @@
 
 from __future__ import absolute_import
 import os
+import subprocess
 import time
 
 from mock import MagicMock, Mock, patch
@@ -180,3 +181,67 @@ class ProcessContainerTests(unittest.TestCase):
                 "exit_code": 1,
             },
         )
+
+    @patch.object(
+        ProcessSensorContainer, "_respawn_sensor", MagicMock(return_value=None)
+    )
+    @patch("st2reactor.container.process_container.get_driver")
+    def test_dead_sensor_is_detected_without_waiting_for_poll_interval(
+        self, mock_get_driver
+    ):
+        sensor = {"ref": "wolfpack.StupidSensor", "class_name": "StupidSensor"}
+
+        def mock_spawn_sensor_process(sensor):
+            process = subprocess.Popen(["sleep", "0.2"])
+            process_container._processes[sensor["ref"]] = process
+            process_container._sensor_start_times[sensor["ref"]] = int(time.time())
+            return process
+
+        mock_dispatcher = Mock()
+        process_container = ProcessSensorContainer(
+            [sensor], poll_interval=30, dispatcher=mock_dispatcher
+        )
+        process_container._spawn_sensor_process = mock_spawn_sensor_process
+
+        process_container_thread = concurrency.spawn(process_container.run)
+
+        # Process exit should be detected right away even though poll interval is 30 seconds
+        for _ in range(0, 50):
+            if process_container._respawn_sensor.call_count:
+                break
+
+            concurrency.sleep(0.1)
+
+        process_container._respawn_sensor.assert_called_once()
+        self.assertEqual(process_container._respawn_sensor.call_args[1]["exit_code"], 0)
+        self.assertEqual(process_container.running(), 0)
+
+        metrics_driver = mock_get_driver.return_value
+        metrics_driver.inc_counter.assert_called_once_with(
+            "sensor.wolfpack.StupidSensor.exited"
+        )
+        timer_keys = [call[0][0] for call in metrics_driver.time.call_args_list]
+        self.assertIn("sensor.wolfpack.StupidSensor.uptime", timer_keys)
+        self.assertIn("sensor.wolfpack.StupidSensor.exit_detection_latency", timer_keys)
+
+        process_container.shutdown()
+        process_container_thread.kill()
+
+    @patch.object(concurrency, "sleep", MagicMock(return_value=None))
+    def test_first_respawn_is_not_delayed(self):
+        sensor = {"ref": "wolfpack.StupidSensor", "class_name": "StupidSensor"}
+
+        process_container = ProcessSensorContainer(None, dispatcher=Mock())
+        process_container._spawn_sensor_process = MagicMock(return_value=None)
+
+        process_container._respawn_sensor(
+            sensor_id=sensor["ref"], sensor=sensor, exit_code=1
+        )
+        self.assertEqual(process_container._spawn_sensor_process.call_count, 1)
+        self.assertEqual(concurrency.sleep.call_count, 0)
+
+        process_container._respawn_sensor(
+            sensor_id=sensor["ref"], sensor=sensor, exit_code=1
+        )
+        self.assertEqual(process_container._spawn_sensor_process.call_count, 2)
+        concurrency.sleep.assert_called_once_with(2.5)
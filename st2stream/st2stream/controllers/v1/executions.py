@@ -29,6 +29,7 @@ from st2common.router import Response
 from st2common.util.jsonify import json_encode
 from st2common.rbac.types import PermissionType
 from st2common.stream.listener import get_listener
+from st2common.stream.listener import StreamEvent
 
 __all__ = ["ActionExecutionOutputStreamController"]
 
@@ -127,6 +128,11 @@ class ActionExecutionOutputStreamController(ResourceController):
                             ):
                                 continue
 
+                            if isinstance(pack, StreamEvent):
+                                # Use output event which is encoded once for all the clients
+                                yield pack.encode()
+                                continue
+
                             output = format_output_object(model_api).encode("utf-8")
                             yield six.binary_type(output)
                         elif isinstance(model_api, ActionExecutionAPI):
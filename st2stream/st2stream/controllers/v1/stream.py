@@ -20,6 +20,7 @@ from st2common.constants import action as action_constants
 from st2common.router import Response
 from st2common.util.jsonify import json_encode
 from st2common.stream.listener import get_listener
+from st2common.stream.listener import StreamEvent
 
 __all__ = ["StreamController"]
 
@@ -43,6 +44,9 @@ def format(gen):
         if not pack:
             # Note: gunicorn wsgi handler expect bytes, not unicode
             yield six.binary_type(b"\n")
+        elif isinstance(pack, StreamEvent):
+            # Event is encoded only once and the same buffer is shared by all the clients
+            yield pack.encode()
         else:
             (event, body) = pack
             # Note: gunicorn wsgi handler expect bytes, not unicode
@@ -59,6 +63,8 @@ class StreamController(object):
         events=None,
         action_refs=None,
         execution_ids=None,
+        coalesce=False,
+        last_event_id=None,
         requester_user=None,
     ):
         events = events if events else DEFAULT_EVENTS_WHITELIST
@@ -75,6 +81,8 @@ class StreamController(object):
                     end_statuses=action_constants.LIVEACTION_COMPLETED_STATES,
                     end_execution_id=end_execution_id,
                     execution_ids=execution_ids,
+                    coalesce=coalesce,
+                    last_event_id=last_event_id,
                 )
             )
             res = Response(
@@ -25,6 +25,7 @@ import st2common.config as common_config
 from st2common.constants.system import DEFAULT_CONFIG_FILE_PATH
 from st2common.constants.garbage_collection import DEFAULT_COLLECTION_INTERVAL
 from st2common.constants.garbage_collection import DEFAULT_SLEEP_DELAY
+from st2common.constants.garbage_collection import DEFAULT_PURGE_BATCH_SIZE
 from st2common.constants.sensors import DEFAULT_PARTITION_LOADER
 from st2tests.fixturesloader import get_fixtures_packs_base_path
 
@@ -223,6 +224,7 @@ def _register_api_opts():
 
     api_opts = [
         cfg.BoolOpt("debug", default=True),
+        cfg.BoolOpt("alias_matcher_cache_enabled", default=False),
     ]
 
     _register_opts(api_opts, group="api")
@@ -499,6 +501,22 @@ def _register_garbage_collector_opts():
             help="How long to wait / sleep (in seconds) between "
             "collection of different object types.",
         ),
+        cfg.IntOpt(
+            "purge_batch_size",
+            default=DEFAULT_PURGE_BATCH_SIZE,
+            help="Maximum number of objects which are deleted using a single delete query.",
+        ),
+        cfg.IntOpt(
+            "purge_max_deletes_per_second",
+            default=None,
+            help="Maximum number of objects of a single type which are deleted per second.",
+        ),
+        cfg.BoolOpt(
+            "use_ttl_indexes",
+            default=False,
+            help="Set to True to let MongoDB delete old trigger instances and tokens using TTL "
+            "indexes.",
+        ),
     ]
 
     _register_opts(common_opts, group="garbagecollector")
@@ -554,6 +572,17 @@ def _register_garbage_collector_opts():
 
     _register_opts(ttl_opts, group="garbagecollector")
 
+    archive_opts = [
+        cfg.StrOpt(
+            "action_executions_archive_dir",
+            default=None,
+            help="If specified, action executions are archived in this directory before they "
+            "are deleted.",
+        ),
+    ]
+
+    _register_opts(archive_opts, group="garbagecollector")
+
     inquiry_opts = [
         cfg.BoolOpt(
             "purge_inquiries",
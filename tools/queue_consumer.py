@@ -29,6 +29,7 @@ from kombu import Exchange, Queue
 
 from st2common import config
 from st2common.transport import utils as transport_utils
+from st2common.transport.serializers import ACCEPT_CONTENT
 
 
 class QueueConsumer(ConsumerMixin):
@@ -39,7 +40,9 @@ class QueueConsumer(ConsumerMixin):
     def get_consumers(self, Consumer, channel):
         return [
             Consumer(
-                queues=[self.queue], accept=["pickle"], callbacks=[self.process_task]
+                queues=[self.queue],
+                accept=ACCEPT_CONTENT,
+                callbacks=[self.process_task],
             )
         ]
 